@@ -6,19 +6,42 @@ conversation memory and vector search integration. It enables users
 to interact with the NYC Landmarks database using natural language.
 """
 
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 import openai
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel, Field
 
+from nyc_landmarks.chat.answer_cache import CachedAnswer, SemanticAnswerCache
+from nyc_landmarks.chat.context_builder import ContextBuilder, ContextChunk
 from nyc_landmarks.chat.conversation import Conversation, conversation_store
+from nyc_landmarks.config.settings import VectorDBBackend, settings
 from nyc_landmarks.db.db_client import DbClient
 from nyc_landmarks.embeddings.generator import EmbeddingGenerator
-from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.utils.logger import get_logger, log_performance
 from nyc_landmarks.utils.validation import ValidationLogger, get_client_info
-from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+from nyc_landmarks.vectordb.local_vector_db import get_local_vector_db
+from nyc_landmarks.vectordb.pinecone_db import (
+    PineconeDB,
+    register_vector_change_listener,
+)
+from nyc_landmarks.vectordb.read_replica import get_read_replica_db
 
 
 # Define a protocol for QueryMatch to avoid direct import
@@ -33,12 +56,30 @@ class QueryMatch(Protocol):
 # Configure logging
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Create API router
 router = APIRouter(
     prefix="/api/chat",
     tags=["chat"],
 )
 
+# Chat completion parameters shared by the buffered and streaming endpoints
+CHAT_COMPLETION_MODEL = "gpt-3.5-turbo"  # Can be configured in settings
+CHAT_COMPLETION_TEMPERATURE = 0.7
+CHAT_COMPLETION_MAX_TOKENS = 1000
+
+# Number of recent conversation messages considered for the chat prompt
+CHAT_HISTORY_LIMIT = 10
+
+# Fits retrieved context and history into the configured token budgets
+context_builder = ContextBuilder()
+
+# Reuses answers to near-duplicate first-turn questions (CHAT_ANSWER_CACHE_ENABLED),
+# dropping them when the vectors of a landmark they depend on change
+answer_cache = SemanticAnswerCache()
+register_vector_change_listener(answer_cache.invalidate_landmark)
+
 
 # --- Pydantic models for requests and responses ---
 
@@ -105,7 +146,11 @@ def get_embedding_generator() -> EmbeddingGenerator:
 
 
 def get_vector_db() -> PineconeDB:
-    """Get an instance of PineconeDB."""
+    """Get the vector database for the configured backend."""
+    if settings.VECTOR_DB_BACKEND == VectorDBBackend.LOCAL:
+        return get_local_vector_db()
+    if settings.VECTOR_DB_BACKEND == VectorDBBackend.REPLICA:
+        return get_read_replica_db()
     return PineconeDB()
 
 
@@ -120,6 +165,61 @@ def get_db_client() -> DbClient:
 # --- Helper functions ---
 
 
+class ChatTimings:
+    """Wall-clock timings (milliseconds) of the stages of one chat turn."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder and start the turn clock."""
+        self.stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    async def measure(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Await a stage and record how long it took.
+
+        Args:
+            stage: Stage name
+            awaitable: Coroutine or task running the stage
+
+        Returns:
+            The stage result
+        """
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.stages[stage] = round((time.perf_counter() - start) * 1000, 2)
+
+    @property
+    def total_ms(self) -> float:
+        """Milliseconds since the turn started."""
+        return round((time.perf_counter() - self._started) * 1000, 2)
+
+    def server_timing_header(self) -> str:
+        """Format the stage timings as a ``Server-Timing`` header value."""
+        stages = [f"{stage};dur={ms}" for stage, ms in self.stages.items()]
+        return ", ".join(stages + [f"total;dur={self.total_ms}"])
+
+    def log(self, endpoint: str, conversation_id: str, cache_hit: bool) -> None:
+        """Log the stage timings of the turn as a performance metric.
+
+        Args:
+            endpoint: Chat endpoint that handled the turn
+            conversation_id: Conversation ID
+            cache_hit: Whether the answer came from the answer cache
+        """
+        log_performance(
+            logger,
+            f"chat_turn {endpoint}",
+            self.total_ms,
+            extra={
+                "endpoint": endpoint,
+                "conversation_id": conversation_id,
+                "answer_cache_hit": cache_hit,
+                "stage_timings_ms": dict(self.stages),
+            },
+        )
+
+
 def _get_or_create_conversation(conversation_id: Optional[str] = None) -> Conversation:
     """Get an existing conversation or create a new one.
 
@@ -147,6 +247,49 @@ def _get_or_create_conversation(conversation_id: Optional[str] = None) -> Conver
     return conversation
 
 
+def _is_first_turn(conversation: Conversation) -> bool:
+    """Check whether a conversation has no messages besides system messages.
+
+    Args:
+        conversation: Conversation object
+
+    Returns:
+        True if the next user message starts the conversation
+    """
+    return all(msg["role"] == "system" for msg in conversation.get_messages())
+
+
+def _load_conversation(
+    chat_request: ChatRequest,
+) -> Tuple[Conversation, bool, List[Dict[str, Any]]]:
+    """Load the conversation, add the user message and shape the history.
+
+    Args:
+        chat_request: Chat request model
+
+    Returns:
+        Tuple of (conversation, first_turn, history) where history holds the
+        recent non-system messages that fit the history token budget
+    """
+    # Load the full history: the response returns every message, only the
+    # prompt is limited to the recent ones
+    conversation = _get_or_create_conversation(chat_request.conversation_id)
+    first_turn = _is_first_turn(conversation)
+
+    # Add user message to conversation
+    conversation.add_message("user", chat_request.message)
+
+    # Keep the last CHAT_HISTORY_LIMIT messages, skipping system messages
+    # (the prompt has its own) and trimming the oldest messages first to fit
+    # the history token budget
+    history = [
+        msg
+        for msg in conversation.get_messages(limit=CHAT_HISTORY_LIMIT)
+        if msg["role"] != "system"
+    ]
+    return conversation, first_turn, context_builder.fit_history(history)
+
+
 def _extract_metadata_and_score(match: Any) -> Tuple[Dict[str, Any], float]:
     """Extract metadata and score from a match result.
 
@@ -257,81 +400,111 @@ def _create_source_object(
     }
 
 
-def _get_context_from_vector_db(
-    query: str,
-    embedding_generator: EmbeddingGenerator,
+def _query_context_chunks(
+    query_embedding: List[float],
     vector_db: PineconeDB,
-    db_client: DbClient,
     landmark_id: Optional[str] = None,
-) -> Tuple[str, List[Dict[str, Any]]]:
-    """Get relevant context from the vector database.
+) -> List[ContextChunk]:
+    """Query the vector database and select chunks for the prompt context.
 
     Args:
-        query: User's query
-        embedding_generator: EmbeddingGenerator instance
+        query_embedding: Embedding of the user's query
         vector_db: PineconeDB instance
-        db_client: Database client instance
         landmark_id: Optional landmark ID to filter results
 
     Returns:
-        Tuple of (context_text, sources)
+        Selected context chunks in descending score order
     """
-    context_text = ""
-    sources = []
-
-    # Generate embedding for the query
-    query_embedding = embedding_generator.generate_embedding(query)
-
-    # Prepare filter dictionary
-    filter_dict = {}
-    if landmark_id:
-        filter_dict["landmark_id"] = landmark_id
-
-    # Only pass filter_dict if it has values
-    filter_to_use = filter_dict if filter_dict else None
+    # Only pass a filter if a landmark was specified
+    filter_to_use = {"landmark_id": landmark_id} if landmark_id else None
 
     # Query the vector database to get combined results from both Wikipedia and PDF sources
     matches = vector_db.query_vectors(
         query_embedding, top_k=5, filter_dict=filter_to_use
     )
 
-    # Process matches to create context
-    for i, match in enumerate(matches):
-        # Extract metadata and score
-        metadata, score = _extract_metadata_and_score(match)
+    # Select matches by score within the context token budget, dropping
+    # low-scoring matches and text overlapping already selected chunks
+    return context_builder.select_context(
+        [_extract_metadata_and_score(match) for match in matches]
+    )
 
-        # Only use matches with a reasonable similarity score
-        if score < 0.7:  # This threshold can be adjusted
-            continue
 
-        text = metadata.get("text", "")
-        landmark_id_from_metadata = metadata.get("landmark_id", "")
+def _format_context_text(chunks: List[ContextChunk]) -> str:
+    """Format selected chunks as numbered, attributed context for the prompt.
+
+    Args:
+        chunks: Selected context chunks
+
+    Returns:
+        Context text
+    """
+    return "".join(
+        f"\nContext {i + 1} {_format_source_info(chunk.metadata)}:\n{chunk.text}\n"
+        for i, chunk in enumerate(chunks)
+    )
+
+
+async def _get_landmark_names(
+    chunks: List[ContextChunk], db_client: DbClient
+) -> Dict[str, Optional[str]]:
+    """Look up the names of the landmarks cited by the selected chunks.
+
+    Each distinct landmark is looked up once, concurrently.
+
+    Args:
+        chunks: Selected context chunks
+        db_client: Database client instance
 
-        # Format source attribution
-        source_info = _format_source_info(metadata)
+    Returns:
+        Dictionary mapping landmark ID to name (None if not found)
+    """
+    landmark_ids = list(
+        dict.fromkeys(
+            chunk.metadata["landmark_id"]
+            for chunk in chunks
+            if chunk.metadata.get("landmark_id")
+        )
+    )
+    names = await asyncio.gather(
+        *(
+            asyncio.to_thread(_get_landmark_name, landmark_id, db_client)
+            for landmark_id in landmark_ids
+        )
+    )
+    return dict(zip(landmark_ids, names))
 
-        # Add to context text
-        context_text += f"\nContext {i + 1} {source_info}:\n{text}\n"
 
-        # Get landmark name
-        landmark_name = None
-        if landmark_id_from_metadata:
-            landmark_name = _get_landmark_name(landmark_id_from_metadata, db_client)
+def _create_sources(
+    chunks: List[ContextChunk], landmark_names: Dict[str, Optional[str]]
+) -> List[Dict[str, Any]]:
+    """Create the response source objects for the selected chunks.
 
-        # Create and add source object
-        source = _create_source_object(metadata, score, source_info, landmark_name)
-        sources.append(source)
+    Args:
+        chunks: Selected context chunks
+        landmark_names: Landmark names by landmark ID
 
-    return context_text, sources
+    Returns:
+        List of source objects
+    """
+    return [
+        _create_source_object(
+            chunk.metadata,
+            chunk.score,
+            _format_source_info(chunk.metadata),
+            landmark_names.get(chunk.metadata.get("landmark_id", "")),
+        )
+        for chunk in chunks
+    ]
 
 
 def _prepare_chat_messages(
-    conversation: Conversation, context_text: str
+    history: List[Dict[str, Any]], context_text: str
 ) -> List[ChatCompletionMessageParam]:
     """Prepare the list of messages for the chat completion API.
 
     Args:
-        conversation: Conversation object
+        history: Conversation history shaped by _load_conversation
         context_text: Context text from vector search
 
     Returns:
@@ -360,14 +533,101 @@ def _prepare_chat_messages(
             }
         )
 
-    # Add conversation history (last 10 messages)
-    for msg in conversation.get_messages(limit=10):
-        if msg["role"] != "system":  # Skip system messages, we've handled them above
-            messages.append({"role": msg["role"], "content": msg["content"]})
+    # Add conversation history
+    for msg in history:
+        messages.append({"role": msg["role"], "content": msg["content"]})
 
     return messages
 
 
+@dataclass
+class PreparedChatTurn:
+    """Everything needed to answer a chat message once retrieval is done."""
+
+    conversation: Conversation
+    first_turn: bool
+    query_embedding: List[float]
+    cached: Optional[CachedAnswer] = None
+    messages: List[ChatCompletionMessageParam] = field(default_factory=list)
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+
+
+async def _prepare_chat_turn(
+    chat_request: ChatRequest,
+    embedding_generator: EmbeddingGenerator,
+    vector_db: PineconeDB,
+    db_client: DbClient,
+    timings: ChatTimings,
+) -> PreparedChatTurn:
+    """Load the conversation and retrieve context for a chat message.
+
+    Blocking calls run in worker threads as a small task graph: the query
+    embedding is generated while the conversation is loaded and its history
+    shaped, and landmark names are looked up while the prompt is assembled.
+
+    Args:
+        chat_request: Chat request model
+        embedding_generator: EmbeddingGenerator instance
+        vector_db: PineconeDB instance
+        db_client: Database client instance
+        timings: Recorder for per-stage timings
+
+    Returns:
+        The prepared chat turn
+    """
+    (conversation, first_turn, history), query_embedding = await asyncio.gather(
+        timings.measure(
+            "conversation", asyncio.to_thread(_load_conversation, chat_request)
+        ),
+        timings.measure(
+            "embedding",
+            asyncio.to_thread(
+                embedding_generator.generate_embedding, chat_request.message
+            ),
+        ),
+    )
+
+    # First-turn questions may be answered from the semantic answer cache
+    if first_turn:
+        cached = answer_cache.lookup(query_embedding, chat_request.landmark_id)
+        if cached:
+            return PreparedChatTurn(
+                conversation,
+                first_turn,
+                query_embedding,
+                cached=cached,
+                sources=cached.sources,
+            )
+
+    chunks = await timings.measure(
+        "retrieval",
+        asyncio.to_thread(
+            _query_context_chunks,
+            query_embedding,
+            vector_db,
+            chat_request.landmark_id,
+        ),
+    )
+
+    landmark_names, messages = await asyncio.gather(
+        timings.measure("enrichment", _get_landmark_names(chunks, db_client)),
+        timings.measure(
+            "prompt_assembly",
+            asyncio.to_thread(
+                _prepare_chat_messages, history, _format_context_text(chunks)
+            ),
+        ),
+    )
+
+    return PreparedChatTurn(
+        conversation,
+        first_turn,
+        query_embedding,
+        messages=messages,
+        sources=_create_sources(chunks, landmark_names),
+    )
+
+
 def _convert_to_chat_messages(conversation: Conversation) -> List[ChatMessage]:
     """Convert conversation messages to ChatMessage objects.
 
@@ -389,6 +649,189 @@ def _convert_to_chat_messages(conversation: Conversation) -> List[ChatMessage]:
     return chat_messages
 
 
+def _validate_chat_request(
+    chat_request: ChatRequest, request: Request, endpoint: str
+) -> None:
+    """Validate a chat request and log the outcome.
+
+    Args:
+        chat_request: Chat request model
+        request: FastAPI request object for logging
+        endpoint: Endpoint path used in validation log records
+
+    Raises:
+        HTTPException: If any of the request fields fail validation
+    """
+    # Get client information for logging
+    client_ip, user_agent = get_client_info(request)
+
+    # Validate chat message input
+    ValidationLogger.validate_text_query(
+        chat_request.message, endpoint, client_ip, user_agent
+    )
+    ValidationLogger.validate_session_id(
+        chat_request.conversation_id, endpoint, client_ip, user_agent
+    )
+    ValidationLogger.validate_landmark_id(
+        chat_request.landmark_id, endpoint, client_ip, user_agent
+    )
+
+    # Log successful validation
+    ValidationLogger.log_validation_success(
+        endpoint,
+        {
+            "message": chat_request.message,
+            "conversation_id": chat_request.conversation_id,
+            "landmark_id": chat_request.landmark_id,
+        },
+        client_ip,
+        user_agent,
+    )
+
+
+def _get_source_types(sources: List[Dict[str, Any]]) -> List[str]:
+    """Extract the distinct source types used by a list of sources.
+
+    Args:
+        sources: Source objects created by _create_source_object
+
+    Returns:
+        List of unique source types
+    """
+    return list({source.get("source_type", "pdf") for source in sources})
+
+
+def _format_sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a Server-Sent Events frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable event payload
+
+    Returns:
+        SSE frame terminated by a blank line
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _stream_chat_completion(
+    conversation: Conversation,
+    messages: List[ChatCompletionMessageParam],
+    sources: List[Dict[str, Any]],
+    landmark_id: Optional[str],
+    question: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
+) -> Iterator[str]:
+    """Stream a chat completion as Server-Sent Events.
+
+    The retrieved sources are sent first so the client can render them while
+    the completion is generated. Each completion delta is then forwarded as a
+    ``token`` event, and a final ``done`` event carries the full response once
+    it has been appended to the conversation. If the stream is cut short, the
+    part of the response sent so far is appended instead.
+
+    Args:
+        conversation: Conversation the user message was added to
+        messages: Prepared messages for the chat completion API
+        sources: Sources retrieved from the vector database
+        landmark_id: Optional landmark ID the chat is focused on
+        question: First-turn question to cache the answer for (optional)
+        query_embedding: Embedding of ``question`` (optional)
+
+    Yields:
+        SSE frames
+    """
+    yield _format_sse_event(
+        "sources",
+        {
+            "conversation_id": conversation.conversation_id,
+            "landmark_id": landmark_id,
+            "sources": sources,
+            "source_types": _get_source_types(sources),
+        },
+    )
+
+    response_parts: List[str] = []
+    completed = False
+    try:
+        stream = openai.chat.completions.create(
+            model=CHAT_COMPLETION_MODEL,
+            messages=messages,
+            temperature=CHAT_COMPLETION_TEMPERATURE,
+            max_tokens=CHAT_COMPLETION_MAX_TOKENS,
+            stream=True,
+        )
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                response_parts.append(delta)
+                yield _format_sse_event("token", {"content": delta})
+
+        assistant_response = "".join(response_parts)
+
+        # Add assistant response to conversation once generation has completed
+        conversation.add_message("assistant", assistant_response)
+        completed = True
+        if question is not None and query_embedding is not None:
+            answer_cache.store(
+                question, query_embedding, assistant_response, sources, landmark_id
+            )
+
+        yield _format_sse_event(
+            "done",
+            {
+                "conversation_id": conversation.conversation_id,
+                "response": assistant_response,
+            },
+        )
+    except Exception as e:
+        # Headers have already been sent, so report the failure in-band
+        logger.error(f"Error streaming chat response: {e}")
+        yield _format_sse_event("error", {"detail": str(e)})
+    finally:
+        # Save the part the client received when the stream is cut short
+        # (disconnect or error), so the user message is not left unanswered
+        if not completed and response_parts:
+            conversation.add_message("assistant", "".join(response_parts))
+
+
+def _stream_cached_answer(
+    conversation: Conversation, cached: CachedAnswer, landmark_id: Optional[str]
+) -> Iterator[str]:
+    """Stream a cached answer with the same events as a generated one.
+
+    Args:
+        conversation: Conversation the user message was added to
+        cached: Cached answer to replay
+        landmark_id: Optional landmark ID the chat is focused on
+
+    Yields:
+        SSE frames
+    """
+    yield _format_sse_event(
+        "sources",
+        {
+            "conversation_id": conversation.conversation_id,
+            "landmark_id": landmark_id,
+            "sources": cached.sources,
+            "source_types": _get_source_types(cached.sources),
+        },
+    )
+    yield _format_sse_event("token", {"content": cached.answer})
+
+    conversation.add_message("assistant", cached.answer)
+    yield _format_sse_event(
+        "done",
+        {
+            "conversation_id": conversation.conversation_id,
+            "response": cached.answer,
+        },
+    )
+
+
 # --- API endpoints ---
 
 
@@ -396,15 +839,19 @@ def _convert_to_chat_messages(conversation: Conversation) -> List[ChatMessage]:
 async def chat_message(
     chat_request: ChatRequest,
     request: Request,
+    response: Response,
     embedding_generator: EmbeddingGenerator = Depends(get_embedding_generator),
     vector_db: PineconeDB = Depends(get_vector_db),
     db_client: DbClient = Depends(get_db_client),
 ) -> ChatResponse:
     """Process a chat message and generate a response.
 
+    Per-stage timings are logged and returned in the ``Server-Timing`` header.
+
     Args:
         chat_request: Chat request model
         request: FastAPI request object for logging
+        response: FastAPI response object for the timing header
         embedding_generator: EmbeddingGenerator instance
         vector_db: PineconeDB instance
         db_client: Database client instance
@@ -412,80 +859,58 @@ async def chat_message(
     Returns:
         ChatResponse with assistant's response and conversation history
     """
+    timings = ChatTimings()
     try:
-        # Get client information for logging
-        client_ip, user_agent = get_client_info(request)
-        endpoint = "/api/chat/message"
-
-        # Validate chat message input
-        ValidationLogger.validate_text_query(
-            chat_request.message, endpoint, client_ip, user_agent
-        )
-        ValidationLogger.validate_session_id(
-            chat_request.conversation_id, endpoint, client_ip, user_agent
-        )
-        ValidationLogger.validate_landmark_id(
-            chat_request.landmark_id, endpoint, client_ip, user_agent
-        )
+        _validate_chat_request(chat_request, request, "/api/chat/message")
 
-        # Log successful validation
-        ValidationLogger.log_validation_success(
-            endpoint,
-            {
-                "message": chat_request.message,
-                "conversation_id": chat_request.conversation_id,
-                "landmark_id": chat_request.landmark_id,
-            },
-            client_ip,
-            user_agent,
+        turn = await _prepare_chat_turn(
+            chat_request, embedding_generator, vector_db, db_client, timings
         )
+        conversation = turn.conversation
+
+        if turn.cached:
+            assistant_response = turn.cached.answer
+        else:
+            # Generate response using OpenAI API
+            completion = await timings.measure(
+                "completion",
+                asyncio.to_thread(
+                    openai.chat.completions.create,
+                    model=CHAT_COMPLETION_MODEL,
+                    messages=turn.messages,
+                    temperature=CHAT_COMPLETION_TEMPERATURE,
+                    max_tokens=CHAT_COMPLETION_MAX_TOKENS,
+                ),
+            )
 
-        # Get or create conversation
-        conversation = _get_or_create_conversation(chat_request.conversation_id)
-
-        # Add user message to conversation
-        conversation.add_message("user", chat_request.message)
-
-        # Get relevant context from vector database
-        context_text, sources = _get_context_from_vector_db(
-            chat_request.message,
-            embedding_generator,
-            vector_db,
-            db_client,
-            chat_request.landmark_id,
-        )
+            # Extract response content
+            assistant_response = completion.choices[0].message.content or ""
 
-        # Prepare messages for chat completion API
-        messages = _prepare_chat_messages(conversation, context_text)
-
-        # Generate response using OpenAI API
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",  # Can be configured in settings
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1000,
-        )
-
-        # Extract response content
-        assistant_response = response.choices[0].message.content or ""
+            if turn.first_turn:
+                answer_cache.store(
+                    chat_request.message,
+                    turn.query_embedding,
+                    assistant_response,
+                    turn.sources,
+                    chat_request.landmark_id,
+                )
 
         # Add assistant response to conversation
         conversation.add_message("assistant", assistant_response)
 
-        # Convert conversation messages to ChatMessage objects
-        chat_messages = _convert_to_chat_messages(conversation)
-
-        # Extract source types for the response
-        source_types = list({source.get("source_type", "pdf") for source in sources})
+        timings.log(
+            "/api/chat/message", conversation.conversation_id, turn.cached is not None
+        )
+        response.headers["Server-Timing"] = timings.server_timing_header()
 
         # Create and return response
         return ChatResponse(
             conversation_id=conversation.conversation_id,
             response=assistant_response,
-            messages=chat_messages,
+            messages=_convert_to_chat_messages(conversation),
             landmark_id=chat_request.landmark_id,
-            sources=sources,
-            source_types=source_types,
+            sources=turn.sources,
+            source_types=_get_source_types(turn.sources),
         )
     except HTTPException:
         raise
@@ -494,6 +919,75 @@ async def chat_message(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/message/stream")  # type: ignore[misc]
+async def chat_message_stream(
+    chat_request: ChatRequest,
+    request: Request,
+    embedding_generator: EmbeddingGenerator = Depends(get_embedding_generator),
+    vector_db: PineconeDB = Depends(get_vector_db),
+    db_client: DbClient = Depends(get_db_client),
+) -> StreamingResponse:
+    """Process a chat message and stream the response over Server-Sent Events.
+
+    Retrieval runs before the response starts, so validation and retrieval
+    errors are still reported as regular HTTP errors. The stream then emits a
+    ``sources`` event, one ``token`` event per completion delta, and a final
+    ``done`` (or ``error``) event. Timings of the stages before the stream
+    starts are logged and returned in the ``Server-Timing`` header.
+
+    Args:
+        chat_request: Chat request model
+        request: FastAPI request object for logging
+        embedding_generator: EmbeddingGenerator instance
+        vector_db: PineconeDB instance
+        db_client: Database client instance
+
+    Returns:
+        StreamingResponse with ``text/event-stream`` content
+    """
+    timings = ChatTimings()
+    try:
+        _validate_chat_request(chat_request, request, "/api/chat/message/stream")
+
+        turn = await _prepare_chat_turn(
+            chat_request, embedding_generator, vector_db, db_client, timings
+        )
+
+        if turn.cached:
+            events = _stream_cached_answer(
+                turn.conversation, turn.cached, chat_request.landmark_id
+            )
+        else:
+            events = _stream_chat_completion(
+                turn.conversation,
+                turn.messages,
+                turn.sources,
+                chat_request.landmark_id,
+                question=chat_request.message if turn.first_turn else None,
+                query_embedding=turn.query_embedding,
+            )
+
+        timings.log(
+            "/api/chat/message/stream",
+            turn.conversation.conversation_id,
+            turn.cached is not None,
+        )
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+                "Server-Timing": timings.server_timing_header(),
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing streaming chat message: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/conversations/{conversation_id}", response_model=ConversationHistoryResponse)  # type: ignore[misc]
 async def get_conversation_history(conversation_id: str) -> ConversationHistoryResponse:
     """Get conversation history.
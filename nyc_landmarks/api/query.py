@@ -5,14 +5,16 @@ This module provides API endpoints for vector search and querying
 landmark information.
 """
 
+from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi import Query as QueryParam
 from fastapi import Request
 from fastapi.openapi.models import Example
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+from nyc_landmarks.config.settings import VectorDBBackend, settings
 from nyc_landmarks.db.db_client import DbClient
 from nyc_landmarks.embeddings.generator import EmbeddingGenerator
 from nyc_landmarks.examples.search_examples import (
@@ -22,7 +24,15 @@ from nyc_landmarks.examples.search_examples import (
 from nyc_landmarks.utils.correlation import get_correlation_id
 from nyc_landmarks.utils.logger import get_logger
 from nyc_landmarks.utils.validation import ValidationLogger, get_client_info
+from nyc_landmarks.vectordb.lexical_index import get_lexical_index
+from nyc_landmarks.vectordb.local_vector_db import get_local_vector_db
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+from nyc_landmarks.vectordb.read_replica import get_read_replica_db
+from nyc_landmarks.vectordb.reranking import (
+    DEFAULT_LAMBDA,
+    query_hybrid,
+    query_reranked,
+)
 
 # Configure logging
 logger = get_logger(__name__)
@@ -37,6 +47,13 @@ router = APIRouter(
 # --- Pydantic models for requests and responses ---
 
 
+class SearchMode(str, Enum):
+    """Retrieval modes of text search."""
+
+    DENSE = "dense"
+    HYBRID = "hybrid"  # Dense and BM25 rankings fused by reciprocal rank
+
+
 class TextQuery(BaseModel):
     """Text query for vector search."""
 
@@ -48,13 +65,56 @@ class TextQuery(BaseModel):
         None, description="Optional source type filter ('wikipedia' or 'pdf')"
     )
     top_k: int = Field(5, description="Number of results to return", ge=1, le=20)
+    mode: SearchMode = Field(
+        default=SearchMode.DENSE,
+        description=(
+            "Retrieval mode: 'dense' or 'hybrid' (dense + local BM25 fused by "
+            "rank, without MMR re-ranking)"
+        ),
+    )
+    rerank: bool = Field(
+        default=False,
+        description="Re-rank over-fetched results with maximal marginal relevance",
+    )
+    mmr_lambda: float = Field(
+        default=DEFAULT_LAMBDA,
+        description="Re-ranking weight of relevance against diversity (1.0 = relevance only)",
+        ge=0.0,
+        le=1.0,
+    )
+    max_per_landmark: Optional[int] = Field(
+        default=None,
+        description="Maximum results per landmark (enables re-ranking)",
+        ge=1,
+    )
+    max_per_document: Optional[int] = Field(
+        default=None,
+        description="Maximum results per source document (enables re-ranking)",
+        ge=1,
+    )
+
+    @field_validator("rerank", "mmr_lambda", mode="after")  # type: ignore[misc]
+    @classmethod
+    def validate_rerank_mode(cls, v: Any, info: ValidationInfo) -> Any:
+        """Reject MMR re-ranking options in hybrid mode, which fuses ranks."""
+        if info.data.get("mode") == SearchMode.HYBRID and (
+            info.field_name == "mmr_lambda" or v
+        ):
+            raise ValueError(f"{info.field_name} is not supported in hybrid mode")
+        return v
 
 
 class SearchResult(BaseModel):
     """Search result model."""
 
     text: str = Field(..., description="Text content of the search result")
-    score: float = Field(..., description="Similarity score")
+    score: float = Field(
+        ...,
+        description=(
+            "Relevance score: cosine similarity in dense mode, reciprocal rank "
+            "fusion score (sum of 1 / (k + rank)) in hybrid mode"
+        ),
+    )
     landmark_id: str = Field(..., description="ID of the landmark")
     landmark_name: Optional[str] = Field(None, description="Name of the landmark")
     source_type: str = Field("pdf", description="Source type ('wikipedia' or 'pdf')")
@@ -138,7 +198,11 @@ def get_embedding_generator() -> EmbeddingGenerator:
 
 
 def get_vector_db() -> PineconeDB:
-    """Get an instance of PineconeDB."""
+    """Get the vector database for the configured backend."""
+    if settings.VECTOR_DB_BACKEND == VectorDBBackend.LOCAL:
+        return get_local_vector_db()
+    if settings.VECTOR_DB_BACKEND == VectorDBBackend.REPLICA:
+        return get_read_replica_db()
     return PineconeDB()
 
 
@@ -255,8 +319,8 @@ async def search_text(
 
         # Query the vector database (only pass filter_dict if it has values)
         filter_to_use = filter_dict if filter_dict else None
-        matches = vector_db.query_vectors(
-            query_embedding, query.top_k, filter_to_use, correlation_id=correlation_id
+        matches = _retrieve(
+            query, query_embedding, filter_to_use, vector_db, correlation_id
         )
 
         # Get index information from vector_db
@@ -506,7 +570,7 @@ def _initialize_components(
     if embedding_generator is None:
         embedding_generator = EmbeddingGenerator()
     if vector_db is None:
-        vector_db = PineconeDB()
+        vector_db = get_vector_db()
     if db_client is None:
         from nyc_landmarks.db.db_client import get_db_client
 
@@ -673,12 +737,65 @@ def _generate_query_embedding(
     return embedding
 
 
+def _retrieve(
+    query: TextQuery,
+    embedding: List[float],
+    filter_dict: Optional[Dict[str, Any]],
+    vector_db: PineconeDB,
+    correlation_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the matches of a text query in its search mode.
+
+    Args:
+        query: Text query model
+        embedding: Query embedding vector
+        filter_dict: Optional filter dictionary
+        vector_db: PineconeDB instance
+        correlation_id: Optional correlation ID for request tracing
+
+    Returns:
+        List of raw vector search results
+    """
+    if query.mode == SearchMode.HYBRID:
+        # Pick up index generations saved by pipeline runs
+        lexical_index = get_lexical_index()
+        lexical_index.maybe_refresh(settings.LEXICAL_INDEX_REFRESH_INTERVAL)
+        return query_hybrid(
+            vector_db,
+            lexical_index,
+            query.query,
+            embedding,
+            query.top_k,
+            filter_dict,
+            rrf_k=settings.HYBRID_SEARCH_RRF_K,
+            max_per_landmark=query.max_per_landmark,
+            max_per_document=query.max_per_document,
+            correlation_id=correlation_id,
+        )
+    return _perform_vector_search(
+        embedding,
+        query.top_k,
+        filter_dict,
+        vector_db,
+        correlation_id=correlation_id,
+        rerank=query.rerank,
+        mmr_lambda=query.mmr_lambda,
+        max_per_landmark=query.max_per_landmark,
+        max_per_document=query.max_per_document,
+    )
+
+
 def _perform_vector_search(
     embedding: List[float],
     top_k: int,
     filter_dict: Optional[Dict[str, Any]],
     vector_db: PineconeDB,
     correlation_id: Optional[str] = None,
+    rerank: bool = False,
+    mmr_lambda: float = DEFAULT_LAMBDA,
+    max_per_landmark: Optional[int] = None,
+    max_per_document: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Perform vector search in the database.
@@ -689,10 +806,25 @@ def _perform_vector_search(
         filter_dict: Optional filter dictionary
         vector_db: PineconeDB instance
         correlation_id: Optional correlation ID for request tracing
+        rerank: Re-rank over-fetched results with maximal marginal relevance
+        mmr_lambda: Re-ranking weight of relevance against diversity
+        max_per_landmark: Maximum results per landmark (enables re-ranking)
+        max_per_document: Maximum results per source document (enables re-ranking)
 
     Returns:
         List of raw vector search results
     """
+    if rerank or max_per_landmark or max_per_document:
+        return query_reranked(
+            vector_db,
+            embedding,
+            top_k,
+            filter_dict,
+            lambda_mult=mmr_lambda,
+            max_per_landmark=max_per_landmark,
+            max_per_document=max_per_document,
+            correlation_id=correlation_id,
+        )
     return vector_db.query_vectors(
         query_vector=embedding,
         top_k=top_k,
@@ -726,6 +858,10 @@ def search_combined_sources(
     embedding_generator: Optional[EmbeddingGenerator] = None,
     vector_db: Optional[PineconeDB] = None,
     db_client: Optional[DbClient] = None,
+    rerank: bool = False,
+    mmr_lambda: float = DEFAULT_LAMBDA,
+    max_per_landmark: Optional[int] = None,
+    max_per_document: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for information about landmarks using vector similarity across both Wikipedia and PDF sources.
@@ -741,6 +877,10 @@ def search_combined_sources(
         embedding_generator: Optional EmbeddingGenerator instance
         vector_db: Optional PineconeDB instance
         db_client: Optional DbClient instance
+        rerank: Re-rank over-fetched results with maximal marginal relevance
+        mmr_lambda: Re-ranking weight of relevance against diversity
+        max_per_landmark: Maximum results per landmark (enables re-ranking)
+        max_per_document: Maximum results per source document (enables re-ranking)
 
     Returns:
         List of search results with metadata and source attribution
@@ -758,7 +898,15 @@ def search_combined_sources(
     # Build filter dictionary and query the vector database
     filter_dict = _build_search_filter(landmark_id, source_type)
     matches = _perform_vector_search(
-        embedding, top_k, filter_dict, vector_db, correlation_id
+        embedding,
+        top_k,
+        filter_dict,
+        vector_db,
+        correlation_id,
+        rerank=rerank,
+        mmr_lambda=mmr_lambda,
+        max_per_landmark=max_per_landmark,
+        max_per_document=max_per_document,
     )
 
     # Enhance results with source attribution and additional information
@@ -0,0 +1,266 @@
+"""
+Semantic answer cache for the chat API.
+
+First-turn chat questions are often near-duplicates of earlier ones ("When
+was the Chrysler Building designated?"). This module keeps the embeddings of
+previously answered first-turn questions in a small in-process vector index,
+partitioned by the ``landmark_id`` filter of the request, so a close enough
+question can reuse the earlier answer and sources instead of paying for a
+vector query and a completion.
+
+Entries expire after a TTL and are invalidated when the vectors of a
+landmark they depend on change (see
+``nyc_landmarks.vectordb.pinecone_db.register_vector_change_listener``).
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.utils.logger import get_logger
+
+# Configure logging
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedAnswer:
+    """An answer to a first-turn question kept for reuse."""
+
+    question: str
+    answer: str
+    sources: List[Dict[str, Any]]
+    landmark_id: Optional[str]
+    landmark_ids: FrozenSet[str]
+    created_at: float = field(default_factory=time.time)
+
+
+class _Partition:
+    """Question embeddings cached for one ``landmark_id`` filter."""
+
+    def __init__(self) -> None:
+        self.vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._keys: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def add(self, key: str, vector: np.ndarray) -> None:
+        self.vectors[key] = vector
+        self._matrix = None
+
+    def remove(self, key: str) -> None:
+        if self.vectors.pop(key, None) is not None:
+            self._matrix = None
+
+    def best_match(self, query: np.ndarray) -> Optional[Tuple[str, float]]:
+        """Return the key and cosine similarity of the closest question."""
+        if not self.vectors:
+            return None
+        if self._matrix is None:
+            self._keys = list(self.vectors)
+            self._matrix = np.vstack([self.vectors[key] for key in self._keys])
+        scores = self._matrix @ query
+        best = int(np.argmax(scores))
+        return self._keys[best], float(scores[best])
+
+
+class SemanticAnswerCache:
+    """Bounded cache of chat answers looked up by question similarity."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ):
+        """Initialize the answer cache.
+
+        Args:
+            enabled: Whether lookups and stores are performed (default: from settings)
+            threshold: Minimum cosine similarity for a hit (default: from settings)
+            max_entries: Maximum cached answers (default: from settings)
+            ttl: Seconds a cached answer stays valid (default: from settings)
+        """
+        self.enabled = (
+            enabled if enabled is not None else settings.CHAT_ANSWER_CACHE_ENABLED
+        )
+        self.threshold = (
+            threshold if threshold is not None else settings.CHAT_ANSWER_CACHE_THRESHOLD
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else settings.CHAT_ANSWER_CACHE_MAX_ENTRIES
+        )
+        self.ttl = ttl if ttl is not None else settings.CHAT_ANSWER_CACHE_TTL
+
+        self._entries: "OrderedDict[str, CachedAnswer]" = OrderedDict()
+        self._partitions: Dict[Optional[str], _Partition] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        partition = self._partitions.get(entry.landmark_id)
+        if partition is not None:
+            partition.remove(key)
+            if not partition.vectors:
+                del self._partitions[entry.landmark_id]
+
+    def lookup(
+        self, embedding: List[float], landmark_id: Optional[str] = None
+    ) -> Optional[CachedAnswer]:
+        """Find a cached answer to a similar question with the same filter.
+
+        Args:
+            embedding: Embedding of the new question
+            landmark_id: Landmark ID filter of the request, if any
+
+        Returns:
+            The cached answer, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        query = self._normalize(embedding)
+        with self._lock:
+            partition = self._partitions.get(landmark_id)
+            match = (
+                partition.best_match(query)
+                if partition is not None and query is not None
+                else None
+            )
+            if match is None:
+                self._misses += 1
+                return None
+
+            key, score = match
+            entry = self._entries[key]
+            if time.time() - entry.created_at > self.ttl:
+                self._remove(key)
+                self._misses += 1
+                return None
+            if score < self.threshold:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        logger.info(
+            f"Answer cache hit (similarity {score:.3f}) for landmark filter "
+            f"{landmark_id}: {entry.question!r}"
+        )
+        return entry
+
+    def store(
+        self,
+        question: str,
+        embedding: List[float],
+        answer: str,
+        sources: List[Dict[str, Any]],
+        landmark_id: Optional[str] = None,
+    ) -> None:
+        """Cache the answer to a first-turn question.
+
+        Args:
+            question: The question that was answered
+            embedding: Embedding of the question
+            answer: Assistant response
+            sources: Sources returned with the response
+            landmark_id: Landmark ID filter of the request, if any
+        """
+        if not self.enabled or not answer:
+            return
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        # Landmarks whose vector changes make this answer stale
+        landmark_ids = {
+            str(source["landmark_id"])
+            for source in sources
+            if source.get("landmark_id")
+        }
+        if landmark_id:
+            landmark_ids.add(landmark_id)
+
+        entry = CachedAnswer(
+            question=question,
+            answer=answer,
+            sources=sources,
+            landmark_id=landmark_id,
+            landmark_ids=frozenset(landmark_ids),
+        )
+        key = uuid.uuid4().hex
+        with self._lock:
+            self._entries[key] = entry
+            self._partitions.setdefault(landmark_id, _Partition()).add(key, vector)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_landmark(self, landmark_id: Optional[str] = None) -> int:
+        """Drop cached answers that depend on a landmark's vectors.
+
+        Args:
+            landmark_id: Landmark whose vectors changed, or None if unknown
+                (drops every entry)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if landmark_id is None:
+                stale = list(self._entries)
+            else:
+                stale = [
+                    key
+                    for key, entry in self._entries.items()
+                    if landmark_id in entry.landmark_ids
+                ]
+            for key in stale:
+                self._remove(key)
+            self._invalidations += len(stale)
+
+        if stale:
+            logger.info(
+                f"Invalidated {len(stale)} cached answers for landmark "
+                f"{landmark_id or '(all)'}"
+            )
+        return len(stale)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary of cache metrics
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
@@ -0,0 +1,232 @@
+"""
+Token-budgeted prompt context assembly for the chat API.
+
+Retrieved chunks and conversation history are measured with the same
+tiktoken encoder used by ``TextChunker`` so prompt size is predictable:
+
+- Retrieved chunks are added in score order until the context budget is
+  used. Text that overlaps an already selected chunk from the same
+  landmark document (``TextChunker`` windows overlap by ``CHUNK_OVERLAP``
+  tokens) is removed, and exact duplicates are dropped.
+- Conversation history is filled newest first until the history budget is
+  used, so the oldest messages are trimmed first.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import tiktoken
+
+from nyc_landmarks.chunking import get_tokenizer
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.reranking import document_key
+
+# Configure logging
+logger = get_logger(__name__)
+
+# Marker appended to text that was cut to fit a budget
+TRUNCATION_MARKER = " [...]"
+
+
+@dataclass
+class ContextChunk:
+    """A retrieved chunk selected for the prompt context."""
+
+    text: str
+    score: float
+    metadata: Dict[str, Any]
+    token_count: int
+
+
+class ContextBuilder:
+    """Assemble chat prompt context within fixed token budgets."""
+
+    def __init__(
+        self,
+        context_token_budget: Optional[int] = None,
+        history_token_budget: Optional[int] = None,
+        min_score: Optional[float] = None,
+        min_overlap_chars: int = 64,
+        min_fragment_tokens: int = 50,
+    ):
+        """Initialize the context builder.
+
+        Args:
+            context_token_budget: Maximum tokens of retrieved context
+                (default: from settings)
+            history_token_budget: Maximum tokens of conversation history
+                (default: from settings)
+            min_score: Minimum similarity score for a chunk to be used
+                (default: from settings)
+            min_overlap_chars: Minimum shared characters treated as chunk overlap
+            min_fragment_tokens: Smallest truncated chunk or message worth keeping
+        """
+        self.context_token_budget = (
+            context_token_budget
+            if context_token_budget is not None
+            else settings.CHAT_CONTEXT_TOKEN_BUDGET
+        )
+        self.history_token_budget = (
+            history_token_budget
+            if history_token_budget is not None
+            else settings.CHAT_HISTORY_TOKEN_BUDGET
+        )
+        self.min_score = (
+            min_score if min_score is not None else settings.CHAT_CONTEXT_MIN_SCORE
+        )
+        self.min_overlap_chars = min_overlap_chars
+        self.min_fragment_tokens = min_fragment_tokens
+
+    @property
+    def tokenizer(self) -> tiktoken.Encoding:
+        """Shared tiktoken encoder (loaded on first use)."""
+        return get_tokenizer()
+
+    def count_tokens(self, text: str) -> int:
+        """Count the number of tokens in a text.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Token count
+        """
+        return len(self.tokenizer.encode(text))
+
+    def _truncate(self, tokens: List[int], max_tokens: int) -> Tuple[str, List[int]]:
+        """Cut tokens to ``max_tokens`` (including the truncation marker)."""
+        marker_tokens = self.tokenizer.encode(TRUNCATION_MARKER)
+        kept = tokens[: max(max_tokens - len(marker_tokens), 0)] + marker_tokens
+        return self.tokenizer.decode(kept), kept
+
+    @staticmethod
+    def _document_key(metadata: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Key identifying the source document a chunk was cut from."""
+        return document_key(metadata)
+
+    def _overlap_start(self, head: str, tail: str) -> int:
+        """Position in ``head`` where a suffix equal to a prefix of ``tail`` starts.
+
+        Returns ``len(head)`` when the texts don't overlap by at least
+        ``min_overlap_chars`` characters.
+        """
+        probe = tail[: self.min_overlap_chars]
+        if len(probe) < self.min_overlap_chars:
+            return len(head)
+
+        position = head.find(probe)
+        while position != -1:
+            if tail.startswith(head[position:]):
+                return position
+            position = head.find(probe, position + 1)
+        return len(head)
+
+    def _remove_overlap(self, text: str, selected: List[ContextChunk]) -> str:
+        """Strip text shared with adjacent chunks that were already selected."""
+        for chunk in selected:
+            if text in chunk.text:
+                return ""
+            # Selected chunk precedes this one: drop the shared prefix
+            start = self._overlap_start(chunk.text, text)
+            text = text[len(chunk.text) - start :]
+            # Selected chunk follows this one: drop the shared suffix
+            text = text[: self._overlap_start(text, chunk.text)]
+        return text
+
+    def select_context(
+        self, matches: Sequence[Tuple[Dict[str, Any], float]]
+    ) -> List[ContextChunk]:
+        """Select retrieved chunks for the prompt within the context budget.
+
+        Args:
+            matches: (metadata, score) pairs from the vector search
+
+        Returns:
+            Selected chunks in descending score order
+        """
+        candidates = sorted(
+            (m for m in matches if m[1] >= self.min_score),
+            key=lambda m: m[1],
+            reverse=True,
+        )
+
+        selected: List[ContextChunk] = []
+        by_document: Dict[Tuple[str, str, str], List[ContextChunk]] = {}
+        seen_texts = set()
+        remaining = self.context_token_budget
+        skipped = 0
+
+        for metadata, score in candidates:
+            text = metadata.get("text", "")
+            if not text or text in seen_texts:
+                skipped += 1
+                continue
+            seen_texts.add(text)
+
+            document_key = self._document_key(metadata)
+            siblings = by_document.get(document_key, [])
+            if siblings:
+                text = self._remove_overlap(text, siblings).strip()
+                if len(text) < self.min_overlap_chars:
+                    skipped += 1
+                    continue
+
+            tokens = self.tokenizer.encode(text)
+            if len(tokens) > remaining:
+                if remaining < self.min_fragment_tokens:
+                    skipped += 1
+                    continue
+                text, tokens = self._truncate(tokens, remaining)
+
+            chunk = ContextChunk(
+                text=text, score=score, metadata=metadata, token_count=len(tokens)
+            )
+            selected.append(chunk)
+            by_document.setdefault(document_key, []).append(chunk)
+            remaining -= chunk.token_count
+
+        logger.debug(
+            f"Selected {len(selected)} context chunks "
+            f"({self.context_token_budget - remaining} tokens, {skipped} skipped)"
+        )
+        return selected
+
+    def fit_history(self, messages: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the most recent messages that fit within the history budget.
+
+        Messages are considered newest first. The oldest message that only
+        partially fits is truncated; anything older is dropped. The newest
+        message is always kept, truncated if needed.
+
+        Args:
+            messages: Conversation messages in chronological order
+
+        Returns:
+            Messages to include in the prompt, in chronological order
+        """
+        fitted: List[Dict[str, Any]] = []
+        remaining = self.history_token_budget
+
+        for position, message in enumerate(reversed(messages)):
+            tokens = self.tokenizer.encode(message.get("content", ""))
+            if len(tokens) <= remaining:
+                fitted.append(message)
+                remaining -= len(tokens)
+                continue
+
+            if position == 0 or remaining >= self.min_fragment_tokens:
+                content, kept = self._truncate(
+                    tokens, max(remaining, self.min_fragment_tokens)
+                )
+                fitted.append({**message, "content": content})
+                remaining -= len(kept)
+            break
+
+        fitted.reverse()
+        if len(fitted) < len(messages):
+            logger.debug(
+                f"Trimmed conversation history from {len(messages)} "
+                f"to {len(fitted)} messages"
+            )
+        return fitted
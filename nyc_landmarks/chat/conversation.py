@@ -3,13 +3,37 @@ Conversation memory module for NYC Landmarks Vector Database.
 
 This module handles the storage and retrieval of conversation history
 for the chatbot functionality.
+
+``ConversationStore`` defines the storage backend interface. Two
+implementations are provided:
+
+- ``InMemoryConversationStore``: per-process LRU store (the default)
+- ``SQLiteConversationStore``: SQLite database in WAL mode that can be
+  shared by several workers on the same host
+
+The backend is selected with the ``CONVERSATION_BACKEND`` setting. Other
+backends (e.g. a networked key-value store) only need to implement the
+``ConversationStore`` interface.
+
+Stores are bounded: they hold at most ``CONVERSATION_MAX_COUNT``
+conversations (least recently used ones are evicted first), each
+conversation keeps at most ``CONVERSATION_MAX_MESSAGES`` messages, and
+expired conversations are removed by a periodic background sweeper
+started from the application lifespan.
 """
 
+import asyncio
+import json
+import os
+import sqlite3
+import threading
 import time
 import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
-from nyc_landmarks.config.settings import settings
+from nyc_landmarks.config.settings import ConversationBackend, settings
 from nyc_landmarks.utils.logger import get_logger
 
 # Configure logging
@@ -19,38 +43,75 @@ logger = get_logger(__name__)
 class Conversation:
     """Model for a conversation with the chatbot."""
 
-    def __init__(self, conversation_id: Optional[str] = None):
+    def __init__(
+        self,
+        conversation_id: Optional[str] = None,
+        max_messages: Optional[int] = None,
+        store: Optional["ConversationStore"] = None,
+    ):
         """Initialize a conversation.
 
         Args:
             conversation_id: ID for the conversation (generated if not provided)
+            max_messages: Maximum number of messages to retain (unbounded if None)
+            store: Store that new messages are persisted to (optional)
         """
         self.conversation_id = conversation_id if conversation_id else str(uuid.uuid4())
         self.messages: List[Dict[str, Any]] = []
+        self.max_messages = max_messages
         self.created_at = time.time()
         self.updated_at = time.time()
+        self._store = store
+        self._lock = threading.Lock()
 
     def add_message(
         self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Add a message to the conversation.
 
+        When the conversation exceeds ``max_messages``, the oldest non-system
+        messages are dropped so the system prompt is always retained. If the
+        conversation belongs to a persistent store, the message is appended
+        to the store as well.
+
         Args:
             role: Role of the message sender (user, assistant, system)
             content: Content of the message
             metadata: Additional metadata for the message
         """
-        message = {
+        timestamp = time.time()
+        message: Dict[str, Any] = {
             "role": role,
             "content": content,
-            "timestamp": time.time(),
+            "timestamp": timestamp,
         }
 
         if metadata:
             message["metadata"] = metadata
 
-        self.messages.append(message)
-        self.updated_at = time.time()
+        with self._lock:
+            self.messages.append(message)
+            self._trim_messages()
+            self.updated_at = timestamp
+            if self._store is not None:
+                self._store.append_message(self.conversation_id, message)
+
+    def _trim_messages(self) -> None:
+        """Drop the oldest non-system messages beyond ``max_messages``."""
+        if not self.max_messages:
+            return
+
+        excess = len(self.messages) - self.max_messages
+        if excess <= 0:
+            return
+
+        retained: List[Dict[str, Any]] = []
+        for message in self.messages:
+            if excess > 0 and message["role"] != "system":
+                excess -= 1
+                continue
+            retained.append(message)
+        self.messages = retained
 
     def get_messages(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get messages from the conversation.
@@ -61,9 +122,10 @@ class Conversation:
         Returns:
             List of messages
         """
-        if limit:
-            return self.messages[-limit:]
-        return self.messages
+        with self._lock:
+            if limit:
+                return self.messages[-limit:]
+            return list(self.messages)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert conversation to dictionary.
@@ -95,50 +157,250 @@ class Conversation:
         return conversation
 
 
-class ConversationStore:
-    """In-memory store for conversation history."""
+class ConversationStore(ABC):
+    """Interface for conversation storage backends.
+
+    Implementations must be safe to share between request handlers running
+    on the event loop and in the threadpool.
+    """
+
+    def __init__(
+        self,
+        max_conversations: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Initialize the store limits.
+
+        Args:
+            max_conversations: Maximum number of conversations to keep
+                (default: from settings)
+            max_messages: Maximum number of messages per conversation
+                (default: from settings)
+            ttl: Time to live in seconds (default: from settings)
+        """
+        self.ttl = ttl if ttl is not None else settings.CONVERSATION_TTL
+        self.max_conversations = (
+            max_conversations
+            if max_conversations is not None
+            else settings.CONVERSATION_MAX_COUNT
+        )
+        self.max_messages = (
+            max_messages
+            if max_messages is not None
+            else settings.CONVERSATION_MAX_MESSAGES
+        )
+        self._cleanup_task: Optional["asyncio.Task[None]"] = None
+
+    def _is_expired(self, updated_at: float, now: float) -> bool:
+        """Check whether a conversation last updated at ``updated_at`` expired."""
+        return now - updated_at > self.ttl
+
+    @abstractmethod
+    def create_conversation(self) -> Conversation:
+        """Create a new conversation.
+
+        Returns:
+            New conversation instance
+        """
+
+    @abstractmethod
+    def get_conversation(
+        self, conversation_id: str, message_limit: Optional[int] = None
+    ) -> Optional[Conversation]:
+        """Get a conversation by ID.
+
+        Args:
+            conversation_id: ID of the conversation
+            message_limit: Only load the most recent N messages (all if None)
+
+        Returns:
+            Conversation instance, or None if not found or expired
+        """
+
+    @abstractmethod
+    def append_message(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """Persist a message added to a conversation.
+
+        Args:
+            conversation_id: ID of the conversation
+            message: Message dictionary created by Conversation.add_message
+        """
+
+    @abstractmethod
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation.
+
+        Args:
+            conversation_id: ID of the conversation
+
+        Returns:
+            True if deleted, False if not found
+        """
+
+    @abstractmethod
+    def cleanup_expired(self) -> int:
+        """Clean up expired conversations.
+
+        Returns:
+            Number of conversations deleted
+        """
+
+    @abstractmethod
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get size and eviction metrics for the store.
+
+        Returns:
+            Dictionary with current size, configured limits and counters
+        """
+
+    async def _run_cleanup_loop(self, interval: float) -> None:
+        """Periodically remove expired conversations until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Run in a worker thread so database backends don't block the loop
+                await asyncio.to_thread(self.cleanup_expired)
+            except Exception as e:
+                logger.error(f"Error cleaning up expired conversations: {e}")
 
-    def __init__(self) -> None:
-        """Initialize the conversation store."""
-        self.conversations: Dict[str, Conversation] = {}
-        self.ttl = settings.CONVERSATION_TTL  # Time to live in seconds
+    def start_cleanup_task(self, interval: Optional[float] = None) -> None:
+        """Start the background sweeper on the running event loop.
+
+        Args:
+            interval: Seconds between sweeps (default: from settings)
+        """
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+
+        sweep_interval = (
+            interval if interval is not None else settings.CONVERSATION_CLEANUP_INTERVAL
+        )
+        self._cleanup_task = asyncio.get_running_loop().create_task(
+            self._run_cleanup_loop(sweep_interval)
+        )
+        logger.info(
+            f"Started conversation cleanup task with {sweep_interval}s interval"
+        )
+
+    async def stop_cleanup_task(self) -> None:
+        """Cancel the background sweeper and wait for it to finish."""
+        if self._cleanup_task is None:
+            return
+
+        self._cleanup_task.cancel()
+        try:
+            await self._cleanup_task
+        except asyncio.CancelledError:
+            pass
+        self._cleanup_task = None
+        logger.info("Stopped conversation cleanup task")
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Bounded in-memory store for conversation history.
+
+    Conversations are kept in least-recently-used order and are only visible
+    to the process that created them.
+    """
+
+    def __init__(
+        self,
+        max_conversations: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Initialize the conversation store.
+
+        Args:
+            max_conversations: Maximum number of conversations to keep
+                (default: from settings)
+            max_messages: Maximum number of messages per conversation
+                (default: from settings)
+            ttl: Time to live in seconds (default: from settings)
+        """
+        super().__init__(max_conversations, max_messages, ttl)
+        self.conversations: "OrderedDict[str, Conversation]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters exposed through get_metrics()
+        self.created_count = 0
+        self.eviction_count = 0
+        self.expired_count = 0
 
     def create_conversation(self) -> Conversation:
         """Create a new conversation.
 
+        Evicts the least recently used conversations if the store is full.
+
         Returns:
             New conversation instance
         """
-        conversation = Conversation()
-        self.conversations[conversation.conversation_id] = conversation
+        conversation = Conversation(max_messages=self.max_messages)
+
+        with self._lock:
+            self.conversations[conversation.conversation_id] = conversation
+            self.created_count += 1
+
+            evicted_ids = []
+            while len(self.conversations) > self.max_conversations:
+                evicted_id, _ = self.conversations.popitem(last=False)
+                evicted_ids.append(evicted_id)
+            self.eviction_count += len(evicted_ids)
+
+        if evicted_ids:
+            logger.info(
+                f"Evicted {len(evicted_ids)} least recently used conversations",
+                extra={
+                    "evicted_count": len(evicted_ids),
+                    "store_size": len(self.conversations),
+                    "operation": "conversation_eviction",
+                },
+            )
 
         logger.info(f"Created conversation: {conversation.conversation_id}")
         return conversation
 
-    def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
+    def get_conversation(
+        self, conversation_id: str, message_limit: Optional[int] = None
+    ) -> Optional[Conversation]:
         """Get a conversation by ID.
 
+        The in-memory store returns the live conversation object, so
+        ``message_limit`` does not apply.
+
         Args:
             conversation_id: ID of the conversation
+            message_limit: Ignored by the in-memory store
 
         Returns:
             Conversation instance, or None if not found
         """
-        # Check if conversation exists
-        conversation = self.conversations.get(conversation_id)
+        with self._lock:
+            # Check if conversation exists
+            conversation = self.conversations.get(conversation_id)
+
+            if conversation is not None and self._is_expired(
+                conversation.updated_at, time.time()
+            ):
+                del self.conversations[conversation_id]
+                self.expired_count += 1
+                logger.info(f"Conversation expired: {conversation_id}")
+                return None
+
+            if conversation is not None:
+                # Mark as most recently used
+                self.conversations.move_to_end(conversation_id)
 
         if not conversation:
             logger.warning(f"Conversation not found: {conversation_id}")
             return None
 
-        # Check if conversation has expired
-        if time.time() - conversation.updated_at > self.ttl:
-            logger.info(f"Conversation expired: {conversation_id}")
-            del self.conversations[conversation_id]
-            return None
-
         return conversation
 
+    def append_message(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """No-op: in-memory conversations are their own storage."""
+
     def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation.
 
@@ -148,8 +410,10 @@ class ConversationStore:
         Returns:
             True if deleted, False if not found
         """
-        if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
+        with self._lock:
+            deleted = self.conversations.pop(conversation_id, None) is not None
+
+        if deleted:
             logger.info(f"Deleted conversation: {conversation_id}")
             return True
 
@@ -163,20 +427,382 @@ class ConversationStore:
             Number of conversations deleted
         """
         current_time = time.time()
-        expired_ids = [
-            conv_id
-            for conv_id, conv in self.conversations.items()
-            if current_time - conv.updated_at > self.ttl
-        ]
+        with self._lock:
+            expired_ids = [
+                conv_id
+                for conv_id, conv in self.conversations.items()
+                if self._is_expired(conv.updated_at, current_time)
+            ]
 
-        for conv_id in expired_ids:
-            del self.conversations[conv_id]
+            for conv_id in expired_ids:
+                del self.conversations[conv_id]
+            self.expired_count += len(expired_ids)
 
         if expired_ids:
             logger.info(f"Cleaned up {len(expired_ids)} expired conversations")
 
         return len(expired_ids)
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get size and eviction metrics for the store.
+
+        Returns:
+            Dictionary with current size, configured limits and counters
+        """
+        with self._lock:
+            return {
+                "backend": ConversationBackend.MEMORY.value,
+                "size": len(self.conversations),
+                "max_conversations": self.max_conversations,
+                "max_messages": self.max_messages,
+                "created": self.created_count,
+                "evictions": self.eviction_count,
+                "expirations": self.expired_count,
+            }
+
+
+class SQLiteConversationStore(ConversationStore):
+    """SQLite-backed conversation store shared across worker processes.
+
+    The database runs in WAL mode so readers in one worker don't block writes
+    in another. Messages are stored one row each: appending a message is a
+    single insert, and loading a conversation reads only the most recent
+    ``message_limit`` rows. Each thread uses its own connection.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS conversations (
+            conversation_id TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_conversations_updated_at
+            ON conversations (updated_at);
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            conversation_id TEXT NOT NULL,
+            role TEXT NOT NULL,
+            content TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            metadata TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation
+            ON messages (conversation_id, id);
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_conversations: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Initialize the conversation store and create the schema.
+
+        Args:
+            db_path: Path to the SQLite database file (default: from settings)
+            max_conversations: Maximum number of conversations to keep
+                (default: from settings)
+            max_messages: Maximum number of messages per conversation
+                (default: from settings)
+            ttl: Time to live in seconds (default: from settings)
+        """
+        super().__init__(max_conversations, max_messages, ttl)
+        self.db_path = db_path or settings.CONVERSATION_DB_PATH
+        self._local = threading.local()
+
+        # Counters exposed through get_metrics() (per process)
+        self._lock = threading.Lock()
+        self.created_count = 0
+        self.eviction_count = 0
+        self.expired_count = 0
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(self._SCHEMA)
+        logger.info(f"Initialized SQLite conversation store: {self.db_path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the SQLite connection for the current thread."""
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = sqlite3.connect(
+                self.db_path, timeout=30.0, isolation_level=None
+            )
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _delete_conversations(
+        self, connection: sqlite3.Connection, conversation_ids: List[str]
+    ) -> None:
+        """Delete conversations and their messages inside a transaction."""
+        connection.executemany(
+            "DELETE FROM messages WHERE conversation_id = ?",
+            [(conv_id,) for conv_id in conversation_ids],
+        )
+        connection.executemany(
+            "DELETE FROM conversations WHERE conversation_id = ?",
+            [(conv_id,) for conv_id in conversation_ids],
+        )
+
+    def create_conversation(self) -> Conversation:
+        """Create a new conversation.
+
+        Evicts the least recently used conversations if the store is full.
+
+        Returns:
+            New conversation instance
+        """
+        conversation = Conversation(max_messages=self.max_messages, store=self)
+        connection = self._connection()
+
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT INTO conversations (conversation_id, created_at, updated_at) "
+                "VALUES (?, ?, ?)",
+                (
+                    conversation.conversation_id,
+                    conversation.created_at,
+                    conversation.updated_at,
+                ),
+            )
+            (size,) = connection.execute(
+                "SELECT COUNT(*) FROM conversations"
+            ).fetchone()
+            evicted_ids: List[str] = []
+            if size > self.max_conversations:
+                evicted_ids = [
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT conversation_id FROM conversations "
+                        "ORDER BY updated_at ASC LIMIT ?",
+                        (size - self.max_conversations,),
+                    )
+                ]
+                self._delete_conversations(connection, evicted_ids)
+
+        with self._lock:
+            self.created_count += 1
+            self.eviction_count += len(evicted_ids)
+        if evicted_ids:
+            logger.info(
+                f"Evicted {len(evicted_ids)} least recently used conversations",
+                extra={
+                    "evicted_count": len(evicted_ids),
+                    "operation": "conversation_eviction",
+                },
+            )
+
+        logger.info(f"Created conversation: {conversation.conversation_id}")
+        return conversation
+
+    def get_conversation(
+        self, conversation_id: str, message_limit: Optional[int] = None
+    ) -> Optional[Conversation]:
+        """Get a conversation by ID.
+
+        Args:
+            conversation_id: ID of the conversation
+            message_limit: Only load the most recent N messages (all if None)
+
+        Returns:
+            Conversation instance, or None if not found or expired
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT created_at, updated_at FROM conversations "
+            "WHERE conversation_id = ?",
+            (conversation_id,),
+        ).fetchone()
+
+        if row is None:
+            logger.warning(f"Conversation not found: {conversation_id}")
+            return None
+
+        created_at, updated_at = row
+        if self._is_expired(updated_at, time.time()):
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                self._delete_conversations(connection, [conversation_id])
+            with self._lock:
+                self.expired_count += 1
+            logger.info(f"Conversation expired: {conversation_id}")
+            return None
+
+        limit = message_limit if message_limit else -1
+        rows = connection.execute(
+            "SELECT role, content, timestamp, metadata FROM messages "
+            "WHERE conversation_id = ? ORDER BY id DESC LIMIT ?",
+            (conversation_id, limit),
+        ).fetchall()
+
+        messages: List[Dict[str, Any]] = []
+        for role, content, timestamp, metadata in reversed(rows):
+            message: Dict[str, Any] = {
+                "role": role,
+                "content": content,
+                "timestamp": timestamp,
+            }
+            if metadata:
+                message["metadata"] = json.loads(metadata)
+            messages.append(message)
+
+        conversation = Conversation(
+            conversation_id=conversation_id,
+            max_messages=self.max_messages,
+            store=self,
+        )
+        conversation.messages = messages
+        conversation.created_at = created_at
+        conversation.updated_at = updated_at
+        return conversation
+
+    def append_message(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """Insert a message row and trim the conversation to ``max_messages``.
+
+        Args:
+            conversation_id: ID of the conversation
+            message: Message dictionary created by Conversation.add_message
+        """
+        metadata = message.get("metadata")
+        connection = self._connection()
+
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT INTO messages "
+                "(conversation_id, role, content, timestamp, metadata) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    conversation_id,
+                    message["role"],
+                    message["content"],
+                    message["timestamp"],
+                    json.dumps(metadata) if metadata else None,
+                ),
+            )
+            connection.execute(
+                "UPDATE conversations SET updated_at = ? WHERE conversation_id = ?",
+                (message["timestamp"], conversation_id),
+            )
+            if self.max_messages:
+                # Drop the oldest non-system messages beyond the cap
+                keep = self._max_non_system_messages(connection, conversation_id)
+                connection.execute(
+                    "DELETE FROM messages WHERE id IN ("
+                    "  SELECT id FROM messages"
+                    "  WHERE conversation_id = ? AND role != 'system'"
+                    "  ORDER BY id DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (conversation_id, keep),
+                )
+
+    def _max_non_system_messages(
+        self, connection: sqlite3.Connection, conversation_id: str
+    ) -> int:
+        """Number of non-system messages that fit within ``max_messages``."""
+        (system_count,) = connection.execute(
+            "SELECT COUNT(*) FROM messages "
+            "WHERE conversation_id = ? AND role = 'system'",
+            (conversation_id,),
+        ).fetchone()
+        return max(int(self.max_messages) - int(system_count), 0)
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation.
+
+        Args:
+            conversation_id: ID of the conversation
+
+        Returns:
+            True if deleted, False if not found
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            deleted = (
+                connection.execute(
+                    "SELECT 1 FROM conversations WHERE conversation_id = ?",
+                    (conversation_id,),
+                ).fetchone()
+                is not None
+            )
+            self._delete_conversations(connection, [conversation_id])
+
+        if deleted:
+            logger.info(f"Deleted conversation: {conversation_id}")
+            return True
+
+        logger.warning(f"Conversation not found for deletion: {conversation_id}")
+        return False
+
+    def cleanup_expired(self) -> int:
+        """Clean up expired conversations.
+
+        Returns:
+            Number of conversations deleted
+        """
+        cutoff = time.time() - self.ttl
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            expired_ids = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT conversation_id FROM conversations WHERE updated_at < ?",
+                    (cutoff,),
+                )
+            ]
+            self._delete_conversations(connection, expired_ids)
+
+        with self._lock:
+            self.expired_count += len(expired_ids)
+        if expired_ids:
+            logger.info(f"Cleaned up {len(expired_ids)} expired conversations")
+
+        return len(expired_ids)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get size and eviction metrics for the store.
+
+        The size reflects the shared database; counters are per process.
+
+        Returns:
+            Dictionary with current size, configured limits and counters
+        """
+        (size,) = (
+            self._connection().execute("SELECT COUNT(*) FROM conversations").fetchone()
+        )
+        with self._lock:
+            return {
+                "backend": ConversationBackend.SQLITE.value,
+                "size": size,
+                "max_conversations": self.max_conversations,
+                "max_messages": self.max_messages,
+                "created": self.created_count,
+                "evictions": self.eviction_count,
+                "expirations": self.expired_count,
+            }
+
+
+def create_conversation_store() -> ConversationStore:
+    """Create the conversation store configured by ``CONVERSATION_BACKEND``.
+
+    Returns:
+        ConversationStore implementation
+    """
+    if settings.CONVERSATION_BACKEND == ConversationBackend.SQLITE:
+        return SQLiteConversationStore()
+    return InMemoryConversationStore()
+
 
 # Create a global instance of the conversation store
-conversation_store = ConversationStore()
+conversation_store = create_conversation_store()
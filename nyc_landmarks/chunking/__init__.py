@@ -0,0 +1,12 @@
+"""Text chunking shared by the PDF and Wikipedia pipelines."""
+
+from nyc_landmarks.config.settings import ChunkStrategy
+
+from .engine import Chunk, ChunkingEngine, get_tokenizer
+
+__all__ = [
+    "Chunk",
+    "ChunkingEngine",
+    "ChunkStrategy",
+    "get_tokenizer",
+]
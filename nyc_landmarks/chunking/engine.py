@@ -0,0 +1,300 @@
+"""
+Chunking engine shared by the PDF and Wikipedia pipelines.
+
+``ChunkingEngine`` splits text into chunks of at most ``chunk_size`` tokens of
+the embedding model's tiktoken encoder, with one of several strategies:
+
+- ``tokens``: fixed token windows overlapping by ``chunk_overlap`` tokens
+- ``sentences``: windows of whole sentences
+- ``paragraphs``: windows of whole paragraphs
+- ``sections``: windows of whole sections, starting a new chunk at every
+  section that has to be split (Wikipedia ``== Heading ==`` lines)
+
+Units larger than a chunk are split with the next finer strategy, down to
+token windows. Chunks are located by character offsets and sliced from the
+text once, so chunking is linear in the length of the text. Every strategy
+produces the same chunk dictionaries (see ``ChunkingEngine.chunk_dicts``).
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import tiktoken
+
+from nyc_landmarks.config.settings import ChunkStrategy
+
+# Encoding used by text-embedding-3-small/large
+TOKENIZER_ENCODING = "cl100k_base"
+
+_HEADING = re.compile(r"^(={2,6})[ \t]*(.+?)[ \t]*\1[ \t]*$", re.MULTILINE)
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+_SENTENCE_BREAK = re.compile(r"[.!?][\"')\]]*(\s+)")
+
+# Strategy used to split a unit that does not fit in a chunk
+_FINER = {
+    ChunkStrategy.SECTIONS: ChunkStrategy.PARAGRAPHS,
+    ChunkStrategy.PARAGRAPHS: ChunkStrategy.SENTENCES,
+    ChunkStrategy.SENTENCES: ChunkStrategy.TOKENS,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer() -> tiktoken.Encoding:
+    """Get the process-wide tiktoken encoder used for chunking and token budgets.
+
+    Returns:
+        Shared tiktoken Encoding instance
+    """
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
+
+
+@dataclass
+class Chunk:
+    """A chunk of text and where it was taken from."""
+
+    text: str
+    index: int
+    start: int  # Character offset of the chunk in the text
+    end: int
+    token_count: int
+    section: Optional[str] = None  # Heading of the section the chunk starts in
+
+
+@dataclass
+class _Unit:
+    """Span of the text that is kept whole when it fits in a chunk."""
+
+    start: int
+    end: int
+    tokens: int
+    new_chunk: bool = False  # Must not share a chunk with the previous unit
+
+
+class ChunkingEngine:
+    """Split text into token-limited chunks with a pluggable strategy."""
+
+    def __init__(
+        self,
+        strategy: ChunkStrategy = ChunkStrategy.TOKENS,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 0,
+        tokenizer: Optional[tiktoken.Encoding] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            strategy: How chunk boundaries are chosen
+            chunk_size: Maximum tokens per chunk
+            chunk_overlap: Tokens repeated from the end of the previous chunk
+            tokenizer: Encoder to count tokens with (default: the shared
+                encoder of the embedding model, loaded on first use)
+
+        Raises:
+            ValueError: If the chunk size is not positive or the overlap is
+                not smaller than the chunk size
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("Chunk overlap must be between 0 and the chunk size.")
+        self.strategy = ChunkStrategy(strategy)
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._tokenizer = tokenizer
+
+    @property
+    def tokenizer(self) -> tiktoken.Encoding:
+        """Encoder to count tokens with (the shared one is loaded on first use)."""
+        return self._tokenizer or get_tokenizer()
+
+    def chunk(self, text: Optional[str]) -> List[Chunk]:
+        """Split text into chunks.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Chunks in text order
+        """
+        if not text or not text.strip():
+            return []
+
+        if self.strategy == ChunkStrategy.TOKENS:
+            spans = self._token_windows(text, 0, len(text), self.chunk_overlap)
+        else:
+            spans = self._pack(self._units(text, 0, len(text), self.strategy))
+
+        headings = [
+            (match.start(), match.group(2)) for match in _HEADING.finditer(text)
+        ]
+        heading_starts = [start for start, _ in headings]
+        chunks = []
+        for index, (start, end, tokens) in enumerate(spans):
+            position = bisect.bisect_right(heading_starts, start) - 1
+            chunks.append(
+                Chunk(
+                    text=text[start:end],
+                    index=index,
+                    start=start,
+                    end=end,
+                    token_count=tokens,
+                    section=headings[position][1] if position >= 0 else None,
+                )
+            )
+        return chunks
+
+    def chunk_texts(self, text: Optional[str]) -> List[str]:
+        """Split text into chunk texts.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Chunk texts in text order
+        """
+        return [chunk.text for chunk in self.chunk(text)]
+
+    def chunk_dicts(
+        self, text: Optional[str], metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Split text into chunk dictionaries ready for embedding.
+
+        Args:
+            text: Text to split
+            metadata: Metadata copied into every chunk's metadata
+
+        Returns:
+            Dictionaries with ``text``, ``chunk_index``, ``total_chunks`` and
+            ``metadata`` (the given metadata plus ``chunk_index``,
+            ``total_chunks``, ``token_count`` and ``section``)
+        """
+        chunks = self.chunk(text)
+        return [
+            {
+                "text": chunk.text,
+                "chunk_index": chunk.index,
+                "total_chunks": len(chunks),
+                "metadata": {
+                    **(metadata or {}),
+                    "chunk_index": chunk.index,
+                    "total_chunks": len(chunks),
+                    "token_count": chunk.token_count,
+                    "section": chunk.section,
+                },
+            }
+            for chunk in chunks
+        ]
+
+    def _token_windows(
+        self, text: str, start: int, end: int, overlap: int
+    ) -> List[Tuple[int, int, int]]:
+        """Token windows of a span as (start, end, tokens) character spans."""
+        tokens = self.tokenizer.encode(text[start:end])
+        if len(tokens) <= self.chunk_size:
+            return [(start, end, len(tokens))] if tokens else []
+
+        _, offsets = self.tokenizer.decode_with_offsets(tokens)
+        step = self.chunk_size - overlap
+        windows = []
+        for first in range(0, len(tokens), step):
+            last = min(first + self.chunk_size, len(tokens))
+            window_end = end if last == len(tokens) else start + offsets[last]
+            windows.append((start + offsets[first], window_end, last - first))
+            if last == len(tokens):
+                break
+        return windows
+
+    def _units(
+        self, text: str, start: int, end: int, strategy: ChunkStrategy
+    ) -> List[_Unit]:
+        """Split a span into units that each fit in a chunk."""
+        if strategy == ChunkStrategy.TOKENS:
+            return [
+                _Unit(window_start, window_end, tokens)
+                for window_start, window_end, tokens in self._token_windows(
+                    text, start, end, 0
+                )
+            ]
+
+        units: List[_Unit] = []
+        after_split_section = False
+        for span_start, span_end in _spans(text, start, end, strategy):
+            tokens = len(self.tokenizer.encode(text[span_start:span_end]))
+            if tokens <= self.chunk_size:
+                units.append(
+                    _Unit(span_start, span_end, tokens, new_chunk=after_split_section)
+                )
+                after_split_section = False
+                continue
+            parts = self._units(text, span_start, span_end, _FINER[strategy])
+            if strategy == ChunkStrategy.SECTIONS and parts:
+                # A split section starts a chunk, and so does what follows it
+                parts[0].new_chunk = True
+                after_split_section = True
+            units.extend(parts)
+        return units
+
+    def _pack(self, units: List[_Unit]) -> List[Tuple[int, int, int]]:
+        """Greedily pack consecutive units into chunks with unit overlap."""
+        spans = []
+        first = 0
+        while first < len(units):
+            last = first
+            tokens = units[first].tokens
+            while (
+                last + 1 < len(units)
+                and not units[last + 1].new_chunk
+                and tokens + units[last + 1].tokens <= self.chunk_size
+            ):
+                last += 1
+                tokens += units[last].tokens
+            spans.append((units[first].start, units[last].end, tokens))
+
+            # Repeat whole trailing units up to the overlap in the next chunk
+            following = last + 1
+            if following < len(units) and not units[following].new_chunk:
+                overlap = 0
+                while (
+                    following - 1 > first
+                    and overlap + units[following - 1].tokens <= self.chunk_overlap
+                ):
+                    following -= 1
+                    overlap += units[following].tokens
+            first = following
+        return spans
+
+
+def _spans(
+    text: str, start: int, end: int, strategy: ChunkStrategy
+) -> List[Tuple[int, int]]:
+    """Split a span into sections, paragraphs or sentences without whitespace."""
+    if strategy == ChunkStrategy.SECTIONS:
+        bounds = [match.start() for match in _HEADING.finditer(text, start, end)] + [
+            end
+        ]
+        pieces = list(zip([start] + bounds, bounds))
+    else:
+        pattern = (
+            _PARAGRAPH_BREAK
+            if strategy == ChunkStrategy.PARAGRAPHS
+            else _SENTENCE_BREAK
+        )
+        pieces = []
+        piece_start = start
+        for match in pattern.finditer(text, start, end):
+            pieces.append((piece_start, match.start(match.lastindex or 0)))
+            piece_start = match.end()
+        pieces.append((piece_start, end))
+
+    spans = []
+    for piece_start, piece_end in pieces:
+        while piece_start < piece_end and text[piece_start].isspace():
+            piece_start += 1
+        while piece_end > piece_start and text[piece_end - 1].isspace():
+            piece_end -= 1
+        if piece_end > piece_start:
+            spans.append((piece_start, piece_end))
+    return spans
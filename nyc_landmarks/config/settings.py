@@ -54,6 +54,38 @@ class LogProvider(str, Enum):
     GOOGLE = "google"
 
 
+class LogQueueOverflow(str, Enum):
+    """What the log queue does with records when it is full."""
+
+    DROP_DEBUG = "drop_debug"  # Drop DEBUG records early, others when full
+    DROP = "drop"  # Drop any record when full
+    BLOCK = "block"  # Wait for room in the queue
+
+
+class ConversationBackend(str, Enum):
+    """Available conversation storage backends."""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+
+
+class VectorDBBackend(str, Enum):
+    """Available vector database backends."""
+
+    PINECONE = "pinecone"
+    LOCAL = "local"
+    REPLICA = "replica"
+
+
+class ChunkStrategy(str, Enum):
+    """Ways of choosing chunk boundaries."""
+
+    TOKENS = "tokens"
+    SENTENCES = "sentences"
+    PARAGRAPHS = "paragraphs"
+    SECTIONS = "sections"
+
+
 class Settings(BaseSettings):
     """Application settings and configuration."""
 
@@ -62,6 +94,13 @@ class Settings(BaseSettings):
     LOG_LEVEL: LogLevel = Field(default=LogLevel.INFO)
     LOG_PROVIDER: LogProvider = Field(default=LogProvider.STDOUT)
     LOG_NAME_PREFIX: str = Field(default="nyc-landmarks-vector-db")
+    LOG_QUEUE_ENABLED: bool = Field(
+        default=False
+    )  # Format and export log records on a background thread
+    LOG_QUEUE_SIZE: int = Field(default=10000)  # Records buffered by the log queue
+    LOG_QUEUE_OVERFLOW: LogQueueOverflow = Field(
+        default=LogQueueOverflow.DROP_DEBUG
+    )  # Overflow policy of the log queue
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize settings with environment-specific defaults."""
@@ -83,6 +122,18 @@ class Settings(BaseSettings):
     OPENAI_EMBEDDING_MODEL: str = Field(default="text-embedding-3-small")
     OPENAI_EMBEDDING_DIMENSIONS: int = Field(default=1536)  # For text-embedding-3-small
     OPENAI_API_BASE: Optional[str] = Field(default=None)
+    EMBEDDING_BATCH_SIZE: int = Field(
+        default=100
+    )  # Texts per embedding request when pipeline workers share a batcher
+    EMBEDDING_BATCH_MAX_WAIT: float = Field(
+        default=0.1
+    )  # Seconds a text waits for its embedding batch to fill
+    EMBEDDING_BATCH_MAX_TOKENS: int = Field(
+        default=250000
+    )  # Estimated tokens per embedding request (the API allows 300k)
+    EMBEDDING_BATCH_WORKERS: int = Field(
+        default=2
+    )  # Concurrent embedding requests of the batcher
 
     # Pinecone settings
     PINECONE_API_KEY: str = Field(default="")
@@ -93,6 +144,45 @@ class Settings(BaseSettings):
     PINECONE_DIMENSIONS: int = Field(
         default=1536
     )  # Should match OPENAI_EMBEDDING_DIMENSIONS
+    PINECONE_INDEX_STATS_TTL: int = Field(
+        default=30
+    )  # Seconds index stats are reused when resolving vector namespaces
+
+    # Vector database backend settings
+    VECTOR_DB_BACKEND: VectorDBBackend = Field(
+        default=VectorDBBackend.PINECONE
+    )  # "local": in-process vector store; "replica": read-only local snapshot
+    LOCAL_VECTOR_DB_PATH: str = Field(
+        default="data/local_vector_db"
+    )  # Directory the local vector store persists to
+    LOCAL_VECTOR_DB_HNSW_THRESHOLD: int = Field(
+        default=50000
+    )  # Namespace size from which queries use an HNSW graph (requires hnswlib)
+    VECTOR_DB_SNAPSHOT_PATH: str = Field(
+        default="data/vector_db_snapshot"
+    )  # Exported index snapshot served by the "replica" backend
+    VECTOR_DB_SNAPSHOT_REFRESH_INTERVAL: int = Field(
+        default=60
+    )  # Seconds between checks of the snapshot generation
+
+    # Pipeline settings
+    PIPELINE_MANIFEST_PATH: str = Field(
+        default="data/pipeline_manifest.db"
+    )  # SQLite run manifest used to resume pipeline runs
+
+    # Lexical (BM25) index settings
+    LEXICAL_INDEX_ENABLED: bool = Field(
+        default=False
+    )  # Update the lexical index from pipeline writes
+    LEXICAL_INDEX_PATH: str = Field(
+        default="data/lexical_index"
+    )  # Directory the lexical index is saved to
+    LEXICAL_INDEX_REFRESH_INTERVAL: int = Field(
+        default=60
+    )  # Seconds between checks for a newer saved lexical index generation
+    HYBRID_SEARCH_RRF_K: int = Field(
+        default=60
+    )  # Rank offset of reciprocal rank fusion in hybrid search
 
     # Azure Blob Storage settings
     AZURE_STORAGE_CONNECTION_STRING: str = Field(default="")
@@ -115,11 +205,50 @@ class Settings(BaseSettings):
     # PDF processing settings
     CHUNK_SIZE: int = Field(default=1000)  # Token size for text chunks
     CHUNK_OVERLAP: int = Field(default=200)  # Token overlap between chunks
+    CHUNK_STRATEGY: ChunkStrategy = Field(
+        default=ChunkStrategy.TOKENS
+    )  # How PDF chunk boundaries are chosen
 
     # Chat settings
     CONVERSATION_TTL: int = Field(
         default=3600
     )  # Time to live for conversation history in seconds
+    CONVERSATION_MAX_COUNT: int = Field(
+        default=1000
+    )  # Maximum conversations kept in memory (least recently used are evicted)
+    CONVERSATION_MAX_MESSAGES: int = Field(
+        default=50
+    )  # Maximum messages retained per conversation
+    CONVERSATION_CLEANUP_INTERVAL: int = Field(
+        default=300
+    )  # Seconds between background sweeps of expired conversations
+    CONVERSATION_BACKEND: ConversationBackend = Field(
+        default=ConversationBackend.MEMORY
+    )  # Use "sqlite" to share conversations across workers
+    CONVERSATION_DB_PATH: str = Field(
+        default="data/conversations.db"
+    )  # SQLite database file used by the sqlite conversation backend
+    CHAT_CONTEXT_TOKEN_BUDGET: int = Field(
+        default=3000
+    )  # Maximum tokens of retrieved context in a chat prompt
+    CHAT_HISTORY_TOKEN_BUDGET: int = Field(
+        default=1500
+    )  # Maximum tokens of conversation history in a chat prompt
+    CHAT_CONTEXT_MIN_SCORE: float = Field(
+        default=0.7
+    )  # Minimum similarity score for a retrieved chunk to be used as context
+    CHAT_ANSWER_CACHE_ENABLED: bool = Field(
+        default=False
+    )  # Reuse answers to near-duplicate first-turn questions
+    CHAT_ANSWER_CACHE_THRESHOLD: float = Field(
+        default=0.95
+    )  # Minimum cosine similarity between questions for a cache hit
+    CHAT_ANSWER_CACHE_MAX_ENTRIES: int = Field(
+        default=1000
+    )  # Maximum cached answers (least recently used are evicted)
+    CHAT_ANSWER_CACHE_TTL: int = Field(
+        default=86400
+    )  # Seconds a cached answer stays valid
 
     # Wikipedia API settings
     WIKIPEDIA_USER_AGENT: str = Field(
@@ -129,6 +258,33 @@ class Settings(BaseSettings):
     WIKIPEDIA_API_ENDPOINT: str = Field(
         default="https://api.wikimedia.org/service/lw/inference/v1/models/enwiki-articlequality:predict"
     )
+    WIKIPEDIA_FETCH_CONCURRENCY: int = Field(
+        default=4
+    )  # Concurrent MediaWiki Action API requests
+    WIKIPEDIA_REQUESTS_PER_SECOND: float = Field(
+        default=10.0
+    )  # Maximum MediaWiki API requests started per second (0 for no limit)
+    WIKIPEDIA_TITLES_PER_REQUEST: int = Field(
+        default=50
+    )  # Titles per bulk revision query (the API allows at most 50)
+    WIKIPEDIA_QUALITY_CONCURRENCY: int = Field(
+        default=4
+    )  # Concurrent Lift Wing article quality requests
+    WIKIPEDIA_QUALITY_REQUESTS_PER_SECOND: float = Field(
+        default=5.0
+    )  # Maximum Lift Wing requests started per second (0 for no limit)
+    WIKIPEDIA_QUALITY_CACHE_PATH: str = Field(
+        default="data/wikipedia_quality.db"
+    )  # SQLite cache of quality scores by revision ID (empty to disable)
+    WIKIPEDIA_CHUNK_STRATEGY: ChunkStrategy = Field(
+        default=ChunkStrategy.SECTIONS
+    )  # How Wikipedia chunk boundaries are chosen
+    WIKIPEDIA_CHUNK_SIZE: int = Field(
+        default=7692
+    )  # Token size for Wikipedia chunks (8192 minus room for metadata)
+    WIKIPEDIA_CHUNK_OVERLAP: int = Field(
+        default=0
+    )  # Token overlap between Wikipedia chunks
 
     @field_validator("PINECONE_DIMENSIONS", mode="before")  # type: ignore[misc]
     @classmethod
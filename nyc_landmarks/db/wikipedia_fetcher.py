@@ -8,7 +8,7 @@ for landmarks to be embedded and stored in the vector database.
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, cast
 
 import requests
 from bs4 import BeautifulSoup
@@ -20,6 +20,7 @@ from tenacity import (
     wait_random_exponential,
 )
 
+from nyc_landmarks.chunking import ChunkingEngine, ChunkStrategy
 from nyc_landmarks.config.settings import settings
 from nyc_landmarks.models.wikipedia_models import (
     WikipediaArticleModel,
@@ -32,6 +33,9 @@ from nyc_landmarks.utils.logger import configure_basic_logging_safely
 logger = logging.getLogger(__name__)
 configure_basic_logging_safely(level=getattr(logging, settings.LOG_LEVEL.value))
 
+# Average characters per token, for chunk sizes given in characters
+CHARS_PER_TOKEN = 4
+
 
 # Define chunk type for mypy
 class ChunkDict(TypedDict):
@@ -325,6 +329,10 @@ class WikipediaFetcher:
     ) -> List[ChunkDict]:
         """Split Wikipedia article text into chunks suitable for embedding.
 
+        Paragraphs are packed into chunks by the shared chunking engine. The
+        character sizes are converted to token budgets at about four
+        characters per token.
+
         Args:
             text: Wikipedia article text
             chunk_size: Target size of each chunk in characters
@@ -333,72 +341,10 @@ class WikipediaFetcher:
         Returns:
             List of chunk dictionaries with text and metadata
         """
-        chunks = []
-
-        # Split text into paragraphs
-        paragraphs = text.split("\n\n")
-
-        # Initialize variables
-        current_chunk = ""
-        current_chunk_size = 0
-        chunk_index = 0
-
-        for paragraph in paragraphs:
-            # If adding this paragraph would exceed the chunk size and we already have content,
-            # save the current chunk and start a new one with overlap
-            if current_chunk_size + len(paragraph) > chunk_size and current_chunk:
-                # Create chunk metadata
-                chunk: ChunkDict = {
-                    "text": current_chunk.strip(),
-                    "chunk_index": chunk_index,
-                    "metadata": {
-                        "chunk_index": chunk_index,
-                    },
-                    "total_chunks": 0,  # Will be updated later
-                }
-                chunks.append(chunk)
-                chunk_index += 1
-
-                # Start a new chunk with overlap
-                if current_chunk_size > chunk_overlap:
-                    # Try to get approximately chunk_overlap characters from the end
-                    words = current_chunk.split()
-                    overlap_words = words[
-                        -((chunk_overlap // 5) + 1) :
-                    ]  # Estimate words by average length
-                    current_chunk = " ".join(overlap_words)
-                    current_chunk_size = len(current_chunk)
-                else:
-                    # If current chunk is smaller than desired overlap, keep it all
-                    current_chunk_size = len(current_chunk)
-
-            # Add the paragraph to the current chunk
-            if current_chunk:
-                current_chunk += "\n\n" + paragraph
-                current_chunk_size += len(paragraph) + 2  # +2 for the newlines
-            else:
-                current_chunk = paragraph
-                current_chunk_size = len(paragraph)
-
-        # Don't forget the last chunk
-        if current_chunk:
-            final_chunk: ChunkDict = {
-                "text": current_chunk.strip(),
-                "chunk_index": chunk_index,
-                "metadata": {
-                    "chunk_index": chunk_index,
-                },
-                "total_chunks": 0,  # Will be updated later
-            }
-            chunks.append(final_chunk)
-
-        # Add total chunks information to each chunk's metadata
-        total_chunks = len(chunks)
-        for chunk in chunks:
-            chunk["metadata"]["total_chunks"] = total_chunks
-            chunk["total_chunks"] = (
-                total_chunks  # Redundant but matches existing code pattern
-            )
+        token_size = max(chunk_size // CHARS_PER_TOKEN, 1)
+        token_overlap = min(chunk_overlap // CHARS_PER_TOKEN, token_size - 1)
+        engine = ChunkingEngine(ChunkStrategy.PARAGRAPHS, token_size, token_overlap)
+        chunks = cast(List[ChunkDict], engine.chunk_dicts(text))
 
         logger.info(f"Split Wikipedia article into {len(chunks)} chunks")
         return chunks
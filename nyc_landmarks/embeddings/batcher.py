@@ -0,0 +1,271 @@
+"""
+Micro-batching of embedding requests across pipeline workers.
+
+Pipeline workers submit the chunk texts of one landmark or article and get a
+future back. ``EmbeddingBatcher`` coalesces the pending texts of all workers
+into full embedding API requests, bounded by a text count and an estimated
+token budget. A partial batch is sent once its oldest text has waited
+``max_wait`` seconds, so landmarks with two or three chunks no longer cost
+one API request each.
+"""
+
+import atexit
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Deque, List, Optional, Sequence
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.embeddings.generator import EmbeddingGenerator
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Upper estimate of the tokens of a text (about three characters each)."""
+    return len(text) // 3 + 1
+
+
+@dataclass
+class BatcherStats:
+    """Counters of an embedding batcher."""
+
+    requests: int = 0  # Submitted requests
+    texts: int = 0  # Submitted texts
+    api_calls: int = 0  # Embedding API requests sent
+    failed_calls: int = 0  # Embedding API requests that raised
+
+
+class _Request:
+    """Texts submitted together, completed when all their embeddings arrive."""
+
+    def __init__(self, size: int) -> None:
+        self.future: "Future[List[List[float]]]" = Future()
+        self.embeddings: List[Optional[List[float]]] = [None] * size
+        self.remaining = size
+
+
+@dataclass
+class _Item:
+    """One pending text of a request."""
+
+    request: _Request
+    position: int
+    text: str
+    tokens: int
+    submitted_at: float
+
+
+class EmbeddingBatcher:
+    """Coalesce embedding requests of many workers into full API batches."""
+
+    def __init__(
+        self,
+        generator: Optional[EmbeddingGenerator] = None,
+        batch_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        max_batch_tokens: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        """Initialize the batcher.
+
+        The dispatcher thread starts with the first submitted request.
+
+        Args:
+            generator: Embedding generator sending the API requests
+            batch_size: Maximum texts per request (default: EMBEDDING_BATCH_SIZE)
+            max_wait: Seconds a text waits for its batch to fill
+                (default: EMBEDDING_BATCH_MAX_WAIT)
+            max_batch_tokens: Maximum estimated tokens per request
+                (default: EMBEDDING_BATCH_MAX_TOKENS)
+            workers: Concurrent API requests (default: EMBEDDING_BATCH_WORKERS)
+        """
+        self.generator = generator or EmbeddingGenerator()
+        self.batch_size = max(batch_size or settings.EMBEDDING_BATCH_SIZE, 1)
+        self.max_wait = (
+            max_wait if max_wait is not None else settings.EMBEDDING_BATCH_MAX_WAIT
+        )
+        self.max_batch_tokens = max_batch_tokens or settings.EMBEDDING_BATCH_MAX_TOKENS
+        self.workers = max(workers or settings.EMBEDDING_BATCH_WORKERS, 1)
+        self.stats = BatcherStats()
+
+        self._pending: Deque[_Item] = deque()
+        self._pending_tokens = 0
+        self._condition = threading.Condition()
+        self._results_lock = threading.Lock()
+        self._slots = threading.Semaphore(self.workers)
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, texts: Sequence[str]) -> "Future[List[List[float]]]":
+        """Queue texts for embedding.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Future of the embeddings, in the order of the texts
+
+        Raises:
+            RuntimeError: If the batcher is closed
+        """
+        request = _Request(len(texts))
+        if not texts:
+            request.future.set_result([])
+            return request.future
+
+        now = time.monotonic()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Embedding batcher is closed")
+            self._start()
+            for position, text in enumerate(texts):
+                tokens = estimate_tokens(text)
+                self._pending.append(_Item(request, position, text, tokens, now))
+                self._pending_tokens += tokens
+            self.stats.requests += 1
+            self.stats.texts += len(texts)
+            self._condition.notify_all()
+        return request.future
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed texts, waiting for their batch.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in the order of the texts
+        """
+        return self.submit(texts).result()
+
+    def close(self) -> None:
+        """Send the pending texts and stop the dispatcher."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        logger.info(
+            f"Embedding batcher sent {self.stats.api_calls} requests for "
+            f"{self.stats.texts} texts from {self.stats.requests} submissions"
+        )
+
+    def __enter__(self) -> "EmbeddingBatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Start the dispatcher (called with the condition held)."""
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="embedding-batch"
+            )
+            self._thread = threading.Thread(
+                target=self._dispatch, name="embedding-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def _batch_ready(self) -> bool:
+        if not self._pending:
+            return False
+        return (
+            self._closed
+            or len(self._pending) >= self.batch_size
+            or self._pending_tokens >= self.max_batch_tokens
+            or time.monotonic() - self._pending[0].submitted_at >= self.max_wait
+        )
+
+    def _take_batch(self) -> List[_Item]:
+        batch: List[_Item] = []
+        tokens = 0
+        while self._pending and len(batch) < self.batch_size:
+            item = self._pending[0]
+            if batch and tokens + item.tokens > self.max_batch_tokens:
+                break
+            batch.append(self._pending.popleft())
+            tokens += item.tokens
+        self._pending_tokens -= tokens
+        return batch
+
+    def _dispatch(self) -> None:
+        """Send batches while API request slots are free."""
+        while True:
+            # Holding a free slot first lets texts keep accumulating while
+            # every request slot is busy
+            self._slots.acquire()
+            with self._condition:
+                while not self._batch_ready():
+                    if self._closed and not self._pending:
+                        self._slots.release()
+                        return
+                    timeout = None
+                    if self._pending:
+                        waited = time.monotonic() - self._pending[0].submitted_at
+                        timeout = max(self.max_wait - waited, 0.0)
+                    self._condition.wait(timeout)
+                batch = self._take_batch()
+            assert self._executor is not None
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List[_Item]) -> None:
+        """Embed one batch and complete the requests it finishes."""
+        try:
+            texts = [item.text for item in batch]
+            try:
+                embeddings = self.generator.generate_embeddings_batch(
+                    texts, batch_size=len(texts)
+                )
+                if len(embeddings) != len(texts):
+                    raise ValueError(
+                        f"Got {len(embeddings)} embeddings for {len(texts)} texts"
+                    )
+            except Exception as e:
+                logger.error(f"Embedding request for {len(texts)} texts failed: {e}")
+                with self._results_lock:
+                    self.stats.failed_calls += 1
+                    for item in batch:
+                        if not item.request.future.done():
+                            item.request.future.set_exception(e)
+                return
+
+            with self._results_lock:
+                self.stats.api_calls += 1
+                for item, embedding in zip(batch, embeddings):
+                    request = item.request
+                    if request.future.done():
+                        continue  # Another batch of the request failed
+                    request.embeddings[item.position] = embedding
+                    request.remaining -= 1
+                    if request.remaining == 0:
+                        request.future.set_result(
+                            [e for e in request.embeddings if e is not None]
+                        )
+        finally:
+            self._slots.release()
+
+
+@lru_cache(maxsize=None)
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get the process-wide embedding batcher.
+
+    Pending texts are sent when the process exits.
+
+    Returns:
+        Shared EmbeddingBatcher with its own EmbeddingGenerator
+    """
+    batcher = EmbeddingBatcher()
+    atexit.register(batcher.close)
+    return batcher
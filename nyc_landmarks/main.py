@@ -5,7 +5,8 @@ This module initializes the FastAPI application and registers all routes.
 """
 
 import time
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,8 +15,10 @@ from pydantic import AnyUrl, BaseModel, Field
 
 from nyc_landmarks.api import chat, query
 from nyc_landmarks.api.middleware import setup_api_middleware
-from nyc_landmarks.config.settings import settings
+from nyc_landmarks.chat.conversation import conversation_store
+from nyc_landmarks.config.settings import VectorDBBackend, settings
 from nyc_landmarks.utils.logger import get_logger, log_error
+from nyc_landmarks.vectordb.read_replica import get_read_replica_db
 
 # Configure logging
 logger = get_logger(__name__)
@@ -78,12 +81,27 @@ else:
             {"url": settings.DEPLOYMENT_URL, "description": "Production server"}
         )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop background tasks for the application lifetime."""
+    if settings.VECTOR_DB_BACKEND == VectorDBBackend.REPLICA:
+        # Load the index snapshot before serving, not on the first query
+        get_read_replica_db().refresh()
+    conversation_store.start_cleanup_task()
+    try:
+        yield
+    finally:
+        await conversation_store.stop_cleanup_task()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="NYC Landmarks Vector Database API",
     description="API for accessing NYC landmarks information and semantic search functionality",
     version="0.1.0",
     servers=servers,  # Add servers configuration
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -181,6 +199,13 @@ async def health_check() -> HealthResponse:
             "timestamp": time.time(),
         }
 
+    # Report conversation store size and eviction metrics
+    services["conversation_store"] = {
+        "status": "healthy",
+        **conversation_store.get_metrics(),
+        "timestamp": time.time(),
+    }
+
     # Determine overall status
     if any(service.get("status") == "error" for service in services.values()):
         overall_status = "error"
@@ -9,9 +9,8 @@ import logging
 import re
 from typing import Any, Dict, List, Optional
 
-import tiktoken
-
-from nyc_landmarks.config.settings import settings
+from nyc_landmarks.chunking import ChunkingEngine, get_tokenizer
+from nyc_landmarks.config.settings import ChunkStrategy, settings
 from nyc_landmarks.utils.logger import configure_basic_logging_safely
 
 # Configure logging
@@ -23,13 +22,17 @@ class TextChunker:
     """Text preprocessing and chunking for PDF text."""
 
     def __init__(
-        self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None
+        self,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        strategy: Optional[ChunkStrategy] = None,
     ):
         """Initialize the text chunker with configuration.
 
         Args:
             chunk_size: Maximum chunk size in tokens (default: from settings)
             chunk_overlap: Overlap between chunks in tokens (default: from settings)
+            strategy: How chunk boundaries are chosen (default: from settings)
         """
         self.chunk_size = chunk_size if chunk_size is not None else settings.CHUNK_SIZE
         self.chunk_overlap = (
@@ -38,11 +41,18 @@ class TextChunker:
 
         # Initialize tokenizer for counting tokens
         # We use 'cl100k_base' which is used by text-embedding-3-small/large
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.tokenizer = get_tokenizer()
+        self.engine = ChunkingEngine(
+            strategy or settings.CHUNK_STRATEGY,
+            self.chunk_size,
+            self.chunk_overlap,
+            self.tokenizer,
+        )
 
         logger.info(
             f"Initialized TextChunker with chunk_size={self.chunk_size}, "
-            f"chunk_overlap={self.chunk_overlap}"
+            f"chunk_overlap={self.chunk_overlap}, "
+            f"strategy={self.engine.strategy.value}"
         )
 
     def preprocess_text(self, text: str) -> str:
@@ -95,52 +105,7 @@ class TextChunker:
         if not text:
             return []
 
-        # Preprocess the text
-        text = self.preprocess_text(text)
-
-        # Tokenize the text
-        tokens = self.tokenizer.encode(text)
-
-        # Calculate the chunk size and overlap in tokens
-        chunk_size = self.chunk_size
-        chunk_overlap = self.chunk_overlap
-
-        # If the text is shorter than the chunk size, return it as a single chunk
-        if len(tokens) <= chunk_size:
-            return [text]
-
-        # Initialize variables for chunking
-        chunks = []
-        start_idx = 0
-
-        # Chunk the text by token count
-        while start_idx < len(tokens):
-            # Calculate the end index for this chunk
-            end_idx = min(start_idx + chunk_size, len(tokens))
-
-            # Get the chunk tokens
-            chunk_tokens = tokens[start_idx:end_idx]
-
-            # Convert tokens back to text
-            chunk = self.tokenizer.decode(chunk_tokens)
-
-            # Add the chunk to the list
-            chunks.append(chunk)
-
-            # Update the start index for the next chunk
-            # We move forward by chunk_size - chunk_overlap
-            start_idx += chunk_size - chunk_overlap
-
-            # If we'd end up with a tiny final chunk, just stop
-            if len(tokens) - start_idx < chunk_size / 3:
-                break
-
-        # Handle any remaining text if we broke out of the loop early
-        if start_idx < len(tokens):
-            chunk_tokens = tokens[start_idx:]
-            chunk = self.tokenizer.decode(chunk_tokens)
-            chunks.append(chunk)
-
+        chunks = self.engine.chunk_texts(self.preprocess_text(text))
         logger.info(f"Chunked text into {len(chunks)} chunks")
         return chunks
 
@@ -154,31 +119,12 @@ class TextChunker:
             metadata: Metadata to add to each chunk
 
         Returns:
-            List of dictionaries containing chunk text and metadata
+            List of dictionaries containing chunk text and metadata, in the
+            format shared with the Wikipedia pipeline
         """
-        # Chunk the text
-        chunks = self.chunk_text_by_tokens(text)
-
-        # Create a list of chunk dictionaries with metadata
-        chunk_dicts = []
-        for i, chunk in enumerate(chunks):
-            # Create a copy of the metadata
-            chunk_metadata = metadata.copy()
-
-            # Add chunk-specific metadata
-            chunk_metadata["chunk_index"] = i
-            chunk_metadata["chunk_count"] = len(chunks)
-            chunk_metadata["token_count"] = self.count_tokens(chunk)
-
-            # Create the chunk dictionary
-            chunk_dict = {
-                "text": chunk,
-                "metadata": chunk_metadata,
-            }
-
-            chunk_dicts.append(chunk_dict)
-
-        return chunk_dicts
+        if not text:
+            return []
+        return self.engine.chunk_dicts(self.preprocess_text(text), metadata)
 
     def process_landmark_text(
         self,
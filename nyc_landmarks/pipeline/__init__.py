@@ -0,0 +1,19 @@
+"""Staged processing pipelines for NYC landmarks."""
+
+from .engine import (
+    PipelineRun,
+    Stage,
+    StagedPipeline,
+    StageFailure,
+    StageKind,
+    StageStats,
+)
+
+__all__ = [
+    "PipelineRun",
+    "Stage",
+    "StagedPipeline",
+    "StageFailure",
+    "StageKind",
+    "StageStats",
+]
@@ -0,0 +1,234 @@
+"""
+Cost model for balancing landmark batch jobs.
+
+The time a landmark takes in the PDF pipeline is dominated by its chunk
+count: every chunk is embedded and upserted, while landmarks without a PDF
+finish almost immediately. ``CostModel`` estimates a landmark's cost in
+chunk units from, in order of preference, the chunk count stored by an
+earlier run, the size of its PDF, or the median of the known landmarks.
+``balance_jobs`` bin-packs landmarks into jobs of similar total cost, so one
+job of historic district reports no longer sets the wall-clock time of a
+whole CI matrix.
+"""
+
+import heapq
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+from nyc_landmarks.pipeline.manifest import RunManifest
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fixed cost of a landmark (metadata lookups, download, vector deletion)
+LANDMARK_OVERHEAD = 2.0
+# PDF bytes per chunk, used until stored runs allow calibrating it
+DEFAULT_BYTES_PER_CHUNK = 50_000
+# Chunks assumed for a PDF nothing is known about
+DEFAULT_CHUNKS = 10
+
+
+@dataclass
+class LandmarkSource:
+    """What is known about the work of one landmark."""
+
+    landmark_id: str
+    has_pdf: bool = True
+    pdf_url: Optional[str] = None
+    chunks: Optional[int] = None  # Chunks stored by an earlier run
+    pdf_bytes: Optional[int] = None  # Size of the PDF report
+
+
+@dataclass
+class Job:
+    """Landmarks assigned to one batch job."""
+
+    landmark_ids: List[str] = field(default_factory=list)
+    cost: float = 0.0
+
+
+class CostModel:
+    """Estimate the processing cost of landmarks in chunk units."""
+
+    def __init__(self, sources: Iterable[LandmarkSource]):
+        """Initialize the model, calibrating it on landmarks with known costs.
+
+        Args:
+            sources: Landmarks to estimate
+        """
+        self.sources = {source.landmark_id: source for source in sources}
+
+        calibration = [s for s in self.sources.values() if s.chunks and s.pdf_bytes]
+        if calibration:
+            self.bytes_per_chunk = sum(s.pdf_bytes or 0 for s in calibration) / sum(
+                s.chunks or 0 for s in calibration
+            )
+        else:
+            self.bytes_per_chunk = DEFAULT_BYTES_PER_CHUNK
+
+        known = [
+            chunks
+            for chunks in (self._chunks(s) for s in self.sources.values() if s.has_pdf)
+            if chunks is not None
+        ]
+        self.default_chunks = statistics.median(known) if known else DEFAULT_CHUNKS
+
+    def _chunks(self, source: LandmarkSource) -> Optional[float]:
+        if source.chunks is not None:
+            return float(source.chunks)
+        if source.pdf_bytes:
+            return max(source.pdf_bytes / self.bytes_per_chunk, 1.0)
+        return None
+
+    def cost(self, landmark_id: str) -> float:
+        """Estimated cost of a landmark.
+
+        Args:
+            landmark_id: Landmark ID
+
+        Returns:
+            Cost in chunk units
+        """
+        source = self.sources.get(landmark_id) or LandmarkSource(landmark_id)
+        if not source.has_pdf:
+            return LANDMARK_OVERHEAD
+        chunks = self._chunks(source)
+        return LANDMARK_OVERHEAD + (
+            chunks if chunks is not None else self.default_chunks
+        )
+
+    def costs(self) -> Dict[str, float]:
+        """Estimated cost of every landmark of the model."""
+        return {landmark_id: self.cost(landmark_id) for landmark_id in self.sources}
+
+
+def balance_jobs(costs: Dict[str, float], jobs: int) -> List[Job]:
+    """Bin-pack landmarks into jobs of similar total cost.
+
+    Landmarks are assigned from the most to the least expensive, each to the
+    currently cheapest job (longest processing time first).
+
+    Args:
+        costs: Estimated cost per landmark ID
+        jobs: Number of jobs
+
+    Returns:
+        Non-empty jobs, each with its landmark IDs in ID order
+
+    Raises:
+        ValueError: If the number of jobs is not positive
+    """
+    if jobs <= 0:
+        raise ValueError("Number of jobs must be positive.")
+
+    bins = [Job() for _ in range(min(jobs, len(costs)))]
+    heap = [(0.0, index) for index in range(len(bins))]
+    for landmark_id, cost in sorted(
+        costs.items(), key=lambda item: (-item[1], item[0])
+    ):
+        total, index = heapq.heappop(heap)
+        bins[index].landmark_ids.append(landmark_id)
+        bins[index].cost = total + cost
+        heapq.heappush(heap, (bins[index].cost, index))
+
+    for job in bins:
+        job.landmark_ids.sort()
+    return bins
+
+
+def sources_from_manifest(manifest: RunManifest) -> Dict[str, LandmarkSource]:
+    """Chunk counts and PDF sizes recorded by earlier pipeline runs.
+
+    Args:
+        manifest: Run manifest of the PDF pipeline
+
+    Returns:
+        Landmark sources by ID
+    """
+    sources: Dict[str, LandmarkSource] = {}
+    for landmark_id, details in manifest.stage_details("store").items():
+        if "vectors" in details:
+            sources[landmark_id] = LandmarkSource(
+                landmark_id, chunks=int(details["vectors"])
+            )
+    for landmark_id, details in manifest.stage_details("download").items():
+        if "bytes" in details:
+            source = sources.setdefault(landmark_id, LandmarkSource(landmark_id))
+            source.pdf_bytes = int(details["bytes"])
+    return sources
+
+
+def sources_from_catalog(landmarks: Iterable[Dict[str, Any]]) -> List[LandmarkSource]:
+    """Landmark sources from catalog records.
+
+    Accepts LPC report records (``lpNumber``/``pdfReportUrl``) and the PDF URL
+    records written by ``scripts/fetch_landmark_reports.py`` (``id``/``pdf_url``).
+
+    Args:
+        landmarks: Catalog records
+
+    Returns:
+        Landmark sources in catalog order
+    """
+    sources = []
+    for landmark in landmarks:
+        landmark_id = landmark.get("lpNumber") or landmark.get("id")
+        if not landmark_id:
+            continue
+        pdf_url = landmark.get("pdfReportUrl") or landmark.get("pdf_url")
+        sources.append(
+            LandmarkSource(landmark_id, has_pdf=bool(pdf_url), pdf_url=pdf_url)
+        )
+    return sources
+
+
+def merge_sources(
+    catalog: List[LandmarkSource], history: Dict[str, LandmarkSource]
+) -> List[LandmarkSource]:
+    """Complete catalog landmarks with what earlier runs recorded.
+
+    Args:
+        catalog: Landmarks to process (every recorded landmark if empty)
+        history: Sources from the run manifest by landmark ID
+
+    Returns:
+        Landmark sources to estimate
+    """
+    if not catalog:
+        return list(history.values())
+    for source in catalog:
+        recorded = history.get(source.landmark_id)
+        if recorded is not None:
+            source.chunks = recorded.chunks
+            source.pdf_bytes = source.pdf_bytes or recorded.pdf_bytes
+    return catalog
+
+
+def fetch_pdf_sizes(pdf_urls: Dict[str, str], workers: int = 8) -> Dict[str, int]:
+    """Sizes of PDF reports from HEAD requests.
+
+    Args:
+        pdf_urls: PDF URL per landmark ID
+        workers: Concurrent requests
+
+    Returns:
+        PDF size in bytes per landmark ID, for servers reporting Content-Length
+    """
+
+    def head(url: str) -> Optional[int]:
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+            length = response.headers.get("Content-Length")
+            return int(length) if length else None
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not get the size of {url}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        sizes = dict(zip(pdf_urls, executor.map(head, pdf_urls.values())))
+    return {landmark_id: size for landmark_id, size in sizes.items() if size}
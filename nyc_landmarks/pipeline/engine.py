@@ -0,0 +1,351 @@
+"""
+Staged producer/consumer pipeline engine.
+
+A ``StagedPipeline`` runs items through a list of ``Stage`` steps connected
+by bounded queues. Each stage has its own workers, so I/O-bound steps (PDF
+downloads, upserts) and CPU-bound steps (text extraction, chunking) proceed
+concurrently on different items:
+
+- ``StageKind.THREAD`` stages call their function on worker threads.
+- ``StageKind.PROCESS`` stages run their function in a process pool of the
+  stage's size, so CPU-bound work isn't serialized by the GIL. The function
+  and items must be picklable.
+- Stages with a ``batch_size`` collect items from different sources into
+  one call (e.g. one embedding request for the chunks of several
+  landmarks). A batch is flushed once its weight reaches ``batch_size`` or
+  ``batch_timeout`` seconds after its first item. When a batch call fails,
+  its items are retried one at a time, so each failing item is reported on
+  its own.
+
+Queues hold at most ``queue_size`` items, so a slow stage blocks the stages
+before it instead of letting work in progress grow without bound. An item
+that fails in a stage is recorded as a ``StageFailure`` and dropped; the
+other items continue.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Items waiting between two stages
+DEFAULT_QUEUE_SIZE = 32
+
+# Seconds a partial batch waits for more items
+DEFAULT_BATCH_TIMEOUT = 0.5
+
+# End-of-input marker passed along the queues
+_DONE = object()
+
+
+class StageKind(str, Enum):
+    """Where a stage runs its function."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass
+class Stage:
+    """One step of a staged pipeline.
+
+    The function takes an item and returns the item for the next stage, or
+    ``None`` to drop it. Batched stages take and return lists of items in
+    the same order.
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    kind: StageKind = StageKind.THREAD
+    batch_size: Optional[int] = None  # Batch weight that triggers a call
+    batch_weight: Optional[Callable[[Any], int]] = None  # Default: 1 per item
+    batch_timeout: float = DEFAULT_BATCH_TIMEOUT
+
+
+@dataclass
+class StageStats:
+    """Counters of one stage."""
+
+    processed: int = 0
+    failed: int = 0
+    calls: int = 0
+    busy_seconds: float = 0.0
+
+
+@dataclass
+class StageFailure:
+    """An item that failed in a stage."""
+
+    key: str
+    stage: str
+    error: str
+    item: Any
+
+
+@dataclass
+class PipelineRun:
+    """Outcome of a pipeline run."""
+
+    results: List[Any] = field(default_factory=list)
+    failures: List[StageFailure] = field(default_factory=list)
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class _Envelope:
+    """An item with the key it is reported under."""
+
+    key: str
+    item: Any
+
+
+class _StageRunner:
+    """Worker threads of one stage, reading one queue and writing the next."""
+
+    def __init__(
+        self,
+        stage: Stage,
+        inbox: "queue.Queue[Any]",
+        outbox: Callable[[Any], None],
+        run: PipelineRun,
+        lock: threading.Lock,
+        progress: Callable[[int], object],
+    ):
+        self.stage = stage
+        self.inbox = inbox
+        self.outbox = outbox
+        self.run = run
+        self.lock = lock
+        self.progress = progress
+        self.stats = run.stages.setdefault(stage.name, StageStats())
+        self.executor: Optional[Executor] = None
+        self.threads: List[threading.Thread] = []
+        self._active = max(stage.workers, 1)
+
+    def start(self) -> None:
+        if self.stage.kind == StageKind.PROCESS:
+            self.executor = ProcessPoolExecutor(
+                max_workers=max(self.stage.workers, 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        target = self._batch_worker if self.stage.batch_size else self._worker
+        for number in range(max(self.stage.workers, 1)):
+            thread = threading.Thread(
+                target=target,
+                name=f"pipeline-{self.stage.name}-{number}",
+                daemon=True,
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def join(self) -> None:
+        for thread in self.threads:
+            thread.join()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def _call(self, payload: Any) -> Any:
+        if self.executor is not None:
+            return self.executor.submit(self.stage.func, payload).result()
+        return self.stage.func(payload)
+
+    def _fail(self, envelopes: List[_Envelope], error: Exception) -> None:
+        logger.error(
+            f"Stage '{self.stage.name}' failed for "
+            f"{', '.join(e.key for e in envelopes)}: {error}"
+        )
+        with self.lock:
+            self.stats.failed += len(envelopes)
+            self.run.failures.extend(
+                StageFailure(e.key, self.stage.name, str(error), e.item)
+                for e in envelopes
+            )
+        self.progress(len(envelopes))
+
+    def _call_batch(self, envelopes: List[_Envelope]) -> List[Any]:
+        """Call the stage function on the items of a batch (or a single item)."""
+        if not self.stage.batch_size:
+            return [self._call(envelopes[0].item)]
+        outputs = self._call([e.item for e in envelopes])
+        if len(outputs) != len(envelopes):
+            raise ValueError(
+                f"Batch returned {len(outputs)} items for {len(envelopes)}"
+            )
+        return list(outputs)
+
+    def _process(self, envelopes: List[_Envelope]) -> None:
+        """Call the stage function and pass the results on."""
+        start = time.monotonic()
+        error: Optional[Exception] = None
+        outputs: List[Any] = []
+        try:
+            outputs = self._call_batch(envelopes)
+        except Exception as e:
+            error = e
+        finally:
+            with self.lock:
+                self.stats.calls += 1
+                self.stats.busy_seconds += time.monotonic() - start
+
+        if error is not None:
+            if len(envelopes) > 1:
+                # Find the failing items instead of failing the whole batch
+                logger.warning(
+                    f"Stage '{self.stage.name}' batch of {len(envelopes)} failed, "
+                    f"retrying its items one at a time: {error}"
+                )
+                for envelope in envelopes:
+                    self._process([envelope])
+            else:
+                self._fail(envelopes, error)
+            return
+
+        with self.lock:
+            self.stats.processed += len(envelopes)
+        dropped = 0
+        for envelope, output in zip(envelopes, outputs):
+            if output is not None:
+                self.outbox(_Envelope(envelope.key, output))
+            else:
+                dropped += 1
+        if dropped:
+            self.progress(dropped)
+
+    def _finish(self) -> None:
+        """Pass the end of input on once the last worker of the stage is done."""
+        # Let the other workers of this stage see the marker too
+        self.inbox.put(_DONE)
+        with self.lock:
+            self._active -= 1
+            last = self._active == 0
+        if last:
+            self.outbox(_DONE)
+
+    def _worker(self) -> None:
+        while True:
+            envelope = self.inbox.get()
+            if envelope is _DONE:
+                self._finish()
+                return
+            self._process([envelope])
+
+    def _batch_worker(self) -> None:
+        weigh = self.stage.batch_weight or (lambda item: 1)
+        batch: List[_Envelope] = []
+        weight = 0
+        deadline = 0.0
+        while True:
+            try:
+                timeout = max(deadline - time.monotonic(), 0) if batch else None
+                envelope = self.inbox.get(timeout=timeout)
+            except queue.Empty:
+                envelope = None
+            if envelope is not None and envelope is not _DONE:
+                if not batch:
+                    deadline = time.monotonic() + self.stage.batch_timeout
+                batch.append(envelope)
+                weight += weigh(envelope.item)
+            if batch and (
+                envelope is None
+                or envelope is _DONE
+                or weight >= (self.stage.batch_size or 1)
+            ):
+                self._process(batch)
+                batch, weight = [], 0
+            if envelope is _DONE:
+                self._finish()
+                return
+
+
+class StagedPipeline:
+    """Runs items through stages connected by bounded queues."""
+
+    def __init__(self, stages: List[Stage], queue_size: int = DEFAULT_QUEUE_SIZE):
+        """Initialize the pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Maximum items waiting in front of each stage
+
+        Raises:
+            ValueError: If no stages are given
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(
+        self,
+        items: Iterable[Any],
+        key: Callable[[Any], str] = str,
+        progress: Optional[Callable[[int], object]] = None,
+    ) -> PipelineRun:
+        """Run items through every stage and wait for them to finish.
+
+        Args:
+            items: Input items of the first stage (consumed lazily)
+            key: Function naming an input item in failures and logs
+            progress: Called with the number of items that left the pipeline
+                (completed, dropped or failed), e.g. ``tqdm.update``
+
+        Returns:
+            Results of the last stage, failures and per-stage counters
+        """
+        start = time.monotonic()
+        run = PipelineRun()
+        lock = threading.Lock()
+        inboxes: List["queue.Queue[Any]"] = [
+            queue.Queue(maxsize=self.queue_size) for _ in self.stages
+        ]
+
+        report = progress or (lambda count: None)
+
+        def collect(envelope: Any) -> None:
+            if envelope is not _DONE:
+                with lock:
+                    run.results.append(envelope.item)
+                report(1)
+
+        runners = [
+            _StageRunner(
+                stage,
+                inboxes[i],
+                inboxes[i + 1].put if i + 1 < len(self.stages) else collect,
+                run,
+                lock,
+                report,
+            )
+            for i, stage in enumerate(self.stages)
+        ]
+        for runner in runners:
+            runner.start()
+
+        try:
+            for item in items:
+                inboxes[0].put(_Envelope(str(key(item)), item))
+        finally:
+            inboxes[0].put(_DONE)
+            for runner in runners:
+                runner.join()
+
+        run.elapsed_seconds = time.monotonic() - start
+        logger.info(
+            f"Pipeline finished in {run.elapsed_seconds:.2f}s: "
+            f"{len(run.results)} completed, {len(run.failures)} failed; "
+            + ", ".join(
+                f"{name} {stats.processed} in {stats.busy_seconds:.1f}s"
+                for name, stats in run.stages.items()
+            )
+        )
+        return run
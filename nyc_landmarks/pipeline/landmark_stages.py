@@ -0,0 +1,112 @@
+"""
+Work items and process-pool steps of the staged landmark PDF pipeline.
+
+Functions run by ``StageKind.PROCESS`` stages are pickled by reference, so
+they live here rather than in the pipeline scripts. Each worker process
+keeps one ``PDFExtractor`` and one ``TextChunker`` per chunking setup.
+"""
+
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from nyc_landmarks.pdf.extractor import PDFExtractor
+from nyc_landmarks.pdf.text_chunker import TextChunker
+from nyc_landmarks.pipeline.manifest import sha256_text
+
+
+@dataclass
+class LandmarkJob:
+    """A landmark moving through the staged pipeline."""
+
+    landmark_id: str
+    landmark: Dict[str, Any]
+    result: Dict[str, Any]  # Per-landmark result in process_landmark_worker format
+    text_dir: Optional[Path] = None
+    pdf_path: Optional[Path] = None
+    text: Optional[str] = None  # Text kept from an earlier run, if resuming
+    metadata: Optional[Dict[str, Any]] = None  # Enhanced metadata, if collected
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+    resumed: bool = False  # Vectors already stored for the same inputs
+
+
+def build_chunk_dicts(chunks: List[str], landmark_id: str) -> List[Dict[str, Any]]:
+    """Wrap PDF text chunks with the metadata stored alongside their vectors.
+
+    Args:
+        chunks: Chunk texts in document order
+        landmark_id: ID of the landmark the PDF belongs to
+
+    Returns:
+        List of chunk dictionaries ready for embedding
+    """
+    processing_date = time.strftime("%Y-%m-%d")
+    return [
+        {
+            "text": chunk,
+            "chunk_index": i,
+            "total_chunks": len(chunks),
+            "metadata": {
+                "landmark_id": landmark_id,
+                "chunk_index": i,
+                "total_chunks": len(chunks),
+                "source_type": "pdf",
+                "processing_date": processing_date,
+            },
+        }
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _extractor() -> PDFExtractor:
+    return PDFExtractor()
+
+
+@lru_cache(maxsize=None)
+def _chunker(chunk_size: int, chunk_overlap: int) -> TextChunker:
+    return TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def extract_and_chunk(
+    job: LandmarkJob, chunk_size: int, chunk_overlap: int
+) -> LandmarkJob:
+    """Extract the text of a downloaded PDF, save it and chunk it.
+
+    Text kept from an earlier run (``job.text``) is chunked without
+    extracting it again.
+
+    Args:
+        job: Job with ``pdf_path`` set
+        chunk_size: Maximum chunk size in tokens
+        chunk_overlap: Overlap between chunks in tokens
+
+    Returns:
+        The job with ``chunks`` set
+
+    Raises:
+        ValueError: If the job has no PDF or no text was extracted
+    """
+    if job.pdf_path is None:
+        raise ValueError(f"No PDF downloaded for landmark {job.landmark_id}")
+
+    text = job.text
+    if text is None:
+        text = _extractor().extract_text_from_bytes(job.pdf_path.read_bytes())
+        if not text:
+            raise ValueError(
+                f"No text extracted from PDF for landmark {job.landmark_id}"
+            )
+        if job.text_dir is not None:
+            text_path = job.text_dir / (job.pdf_path.stem + ".txt")
+            text_path.write_text(text, encoding="utf-8")
+    job.text = None  # Not needed by later stages
+    job.result["stats"]["text_extracted"] = True
+    job.result.setdefault("hashes", {})["text"] = sha256_text(text)
+
+    chunks = _chunker(chunk_size, chunk_overlap).chunk_text_by_tokens(text)
+    job.chunks = build_chunk_dicts(chunks, job.landmark_id)
+    job.result["stats"]["chunks_created"] = len(chunks)
+    return job
@@ -0,0 +1,362 @@
+"""
+Durable run manifest for resumable pipeline runs.
+
+``RunManifest`` is a SQLite database that records, per landmark and stage,
+the fingerprint of the stage's inputs (PDF hash, text hash, chunking
+parameters, embedding model, target index) and of its output. A resumed run
+skips a stage when the manifest has a completed record for the same input
+fingerprint and the local output still matches, instead of re-downloading,
+re-extracting and re-embedding everything. Incremental runs also compare
+source versions (PDF ETags, Wikipedia revision IDs, enhanced metadata
+hashes) kept in the stage details.
+
+Runs are recorded too, so progress can be summarized across runs (see
+``scripts/ci/pipeline_status.py``). The database uses WAL journaling so
+concurrent pipeline jobs on one machine can share it.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    command TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    stats TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (
+    landmark_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input_hash TEXT,
+    output_hash TEXT,
+    run_id TEXT,
+    updated_at TEXT NOT NULL,
+    error TEXT,
+    details TEXT,
+    PRIMARY KEY (landmark_id, stage)
+);
+"""
+
+# Metadata fields set at collection time rather than taken from the source
+VOLATILE_METADATA_FIELDS = frozenset({"processing_date"})
+
+
+class StageStatus(str, Enum):
+    """Outcome of a pipeline stage for one landmark."""
+
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class StageRecord:
+    """Latest manifest entry of a landmark's stage."""
+
+    landmark_id: str
+    stage: str
+    status: StageStatus
+    input_hash: Optional[str]
+    output_hash: Optional[str]
+    run_id: Optional[str]
+    updated_at: str
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+
+
+def sha256_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    """SHA-256 hex digest of UTF-8 text."""
+    return sha256_bytes(text.encode("utf-8"))
+
+
+def sha256_file(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Hash of JSON-serializable values identifying a stage's inputs.
+
+    Args:
+        *parts: Hashes and parameters the stage output depends on
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return sha256_text(json.dumps(parts, sort_keys=True, default=str))
+
+
+def metadata_fingerprint(metadata: Dict[str, Any]) -> str:
+    """Hash of landmark metadata, ignoring fields that change on every collection.
+
+    Args:
+        metadata: Enhanced metadata dictionary
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return fingerprint(
+        {k: v for k, v in metadata.items() if k not in VOLATILE_METADATA_FIELDS}
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class RunManifest:
+    """SQLite record of per-landmark stage completion across pipeline runs."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open or create the manifest database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=30
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self.run_id: Optional[str] = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # --- Runs ---
+
+    def start_run(self, command: str = "") -> str:
+        """Record the start of a pipeline run.
+
+        Args:
+            command: Command line or description of the run
+
+        Returns:
+            ID of the new run, also kept as ``run_id``
+        """
+        run_id = uuid.uuid4().hex[:12]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO runs (run_id, command, started_at) VALUES (?, ?, ?)",
+                (run_id, command, _now()),
+            )
+        self.run_id = run_id
+        logger.info(f"Started pipeline run {run_id} (manifest {self.path})")
+        return run_id
+
+    def finish_run(self, stats: Optional[Dict[str, Any]] = None) -> None:
+        """Record the end of the current run with its summary statistics.
+
+        Args:
+            stats: JSON-serializable run statistics
+        """
+        if self.run_id is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET finished_at = ?, stats = ? WHERE run_id = ?",
+                (_now(), json.dumps(stats or {}, default=str), self.run_id),
+            )
+
+    def runs(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent runs, newest first.
+
+        Args:
+            limit: Maximum number of runs
+
+        Returns:
+            Run rows with decoded statistics
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM runs ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [
+            {**dict(row), "stats": json.loads(row["stats"]) if row["stats"] else None}
+            for row in rows
+        ]
+
+    # --- Stages ---
+
+    def record(
+        self,
+        landmark_id: str,
+        stage: str,
+        input_hash: Optional[str] = None,
+        output_hash: Optional[str] = None,
+        status: StageStatus = StageStatus.DONE,
+        error: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record the outcome of a landmark's stage, replacing earlier entries.
+
+        Args:
+            landmark_id: Landmark ID
+            stage: Stage name (e.g. "download", "extract", "store")
+            input_hash: Fingerprint of the stage inputs
+            output_hash: Hash of the stage output
+            status: Stage outcome
+            error: Error message of a failed stage
+            details: Additional JSON-serializable details
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stages (landmark_id, stage, status, "
+                "input_hash, output_hash, run_id, updated_at, error, details) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    landmark_id,
+                    stage,
+                    StageStatus(status).value,
+                    input_hash,
+                    output_hash,
+                    self.run_id,
+                    _now(),
+                    error,
+                    json.dumps(details) if details else None,
+                ),
+            )
+
+    def get(self, landmark_id: str, stage: str) -> Optional[StageRecord]:
+        """Latest entry of a landmark's stage.
+
+        Args:
+            landmark_id: Landmark ID
+            stage: Stage name
+
+        Returns:
+            The stage record, or None if the stage never ran
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM stages WHERE landmark_id = ? AND stage = ?",
+                (landmark_id, stage),
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def completed(
+        self, landmark_id: str, stage: str, input_hash: str
+    ) -> Optional[StageRecord]:
+        """Entry of a stage completed with the given input fingerprint.
+
+        Args:
+            landmark_id: Landmark ID
+            stage: Stage name
+            input_hash: Fingerprint of the current stage inputs
+
+        Returns:
+            The stage record if the stage is done for these inputs, else None
+        """
+        record = self.get(landmark_id, stage)
+        if (
+            record is not None
+            and record.status == StageStatus.DONE
+            and record.input_hash == input_hash
+        ):
+            return record
+        return None
+
+    def landmark_stages(self, landmark_id: str) -> List[StageRecord]:
+        """Every stage entry of a landmark.
+
+        Args:
+            landmark_id: Landmark ID
+
+        Returns:
+            Stage records ordered by update time
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM stages WHERE landmark_id = ? ORDER BY updated_at",
+                (landmark_id,),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def failures(self) -> List[StageRecord]:
+        """Stage entries whose latest outcome is a failure."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM stages WHERE status = ? ORDER BY updated_at DESC",
+                (StageStatus.FAILED.value,),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def stage_details(self, stage: str) -> Dict[str, Dict[str, Any]]:
+        """Details of the completed entries of a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Mapping of landmark ID to stage details (empty if none were kept)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT landmark_id, details FROM stages "
+                "WHERE stage = ? AND status = ?",
+                (stage, StageStatus.DONE.value),
+            ).fetchall()
+        return {
+            row["landmark_id"]: json.loads(row["details"]) if row["details"] else {}
+            for row in rows
+        }
+
+    def stage_summary(self) -> Dict[str, Dict[str, int]]:
+        """Count landmarks per stage and outcome.
+
+        Returns:
+            Mapping of stage name to counts per status
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage, status, COUNT(*) AS count FROM stages "
+                "GROUP BY stage, status"
+            ).fetchall()
+        summary: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            summary.setdefault(row["stage"], {})[row["status"]] = row["count"]
+        return summary
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> StageRecord:
+        return StageRecord(
+            landmark_id=row["landmark_id"],
+            stage=row["stage"],
+            status=StageStatus(row["status"]),
+            input_hash=row["input_hash"],
+            output_hash=row["output_hash"],
+            run_id=row["run_id"],
+            updated_at=row["updated_at"],
+            error=row["error"],
+            details=json.loads(row["details"]) if row["details"] else None,
+        )
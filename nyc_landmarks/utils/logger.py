@@ -9,17 +9,25 @@ in the project, with capabilities for:
 - Structured logging with standardized fields
 - Request context integration
 - Performance monitoring
+- Optional queue-based logging, formatting and exporting records on a
+  background thread
 """
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 import traceback
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from nyc_landmarks.config.settings import LogProvider, settings
+from nyc_landmarks.config.settings import LogProvider, LogQueueOverflow, settings
 
 # Try to import request context utilities - they may not be available in all environments
 try:
@@ -92,8 +100,11 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON string."""
+        # Time the record was created, which may precede formatting when
+        # records are formatted on the log queue thread
+        created = datetime.fromtimestamp(record.created, timezone.utc)
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": created.isoformat().replace("+00:00", "Z"),
             "severity": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -160,6 +171,205 @@ class StructuredFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+# Share of the log queue that DEBUG records may fill under DROP_DEBUG
+DEBUG_QUEUE_SHARE = 0.75
+
+
+# Record attribute carrying the handlers a queued record is emitted with
+_TARGET_HANDLERS_ATTR = "_log_queue_handlers"
+
+
+class _LogQueueListener(logging.handlers.QueueListener):
+    """Queue listener sending each record to the handlers it was queued for."""
+
+    queue: "queue.Queue[Any]"
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Emit a queued record with its target handlers."""
+        handlers = cast(
+            List[logging.Handler], record.__dict__.pop(_TARGET_HANDLERS_ATTR)
+        )
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop marker, waiting for room in a full queue."""
+        self.queue.put(None)
+
+
+class LogQueue:
+    """Bounded queue of log records drained by one background thread.
+
+    Loggers hand their records to the queue and return; the listener thread
+    formats them and runs the console, file and Cloud Logging handlers. When
+    the queue is full, records are dropped (and counted) or the caller waits,
+    depending on the overflow policy.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.LOG_QUEUE_SIZE,
+        overflow: LogQueueOverflow = settings.LOG_QUEUE_OVERFLOW,
+    ) -> None:
+        """Initialize the queue and start its listener thread.
+
+        Args:
+            maxsize: Records buffered before the overflow policy applies
+            overflow: What to do with records when the queue is full
+        """
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+        self.maxsize = maxsize
+        self.overflow = LogQueueOverflow(overflow)
+        self.dropped: Counter[str] = Counter()  # Dropped records by level name
+        self._lock = threading.Lock()
+        self._stopped = False
+        self.listener = _LogQueueListener(self.queue)
+        self.listener.start()
+
+    def put(self, handlers: List[logging.Handler], record: logging.LogRecord) -> None:
+        """Queue a record for its handlers, applying the overflow policy.
+
+        Args:
+            handlers: Handlers to emit the record with
+            record: Prepared log record
+        """
+        setattr(record, _TARGET_HANDLERS_ATTR, handlers)
+        if self._stopped:
+            # No listener any more: emit on the calling thread
+            self.listener.handle(record)
+            return
+
+        if self.overflow == LogQueueOverflow.BLOCK:
+            self.queue.put(record)
+            return
+        if (
+            self.overflow == LogQueueOverflow.DROP_DEBUG
+            and record.levelno < logging.INFO
+            and self.queue.qsize() >= self.maxsize * DEBUG_QUEUE_SHARE
+        ):
+            self._drop(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop(record)
+
+    def _drop(self, record: logging.LogRecord) -> None:
+        with self._lock:
+            self.dropped[record.levelname] += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued record has been emitted.
+
+        Args:
+            timeout: Seconds to wait at most (default: no limit)
+
+        Returns:
+            True if the queue was drained
+        """
+        if self._stopped:
+            return True
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(
+                lambda: not self.queue.unfinished_tasks, timeout
+            )
+
+    def stop(self) -> None:
+        """Emit the remaining records and stop the listener thread.
+
+        Records logged afterwards are emitted on the calling thread.
+        """
+        if self._stopped:
+            return
+        self.listener.stop()
+        self._stopped = True
+        if self.dropped:
+            # Use basic print since the handlers may already be closed
+            print(
+                f"Warning: Log queue dropped {sum(self.dropped.values())} records "
+                f"({dict(self.dropped)})",
+                file=sys.stderr,
+            )
+
+
+class QueuedLogHandler(logging.handlers.QueueHandler):
+    """Handler passing records to the log queue instead of emitting them."""
+
+    def __init__(self, log_queue: LogQueue, handlers: List[logging.Handler]) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Queue drained by the background thread
+            handlers: Handlers the background thread emits the records with
+        """
+        super().__init__(log_queue.queue)
+        self.log_queue = log_queue
+        self.handlers = handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture what depends on the calling thread; formatting is deferred.
+
+        The message arguments are merged and the request context is copied
+        onto the record, since neither is available on the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if REQUEST_CONTEXT_AVAILABLE:
+            try:
+                for key, value in get_request_context().items():
+                    if not hasattr(record, key):
+                        setattr(record, key, value)
+            except Exception:
+                # Fail silently if context extraction fails
+                pass  # nosec B110
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a prepared record for this handler's targets."""
+        self.log_queue.put(self.handlers, record)
+
+    def flush(self) -> None:
+        """Wait for the queued records, then flush the target handlers."""
+        self.log_queue.flush()
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Close the target handlers."""
+        for handler in self.handlers:
+            handler.close()
+        super().close()
+
+
+_log_queue: Optional[LogQueue] = None
+_log_queue_lock = threading.Lock()
+
+
+def get_log_queue() -> LogQueue:
+    """Get the process-wide log queue, starting its listener on first use.
+
+    Returns:
+        Shared LogQueue instance
+    """
+    global _log_queue
+    with _log_queue_lock:
+        if _log_queue is None:
+            _log_queue = LogQueue()
+            atexit.register(stop_log_queue)
+        return _log_queue
+
+
+def stop_log_queue() -> None:
+    """Drain and stop the process-wide log queue if it was started."""
+    global _log_queue
+    with _log_queue_lock:
+        log_queue, _log_queue = _log_queue, None
+    if log_queue is not None:
+        log_queue.stop()
+
+
 class LoggerSetup:
     """Centralized logging configuration for NYC Landmarks Vector DB."""
 
@@ -179,6 +389,7 @@ class LoggerSetup:
         log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         provider: LogProvider = settings.LOG_PROVIDER,
         structured: bool = False,
+        use_queue: Optional[bool] = None,
     ) -> logging.Logger:
         """
         Configure and return a logger with the specified settings.
@@ -191,6 +402,9 @@ class LoggerSetup:
             log_filename: Custom log filename (default: None, generates timestamped filename)
             log_format: Format string for log messages
             provider: Logging provider to use (default: settings.LOG_PROVIDER)
+            structured: Whether to use structured (JSON) logging format
+            use_queue: Whether to emit records on the background log queue
+                thread (default: settings.LOG_QUEUE_ENABLED)
 
         Returns:
             Configured logger instance
@@ -216,6 +430,54 @@ class LoggerSetup:
         # Use structured formatter if requested or when using Google Cloud Logging
         use_structured = structured or provider == LogProvider.GOOGLE
         formatter = json_formatter if use_structured else standard_formatter
+        handlers, cloud_error = self._build_handlers(
+            provider=provider,
+            formatter=formatter,
+            json_formatter=json_formatter,
+            log_to_console=log_to_console,
+            log_to_file=log_to_file,
+            log_dir=log_dir,
+            log_filename=log_filename,
+        )
+
+        if use_queue is None:
+            use_queue = settings.LOG_QUEUE_ENABLED
+        if use_queue and handlers:
+            # Format and export on the background thread of the log queue
+            self.logger.addHandler(QueuedLogHandler(get_log_queue(), handlers))
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        if cloud_error is not None:
+            self.logger.error(
+                "Failed to initialize Google Cloud Logging, falling back to console: %s",
+                str(cloud_error),
+                exc_info=cloud_error,
+            )
+
+        self._configured = True
+        return self.logger
+
+    def _build_handlers(
+        self,
+        provider: LogProvider,
+        formatter: logging.Formatter,
+        json_formatter: logging.Formatter,
+        log_to_console: bool,
+        log_to_file: bool,
+        log_dir: Union[str, Path],
+        log_filename: Optional[str],
+    ) -> Tuple[List[logging.Handler], Optional[Exception]]:
+        """
+        Create the handlers for the logging provider.
+
+        Returns:
+            The handlers, and the error raised if Cloud Logging could not be
+            initialized and console logging was used instead
+        """
+        handlers: List[logging.Handler] = []
+        cloud_error: Optional[Exception] = None
 
         # Configure handlers based on provider - MUTUALLY EXCLUSIVE to prevent duplicates
         if provider == LogProvider.GOOGLE and GCP_LOGGING_AVAILABLE:
@@ -233,23 +495,20 @@ class LoggerSetup:
                 # Set a custom formatter for Cloud Logging to ensure environment is included
                 cloud_handler.setFormatter(json_formatter)
 
-                self.logger.addHandler(cloud_handler)
+                handlers.append(cloud_handler)
             except Exception as e:
                 # Fallback to console logging if Cloud Logging fails
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_handler.setFormatter(formatter)
-                self.logger.addHandler(console_handler)
-                self.logger.exception(
-                    "Failed to initialize Google Cloud Logging, falling back to console: %s",
-                    str(e),
-                )
+                handlers.append(console_handler)
+                cloud_error = e
         else:
             # DEVELOPMENT: Use console and/or file logging
             # Add console handler if requested
             if log_to_console:
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_handler.setFormatter(formatter)
-                self.logger.addHandler(console_handler)
+                handlers.append(console_handler)
 
             # Add file handler if requested
             if log_to_file:
@@ -266,10 +525,9 @@ class LoggerSetup:
                 log_filepath = log_dir_path / log_filename
                 file_handler = logging.FileHandler(log_filepath)
                 file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
 
-        self._configured = True
-        return self.logger
+        return handlers, cloud_error
 
     def get_logger(self) -> logging.Logger:
         """
@@ -296,6 +554,7 @@ def get_logger(
     log_to_file: bool = True,
     provider: LogProvider = settings.LOG_PROVIDER,
     structured: bool = False,
+    use_queue: Optional[bool] = None,
 ) -> logging.Logger:
     """
     Convenience function to get a configured logger.
@@ -307,6 +566,8 @@ def get_logger(
         log_to_file: Whether to log to file (default: True)
         provider: Logging provider to use (default: settings.LOG_PROVIDER)
         structured: Whether to use structured (JSON) logging format (default: False)
+        use_queue: Whether to emit records on the background log queue thread
+            (default: settings.LOG_QUEUE_ENABLED)
 
     Returns:
         Configured logger instance
@@ -319,6 +580,7 @@ def get_logger(
             log_to_file=log_to_file,
             provider=provider,
             structured=structured,
+            use_queue=use_queue,
         )
 
     return default_logger.setup(
@@ -327,6 +589,7 @@ def get_logger(
         log_to_file=log_to_file,
         provider=provider,
         structured=structured,
+        use_queue=use_queue,
     )
 
 
@@ -546,6 +809,11 @@ def _get_cloud_handlers(logger_obj: logging.Logger) -> List[logging.Handler]:
         # Check if it's a CloudLoggingHandler
         if hasattr(handler, "transport") and hasattr(handler, "close"):
             handlers.append(handler)
+        # Or a queued handler emitting to one
+        elif isinstance(handler, QueuedLogHandler) and any(
+            hasattr(target, "transport") for target in handler.handlers
+        ):
+            handlers.append(handler)
     return handlers
 
 
@@ -621,8 +889,9 @@ def shutdown_logging_gracefully() -> None:
     to ensure all logs are flushed and handlers are properly closed.
     """
     try:
-        # First flush all logs
+        # First flush all logs, draining the log queue
         flush_loggers()
+        stop_log_queue()
 
         # Wait a moment for logs to be sent
         import time
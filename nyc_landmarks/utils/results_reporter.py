@@ -17,6 +17,8 @@ class ProcessingStatistics:
     failed_landmarks: int = 0
     landmarks_with_articles: int = 0
     landmarks_without_articles: int = 0
+    unchanged_landmarks: int = 0  # Skipped by incremental runs
+    unchanged_articles: int = 0  # Skipped by the revision check
     total_articles_processed: int = 0
     total_chunks_embedded: int = 0
     total_processing_time: float = 0.0
@@ -42,8 +44,13 @@ def calculate_statistics(
     stats.total_landmarks = len(landmark_results)
 
     for landmark_id, result in landmark_results.items():
+        stats.unchanged_articles += result.get("articles_unchanged", 0)
         if result.get("success", False):
             stats.successful_landmarks += 1
+            if result.get("unchanged", False):
+                stats.unchanged_landmarks += 1
+                stats.landmarks_with_articles += 1
+                continue
             articles_processed = result.get("articles_processed", 0)
             chunks_embedded = result.get("chunks_embedded", 0)
 
@@ -73,12 +80,16 @@ def print_statistics(
     print(f"Successful landmarks:            {stats.successful_landmarks}")
     print(f"Failed landmarks:                {stats.failed_landmarks}")
     print(f"Skipped landmarks:               {len(stats.skipped_landmarks)}")
+    if stats.unchanged_landmarks:
+        print(f"Unchanged landmarks:             {stats.unchanged_landmarks}")
     print()
 
     # Article-specific statistics
     print(f"Landmarks with Wikipedia:        {stats.landmarks_with_articles}")
     print(f"Landmarks without Wikipedia:     {stats.landmarks_without_articles}")
     print(f"Total articles processed:        {stats.total_articles_processed}")
+    if stats.unchanged_articles:
+        print(f"Unchanged articles skipped:      {stats.unchanged_articles}")
     print(f"Total chunks embedded:           {stats.total_chunks_embedded}")
     print()
 
@@ -0,0 +1,523 @@
+"""
+Local BM25 index over the chunk texts stored in vector metadata.
+
+Dense search does poorly on exact-match queries such as LP numbers, street
+addresses and architect names. ``LexicalIndex`` is an inverted index over
+the ``text`` (and a few descriptive fields) of every vector's metadata,
+scored with Okapi BM25, that serves the lexical half of hybrid search
+without a remote call.
+
+- Saved postings are kept in CSR form (``offsets``, ``doc_positions``,
+  ``term_freqs``) in ``.npy`` files that are memory-mapped on load.
+- Writes go to an in-memory delta segment, and replaced or deleted chunks
+  are masked out, so the index can be updated incrementally. ``save``
+  merges the delta into new files and writes a manifest with a new
+  generation last, like ``LocalIndex``.
+- ``enable_lexical_indexing`` registers the index as a PineconeDB write
+  listener, so pipeline runs keep it in step with the vector index.
+"""
+
+import atexit
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.local_vector_db import (
+    IDS_FILE,
+    MANIFEST_FILE,
+    read_metadata,
+    read_snapshot_generation,
+    write_metadata,
+)
+from nyc_landmarks.vectordb.metadata_filter import matches_filter
+from nyc_landmarks.vectordb.pinecone_db import (
+    PineconeDB,
+    VectorWrite,
+    _namespace_name,
+    register_vector_write_listener,
+)
+
+logger = get_logger(__name__)
+
+# Files of a saved index (next to ids.npy, metadata and manifest.json)
+VOCABULARY_FILE = "vocabulary.json"
+OFFSETS_FILE = "offsets.npy"
+DOC_POSITIONS_FILE = "doc_positions.npy"
+TERM_FREQS_FILE = "term_freqs.npy"
+LENGTHS_FILE = "lengths.npy"
+
+# Metadata fields indexed alongside the chunk text
+LEXICAL_FIELDS = [
+    "text",
+    "landmark_id",
+    "name",
+    "architect",
+    "style",
+    "neighborhood",
+    "location",
+    "property_address",
+    "building_names",
+    "article_title",
+]
+
+# Words with internal hyphens or apostrophes stay whole ("lp-00001")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+
+# Changed chunks after which a listening index saves itself
+AUTOSAVE_PENDING_CHANGES = 1000
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _document_tokens(metadata: Dict[str, Any]) -> List[str]:
+    """Tokens of the indexed metadata fields of one vector."""
+    tokens: List[str] = []
+    for field_name in LEXICAL_FIELDS:
+        value = metadata.get(field_name)
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        if value:
+            tokens.extend(tokenize(str(value)))
+    return tokens
+
+
+class LexicalIndex:
+    """BM25 inverted index over vector metadata, updatable in place."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        namespace: Optional[str] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """Initialize the index, loading it from ``path`` if it was saved there.
+
+        Args:
+            path: Directory the index is saved to (None for an in-memory index)
+            namespace: Vector namespace the index follows when listening to
+                writes (default: from settings)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.path = Path(path) if path else None
+        self.namespace = (
+            namespace if namespace is not None else settings.PINECONE_NAMESPACE
+        )
+        self.k1 = k1
+        self.b = b
+        self.generation: Optional[str] = None
+        self._lock = threading.RLock()
+        self._last_check = 0.0
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        """Drop every document and posting."""
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._lengths: List[int] = []
+        self._alive: List[bool] = []
+        self._metadata: List[Dict[str, Any]] = []
+        # Saved postings: term -> row of offsets
+        self._vocabulary: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._doc_positions = np.zeros(0, dtype=np.int32)
+        self._term_freqs = np.zeros(0, dtype=np.int32)
+        # Postings added since the last save: term -> {position: frequency}
+        self._delta: Dict[str, Dict[int, int]] = {}
+        self._pending = 0
+
+    def _load(self) -> None:
+        """Load the saved index, memory-mapping the posting arrays."""
+        if not self.path or not (self.path / MANIFEST_FILE).exists():
+            return
+        with open(self.path / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        with open(self.path / VOCABULARY_FILE, "r", encoding="utf-8") as f:
+            terms = json.load(f)
+
+        self._reset()
+        self._ids = [str(vector_id) for vector_id in np.load(self.path / IDS_FILE)]
+        self._positions = {vector_id: i for i, vector_id in enumerate(self._ids)}
+        self._lengths = np.load(self.path / LENGTHS_FILE).tolist()
+        self._alive = [True] * len(self._ids)
+        self._metadata = read_metadata(self.path)
+        self._vocabulary = {term: i for i, term in enumerate(terms)}
+        self._offsets = np.load(self.path / OFFSETS_FILE, mmap_mode="r")
+        self._doc_positions = np.load(self.path / DOC_POSITIONS_FILE, mmap_mode="r")
+        self._term_freqs = np.load(self.path / TERM_FREQS_FILE, mmap_mode="r")
+        self.generation = manifest.get("generation")
+        logger.info(
+            f"Loaded lexical index {self.generation} with {len(self._ids)} chunks"
+        )
+
+    def __len__(self) -> int:
+        """Number of indexed chunks."""
+        return len(self._positions)
+
+    # --- Writes ---
+
+    def _remove_position(self, position: int) -> None:
+        self._alive[position] = False
+        self._positions.pop(self._ids[position], None)
+        self._pending += 1
+
+    def upsert(self, vectors: Iterable[Dict[str, Any]]) -> int:
+        """Index vectors given as dicts with id and metadata, replacing existing ones.
+
+        Args:
+            vectors: Vectors in the ``upsert_vectors`` format (values are ignored)
+
+        Returns:
+            Number of chunks indexed
+        """
+        count = 0
+        with self._lock:
+            for vector in vectors:
+                vector_id = str(vector["id"])
+                metadata = dict(vector.get("metadata") or {})
+                if vector_id in self._positions:
+                    self._remove_position(self._positions[vector_id])
+
+                position = len(self._ids)
+                tokens = _document_tokens(metadata)
+                self._ids.append(vector_id)
+                self._positions[vector_id] = position
+                self._lengths.append(len(tokens))
+                self._alive.append(True)
+                self._metadata.append(metadata)
+                for term, frequency in Counter(tokens).items():
+                    self._delta.setdefault(term, {})[position] = frequency
+                self._pending += 1
+                count += 1
+        return count
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove chunks by vector ID.
+
+        Args:
+            ids: Vector IDs to remove
+
+        Returns:
+            Number of chunks removed
+        """
+        removed = 0
+        with self._lock:
+            for vector_id in ids:
+                position = self._positions.get(str(vector_id))
+                if position is not None:
+                    self._remove_position(position)
+                    removed += 1
+        return removed
+
+    def delete_by_filter(self, filter_dict: Dict[str, Any]) -> int:
+        """Remove chunks whose metadata matches a Pinecone metadata filter.
+
+        Args:
+            filter_dict: Metadata filter
+
+        Returns:
+            Number of chunks removed
+        """
+        with self._lock:
+            positions = [
+                position
+                for position in self._positions.values()
+                if matches_filter(self._metadata[position], filter_dict)
+            ]
+            for position in positions:
+                self._remove_position(position)
+        return len(positions)
+
+    def clear(self) -> None:
+        """Remove every chunk."""
+        with self._lock:
+            self._reset()
+            self._pending = 1
+
+    def apply(self, write: VectorWrite) -> None:
+        """Apply a write made through PineconeDB (a vector write listener).
+
+        Writes to other namespaces are ignored. The index saves itself after
+        ``AUTOSAVE_PENDING_CHANGES`` changed chunks.
+
+        Args:
+            write: Upserted or deleted vectors
+        """
+        if write.cleared:
+            self.clear()
+        elif write.namespace != _namespace_name(self.namespace):
+            return
+        if write.deleted_ids:
+            self.delete(write.deleted_ids)
+        if write.deleted_filter is not None:
+            self.delete_by_filter(write.deleted_filter)
+        if write.upserted:
+            self.upsert(write.upserted)
+        if self._pending >= AUTOSAVE_PENDING_CHANGES:
+            self.save()
+
+    # --- Search ---
+
+    def _postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and frequencies of the chunks containing a term."""
+        positions: List[np.ndarray] = []
+        frequencies: List[np.ndarray] = []
+        row = self._vocabulary.get(term)
+        if row is not None:
+            start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+            positions.append(np.asarray(self._doc_positions[start:end], np.int64))
+            frequencies.append(np.asarray(self._term_freqs[start:end], np.float32))
+        delta = self._delta.get(term)
+        if delta:
+            positions.append(np.fromiter(delta.keys(), np.int64, len(delta)))
+            frequencies.append(np.fromiter(delta.values(), np.float32, len(delta)))
+        if not positions:
+            return np.zeros(0, np.int64), np.zeros(0, np.float32)
+        return np.concatenate(positions), np.concatenate(frequencies)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rank chunks against a text query with BM25.
+
+        Args:
+            query: Text query
+            top_k: Number of results to return
+            filter_dict: Optional Pinecone metadata filter
+
+        Returns:
+            Matches in the ``query_vectors`` format (id, score, metadata)
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or not self._positions:
+                return []
+
+            alive = np.asarray(self._alive, dtype=bool)
+            lengths = np.asarray(self._lengths, dtype=np.float32)
+            live_count = len(self._positions)
+            average_length = max(float(lengths[alive].mean()), 1.0)
+            scores = np.zeros(len(self._ids), dtype=np.float32)
+
+            for term in terms:
+                positions, frequencies = self._postings(term)
+                keep = alive[positions]
+                positions, frequencies = positions[keep], frequencies[keep]
+                if not len(positions):
+                    continue
+                idf = math.log(
+                    1.0 + (live_count - len(positions) + 0.5) / (len(positions) + 0.5)
+                )
+                norm = self.k1 * (
+                    1.0 - self.b + self.b * lengths[positions] / average_length
+                )
+                scores[positions] += (
+                    idf * frequencies * (self.k1 + 1.0) / (frequencies + norm)
+                )
+
+            candidates = np.flatnonzero(scores > 0)
+            if filter_dict:
+                candidates = np.asarray(
+                    [
+                        position
+                        for position in candidates
+                        if matches_filter(self._metadata[position], filter_dict)
+                    ],
+                    dtype=np.int64,
+                )
+            if len(candidates) > top_k:
+                top = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+                candidates = candidates[top]
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            return [
+                {
+                    "id": self._ids[position],
+                    "score": float(scores[position]),
+                    "metadata": dict(self._metadata[position]),
+                }
+                for position in order
+            ]
+
+    # --- Persistence ---
+
+    def save(self) -> None:
+        """Merge pending changes into new posting files and start a new generation."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._pending and self.generation is not None:
+                return
+
+            live = [
+                position for position in range(len(self._ids)) if self._alive[position]
+            ]
+            remap = np.full(len(self._ids), -1, dtype=np.int64)
+            remap[live] = np.arange(len(live))
+
+            terms = sorted(set(self._vocabulary) | set(self._delta))
+            offsets = [0]
+            doc_positions: List[np.ndarray] = []
+            term_freqs: List[np.ndarray] = []
+            vocabulary: List[str] = []
+            for term in terms:
+                positions, frequencies = self._postings(term)
+                new_positions = remap[positions]
+                keep = new_positions >= 0
+                if not keep.any():
+                    continue
+                order = np.argsort(new_positions[keep], kind="stable")
+                doc_positions.append(new_positions[keep][order].astype(np.int32))
+                term_freqs.append(frequencies[keep][order].astype(np.int32))
+                vocabulary.append(term)
+                offsets.append(offsets[-1] + int(keep.sum()))
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = self.path.with_name(f".{self.path.name}.tmp-{uuid.uuid4().hex}")
+            tmp_dir.mkdir(parents=True)
+            with open(tmp_dir / VOCABULARY_FILE, "w", encoding="utf-8") as f:
+                json.dump(vocabulary, f)
+            np.save(tmp_dir / OFFSETS_FILE, np.asarray(offsets, dtype=np.int64))
+            np.save(
+                tmp_dir / DOC_POSITIONS_FILE,
+                (
+                    np.concatenate(doc_positions)
+                    if doc_positions
+                    else np.zeros(0, np.int32)
+                ),
+            )
+            np.save(
+                tmp_dir / TERM_FREQS_FILE,
+                np.concatenate(term_freqs) if term_freqs else np.zeros(0, np.int32),
+            )
+            np.save(
+                tmp_dir / LENGTHS_FILE,
+                np.asarray([self._lengths[p] for p in live], dtype=np.int32),
+            )
+            np.save(
+                tmp_dir / IDS_FILE, np.array([self._ids[p] for p in live], dtype=str)
+            )
+            write_metadata(tmp_dir, [self._metadata[p] for p in live])
+
+            # The manifest is written last, so a directory without one is incomplete
+            generation = uuid.uuid4().hex
+            manifest = {
+                "generation": generation,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "chunks": len(live),
+                "terms": len(vocabulary),
+            }
+            with open(tmp_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+            backup_dir = self.path.with_name(
+                f".{self.path.name}.old-{uuid.uuid4().hex}"
+            )
+            if self.path.exists():
+                os.replace(self.path, backup_dir)
+            os.replace(tmp_dir, self.path)
+            shutil.rmtree(backup_dir, ignore_errors=True)
+
+            self._load()
+            logger.info(
+                f"Saved lexical index {self.generation}: {len(live)} chunks, "
+                f"{len(vocabulary)} terms"
+            )
+
+    def maybe_refresh(self, interval: float) -> bool:
+        """Reload the index if another process saved a new generation.
+
+        The manifest is checked at most every ``interval`` seconds, and only
+        while there are no unsaved changes.
+
+        Args:
+            interval: Minimum seconds between manifest checks
+
+        Returns:
+            True if a new generation was loaded
+        """
+        if not self.path or time.monotonic() - self._last_check < interval:
+            return False
+        with self._lock:
+            self._last_check = time.monotonic()
+            if self._pending:
+                return False
+            generation = read_snapshot_generation(str(self.path))
+            if generation is None or generation == self.generation:
+                return False
+            self._load()
+            return True
+
+
+def build_lexical_index(source: PineconeDB, index: LexicalIndex) -> int:
+    """Rebuild a lexical index from every vector of the followed namespace.
+
+    Args:
+        source: Vector database to read chunk metadata from
+        index: Lexical index to rebuild
+
+    Returns:
+        Number of chunks indexed
+    """
+    index.clear()
+    indexed = 0
+    for vector in source.iter_vectors(namespace_override=index.namespace):
+        indexed += index.upsert([vector])
+    index.save()
+    logger.info(f"Indexed {indexed} chunks from namespace '{index.namespace}'")
+    return indexed
+
+
+@lru_cache(maxsize=None)
+def get_lexical_index() -> LexicalIndex:
+    """Get the process-wide lexical index.
+
+    Returns:
+        Shared LexicalIndex saved at ``LEXICAL_INDEX_PATH``
+    """
+    return LexicalIndex(settings.LEXICAL_INDEX_PATH)
+
+
+@lru_cache(maxsize=None)
+def enable_lexical_indexing() -> LexicalIndex:
+    """Keep the process-wide lexical index in step with writes through PineconeDB.
+
+    Pending changes are saved when the process exits.
+
+    Returns:
+        The shared lexical index
+    """
+    index = get_lexical_index()
+    register_vector_write_listener(index.apply)
+    atexit.register(index.save)
+    logger.info(f"Lexical indexing enabled ({settings.LEXICAL_INDEX_PATH})")
+    return index
@@ -0,0 +1,1013 @@
+"""
+In-process vector store that can stand in for the hosted Pinecone index.
+
+``LocalIndex`` implements the subset of the Pinecone ``Index`` API that
+``PineconeDB`` uses (upsert, query, fetch, delete, list and index stats), so
+``LocalVectorDB`` inherits every ``PineconeDB`` operation unchanged. This allows
+offline load testing and tests that run against a real index instead of mocks.
+
+Each namespace holds its vectors in a float32 NumPy matrix with a parallel list
+of metadata records. Queries compute exact cosine similarity with one matrix
+multiply and select the top k with ``argpartition``. When ``hnswlib`` is
+installed, namespaces with at least ``LOCAL_VECTOR_DB_HNSW_THRESHOLD`` vectors
+are queried through an HNSW graph instead. Metadata filters use the Pinecone
+dialect (``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$in``,
+``$nin``, ``$exists``, ``$and`` and ``$or``).
+
+Namespaces persist to one directory each, holding a float32 ``vectors.npy``
+matrix, an ``ids.npy`` array and the metadata records, stored as
+``metadata.parquet`` when ``pyarrow`` is installed (``metadata.jsonl``
+otherwise). Every save also writes ``manifest.json`` with a new
+snapshot generation, which read replicas use to detect changed snapshots (see
+``nyc_landmarks.vectordb.read_replica``).
+"""
+
+import bisect
+import json
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pinecone import Pinecone
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.metadata_filter import MISSING, value_matches
+from nyc_landmarks.vectordb.pinecone_db import (
+    PineconeDB,
+    VectorWrite,
+    _notify_vector_change,
+    _notify_vector_write,
+)
+
+try:
+    import hnswlib  # type: ignore
+
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Directory name used to persist the default ("") namespace
+DEFAULT_NAMESPACE_DIR = "__default__"
+
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+METADATA_FILE = "metadata.jsonl"
+METADATA_PARQUET_FILE = "metadata.parquet"
+MANIFEST_FILE = "manifest.json"
+
+# Operators evaluated with vectorized comparisons on scalar columns
+_VECTORIZED_OPERATORS = {"$eq", "$ne", "$in", "$nin"}
+
+
+# --- Pinecone-compatible response objects ---
+
+
+@dataclass
+class LocalMatch:
+    """A query match, shaped like a Pinecone ``ScoredVector``."""
+
+    id: str
+    score: float
+    values: List[float] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class LocalQueryResponse:
+    """Query response, shaped like a Pinecone ``QueryResponse``."""
+
+    matches: List[LocalMatch]
+    namespace: str
+
+
+@dataclass
+class LocalVector:
+    """A fetched vector, shaped like a Pinecone ``Vector``."""
+
+    id: str
+    values: List[float]
+    metadata: Dict[str, Any]
+
+
+@dataclass
+class LocalFetchResponse:
+    """Fetch response, shaped like a Pinecone ``FetchResponse``."""
+
+    vectors: Dict[str, LocalVector]
+    namespace: str
+
+
+@dataclass
+class LocalUpsertResponse:
+    """Upsert response, shaped like a Pinecone ``UpsertResponse``."""
+
+    upserted_count: int
+
+
+@dataclass
+class LocalIndexStats:
+    """Index statistics, shaped like a Pinecone ``DescribeIndexStatsResponse``."""
+
+    namespaces: Dict[str, Dict[str, int]]
+    dimension: int
+    index_fullness: float
+    total_vector_count: int
+
+
+@dataclass
+class LocalListItem:
+    """A listed vector ID, shaped like a Pinecone ``ListItem``."""
+
+    id: str
+
+
+@dataclass
+class LocalPagination:
+    """Pagination token, shaped like a Pinecone ``Pagination``."""
+
+    next: str
+
+
+@dataclass
+class LocalListResponse:
+    """One page of vector IDs, shaped like a Pinecone ``ListResponse``."""
+
+    vectors: List[LocalListItem]
+    namespace: str
+    pagination: Optional[LocalPagination] = None
+
+
+# --- Metadata persistence ---
+
+# Parquet schema metadata key listing columns stored as JSON strings
+_JSON_COLUMNS_KEY = b"json_columns"
+
+
+def _parquet_column(values: List[Any]) -> Tuple[Any, bool]:
+    """Convert one metadata field to an Arrow array.
+
+    Fields whose values don't share one Arrow type (e.g. numbers in some
+    records and strings in others) are stored as JSON strings instead.
+
+    Returns:
+        Tuple of (Arrow array, whether the values are JSON-encoded)
+    """
+    try:
+        return pa.array(values), False
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        return (
+            pa.array(
+                [json.dumps(value) if value is not None else None for value in values],
+                type=pa.string(),
+            ),
+            True,
+        )
+
+
+def write_metadata(directory: Path, records: List[Dict[str, Any]]) -> None:
+    """Write metadata records to a namespace directory.
+
+    Records are stored column-wise in Parquet (one column per metadata field)
+    when ``pyarrow`` is installed, and as JSON lines otherwise.
+
+    Args:
+        directory: Namespace directory
+        records: Metadata record of each vector, in row order
+    """
+    names = sorted({name for record in records for name in record})
+    # A Parquet table without columns can't record its row count
+    if not PYARROW_AVAILABLE or not names:
+        with open(directory / METADATA_FILE, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        return
+
+    arrays = []
+    json_columns = []
+    for name in names:
+        array, is_json = _parquet_column([record.get(name) for record in records])
+        arrays.append(array)
+        if is_json:
+            json_columns.append(name)
+    table = pa.Table.from_arrays(arrays, names=names)
+    table = table.replace_schema_metadata(
+        {_JSON_COLUMNS_KEY: json.dumps(json_columns).encode()}
+    )
+    pq.write_table(table, directory / METADATA_PARQUET_FILE)
+
+
+def read_metadata(directory: Path) -> List[Dict[str, Any]]:
+    """Read the metadata records written by ``write_metadata``.
+
+    Args:
+        directory: Namespace directory
+
+    Returns:
+        Metadata record of each vector, in row order
+    """
+    parquet_file = directory / METADATA_PARQUET_FILE
+    if not parquet_file.exists():
+        with open(directory / METADATA_FILE, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError(f"pyarrow is required to read {parquet_file}")
+    table = pq.read_table(parquet_file)
+    schema_metadata = table.schema.metadata or {}
+    json_columns = set(json.loads(schema_metadata.get(_JSON_COLUMNS_KEY, b"[]")))
+
+    columns = {name: table.column(name).to_pylist() for name in table.column_names}
+    records: List[Dict[str, Any]] = [{} for _ in range(table.num_rows)]
+    for name, values in columns.items():
+        for record, value in zip(records, values):
+            # Missing fields are read back as nulls
+            if value is not None:
+                record[name] = json.loads(value) if name in json_columns else value
+    return records
+
+
+class _Namespace:
+    """Vectors, IDs and metadata of one namespace."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.metadata: List[Dict[str, Any]] = []
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        # Metadata field -> (values of every row, whether any value is a list)
+        self._columns: Dict[str, Tuple[np.ndarray, bool]] = {}
+        self._hnsw: Any = None
+        self._sorted_ids: Optional[List[str]] = None
+        self.dirty = False
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The live rows of the vector matrix."""
+        return self._vectors[: self.size]
+
+    def _changed(self) -> None:
+        self._columns = {}
+        self._hnsw = None
+        self._sorted_ids = None
+        self.dirty = True
+
+    @property
+    def sorted_ids(self) -> List[str]:
+        """IDs in lexicographic order (cached until a write)."""
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self.ids)
+        return self._sorted_ids
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix capacity (doubling) to hold at least ``rows`` rows."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, 64)
+        vectors = np.empty((new_capacity, self.dimension), dtype=np.float32)
+        vectors[: self.size] = self.vectors
+        norms = np.empty(new_capacity, dtype=np.float32)
+        norms[: self.size] = self._norms[: self.size]
+        self._vectors, self._norms = vectors, norms
+
+    def _ensure_writable(self) -> None:
+        """Copy a memory-mapped (read-only) matrix into memory before a write."""
+        if not self._vectors.flags.writeable:
+            self._vectors = np.array(self.vectors, dtype=np.float32)
+            self._norms = np.array(self._norms[: self.size], dtype=np.float32)
+
+    def load(
+        self, ids: Sequence[str], vectors: np.ndarray, metadata: List[Dict[str, Any]]
+    ) -> None:
+        """Replace the namespace contents with the given arrays."""
+        self.ids = list(ids)
+        self.rows = {vector_id: row for row, vector_id in enumerate(self.ids)}
+        self.metadata = metadata
+        self._vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self._norms = np.linalg.norm(self._vectors, axis=1).astype(np.float32)
+        self._changed()
+        self.dirty = False
+
+    def upsert(
+        self,
+        ids: List[str],
+        values: np.ndarray,
+        metadata: List[Dict[str, Any]],
+    ) -> None:
+        """Insert or overwrite vectors."""
+        self._ensure_writable()
+        norms = np.linalg.norm(values, axis=1).astype(np.float32)
+        self._reserve(self.size + len(ids))
+        for vector_id, vector, norm, meta in zip(ids, values, norms, metadata):
+            row = self.rows.get(vector_id)
+            if row is None:
+                row = self.size
+                self.rows[vector_id] = row
+                self.ids.append(vector_id)
+                self.metadata.append(meta)
+            else:
+                self.metadata[row] = meta
+            self._vectors[row] = vector
+            self._norms[row] = norm
+        self._changed()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """Delete vectors by ID, moving the last row into each freed slot."""
+        self._ensure_writable()
+        deleted = 0
+        for vector_id in ids:
+            row = self.rows.pop(vector_id, None)
+            if row is None:
+                continue
+            last = self.size - 1
+            if row != last:
+                moved_id = self.ids[last]
+                self.ids[row] = moved_id
+                self.metadata[row] = self.metadata[last]
+                self._vectors[row] = self._vectors[last]
+                self._norms[row] = self._norms[last]
+                self.rows[moved_id] = row
+            self.ids.pop()
+            self.metadata.pop()
+            deleted += 1
+        if deleted:
+            self._changed()
+        return deleted
+
+    def _column(self, name: str) -> Tuple[np.ndarray, bool]:
+        """Values of one metadata field for every row (cached until a write)."""
+        column = self._columns.get(name)
+        if column is None:
+            values = np.fromiter(
+                (meta.get(name, MISSING) for meta in self.metadata),
+                dtype=object,
+                count=self.size,
+            )
+            has_lists = any(isinstance(value, list) for value in values)
+            column = self._columns[name] = (values, has_lists)
+        return column
+
+    def build_columns(self, names: Sequence[str]) -> None:
+        """Build the columns of frequently filtered fields ahead of queries."""
+        for name in names:
+            self._column(name)
+
+    def _condition_mask(self, name: str, operator: str, operand: Any) -> np.ndarray:
+        """Boolean mask of the rows whose ``name`` field matches one operator."""
+        values, has_lists = self._column(name)
+        operands = operand if operator in {"$in", "$nin"} else [operand]
+        vectorized = (
+            operator in _VECTORIZED_OPERATORS
+            and not has_lists
+            and all(isinstance(o, (str, int, float, bool)) for o in operands)
+        )
+        if not vectorized:
+            return np.fromiter(
+                (value_matches(value, operator, operand) for value in values),
+                dtype=bool,
+                count=self.size,
+            )
+
+        # Elementwise == on the object column (missing values never compare equal)
+        mask = np.zeros(self.size, dtype=bool)
+        for value in operands:
+            mask |= np.asarray(values == value, dtype=bool)
+        return ~mask if operator in {"$ne", "$nin"} else mask
+
+    def filter_mask(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        """Boolean mask of the rows matching a Pinecone metadata filter."""
+        mask = np.ones(self.size, dtype=bool)
+        for key, condition in filter_dict.items():
+            if key == "$and":
+                for sub_filter in condition:
+                    mask &= self.filter_mask(sub_filter)
+            elif key == "$or":
+                any_mask = np.zeros(self.size, dtype=bool)
+                for sub_filter in condition:
+                    any_mask |= self.filter_mask(sub_filter)
+                mask &= any_mask
+            else:
+                if not isinstance(condition, dict):
+                    condition = {"$eq": condition}
+                for operator, operand in condition.items():
+                    mask &= self._condition_mask(key, operator, operand)
+        return mask
+
+    def _exact_top_k(
+        self, query: np.ndarray, top_k: int, mask: Optional[np.ndarray]
+    ) -> List[Tuple[int, float]]:
+        """Exact cosine top-k with a matrix multiply and ``argpartition``."""
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0.0:
+            # Listing query (zero vector): every row scores 0
+            scores = np.zeros(self.size, dtype=np.float32)
+        else:
+            denominators = self._norms[: self.size] * query_norm
+            scores = np.divide(
+                self.vectors @ query,
+                denominators,
+                out=np.zeros(self.size, dtype=np.float32),
+                where=denominators > 0,
+            )
+
+        if mask is not None:
+            candidates = int(mask.sum())
+            scores = np.where(mask, scores, -np.inf)
+        else:
+            candidates = self.size
+
+        k = min(top_k, candidates)
+        if k <= 0:
+            return []
+        if k < self.size:
+            rows = np.argpartition(-scores, k - 1)[:k]
+        else:
+            rows = np.arange(self.size)
+        rows = rows[np.argsort(-scores[rows], kind="stable")][:k]
+        return [(int(row), float(scores[row])) for row in rows]
+
+    def _hnsw_top_k(
+        self, query: np.ndarray, top_k: int, mask: Optional[np.ndarray]
+    ) -> List[Tuple[int, float]]:
+        """Approximate cosine top-k through an HNSW graph (built on first use)."""
+        if self._hnsw is None:
+            graph = hnswlib.Index(space="cosine", dim=self.dimension)
+            graph.init_index(max_elements=self.size, ef_construction=200, M=16)
+            graph.add_items(self.vectors, np.arange(self.size))
+            self._hnsw = graph
+        self._hnsw.set_ef(max(64, top_k * 2))
+
+        row_filter: Optional[Callable[[int], bool]] = (
+            (lambda row: bool(mask[row])) if mask is not None else None
+        )
+        k = min(top_k, self.size if mask is None else int(mask.sum()))
+        if k <= 0:
+            return []
+        labels, distances = self._hnsw.knn_query(query, k=k, filter=row_filter)
+        return [
+            (int(row), 1.0 - float(distance))
+            for row, distance in zip(labels[0], distances[0])
+        ]
+
+    def query(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]],
+        hnsw_threshold: int,
+    ) -> List[Tuple[int, float]]:
+        """Find the top-k rows by cosine similarity among rows matching a filter."""
+        if self.size == 0 or top_k <= 0:
+            return []
+        mask = self.filter_mask(filter_dict) if filter_dict else None
+
+        use_hnsw = (
+            HNSWLIB_AVAILABLE
+            and self.size >= hnsw_threshold
+            and float(np.linalg.norm(query)) > 0.0
+        )
+        if use_hnsw:
+            try:
+                return self._hnsw_top_k(query, top_k, mask)
+            except RuntimeError as e:
+                # hnswlib raises when a filter leaves too few reachable rows
+                logger.debug(f"HNSW query failed, using exact search: {e}")
+        return self._exact_top_k(query, top_k, mask)
+
+    def save(self, directory: Path) -> None:
+        """Write the namespace to a directory, replacing it atomically."""
+        tmp_dir = directory.with_name(f".{directory.name}.tmp-{uuid.uuid4().hex}")
+        tmp_dir.mkdir(parents=True)
+        np.save(tmp_dir / VECTORS_FILE, self.vectors)
+        np.save(tmp_dir / IDS_FILE, np.array(self.ids, dtype=str))
+        write_metadata(tmp_dir, self.metadata)
+
+        backup_dir = directory.with_name(f".{directory.name}.old-{uuid.uuid4().hex}")
+        if directory.exists():
+            os.replace(directory, backup_dir)
+        os.replace(tmp_dir, directory)
+        shutil.rmtree(backup_dir, ignore_errors=True)
+        self.dirty = False
+
+    @classmethod
+    def read(cls, directory: Path, dimension: int, mmap: bool = False) -> "_Namespace":
+        """Load a namespace written by ``save``.
+
+        With ``mmap`` the vector matrix is memory-mapped read-only instead of
+        read into memory; it is copied on the first write.
+        """
+        namespace = cls(dimension)
+        ids = np.load(directory / IDS_FILE)
+        vectors = np.load(
+            directory / VECTORS_FILE, mmap_mode="r" if mmap else None
+        ).reshape(len(ids), dimension)
+        metadata = read_metadata(directory)
+        namespace.load([str(vector_id) for vector_id in ids], vectors, metadata)
+        return namespace
+
+
+# --- Index ---
+
+
+class LocalIndex:
+    """In-process implementation of the Pinecone ``Index`` operations we use."""
+
+    def __init__(
+        self,
+        dimension: int,
+        path: Optional[str] = None,
+        hnsw_threshold: Optional[int] = None,
+        mmap: bool = False,
+        read_only: bool = False,
+    ):
+        """Initialize the index, loading persisted namespaces from ``path``.
+
+        Args:
+            dimension: Vector dimensions
+            path: Directory to persist namespaces to (in-memory only if None)
+            hnsw_threshold: Namespace size from which queries use HNSW
+                (default: from settings)
+            mmap: Memory-map persisted vector matrices instead of reading them
+            read_only: Reject upserts and deletes
+        """
+        self.dimension = dimension
+        self.path = Path(path) if path else None
+        self.hnsw_threshold = (
+            hnsw_threshold
+            if hnsw_threshold is not None
+            else settings.LOCAL_VECTOR_DB_HNSW_THRESHOLD
+        )
+        self.mmap = mmap
+        self.read_only = read_only
+        self.generation: Optional[str] = None
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.RLock()
+        if self.path and self.path.is_dir():
+            self._load(self.path)
+
+    @staticmethod
+    def _namespace_key(namespace: Optional[str]) -> str:
+        return "" if not namespace or namespace == DEFAULT_NAMESPACE_DIR else namespace
+
+    def _namespace(self, namespace: Optional[str]) -> Optional[_Namespace]:
+        return self._namespaces.get(self._namespace_key(namespace))
+
+    def _writable_namespace(self, namespace: Optional[str]) -> _Namespace:
+        key = self._namespace_key(namespace)
+        ns = self._namespaces.get(key)
+        if ns is None:
+            ns = self._namespaces[key] = _Namespace(self.dimension)
+        return ns
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise RuntimeError("Local vector index is read-only")
+
+    def _load(self, path: Path) -> None:
+        self.generation = read_snapshot_generation(str(path))
+        for directory in sorted(path.iterdir()):
+            if directory.name.startswith(".") or not (directory / IDS_FILE).exists():
+                continue
+            key = self._namespace_key(directory.name)
+            self._namespaces[key] = _Namespace.read(
+                directory, self.dimension, mmap=self.mmap
+            )
+        logger.info(
+            f"Loaded local vector index from {path}: "
+            f"{sum(ns.size for ns in self._namespaces.values())} vectors in "
+            f"{len(self._namespaces)} namespaces (generation {self.generation})"
+        )
+
+    def build_columns(self, names: Sequence[str]) -> None:
+        """Build the metadata columns of frequently filtered fields.
+
+        Args:
+            names: Metadata fields to build columns for
+        """
+        with self._lock:
+            for ns in self._namespaces.values():
+                ns.build_columns(names)
+
+    def save(self) -> None:
+        """Persist namespaces changed since the last save and start a new generation."""
+        if not self.path:
+            return
+        with self._lock:
+            changed = [(key, ns) for key, ns in self._namespaces.items() if ns.dirty]
+            if not changed and self.generation is not None:
+                return
+            self.path.mkdir(parents=True, exist_ok=True)
+            for key, ns in changed:
+                ns.save(self.path / (key or DEFAULT_NAMESPACE_DIR))
+
+            # The manifest is written last so readers never see a new
+            # generation before its namespaces are in place
+            self.generation = uuid.uuid4().hex
+            manifest = {
+                "generation": self.generation,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "dimension": self.dimension,
+                "namespaces": {key: ns.size for key, ns in self._namespaces.items()},
+            }
+            tmp_file = self.path / f".{MANIFEST_FILE}.tmp-{uuid.uuid4().hex}"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_file, self.path / MANIFEST_FILE)
+
+    def clear(self) -> None:
+        """Remove every vector from every namespace (and from disk)."""
+        self._check_writable()
+        with self._lock:
+            self._namespaces = {}
+            self.generation = None
+            if self.path and self.path.is_dir():
+                shutil.rmtree(self.path)
+
+    def upsert(
+        self, vectors: Sequence[Any], namespace: Optional[str] = None, **kwargs: Any
+    ) -> LocalUpsertResponse:
+        """Insert or overwrite vectors given as dicts or (id, values[, metadata]) tuples."""
+        self._check_writable()
+        ids: List[str] = []
+        values: List[Sequence[float]] = []
+        metadata: List[Dict[str, Any]] = []
+        for vector in vectors:
+            if isinstance(vector, dict):
+                ids.append(str(vector["id"]))
+                values.append(vector["values"])
+                metadata.append(dict(vector.get("metadata") or {}))
+            else:
+                ids.append(str(vector[0]))
+                values.append(vector[1])
+                metadata.append(dict(vector[2]) if len(vector) > 2 else {})
+        if not ids:
+            return LocalUpsertResponse(upserted_count=0)
+
+        matrix = np.asarray(values, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Vector dimension {matrix.shape[-1]} does not match index "
+                f"dimension {self.dimension}"
+            )
+        with self._lock:
+            self._writable_namespace(namespace).upsert(ids, matrix, metadata)
+        return LocalUpsertResponse(upserted_count=len(ids))
+
+    def query(
+        self,
+        top_k: int,
+        vector: Optional[Sequence[float]] = None,
+        id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        include_values: bool = False,
+        include_metadata: bool = False,
+        **kwargs: Any,
+    ) -> LocalQueryResponse:
+        """Find the most similar vectors, optionally restricted by a metadata filter."""
+        with self._lock:
+            ns = self._namespace(namespace)
+            if ns is None:
+                return LocalQueryResponse(matches=[], namespace=namespace or "")
+            if vector is None:
+                if id is None or id not in ns.rows:
+                    return LocalQueryResponse(matches=[], namespace=namespace or "")
+                query = ns.vectors[ns.rows[id]].copy()
+            else:
+                query = np.asarray(vector, dtype=np.float32)
+
+            matches = [
+                LocalMatch(
+                    id=ns.ids[row],
+                    score=score,
+                    values=ns.vectors[row].tolist() if include_values else [],
+                    metadata=dict(ns.metadata[row]) if include_metadata else None,
+                )
+                for row, score in ns.query(query, top_k, filter, self.hnsw_threshold)
+            ]
+        return LocalQueryResponse(matches=matches, namespace=namespace or "")
+
+    def fetch(
+        self, ids: Sequence[str], namespace: Optional[str] = None, **kwargs: Any
+    ) -> LocalFetchResponse:
+        """Fetch vectors by ID; missing IDs are omitted."""
+        vectors: Dict[str, LocalVector] = {}
+        with self._lock:
+            ns = self._namespace(namespace)
+            if ns is not None:
+                for vector_id in ids:
+                    row = ns.rows.get(vector_id)
+                    if row is not None:
+                        vectors[vector_id] = LocalVector(
+                            id=vector_id,
+                            values=ns.vectors[row].tolist(),
+                            metadata=dict(ns.metadata[row]),
+                        )
+        return LocalFetchResponse(vectors=vectors, namespace=namespace or "")
+
+    def delete(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        delete_all: bool = False,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Delete vectors by ID, by metadata filter, or all of a namespace."""
+        self._check_writable()
+        with self._lock:
+            ns = self._namespace(namespace)
+            if ns is None:
+                return {}
+            if delete_all:
+                ns.delete(list(ns.ids))
+            elif ids is not None:
+                ns.delete(ids)
+            elif filter:
+                mask = ns.filter_mask(filter)
+                ns.delete([ns.ids[row] for row in np.flatnonzero(mask)])
+        return {}
+
+    def namespaces(self) -> List[str]:
+        """Names of the namespaces holding vectors ("" is the default namespace)."""
+        with self._lock:
+            return [key for key, ns in self._namespaces.items() if ns.size]
+
+    def iter_vectors(
+        self, namespace: Optional[str] = None, batch_size: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the vectors of a namespace in batches of upsert-ready dicts.
+
+        Args:
+            namespace: Namespace to read
+            batch_size: Number of vectors per batch
+
+        Yields:
+            Lists of dicts with id, values and metadata
+        """
+        ns = self._namespace(namespace)
+        if ns is None:
+            return
+        for start in range(0, ns.size, batch_size):
+            with self._lock:
+                rows = range(start, min(start + batch_size, ns.size))
+                batch = [
+                    {
+                        "id": ns.ids[row],
+                        "values": ns.vectors[row].tolist(),
+                        "metadata": dict(ns.metadata[row]),
+                    }
+                    for row in rows
+                ]
+            yield batch
+
+    def describe_index_stats(self, **kwargs: Any) -> LocalIndexStats:
+        """Vector counts per namespace."""
+        with self._lock:
+            namespaces = {
+                key: {"vector_count": ns.size}
+                for key, ns in self._namespaces.items()
+                if ns.size
+            }
+        return LocalIndexStats(
+            namespaces=namespaces,
+            dimension=self.dimension,
+            index_fullness=0.0,
+            total_vector_count=sum(n["vector_count"] for n in namespaces.values()),
+        )
+
+    def list_paginated(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        pagination_token: Optional[str] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> LocalListResponse:
+        """List one page of vector IDs in lexicographic order.
+
+        The pagination token is the last ID of the previous page.
+        """
+        limit = limit or 100
+        prefix = prefix or ""
+        with self._lock:
+            ns = self._namespace(namespace)
+            ids = ns.sorted_ids if ns is not None else []
+        start = bisect.bisect_left(ids, prefix)
+        if pagination_token is not None:
+            start = max(start, bisect.bisect_right(ids, pagination_token))
+
+        # One extra ID tells whether another page follows
+        page = [
+            vector_id
+            for vector_id in ids[start : start + limit + 1]
+            if vector_id.startswith(prefix)
+        ]
+        pagination = None
+        if len(page) > limit:
+            page = page[:limit]
+            pagination = LocalPagination(next=page[-1])
+        return LocalListResponse(
+            vectors=[LocalListItem(id=vector_id) for vector_id in page],
+            namespace=namespace or "",
+            pagination=pagination,
+        )
+
+    def list(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        pagination_token: Optional[str] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[List[str]]:
+        """Yield pages of vector IDs matching a prefix."""
+        while True:
+            response = self.list_paginated(
+                prefix=prefix,
+                limit=limit,
+                pagination_token=pagination_token,
+                namespace=namespace,
+            )
+            if response.vectors:
+                yield [item.id for item in response.vectors]
+            if response.pagination is None:
+                return
+            pagination_token = response.pagination.next
+
+
+def read_snapshot_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Read the manifest of a persisted local index.
+
+    Args:
+        path: Directory the index was saved to
+
+    Returns:
+        Manifest with generation, dimension and per-namespace vector counts, or
+        None if there is no readable manifest
+    """
+    try:
+        with open(Path(path) / MANIFEST_FILE, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def read_snapshot_generation(path: str) -> Optional[str]:
+    """Read the generation of a persisted local index.
+
+    Args:
+        path: Directory the index was saved to
+
+    Returns:
+        Generation ID from the manifest, or None if there is no readable manifest
+    """
+    manifest = read_snapshot_manifest(path)
+    if manifest is None or "generation" not in manifest:
+        return None
+    return str(manifest["generation"])
+
+
+# --- PineconeDB-compatible backend ---
+
+
+class LocalVectorDB(PineconeDB):
+    """PineconeDB backed by an in-process ``LocalIndex`` instead of Pinecone."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        index_name: Optional[str] = None,
+        autosave: bool = True,
+        hnsw_threshold: Optional[int] = None,
+    ):
+        """Initialize the local vector database.
+
+        Args:
+            path: Directory to persist the index to (default: from settings;
+                pass "" for an in-memory index)
+            index_name: Name reported for the index (default: from settings)
+            autosave: Persist changed namespaces after each write operation
+            hnsw_threshold: Namespace size from which queries use HNSW
+                (default: from settings)
+        """
+        self.autosave = autosave
+        self.path = path if path is not None else settings.LOCAL_VECTOR_DB_PATH
+        self.local_index = self._open_local_index(hnsw_threshold)
+        super().__init__(index_name)
+
+    def _open_local_index(self, hnsw_threshold: Optional[int]) -> LocalIndex:
+        """Open the local index persisted at ``self.path``."""
+        return LocalIndex(
+            settings.PINECONE_DIMENSIONS,
+            path=self.path or None,
+            hnsw_threshold=hnsw_threshold,
+        )
+
+    def _create_client(self) -> Optional[Pinecone]:
+        """The local backend does not use a Pinecone client."""
+        return None
+
+    def _connect_to_index(self) -> None:
+        """Serve operations from the local index."""
+        self.index = self.local_index
+        logger.info(f"Using local vector index: {self.path or '(in-memory)'}")
+
+    def save(self) -> None:
+        """Persist namespaces changed since the last save."""
+        self.local_index.save()
+
+    def _autosave(self) -> None:
+        if self.autosave:
+            self.local_index.save()
+
+    def store_chunks(self, *args: Any, **kwargs: Any) -> List[str]:
+        """Store chunks (see ``PineconeDB.store_chunks``) and persist them."""
+        vector_ids = super().store_chunks(*args, **kwargs)
+        self._autosave()
+        return vector_ids
+
+    def store_vectors_batch(
+        self, vectors: List[Tuple[str, List[float], Dict[str, Any]]]
+    ) -> bool:
+        """Store (id, embedding, metadata) tuples and persist them."""
+        stored = super().store_vectors_batch(vectors)
+        self._autosave()
+        return stored
+
+    def upsert_vectors(self, *args: Any, **kwargs: Any) -> int:
+        """Upsert vectors (see ``PineconeDB.upsert_vectors``) and persist them."""
+        stored = super().upsert_vectors(*args, **kwargs)
+        self._autosave()
+        return stored
+
+    def delete_vectors(self, vector_ids: List[str]) -> int:
+        """Delete vectors by ID and persist the change."""
+        deleted = super().delete_vectors(vector_ids)
+        self._autosave()
+        return deleted
+
+    def delete_vectors_by_filter(self, filter_dict: Dict[str, Any]) -> int:
+        """Delete vectors by metadata filter and persist the change."""
+        deleted = super().delete_vectors_by_filter(filter_dict)
+        self._autosave()
+        return deleted
+
+    def recreate_index(self) -> bool:
+        """Remove every vector from the local index."""
+        self.local_index.clear()
+        _notify_vector_change([None])
+        _notify_vector_write(VectorWrite(namespace="", cleared=True))
+        return True
+
+    def delete_index(self) -> bool:
+        """Remove every vector from the local index and its files."""
+        return self.recreate_index()
+
+    def list_indexes(self) -> List[str]:
+        """The local backend has a single index."""
+        return [self.index_name] if self.index_name else []
+
+    def create_index_if_not_exists(
+        self,
+        index_name: Optional[str] = None,
+        dimensions: Optional[int] = None,
+        metric: str = "cosine",
+    ) -> bool:
+        """The local index always exists."""
+        return True
+
+
+@lru_cache(maxsize=None)
+def get_local_vector_db() -> LocalVectorDB:
+    """Get the process-wide local vector database.
+
+    Returns:
+        Shared LocalVectorDB loaded from ``LOCAL_VECTOR_DB_PATH``
+    """
+    return LocalVectorDB()
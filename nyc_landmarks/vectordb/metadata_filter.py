@@ -0,0 +1,101 @@
+"""
+Client-side evaluation of Pinecone metadata filters.
+
+Supports the operators of the Pinecone filter dialect: ``$eq``, ``$ne``,
+``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$in``, ``$nin``, ``$exists``, ``$and``
+and ``$or``. A condition that is not a dict means ``$eq``. Used by the local
+vector store and by listings that fetch metadata instead of querying with a
+server-side filter.
+"""
+
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Dict
+
+# Marker for metadata fields a vector doesn't have
+MISSING = object()
+
+# Comparison of a scalar metadata value with the operand, per filter operator
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "$eq": eq,
+    "$ne": ne,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+    "$gt": gt,
+    "$gte": ge,
+    "$lt": lt,
+    "$lte": le,
+}
+
+
+def _compare(value: Any, operator: str, operand: Any) -> bool:
+    """Evaluate one filter operator against a scalar metadata value."""
+    compare = _OPERATORS.get(operator)
+    if compare is None:
+        raise ValueError(f"Unsupported filter operator: {operator}")
+    try:
+        return bool(compare(value, operand))
+    except TypeError:
+        # Values of incomparable types (e.g. str > int) don't match
+        return False
+
+
+def value_matches(value: Any, operator: str, operand: Any) -> bool:
+    """Evaluate one filter operator against a metadata value.
+
+    List-valued metadata (e.g. ``building_names``) matches ``$eq``/``$in`` when
+    any element matches, and ``$ne``/``$nin`` when no element does.
+
+    Args:
+        value: Metadata value, or ``MISSING`` if the field is absent
+        operator: Filter operator (e.g. "$eq")
+        operand: Operator argument
+
+    Returns:
+        True if the value satisfies the operator
+
+    Raises:
+        ValueError: If the operator is not supported
+    """
+    if operator == "$exists":
+        return (value is not MISSING) == bool(operand)
+    if value is MISSING:
+        return operator in {"$ne", "$nin"}
+    if isinstance(value, list):
+        if operator in {"$eq", "$in"}:
+            return any(_compare(item, operator, operand) for item in value)
+        if operator == "$ne":
+            return operand not in value
+        if operator == "$nin":
+            return not any(item in operand for item in value)
+        return False
+    return _compare(value, operator, operand)
+
+
+def matches_filter(metadata: Dict[str, Any], filter_dict: Dict[str, Any]) -> bool:
+    """Check whether a metadata record satisfies a Pinecone metadata filter.
+
+    Args:
+        metadata: Metadata of one vector
+        filter_dict: Pinecone metadata filter
+
+    Returns:
+        True if the record matches every condition of the filter
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator
+    """
+    for key, condition in filter_dict.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_filter(metadata, sub) for sub in condition):
+                return False
+        else:
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            value = metadata.get(key, MISSING)
+            for operator, operand in condition.items():
+                if not value_matches(value, operator, operand):
+                    return False
+    return True
@@ -5,7 +5,21 @@ PineconeDB class that handles vector operations in Pinecone.
 import os
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    cast,
+)
 
 from pinecone import Pinecone
 
@@ -13,15 +27,156 @@ from nyc_landmarks.config.settings import settings
 from nyc_landmarks.models.metadata_models import LandmarkMetadata
 from nyc_landmarks.utils.logger import get_logger
 from nyc_landmarks.vectordb.enhanced_metadata import EnhancedMetadataCollector
+from nyc_landmarks.vectordb.metadata_filter import matches_filter
+from nyc_landmarks.vectordb.vector_id_validator import VectorIDValidator
 
 logger = get_logger(__name__)
 
+# Callbacks notified with the landmark ID (None when unknown) whenever vectors
+# are written or deleted through PineconeDB, e.g. to invalidate caches
+_vector_change_listeners: List[Callable[[Optional[str]], object]] = []
+
+
+def register_vector_change_listener(
+    listener: Callable[[Optional[str]], object],
+) -> None:
+    """Register a callback invoked when a landmark's vectors change.
+
+    Args:
+        listener: Called with the landmark ID, or None if the change may
+            affect any landmark. Its return value is ignored.
+    """
+    if listener not in _vector_change_listeners:
+        _vector_change_listeners.append(listener)
+
+
+def _notify_vector_change(landmark_ids: Iterable[Optional[str]]) -> None:
+    """Notify registered listeners that vectors of the given landmarks changed."""
+    for landmark_id in set(landmark_ids):
+        for listener in _vector_change_listeners:
+            try:
+                listener(landmark_id)
+            except Exception as e:
+                logger.warning(f"Vector change listener failed: {e}")
+
+
+@dataclass
+class VectorWrite:
+    """Vectors written or deleted through PineconeDB, for derived local indexes."""
+
+    namespace: str
+    upserted: List[Dict[str, Any]] = field(default_factory=list)
+    deleted_ids: List[str] = field(default_factory=list)
+    deleted_filter: Optional[Dict[str, Any]] = None
+    cleared: bool = False  # Every vector of the index was removed
+
+
+# Callbacks notified with the full details of each write, e.g. to keep the
+# lexical index in step with the vector index
+_vector_write_listeners: List[Callable[[VectorWrite], None]] = []
+
+
+def register_vector_write_listener(listener: Callable[[VectorWrite], None]) -> None:
+    """Register a callback invoked with each write made through PineconeDB.
+
+    Args:
+        listener: Called with the namespace and the upserted or deleted vectors
+    """
+    if listener not in _vector_write_listeners:
+        _vector_write_listeners.append(listener)
+
+
+def _notify_vector_write(write: VectorWrite) -> None:
+    """Notify registered listeners of a write."""
+    for listener in _vector_write_listeners:
+        try:
+            listener(write)
+        except Exception as e:
+            logger.warning(f"Vector write listener failed: {e}")
+
+
+def _namespace_name(namespace: Optional[str]) -> str:
+    """Normalize a namespace name, mapping the default namespace to ""."""
+    if not namespace or namespace == "__default__":
+        return ""
+    return namespace
+
+
+# Client error statuses of ID listing requests that may succeed when retried
+_TRANSIENT_LISTING_STATUSES = {401, 403, 408, 429}
+
+
+def _is_listing_unsupported(error: Exception) -> bool:
+    """Check whether an ID listing error means the index can't list IDs at all.
+
+    Pod-based indexes reject listing with a 4xx response. Authentication,
+    timeout and rate limit responses, network errors and server errors are
+    treated as transient.
+    """
+    if isinstance(error, (AttributeError, NotImplementedError)):
+        return True
+    status = getattr(error, "status", None)
+    return (
+        isinstance(status, int)
+        and 400 <= status < 500
+        and status not in _TRANSIENT_LISTING_STATUSES
+    )
+
+
+def _namespace_key(vector_id: str) -> str:
+    """ID prefix used to remember which namespace vectors live in (e.g. "wiki")."""
+    return vector_id.split("-", 1)[0]
+
+
+class VectorIndex(Protocol):
+    """Index operations used by PineconeDB.
+
+    Implemented by the Pinecone ``Index`` and by the in-process ``LocalIndex``.
+    """
+
+    def upsert(self, *args: Any, **kwargs: Any) -> Any:
+        """Insert or overwrite vectors."""
+
+    def query(self, *args: Any, **kwargs: Any) -> Any:
+        """Find the vectors nearest to a query vector."""
+
+    def fetch(self, *args: Any, **kwargs: Any) -> Any:
+        """Fetch vectors by ID."""
+
+    def delete(self, *args: Any, **kwargs: Any) -> Any:
+        """Delete vectors by ID or metadata filter."""
+
+    def describe_index_stats(self, *args: Any, **kwargs: Any) -> Any:
+        """Get vector counts per namespace."""
+
+
+class IdListingIndex(Protocol):
+    """ID listing operations of serverless Pinecone indexes and ``LocalIndex``.
+
+    Pod-based Pinecone indexes reject them, so they are not part of
+    ``VectorIndex``.
+    """
+
+    def list(self, *args: Any, **kwargs: Any) -> Iterator[List[str]]:
+        """Iterate over pages of vector IDs."""
+
+    def list_paginated(self, *args: Any, **kwargs: Any) -> Any:
+        """List one page of vector IDs."""
+
 
 class PineconeDB:
     """
     Class to handle vector operations in Pinecone.
     """
 
+    index: VectorIndex
+
+    # Cleared when the index rejects ID listing (pod-based indexes)
+    _id_listing_supported = True
+
+    # (monotonic time, stats) of the last describe_index_stats call
+    _index_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
     def __init__(self, index_name: Optional[str] = None):
         """
         Initialize PineconeDB with connection to Pinecone index.
@@ -40,10 +195,11 @@ class PineconeDB:
             "PINECONE_NAMESPACE", settings.PINECONE_NAMESPACE
         )
         self.dimensions = settings.PINECONE_DIMENSIONS
+        # Namespace each ID prefix was last fetched from
+        self._prefix_namespaces: Dict[str, str] = {}
 
         # Initialize Pinecone
-        logger.info("Initialized Pinecone client")
-        self.pc = Pinecone(api_key=self.api_key)
+        self.pc = self._create_client()
 
         # Connect to index
         try:
@@ -52,6 +208,30 @@ class PineconeDB:
             logger.error(f"Failed to connect to Pinecone index: {e}")
             raise
 
+    def _create_client(self) -> Optional[Pinecone]:
+        """
+        Create the Pinecone client.
+
+        Returns:
+            Pinecone client, or None for backends that don't use one
+        """
+        logger.info("Initialized Pinecone client")
+        return Pinecone(api_key=self.api_key)
+
+    def _client(self) -> Pinecone:
+        """
+        Get the Pinecone client for index management operations.
+
+        Returns:
+            Pinecone client
+
+        Raises:
+            RuntimeError: If this backend has no Pinecone client
+        """
+        if self.pc is None:
+            raise RuntimeError(f"{type(self).__name__} has no Pinecone client")
+        return self.pc
+
     def _connect_to_index(self) -> None:
         """
         Internal method to connect to Pinecone index.
@@ -61,10 +241,15 @@ class PineconeDB:
         if not self.index_name:
             raise ValueError("Pinecone index name cannot be None")
 
-        self.index = self.pc.Index(self.index_name)
+        self.index = self._client().Index(self.index_name)
         logger.info(f"Connected to Pinecone index: {self.index_name}")
         logger.info(f"Using Pinecone namespace: {self.namespace}")
 
+    @property
+    def id_listing_index(self) -> IdListingIndex:
+        """The index, for ID listing operations (not supported by pod indexes)."""
+        return cast(IdListingIndex, self.index)
+
     def _get_source_type_from_prefix(self, id_prefix: str) -> str:
         """
         Determine source type based on ID prefix.
@@ -328,6 +513,41 @@ class PineconeDB:
                 article_data["article_rev_id"] = article_meta["rev_id"]
             metadata.update({k: v for k, v in article_data.items() if v})
 
+    def _upsert_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        batch_number: int,
+        namespace: Optional[str] = None,
+    ) -> bool:
+        """
+        Upsert one batch of vectors, retrying up to 3 times.
+
+        Args:
+            batch: Vectors to upsert
+            batch_number: Position of the batch (for logging)
+            namespace: Namespace to upsert into (default: instance namespace)
+
+        Returns:
+            True if the batch was stored, False after 3 failed attempts
+        """
+        target_namespace = namespace if namespace is not None else self.namespace
+        retry_count = 0
+        while retry_count < 3:
+            try:
+                # Convert to the expected type for the Pinecone SDK
+                self.index.upsert(
+                    vectors=cast(List[Any], batch),
+                    namespace=target_namespace if target_namespace else None,
+                )
+                return True
+            except Exception as e:
+                retry_count += 1
+                logger.error(
+                    f"Failed to store chunk batch {batch_number} on attempt {retry_count}: {e}"
+                )
+        logger.error(f"Giving up on batch {batch_number} after 3 attempts")
+        return False
+
     def _upsert_vectors_in_batches(
         self, vectors: List[Dict[str, Any]], batch_size: int = 100
     ) -> None:
@@ -339,25 +559,62 @@ class PineconeDB:
             batch_size: Size of each batch
         """
         for i in range(0, len(vectors), batch_size):
-            batch = vectors[i : i + batch_size]
-            retry_count = 0
-            while retry_count < 3:
-                try:
-                    # Convert to the expected type for the Pinecone SDK
-                    self.index.upsert(
-                        vectors=cast(List[Any], batch),
-                        namespace=self.namespace if self.namespace else None,
-                    )
-                    break
-                except Exception as e:
-                    retry_count += 1
-                    logger.error(
-                        f"Failed to store chunk batch {i // batch_size} on attempt {retry_count}: {e}"
+            self._upsert_batch(vectors[i : i + batch_size], i // batch_size)
+
+    def upsert_vectors(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        batch_size: int = 100,
+        max_workers: int = 1,
+    ) -> int:
+        """
+        Upsert vectors in batches, sending up to ``max_workers`` batches concurrently.
+
+        Args:
+            vectors: Vectors as dicts with id, values and metadata
+            namespace: Namespace to upsert into (default: instance namespace)
+            batch_size: Size of each batch
+            max_workers: Number of batches upserted in parallel
+
+        Returns:
+            Number of vectors stored
+        """
+        batches = [
+            vectors[i : i + batch_size] for i in range(0, len(vectors), batch_size)
+        ]
+        if max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda numbered: self._upsert_batch(
+                            numbered[1], numbered[0], namespace
+                        ),
+                        enumerate(batches),
                     )
-                    if retry_count == 3:
-                        logger.error(
-                            f"Giving up on batch {i // batch_size} after 3 attempts"
-                        )
+                )
+        else:
+            results = [
+                self._upsert_batch(batch, number, namespace)
+                for number, batch in enumerate(batches)
+            ]
+
+        stored = sum(len(batch) for batch, ok in zip(batches, results) if ok)
+        _notify_vector_change(
+            vector.get("metadata", {}).get("landmark_id") for vector in vectors
+        )
+        _notify_vector_write(
+            VectorWrite(
+                namespace=_namespace_name(
+                    namespace if namespace is not None else self.namespace
+                ),
+                upserted=[
+                    v for batch, ok in zip(batches, results) if ok for v in batch
+                ],
+            )
+        )
+        logger.info(f"Upserted {stored} of {len(vectors)} vectors")
+        return stored
 
     def store_chunks(
         self,
@@ -439,6 +696,21 @@ class PineconeDB:
 
         # Store vectors in batches
         self._upsert_vectors_in_batches(vectors)
+        _notify_vector_change(
+            [landmark_id]
+            if landmark_id
+            else [
+                (
+                    v["metadata"].get("landmark_id")
+                    if isinstance(v["metadata"], dict)
+                    else None
+                )
+                for v in vectors
+            ]
+        )
+        _notify_vector_write(
+            VectorWrite(namespace=_namespace_name(self.namespace), upserted=vectors)
+        )
 
         logger.info(f"Stored {len(vector_ids)} vectors")
         return vector_ids
@@ -592,13 +864,19 @@ class PineconeDB:
         - ID prefix filtering
         - Listing operations (when query_vector is None)
 
+        Listing operations with an ID prefix or without filters use the index's
+        native ID listing (see ``iter_vectors``), falling back to a zero-vector
+        query on indexes that don't support it. Native listing matches the
+        prefix case-sensitively; a prefix it finds nothing for is matched
+        case-insensitively with the zero-vector query instead.
+
         Args:
             query_vector: Embedding vector for semantic search. If None, performs listing operation
             top_k: Number of results to return
             filter_dict: Custom metadata filters (combined with other filters)
             landmark_id: Filter by specific landmark ID
             source_type: Filter by source type ("wikipedia", "pdf", "test")
-            id_prefix: Filter vector IDs by prefix (case-insensitive)
+            id_prefix: Filter vector IDs by prefix
             include_values: Whether to include embedding values in results
             namespace_override: Override the instance namespace for this query
             correlation_id: Optional correlation ID for request tracing and logging
@@ -632,6 +910,33 @@ class PineconeDB:
             combined_filter = self._build_combined_filter(
                 filter_dict, landmark_id, source_type
             )
+
+            # Exact listing by ID; filter-only listings keep the server-side filter
+            use_id_listing = (
+                query_vector is None
+                and (id_prefix or not combined_filter)
+                and self._id_listing_supported
+            )
+            if use_id_listing:
+                listed = self._list_by_id_prefix(
+                    id_prefix,
+                    combined_filter,
+                    include_values,
+                    namespace_override,
+                    top_k,
+                )
+                if listed is not None:
+                    logger.info(
+                        "Vector query operation completed",
+                        extra={
+                            "correlation_id": correlation_id,
+                            "results_count": len(listed),
+                            "actual_top_k": top_k,
+                            "operation": "vector_query_complete",
+                        },
+                    )
+                    return listed
+
             vector = self._get_query_vector(query_vector)
 
             # Adjust top_k for prefix filtering
@@ -696,6 +1001,56 @@ class PineconeDB:
             )
             return []
 
+    def _list_by_id_prefix(
+        self,
+        id_prefix: Optional[str],
+        combined_filter: Dict[str, Any],
+        include_values: bool,
+        namespace_override: Optional[str],
+        top_k: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        List vectors with the index's native ID listing.
+
+        Native listing matches the prefix case-sensitively. When it finds
+        nothing for a prefix with cased characters, None is returned so the
+        caller falls back to the case-insensitive query listing.
+
+        Args:
+            id_prefix: Filter vector IDs by prefix
+            combined_filter: Metadata filters applied to the fetched vectors
+            include_values: Whether to include embedding values
+            namespace_override: Override the instance namespace for this listing
+            top_k: Maximum number of vectors to return
+
+        Returns:
+            Listed vectors, or None if the query listing should be used
+        """
+        try:
+            result_list = list(
+                self.iter_vectors(
+                    id_prefix=id_prefix,
+                    filter_dict=combined_filter,
+                    include_values=include_values,
+                    namespace_override=namespace_override,
+                    limit=top_k,
+                )
+            )
+        except Exception as e:
+            if _is_listing_unsupported(e):
+                self._id_listing_supported = False
+                logger.warning(f"ID listing unsupported, using query listing: {e}")
+            else:
+                logger.warning(f"ID listing failed, falling back to query listing: {e}")
+            return None
+
+        if not result_list and id_prefix and id_prefix.lower() != id_prefix.upper():
+            logger.debug(
+                f"No IDs start with {id_prefix!r}, matching it case-insensitively"
+            )
+            return None
+        return result_list
+
     # Convenience methods for common query patterns
 
     def query_semantic_search(
@@ -730,6 +1085,147 @@ class PineconeDB:
             correlation_id=correlation_id,
         )
 
+    def iter_id_pages(
+        self,
+        id_prefix: Optional[str] = None,
+        namespace_override: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[List[str]]:
+        """
+        Stream vector IDs in ID order, one page per list request.
+
+        Args:
+            id_prefix: Only list vector IDs starting with this prefix
+                (case-sensitive)
+            namespace_override: Override the instance namespace for this listing
+            page_size: Number of IDs listed per request
+
+        Yields:
+            Pages of vector IDs
+        """
+        namespace = (
+            namespace_override if namespace_override is not None else self.namespace
+        )
+        pagination_token: Optional[str] = None
+
+        while True:
+            page = self.id_listing_index.list_paginated(
+                prefix=id_prefix or None,
+                limit=page_size,
+                pagination_token=pagination_token,
+                namespace=namespace if namespace else None,
+            )
+            ids = [item.id for item in (page.vectors or [])]
+            if ids:
+                yield ids
+
+            pagination = getattr(page, "pagination", None)
+            pagination_token = getattr(pagination, "next", None)
+            if not pagination_token:
+                return
+
+    def iter_vectors(
+        self,
+        id_prefix: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        landmark_id: Optional[str] = None,
+        source_type: Optional[str] = None,
+        include_values: bool = False,
+        namespace_override: Optional[str] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream vectors in ID order using the index's native ID listing.
+
+        Each page of IDs matching the prefix is fetched with one batched
+        ``fetch`` call, and metadata filters are applied to the fetched
+        records. Listing is exact and costs one list and one fetch request
+        per page.
+
+        Args:
+            id_prefix: Only list vector IDs starting with this prefix
+                (case-sensitive)
+            filter_dict: Custom metadata filters
+            landmark_id: Filter by specific landmark ID
+            source_type: Filter by source type
+            include_values: Whether to include embedding values
+            namespace_override: Override the instance namespace for this listing
+            page_size: Number of IDs listed and fetched per request
+            limit: Maximum number of vectors to yield (default: all)
+
+        Yields:
+            Vectors as dicts with id, metadata and optionally values
+        """
+        namespace = (
+            namespace_override if namespace_override is not None else self.namespace
+        )
+        combined_filter = self._build_combined_filter(
+            filter_dict, landmark_id, source_type
+        )
+        yielded = 0
+
+        for ids in self.iter_id_pages(id_prefix, namespace_override, page_size):
+            response = self.index.fetch(
+                ids=ids, namespace=namespace if namespace else None
+            )
+            for vector_id in ids:
+                vector = response.vectors.get(vector_id)
+                if vector is None:
+                    continue
+                metadata = dict(getattr(vector, "metadata", None) or {})
+                if combined_filter and not matches_filter(metadata, combined_filter):
+                    continue
+
+                result: Dict[str, Any] = {"id": vector_id, "metadata": metadata}
+                if include_values:
+                    result["values"] = list(getattr(vector, "values", []))
+                yield result
+
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+    def get_indexed_landmarks(
+        self, namespace_override: Optional[str] = None
+    ) -> Dict[str, Set[str]]:
+        """
+        Find which landmarks have vectors in the index, by source type.
+
+        Vector IDs encode the landmark and chunk (see VectorIDValidator), so
+        the answer comes from one enumeration of the IDs without fetching any
+        vectors or metadata. IDs in other formats are ignored.
+
+        Args:
+            namespace_override: Override the instance namespace for this listing
+
+        Returns:
+            Dictionary mapping source type ("pdf", "wikipedia") to the IDs of
+            landmarks with at least one vector of that type
+
+        Raises:
+            Exception: If the index doesn't support ID listing
+        """
+        indexed: Dict[str, Set[str]] = {"pdf": set(), "wikipedia": set()}
+        listed = 0
+        for ids in self.iter_id_pages(namespace_override=namespace_override):
+            listed += len(ids)
+            for vector_id in ids:
+                info = VectorIDValidator.extract_landmark_info(vector_id)
+                if info is None:
+                    continue
+                source_type = VectorIDValidator.get_source_type(vector_id)
+                indexed.setdefault(source_type, set()).add(info[0])
+
+        logger.info(
+            f"Listed {listed} vector IDs: "
+            + ", ".join(
+                f"{len(landmarks)} landmarks with {source_type} vectors"
+                for source_type, landmarks in indexed.items()
+            )
+        )
+        return indexed
+
     def list_vectors(
         self,
         limit: int = 100,
@@ -744,6 +1240,8 @@ class PineconeDB:
         """
         List vectors without semantic search (listing operation).
 
+        Use ``iter_vectors`` to stream large listings instead.
+
         Args:
             limit: Maximum number of vectors to return
             filter_dict: Custom metadata filters
@@ -773,6 +1271,8 @@ class PineconeDB:
         """
         Delete vectors from Pinecone index.
 
+        Vectors are deleted from the instance namespace, where they are stored.
+
         Args:
             vector_ids: List of vector IDs to delete
 
@@ -789,9 +1289,18 @@ class PineconeDB:
 
             for i in range(0, len(vector_ids), batch_size):
                 batch = vector_ids[i : i + batch_size]
-                self.index.delete(ids=batch)
+                self.index.delete(
+                    ids=batch, namespace=self.namespace if self.namespace else None
+                )
                 deleted_count += len(batch)
 
+            _notify_vector_change([None])
+            _notify_vector_write(
+                VectorWrite(
+                    namespace=_namespace_name(self.namespace),
+                    deleted_ids=list(vector_ids),
+                )
+            )
             return deleted_count
 
         except Exception as e:
@@ -802,6 +1311,8 @@ class PineconeDB:
         """
         Delete vectors by metadata filter.
 
+        Vectors are deleted from the instance namespace, where they are stored.
+
         Args:
             filter_dict: Dictionary of metadata filters
 
@@ -810,7 +1321,20 @@ class PineconeDB:
         """
         try:
             # Delete by filter
-            self.index.delete(filter=filter_dict)
+            self.index.delete(
+                filter=filter_dict,
+                namespace=self.namespace if self.namespace else None,
+            )
+            landmark_id = filter_dict.get("landmark_id")
+            _notify_vector_change(
+                [landmark_id if isinstance(landmark_id, str) else None]
+            )
+            _notify_vector_write(
+                VectorWrite(
+                    namespace=_namespace_name(self.namespace),
+                    deleted_filter=filter_dict,
+                )
+            )
 
             logger.info(f"Deleted vectors matching filter: {filter_dict}")
             return 1  # No way to know exact count from delete response
@@ -904,7 +1428,7 @@ class PineconeDB:
             # Use existing Pinecone client for index operations
             from pinecone import ServerlessSpec
 
-            pc = self.pc
+            pc = self._client()
 
             # Delete the existing index if it exists
             try:
@@ -930,6 +1454,8 @@ class PineconeDB:
 
                 # Reinitialize connection to the new index
                 self._connect_to_index()
+                _notify_vector_change([None])
+                _notify_vector_write(VectorWrite(namespace="", cleared=True))
 
                 return True
             except Exception as e:
@@ -974,6 +1500,15 @@ class PineconeDB:
                     vectors=cast(List[Any], batch),
                     namespace=self.namespace if self.namespace else None,
                 )
+            _notify_vector_change(
+                metadata.get("landmark_id") for _, _, metadata in vectors
+            )
+            _notify_vector_write(
+                VectorWrite(
+                    namespace=_namespace_name(self.namespace),
+                    upserted=pinecone_vectors,
+                )
+            )
 
             logger.info(f"Successfully stored {len(pinecone_vectors)} vectors")
             return True
@@ -994,11 +1529,13 @@ class PineconeDB:
 
         try:
             # Use existing Pinecone client for index operations
-            pc = self.pc
+            pc = self._client()
 
             # Delete the index
             pc.delete_index(self.index_name)
             logger.info(f"Deleted index: {self.index_name}")
+            _notify_vector_change([None])
+            _notify_vector_write(VectorWrite(namespace="", cleared=True))
             return True
         except Exception as e:
             logger.error(f"Failed to delete index: {e}")
@@ -1025,62 +1562,117 @@ class PineconeDB:
             }
         return None
 
-    def _fetch_from_namespace(
-        self, vector_id: str, namespace: Optional[str]
-    ) -> Optional[Dict[str, Any]]:
+    def _cached_index_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics, reusing results for PINECONE_INDEX_STATS_TTL seconds.
+
+        Returns:
+            Dictionary with index statistics
         """
-        Fetch vector from a specific namespace.
+        now = time.monotonic()
+        if (
+            self._index_stats_cache is not None
+            and now - self._index_stats_cache[0] < settings.PINECONE_INDEX_STATS_TTL
+        ):
+            return self._index_stats_cache[1]
+
+        stats = self.get_index_stats()
+        if stats:
+            self._index_stats_cache = (now, stats)
+        return stats
+
+    def _fetch_ids_from_namespace(
+        self, ids: List[str], namespace: str, batch_size: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch vectors from one namespace in batches.
+
+        Records the namespace of every ID prefix that is found.
 
         Args:
-            vector_id: Vector ID to fetch
-            namespace: Namespace to fetch from, None for default namespace
+            ids: Vector IDs to fetch
+            namespace: Namespace to fetch from, "" for the default namespace
+            batch_size: Number of IDs per fetch request
 
         Returns:
-            Vector data or None if not found
+            Dictionary mapping each found ID to its vector data
         """
-        try:
-            if namespace:
-                result = self.index.fetch(ids=[vector_id], namespace=namespace)
-            else:
-                result = self.index.fetch(ids=[vector_id])
-            return self._extract_vector_data(result, vector_id)
-        except Exception as e:
-            ns_str = f"namespace '{namespace}'" if namespace else "default namespace"
-            logger.warning(f"Error fetching vector from {ns_str}: {e}")
-            return None
+        found: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(ids), batch_size):
+            batch = ids[i : i + batch_size]
+            try:
+                result = self.index.fetch(ids=batch, namespace=namespace or None)
+            except Exception as e:
+                ns_str = (
+                    f"namespace '{namespace}'" if namespace else "default namespace"
+                )
+                logger.warning(f"Error fetching vectors from {ns_str}: {e}")
+                continue
 
-    def _search_all_namespaces(
-        self, vector_id: str, skip_namespace: Optional[str]
-    ) -> Optional[Dict[str, Any]]:
+            for vector_id in batch:
+                vector_data = self._extract_vector_data(result, vector_id)
+                if vector_data:
+                    found[vector_id] = vector_data
+                    self._prefix_namespaces[_namespace_key(vector_id)] = namespace
+        return found
+
+    def fetch_vectors(
+        self,
+        ids: List[str],
+        namespace: Optional[str] = None,
+        batch_size: int = 100,
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Search for vector in all namespaces except the one specified.
+        Fetch many vectors by ID with batched requests.
+
+        Each ID is first looked up in the namespace its ID prefix (e.g. "wiki",
+        "LP") was last found in, or else in the requested namespace. IDs not
+        found there are looked up in the other namespaces of the index, one
+        batched fetch per namespace, using index statistics cached for
+        PINECONE_INDEX_STATS_TTL seconds.
 
         Args:
-            vector_id: Vector ID to search for
-            skip_namespace: Namespace to skip in the search
+            ids: Vector IDs to fetch
+            namespace: Namespace to look in first (default: instance namespace)
+            batch_size: Number of IDs per fetch request
 
         Returns:
-            Vector data or None if not found
+            Dictionary mapping each found ID to its vector data (same format as
+            fetch_vector_by_id); IDs not found in any namespace are omitted
         """
-        try:
-            stats = self.get_index_stats()
-            all_namespaces = list(stats.get("namespaces", {}).keys())
+        requested = _namespace_name(
+            namespace if namespace is not None else self.namespace
+        )
+        pending = list(dict.fromkeys(ids))
+
+        first_namespace: Dict[str, str] = {}
+        groups: Dict[str, List[str]] = {}
+        for vector_id in pending:
+            ns = self._prefix_namespaces.get(_namespace_key(vector_id), requested)
+            first_namespace[vector_id] = ns
+            groups.setdefault(ns, []).append(vector_id)
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for ns, group in groups.items():
+            found.update(self._fetch_ids_from_namespace(group, ns, batch_size))
+
+        if len(found) < len(pending):
+            stats = self._cached_index_stats()
+            for ns_name in stats.get("namespaces", {}):
+                ns = _namespace_name(ns_name)
+                missing = [
+                    vector_id
+                    for vector_id in pending
+                    if vector_id not in found and first_namespace[vector_id] != ns
+                ]
+                if not missing:
+                    continue
+                found.update(self._fetch_ids_from_namespace(missing, ns, batch_size))
+                if len(found) == len(pending):
+                    break
 
-            # Try each namespace until we find the vector
-            for ns_name in all_namespaces:
-                if ns_name == skip_namespace:
-                    continue  # Skip the namespace we already tried
-
-                vector_data = self._fetch_from_namespace(vector_id, ns_name)
-                if vector_data:
-                    logger.info(
-                        f"Found vector in namespace '{ns_name}' instead of requested '{skip_namespace}'"
-                    )
-                    return vector_data
-            return None
-        except Exception as e:
-            logger.warning(f"Error when trying to search all namespaces: {e}")
-            return None
+        logger.info(f"Fetched {len(found)} of {len(pending)} vectors")
+        return found
 
     def fetch_vector_by_id(
         self, vector_id: str, namespace: Optional[str] = None
@@ -1088,6 +1680,9 @@ class PineconeDB:
         """
         Fetch a specific vector from Pinecone by ID using fetch approach.
 
+        Looks in the requested namespace first, then in every other namespace
+        (see fetch_vectors). Use fetch_vectors to fetch many IDs.
+
         Args:
             vector_id: The ID of the vector to fetch
             namespace: Optional Pinecone namespace to search in
@@ -1096,29 +1691,11 @@ class PineconeDB:
             The vector data as a dictionary if found, None otherwise
         """
         try:
-            # Use provided namespace or instance default
-            fetch_namespace = namespace if namespace is not None else self.namespace
             logger.info(f"Fetching vector with ID: {vector_id}")
-
-            # Try first without specifying namespace parameter (for "__default__" namespace)
-            if not fetch_namespace or fetch_namespace == "__default__":
-                vector_data = self._fetch_from_namespace(vector_id, None)
-                if vector_data:
-                    return vector_data
-
-            # If we have a specific namespace or the previous attempt failed, try with namespace
-            if fetch_namespace and fetch_namespace != "__default__":
-                vector_data = self._fetch_from_namespace(vector_id, fetch_namespace)
-                if vector_data:
-                    return vector_data
-
-            # If we didn't find it with or without namespace, try all available namespaces
-            vector_data = self._search_all_namespaces(vector_id, fetch_namespace)
-            if vector_data:
-                return vector_data
-
-            logger.error(f"Vector with ID '{vector_id}' not found in any namespace")
-            return None
+            vector_data = self.fetch_vectors([vector_id], namespace).get(vector_id)
+            if vector_data is None:
+                logger.error(f"Vector with ID '{vector_id}' not found in any namespace")
+            return vector_data
 
         except Exception as e:
             logger.error(f"Error fetching vector: {e}")
@@ -1202,7 +1779,7 @@ class PineconeDB:
             List of index names
         """
         try:
-            indexes = self.pc.list_indexes()
+            indexes = self._client().list_indexes()
             index_names = (
                 [idx.name for idx in indexes]
                 if hasattr(indexes, "__iter__")
@@ -1281,7 +1858,7 @@ class PineconeDB:
             )
 
             # Create the index
-            self.pc.create_index(
+            self._client().create_index(
                 name=target_index,
                 dimension=target_dimensions,
                 metric=metric,
@@ -0,0 +1,134 @@
+"""
+Local read replica of the Pinecone index.
+
+The index is small (tens of thousands of vectors) and only changes during batch
+runs, so the API can serve queries from a snapshot instead of paying a network
+round trip to Pinecone for each one. ``ReadReplicaVectorDB`` serves a snapshot
+written by ``nyc_landmarks.vectordb.snapshot.export_snapshot``:
+
+- Vector matrices are memory-mapped, and the metadata columns used by the API
+  filters are built when a snapshot is loaded.
+- The snapshot's manifest is checked at most every
+  ``VECTOR_DB_SNAPSHOT_REFRESH_INTERVAL`` seconds, and a snapshot with a new
+  generation is loaded and swapped in.
+- Until a snapshot exists, queries are forwarded to Pinecone.
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.local_vector_db import (
+    LocalIndex,
+    LocalVectorDB,
+    read_snapshot_generation,
+)
+from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+
+logger = get_logger(__name__)
+
+# Metadata fields the API filters on, built into columns when a snapshot loads
+REPLICA_FILTER_FIELDS = ["landmark_id", "source_type"]
+
+
+class ReadReplicaVectorDB(LocalVectorDB):
+    """Read-only LocalVectorDB serving an exported snapshot of the index."""
+
+    def __init__(
+        self,
+        snapshot_path: Optional[str] = None,
+        refresh_interval: Optional[int] = None,
+        remote_fallback: bool = True,
+    ):
+        """Initialize the replica and load the current snapshot.
+
+        Args:
+            snapshot_path: Snapshot directory (default: from settings)
+            refresh_interval: Minimum seconds between snapshot generation checks
+                (default: from settings)
+            remote_fallback: Forward queries to Pinecone while no snapshot exists
+        """
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else settings.VECTOR_DB_SNAPSHOT_REFRESH_INTERVAL
+        )
+        self.remote_fallback = remote_fallback
+        self._remote: Optional[PineconeDB] = None
+        self._refresh_lock = threading.Lock()
+        self._last_check = 0.0
+        super().__init__(
+            path=snapshot_path or settings.VECTOR_DB_SNAPSHOT_PATH, autosave=False
+        )
+        self.refresh()
+
+    def _open_local_index(self, hnsw_threshold: Optional[int]) -> LocalIndex:
+        """Start with an empty read-only index until refresh() loads a snapshot."""
+        return LocalIndex(
+            settings.PINECONE_DIMENSIONS, hnsw_threshold=hnsw_threshold, read_only=True
+        )
+
+    @property
+    def generation(self) -> Optional[str]:
+        """Generation of the loaded snapshot (None before one is loaded)."""
+        return self.local_index.generation
+
+    def refresh(self) -> bool:
+        """Load the snapshot if its generation differs from the loaded one.
+
+        Returns:
+            True if a new snapshot was loaded
+        """
+        with self._refresh_lock:
+            self._last_check = time.monotonic()
+            generation = read_snapshot_generation(self.path)
+            if generation is None or generation == self.generation:
+                return False
+
+            try:
+                index = LocalIndex(
+                    self.dimensions, path=self.path, mmap=True, read_only=True
+                )
+                index.build_columns(REPLICA_FILTER_FIELDS)
+            except Exception as e:
+                logger.error(f"Failed to load index snapshot from {self.path}: {e}")
+                return False
+
+            # Queries in flight keep using the index they started with
+            self.local_index = index
+            self.index = index
+            logger.info(f"Serving index snapshot generation {index.generation}")
+            return True
+
+    def maybe_refresh(self) -> None:
+        """Check for a new snapshot if the refresh interval has passed."""
+        if time.monotonic() - self._last_check >= self.refresh_interval:
+            self.refresh()
+
+    def _remote_db(self) -> PineconeDB:
+        if self._remote is None:
+            self._remote = PineconeDB()
+        return self._remote
+
+    def query_vectors(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Query the snapshot (see ``PineconeDB.query_vectors``).
+
+        Falls back to Pinecone while no snapshot has been loaded.
+        """
+        self.maybe_refresh()
+        if self.generation is None and self.remote_fallback:
+            return self._remote_db().query_vectors(*args, **kwargs)
+        return super().query_vectors(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_read_replica_db() -> ReadReplicaVectorDB:
+    """Get the process-wide read replica.
+
+    Returns:
+        Shared ReadReplicaVectorDB serving ``VECTOR_DB_SNAPSHOT_PATH``
+    """
+    return ReadReplicaVectorDB()
@@ -0,0 +1,288 @@
+"""
+Client-side re-ranking of vector search results.
+
+``TextChunker`` windows overlap, so the top matches of a query are often
+adjacent chunks of the same report that repeat each other. The re-ranking
+stage over-fetches candidates with their embedding values and selects the
+final results with maximal marginal relevance (MMR):
+
+    score(c) = lambda * sim(query, c) - (1 - lambda) * max(sim(c, selected))
+
+Similarities are computed once as NumPy matrix products, and each greedy
+selection step is a vectorized update over the candidates. Optional caps
+limit how many results may come from one landmark or one source document.
+
+Hybrid search fuses the dense ranking with the ranking of the local BM25
+index (``lexical_index``) by reciprocal rank fusion.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.lexical_index import LexicalIndex
+from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+
+logger = get_logger(__name__)
+
+# Candidates fetched per requested result when re-ranking
+DEFAULT_FETCH_MULTIPLIER = 3
+
+# Weight of query relevance against novelty (1.0 = relevance only)
+DEFAULT_LAMBDA = 0.7
+
+# Rank offset of reciprocal rank fusion (the value of the original RRF paper)
+DEFAULT_RRF_K = 60
+
+
+def document_key(metadata: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Key identifying the source document a chunk was cut from.
+
+    Args:
+        metadata: Vector metadata
+
+    Returns:
+        Tuple of landmark ID, source type and article or document name
+    """
+    return (
+        str(metadata.get("landmark_id", "")),
+        str(metadata.get("source_type", "pdf")),
+        str(
+            metadata.get("article_title")
+            or metadata.get("document_name")
+            or metadata.get("file_name")
+            or ""
+        ),
+    )
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving zero rows unchanged."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized: np.ndarray = matrix / np.where(norms == 0, 1.0, norms)
+    return normalized
+
+
+def mmr_rerank(
+    query_vector: Sequence[float],
+    matches: List[Dict[str, Any]],
+    top_k: int,
+    lambda_mult: float = DEFAULT_LAMBDA,
+    max_per_landmark: Optional[int] = None,
+    max_per_document: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Select results by maximal marginal relevance under per-source caps.
+
+    Matches without embedding values are only subject to the caps, keeping
+    their original order.
+
+    Args:
+        query_vector: Query embedding
+        matches: Candidate matches from ``query_vectors`` with ``values``
+        top_k: Number of results to select
+        lambda_mult: Weight of query relevance against novelty, in [0, 1]
+        max_per_landmark: Maximum results per landmark ID
+        max_per_document: Maximum results per source document
+
+    Returns:
+        Selected matches in selection order
+    """
+    if not matches or top_k <= 0:
+        return []
+
+    landmark_keys = [m.get("metadata", {}).get("landmark_id") for m in matches]
+    document_keys = [document_key(m.get("metadata", {})) for m in matches]
+    landmark_counts: Dict[Any, int] = {}
+    document_counts: Dict[Tuple[str, str, str], int] = {}
+
+    def within_caps(i: int) -> bool:
+        return (
+            max_per_landmark is None
+            or landmark_counts.get(landmark_keys[i], 0) < max_per_landmark
+        ) and (
+            max_per_document is None
+            or document_counts.get(document_keys[i], 0) < max_per_document
+        )
+
+    def take(i: int) -> None:
+        landmark_counts[landmark_keys[i]] = landmark_counts.get(landmark_keys[i], 0) + 1
+        document_counts[document_keys[i]] = document_counts.get(document_keys[i], 0) + 1
+
+    dimension = len(query_vector)
+    if any(len(m.get("values") or []) != dimension for m in matches):
+        selected: List[Dict[str, Any]] = []
+        for i in range(len(matches)):
+            if len(selected) == top_k:
+                break
+            if within_caps(i):
+                take(i)
+                selected.append(matches[i])
+        return selected
+
+    candidates = _normalize_rows(
+        np.asarray([m["values"] for m in matches], dtype=np.float32)
+    )
+    query = _normalize_rows(np.asarray([query_vector], dtype=np.float32))[0]
+    relevance = candidates @ query
+    similarity = candidates @ candidates.T
+
+    # Highest similarity of each candidate to any selected result
+    redundancy = np.full(len(matches), -np.inf, dtype=np.float32)
+    available = np.ones(len(matches), dtype=bool)
+    selected = []
+
+    while len(selected) < top_k and available.any():
+        novelty = np.where(np.isinf(redundancy), 0.0, redundancy)
+        scores = lambda_mult * relevance - (1.0 - lambda_mult) * novelty
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        available[best] = False
+        if not within_caps(best):
+            continue
+
+        take(best)
+        selected.append(matches[best])
+        redundancy = np.maximum(redundancy, similarity[best])
+
+    return selected
+
+
+def query_reranked(
+    vector_db: PineconeDB,
+    query_vector: List[float],
+    top_k: int,
+    filter_dict: Optional[Dict[str, Any]] = None,
+    lambda_mult: float = DEFAULT_LAMBDA,
+    max_per_landmark: Optional[int] = None,
+    max_per_document: Optional[int] = None,
+    fetch_multiplier: int = DEFAULT_FETCH_MULTIPLIER,
+    correlation_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Query the vector database and re-rank an over-fetched candidate set.
+
+    Args:
+        vector_db: Vector database to query
+        query_vector: Query embedding
+        top_k: Number of results to return
+        filter_dict: Optional metadata filter
+        lambda_mult: Weight of query relevance against novelty, in [0, 1]
+        max_per_landmark: Maximum results per landmark ID
+        max_per_document: Maximum results per source document
+        fetch_multiplier: Candidates fetched per requested result
+        correlation_id: Optional correlation ID for request tracing
+
+    Returns:
+        Re-ranked matches in the ``query_vectors`` format, without values
+    """
+    candidates = vector_db.query_vectors(
+        query_vector=query_vector,
+        top_k=top_k * max(fetch_multiplier, 1),
+        filter_dict=filter_dict,
+        include_values=True,
+        correlation_id=correlation_id,
+    )
+    selected = mmr_rerank(
+        query_vector,
+        candidates,
+        top_k,
+        lambda_mult=lambda_mult,
+        max_per_landmark=max_per_landmark,
+        max_per_document=max_per_document,
+    )
+    logger.info(
+        f"Re-ranked {len(candidates)} candidates to {len(selected)} results",
+        extra={"correlation_id": correlation_id, "operation": "rerank"},
+    )
+    return [{k: v for k, v in match.items() if k != "values"} for match in selected]
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[Dict[str, Any]]],
+    k: int = DEFAULT_RRF_K,
+    top_k: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Fuse ranked match lists by reciprocal rank.
+
+    Each match scores ``sum(1 / (k + rank))`` over the lists it appears in
+    (ranks start at 1), which needs no calibration between the BM25 and
+    cosine score scales.
+
+    Args:
+        rankings: Match lists, each ordered best first
+        k: Rank offset damping the weight of top ranks
+        top_k: Number of results to return (default: all)
+
+    Returns:
+        Fused matches with the fused ``score``, best first
+    """
+    scores: Dict[str, float] = {}
+    fused: Dict[str, Dict[str, Any]] = {}
+    for ranking in rankings:
+        for rank, match in enumerate(ranking, start=1):
+            match_id = match["id"]
+            scores[match_id] = scores.get(match_id, 0.0) + 1.0 / (k + rank)
+            if match_id not in fused:
+                fused[match_id] = {
+                    key: value for key, value in match.items() if key != "values"
+                }
+
+    ordered = sorted(fused, key=lambda match_id: scores[match_id], reverse=True)
+    if top_k is not None:
+        ordered = ordered[:top_k]
+    return [{**fused[match_id], "score": scores[match_id]} for match_id in ordered]
+
+
+def query_hybrid(
+    vector_db: PineconeDB,
+    lexical_index: LexicalIndex,
+    query_text: str,
+    query_vector: List[float],
+    top_k: int,
+    filter_dict: Optional[Dict[str, Any]] = None,
+    rrf_k: int = DEFAULT_RRF_K,
+    max_per_landmark: Optional[int] = None,
+    max_per_document: Optional[int] = None,
+    fetch_multiplier: int = DEFAULT_FETCH_MULTIPLIER,
+    correlation_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Query dense and BM25 retrieval and fuse the rankings by reciprocal rank.
+
+    Args:
+        vector_db: Vector database to query
+        lexical_index: Local BM25 index
+        query_text: Text query
+        query_vector: Query embedding
+        top_k: Number of results to return
+        filter_dict: Optional metadata filter, applied to both retrievers
+        rrf_k: Rank offset of reciprocal rank fusion
+        max_per_landmark: Maximum results per landmark ID
+        max_per_document: Maximum results per source document
+        fetch_multiplier: Candidates fetched from each retriever per result
+        correlation_id: Optional correlation ID for request tracing
+
+    Returns:
+        Fused matches in the ``query_vectors`` format with RRF scores
+    """
+    candidate_count = top_k * max(fetch_multiplier, 1)
+    dense = vector_db.query_vectors(
+        query_vector=query_vector,
+        top_k=candidate_count,
+        filter_dict=filter_dict,
+        correlation_id=correlation_id,
+    )
+    lexical = lexical_index.search(query_text, candidate_count, filter_dict)
+    fused = reciprocal_rank_fusion([dense, lexical], k=rrf_k)
+    selected = mmr_rerank(
+        query_vector,
+        fused,
+        top_k,
+        max_per_landmark=max_per_landmark,
+        max_per_document=max_per_document,
+    )
+    logger.info(
+        f"Fused {len(dense)} dense and {len(lexical)} lexical candidates "
+        f"to {len(selected)} results",
+        extra={"correlation_id": correlation_id, "operation": "hybrid_search"},
+    )
+    return selected
@@ -0,0 +1,183 @@
+"""
+Bulk export and import of whole vector indexes.
+
+A snapshot is a local index directory (see
+``nyc_landmarks.vectordb.local_vector_db``) with one subdirectory per
+namespace holding a float32 ``vectors.npy`` matrix, an ``ids.npy`` array and
+Parquet metadata, plus a ``manifest.json`` with the snapshot generation.
+Snapshots are used for backups, migrations between indexes, offline analysis
+and as the data served by ``ReadReplicaVectorDB``.
+
+- ``export_snapshot`` enumerates every ID of each namespace with the index's
+  ID listing API and fetches the vectors in parallel batches.
+- ``import_snapshot`` bulk-upserts a snapshot with
+  ``PineconeDB.upsert_vectors``, sending batches in parallel.
+"""
+
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.local_vector_db import LocalIndex, read_snapshot_manifest
+from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+
+logger = get_logger(__name__)
+
+# Vectors per fetch request (Pinecone limits fetch by URL length)
+DEFAULT_FETCH_BATCH_SIZE = 100
+
+# Vectors per upsert request
+DEFAULT_UPSERT_BATCH_SIZE = 100
+
+# Concurrent fetch/upsert requests
+DEFAULT_MAX_WORKERS = 8
+
+
+def _list_ids(source: PineconeDB, namespace: str) -> List[str]:
+    """Enumerate every vector ID of a namespace with the ID listing API."""
+    ids: List[str] = []
+    for page in source.id_listing_index.list(namespace=namespace or None):
+        ids.extend(str(vector_id) for vector_id in page)
+    return ids
+
+
+def _fetch_batch(
+    source: PineconeDB, ids: List[str], namespace: str
+) -> List[Dict[str, Any]]:
+    """Fetch one batch of vectors as upsert-ready dicts."""
+    response = source.index.fetch(ids=ids, namespace=namespace or None)
+    return [
+        {
+            "id": vector_id,
+            "values": list(vector.values),
+            "metadata": dict(vector.metadata or {}),
+        }
+        for vector_id, vector in response.vectors.items()
+    ]
+
+
+def export_snapshot(
+    source: PineconeDB,
+    path: str,
+    batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> str:
+    """Copy every vector of an index into a snapshot directory.
+
+    The snapshot is written next to ``path`` and swapped in once complete, so
+    readers never load a partial snapshot.
+
+    Args:
+        source: Vector database to export
+        path: Snapshot directory
+        batch_size: Number of IDs fetched per request
+        max_workers: Number of fetch requests in flight
+
+    Returns:
+        Generation ID of the new snapshot
+
+    Raises:
+        RuntimeError: If the saved snapshot has no generation
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.staging-{uuid.uuid4().hex}")
+    snapshot = LocalIndex(source.dimensions, path=str(staging))
+
+    try:
+        stats = source.get_index_stats()
+        namespaces = list(stats.get("namespaces", {})) or [""]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for namespace in namespaces:
+                ids = _list_ids(source, namespace)
+                batches = [
+                    ids[i : i + batch_size] for i in range(0, len(ids), batch_size)
+                ]
+                exported = 0
+                for vectors in executor.map(
+                    lambda batch: _fetch_batch(source, batch, namespace), batches
+                ):
+                    snapshot.upsert(vectors=vectors, namespace=namespace)
+                    exported += len(vectors)
+                if exported < len(ids):
+                    logger.warning(
+                        f"{len(ids) - exported} listed vectors in namespace "
+                        f"'{namespace}' could not be fetched"
+                    )
+                logger.info(f"Exported {exported} vectors from namespace '{namespace}'")
+
+        snapshot.save()
+        generation = snapshot.generation
+        if generation is None:
+            raise RuntimeError(f"Snapshot staged in {staging} has no generation")
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    backup = target.with_name(f".{target.name}.old-{uuid.uuid4().hex}")
+    if target.exists():
+        os.replace(target, backup)
+    os.replace(staging, target)
+    shutil.rmtree(backup, ignore_errors=True)
+
+    logger.info(f"Wrote index snapshot {generation} to {target}")
+    return generation
+
+
+def import_snapshot(
+    target: PineconeDB,
+    path: str,
+    namespace: Optional[str] = None,
+    batch_size: int = DEFAULT_UPSERT_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> int:
+    """Upsert every vector of a snapshot into an index.
+
+    Args:
+        target: Vector database to import into
+        path: Snapshot directory
+        namespace: Namespace to import every vector into (default: keep the
+            namespaces of the snapshot)
+        batch_size: Number of vectors per upsert request
+        max_workers: Number of upsert requests in flight
+
+    Returns:
+        Number of vectors stored
+
+    Raises:
+        ValueError: If the path is not a snapshot or its dimension differs
+            from the target index
+    """
+    manifest = read_snapshot_manifest(path)
+    if manifest is None:
+        raise ValueError(f"No index snapshot found at {path}")
+    dimension = int(manifest.get("dimension", target.dimensions))
+    if dimension != target.dimensions:
+        raise ValueError(
+            f"Snapshot dimension {dimension} does not match index dimension "
+            f"{target.dimensions}"
+        )
+
+    snapshot = LocalIndex(dimension, path=path, mmap=True, read_only=True)
+    # Bound memory by converting a few rounds of parallel batches at a time
+    group_size = batch_size * max_workers * 4
+    stored = 0
+    for source_namespace in snapshot.namespaces():
+        target_namespace = namespace if namespace is not None else source_namespace
+        for vectors in snapshot.iter_vectors(source_namespace, group_size):
+            stored += target.upsert_vectors(
+                vectors,
+                namespace=target_namespace,
+                batch_size=batch_size,
+                max_workers=max_workers,
+            )
+        logger.info(
+            f"Imported namespace '{source_namespace}' into '{target_namespace}'"
+        )
+
+    logger.info(f"Imported {stored} vectors from snapshot {manifest.get('generation')}")
+    return stored
@@ -0,0 +1,432 @@
+"""
+Bulk Wikipedia article fetching through the MediaWiki Action API.
+
+``WikipediaBulkFetcher`` resolves article titles, redirects and current
+revision IDs with one Action API query per 50 titles, then fetches the
+plain-text extract of each article concurrently. All requests share a
+limiter bounding concurrent requests and the request rate, and identify
+themselves with the configured user agent. Articles the API cannot serve
+fall back to HTML scraping with ``WikipediaFetcher``.
+
+Content can be prefetched for many landmarks at once; later lookups of the
+same URLs are then served from memory.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.db.wikipedia_fetcher import WikipediaFetcher
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds of replication lag after which the API asks clients to back off
+MAX_LAG = 5
+
+ArticleContent = Tuple[Optional[str], Optional[str]]  # (content, revision ID)
+
+
+class MediaWikiLagError(Exception):
+    """The MediaWiki API asked clients to retry later."""
+
+
+@dataclass
+class WikipediaPage:
+    """Current state of a Wikipedia article."""
+
+    api_url: str
+    title: str
+    page_id: Optional[int] = None
+    rev_id: Optional[str] = None
+    missing: bool = False
+
+
+class AsyncRateLimiter:
+    """Bound the concurrent requests and the rate at which requests start."""
+
+    def __init__(self, concurrency: int, requests_per_second: float):
+        """Initialize the limiter.
+
+        Must be created inside the event loop that uses it.
+
+        Args:
+            concurrency: Maximum requests in flight
+            requests_per_second: Maximum requests started per second (0 for
+                no limit)
+        """
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self._semaphore.acquire()
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._semaphore.release()
+
+
+def parse_article_url(url: str) -> Optional[Tuple[str, str]]:
+    """Action API endpoint and title of a Wikipedia article URL.
+
+    Args:
+        url: Article URL, e.g. https://en.wikipedia.org/wiki/Gracie_Mansion
+
+    Returns:
+        Tuple of (API URL, title), or None for URLs that are not article links
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc.endswith(
+        "wikipedia.org"
+    ):
+        return None
+    if parsed.path.startswith("/wiki/"):
+        title = parsed.path[len("/wiki/") :]
+    else:
+        title = parse_qs(parsed.query).get("title", [""])[0]
+    title = unquote(title).replace("_", " ").strip()
+    if not title or "oldid=" in parsed.query:
+        return None  # Links to old revisions are left to the HTML fetcher
+    return f"https://{parsed.netloc}/w/api.php", title
+
+
+class WikipediaBulkFetcher:
+    """Fetch Wikipedia articles in bulk through the MediaWiki Action API."""
+
+    def __init__(
+        self,
+        html_fetcher: Optional[WikipediaFetcher] = None,
+        concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        titles_per_request: Optional[int] = None,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            html_fetcher: Fetcher scraping article HTML when the API fails
+            concurrency: Concurrent API requests
+                (default: WIKIPEDIA_FETCH_CONCURRENCY)
+            requests_per_second: Maximum API requests started per second
+                (default: WIKIPEDIA_REQUESTS_PER_SECOND)
+            titles_per_request: Titles per revision query, at most 50
+                (default: WIKIPEDIA_TITLES_PER_REQUEST)
+        """
+        self.html_fetcher = html_fetcher or WikipediaFetcher()
+        self.concurrency = max(concurrency or settings.WIKIPEDIA_FETCH_CONCURRENCY, 1)
+        self.requests_per_second = (
+            requests_per_second
+            if requests_per_second is not None
+            else settings.WIKIPEDIA_REQUESTS_PER_SECOND
+        )
+        self.titles_per_request = min(
+            max(titles_per_request or settings.WIKIPEDIA_TITLES_PER_REQUEST, 1), 50
+        )
+        self.headers = {"User-Agent": settings.WIKIPEDIA_USER_AGENT}
+
+        self._prefetched: Dict[str, ArticleContent] = {}
+        self._revisions: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def fetch_articles(self, urls: Iterable[str]) -> Dict[str, ArticleContent]:
+        """Fetch the content and revision ID of articles.
+
+        Prefetched articles are served from memory (once); the others are
+        fetched in bulk. Must not be called from a running event loop.
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Mapping of URL to (content, revision ID); (None, None) for
+            articles that could not be fetched
+        """
+        urls = list(dict.fromkeys(urls))
+        with self._lock:
+            results = {
+                url: self._prefetched.pop(url)
+                for url in urls
+                if url in self._prefetched
+            }
+        missing = [url for url in urls if url not in results]
+        if missing:
+            results.update(asyncio.run(self.afetch_articles(missing)))
+        return results
+
+    def prefetch(self, urls: Iterable[str]) -> int:
+        """Fetch articles ahead of their ``fetch_articles`` lookups.
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Number of articles with content
+        """
+        fetched = asyncio.run(self.afetch_articles(list(dict.fromkeys(urls))))
+        with self._lock:
+            self._prefetched.update(fetched)
+        return sum(1 for content, _ in fetched.values() if content)
+
+    def fetch_revisions(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Current revision ID of articles, without their content.
+
+        Revision IDs are remembered for the lifetime of the fetcher, so a
+        bulk lookup ahead of a run answers the lookups of single landmarks.
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Mapping of URL to revision ID (None if unknown or missing)
+        """
+        urls = list(dict.fromkeys(urls))
+        with self._lock:
+            missing = [url for url in urls if url not in self._revisions]
+
+        async def run() -> Dict[str, Optional[WikipediaPage]]:
+            limiter = AsyncRateLimiter(self.concurrency, self.requests_per_second)
+            async with self._client() as client:
+                return await self._resolve_pages(client, limiter, missing)
+
+        pages = asyncio.run(run()) if missing else {}
+        with self._lock:
+            self._revisions.update(
+                {url: page.rev_id if page else None for url, page in pages.items()}
+            )
+            return {url: self._revisions.get(url) for url in urls}
+
+    async def afetch_articles(self, urls: List[str]) -> Dict[str, ArticleContent]:
+        """Fetch the content and revision ID of articles (coroutine).
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Mapping of URL to (content, revision ID)
+        """
+        if not urls:
+            return {}
+        started = time.time()
+        limiter = AsyncRateLimiter(self.concurrency, self.requests_per_second)
+        async with self._client() as client:
+            pages = await self._resolve_pages(client, limiter, urls)
+            with self._lock:
+                self._revisions.update(
+                    {url: page.rev_id if page else None for url, page in pages.items()}
+                )
+            contents = await asyncio.gather(
+                *(self._fetch_article(client, limiter, url, pages[url]) for url in urls)
+            )
+        results = dict(zip(urls, contents))
+        logger.info(
+            f"Fetched {sum(1 for c, _ in contents if c)} of {len(urls)} Wikipedia "
+            f"articles in {time.time() - started:.1f}s"
+        )
+        return results
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=self.concurrency),
+            follow_redirects=True,
+        )
+
+    async def _resolve_pages(
+        self, client: httpx.AsyncClient, limiter: AsyncRateLimiter, urls: List[str]
+    ) -> Dict[str, Optional[WikipediaPage]]:
+        """Look up the pages of article URLs, many titles per request."""
+        titles: Dict[str, List[str]] = {}
+        for url in urls:
+            parsed = parse_article_url(url)
+            if parsed:
+                titles.setdefault(parsed[0], []).append(parsed[1])
+
+        batches = [
+            (api_url, unique[i : i + self.titles_per_request])
+            for api_url, api_titles in titles.items()
+            for unique in [list(dict.fromkeys(api_titles))]
+            for i in range(0, len(unique), self.titles_per_request)
+        ]
+        resolved: Dict[Tuple[str, str], WikipediaPage] = {}
+        for batch_pages in await asyncio.gather(
+            *(
+                self._query_pages(client, limiter, api_url, batch)
+                for api_url, batch in batches
+            )
+        ):
+            resolved.update(batch_pages)
+
+        pages: Dict[str, Optional[WikipediaPage]] = {}
+        for url in urls:
+            parsed = parse_article_url(url)
+            pages[url] = resolved.get(parsed) if parsed else None
+        return pages
+
+    async def _query_pages(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        api_url: str,
+        titles: List[str],
+    ) -> Dict[Tuple[str, str], WikipediaPage]:
+        """Resolve up to 50 titles to their current page and revision."""
+        try:
+            data = await self._query(
+                client,
+                limiter,
+                api_url,
+                {"prop": "info", "titles": "|".join(titles), "redirects": 1},
+            )
+        except Exception as e:
+            logger.warning(f"Could not look up {len(titles)} Wikipedia titles: {e}")
+            return {}
+
+        query = data.get("query", {})
+        # Follow title normalization, then redirects, to the page returned
+        aliases = {
+            entry["from"]: entry["to"]
+            for key in ("normalized", "redirects")
+            for entry in query.get(key, [])
+        }
+        by_title = {}
+        for page in query.get("pages", []):
+            if "title" not in page:
+                continue
+            by_title[page["title"]] = WikipediaPage(
+                api_url=api_url,
+                title=page["title"],
+                page_id=page.get("pageid"),
+                rev_id=str(page["lastrevid"]) if page.get("lastrevid") else None,
+                missing=bool(page.get("missing") or page.get("invalid")),
+            )
+
+        resolved = {}
+        for title in titles:
+            target = title
+            for _ in range(3):  # Normalized, then redirected
+                target = aliases.get(target, target)
+            if target in by_title:
+                resolved[(api_url, title)] = by_title[target]
+        return resolved
+
+    async def _fetch_article(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        url: str,
+        page: Optional[WikipediaPage],
+    ) -> ArticleContent:
+        """Fetch one article's extract, scraping its HTML if the API fails."""
+        if page is not None and page.missing:
+            logger.warning(f"Wikipedia article does not exist: {url}")
+            return None, None
+
+        if page is not None and page.page_id is not None:
+            try:
+                data = await self._query(
+                    client,
+                    limiter,
+                    page.api_url,
+                    {
+                        "prop": "extracts",
+                        "pageids": page.page_id,
+                        "explaintext": 1,
+                        "exsectionformat": "wiki",
+                    },
+                )
+                pages = data.get("query", {}).get("pages", [])
+                extract = pages[0].get("extract") if pages else None
+                if extract:
+                    return _clean_extract(extract), page.rev_id
+            except Exception as e:
+                logger.warning(f"Could not get the extract of {url} from the API: {e}")
+
+        logger.info(f"Falling back to HTML scraping for {url}")
+        try:
+            async with limiter:
+                content, rev_id = await asyncio.to_thread(
+                    self.html_fetcher.fetch_wikipedia_content, url
+                )
+        except Exception as e:
+            logger.error(f"Error fetching Wikipedia content from {url}: {e}")
+            return None, None
+        return content, (page.rev_id if page and page.rev_id else rev_id)
+
+    @retry(  # type: ignore[misc]
+        retry=retry_if_exception_type(
+            (httpx.TransportError, httpx.HTTPStatusError, MediaWikiLagError)
+        ),
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _query(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        api_url: str,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Send one Action API query."""
+        async with limiter:
+            response = await client.get(
+                api_url,
+                params={
+                    "action": "query",
+                    "format": "json",
+                    "formatversion": 2,
+                    "maxlag": MAX_LAG,
+                    **params,
+                },
+            )
+        response.raise_for_status()
+        data: Dict[str, Any] = response.json()
+        error = data.get("error")
+        if error:
+            if error.get("code") == "maxlag":
+                raise MediaWikiLagError(error.get("info", "Replication lag"))
+            raise ValueError(f"MediaWiki API error: {error.get('info', error)}")
+        return data
+
+
+def _clean_extract(text: str) -> str:
+    """Normalize whitespace of a plain-text extract, one paragraph per line.
+
+    Lines, including ``== Heading ==`` section lines, are kept as paragraphs
+    so the chunking engine can split the article at section boundaries.
+    """
+    lines = (re.sub(r"\s+", " ", line).strip() for line in text.split("\n"))
+    return "\n\n".join(line for line in lines if line)
+
+
+@lru_cache(maxsize=None)
+def get_wikipedia_bulk_fetcher() -> WikipediaBulkFetcher:
+    """Get the process-wide Wikipedia bulk fetcher.
+
+    Returns:
+        Shared WikipediaBulkFetcher, so prefetched articles are visible to
+        every processor
+    """
+    return WikipediaBulkFetcher()
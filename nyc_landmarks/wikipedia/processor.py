@@ -1,19 +1,32 @@
 """Wikipedia processing functionality for NYC landmarks."""
 
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
-from transformers.tokenization_utils import PreTrainedTokenizer
+import tiktoken
 
+from nyc_landmarks.chunking import ChunkingEngine, ChunkStrategy
+from nyc_landmarks.config.settings import settings
 from nyc_landmarks.db.wikipedia_fetcher import WikipediaFetcher
+from nyc_landmarks.embeddings.batcher import EmbeddingBatcher
 from nyc_landmarks.embeddings.generator import EmbeddingGenerator
 from nyc_landmarks.models.metadata_models import SourceType
 from nyc_landmarks.models.wikipedia_models import (
     WikipediaContentModel,
     WikipediaQualityModel,
 )
+from nyc_landmarks.pipeline.manifest import (
+    RunManifest,
+    StageStatus,
+    fingerprint,
+    metadata_fingerprint,
+    sha256_text,
+)
 from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.lexical_index import enable_lexical_indexing
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+from nyc_landmarks.wikipedia.bulk_fetcher import WikipediaBulkFetcher
 from nyc_landmarks.wikipedia.quality_fetcher import WikipediaQualityFetcher
 
 if TYPE_CHECKING:
@@ -25,13 +38,56 @@ logger = get_logger(__name__)
 class WikipediaProcessor:
     """Processes Wikipedia articles for NYC landmarks."""
 
-    def __init__(self) -> None:
-        """Initialize the Wikipedia processor components."""
+    # Run manifest stage of a landmark's Wikipedia vectors
+    MANIFEST_STAGE = "wikipedia"
+
+    def __init__(
+        self,
+        manifest: Optional[RunManifest] = None,
+        incremental: bool = False,
+        embedding_batcher: Optional[EmbeddingBatcher] = None,
+        bulk_fetcher: Optional[WikipediaBulkFetcher] = None,
+        skip_unchanged_revisions: bool = False,
+        quality_fetcher: Optional[WikipediaQualityFetcher] = None,
+    ) -> None:
+        """Initialize the Wikipedia processor components.
+
+        Args:
+            manifest: Run manifest recording the sources of stored vectors
+            incremental: Skip landmarks whose articles and metadata are
+                unchanged since they were last stored (requires a manifest)
+            embedding_batcher: Batcher shared with other processors (a
+                private one around this processor's generator by default)
+            bulk_fetcher: Article fetcher shared with other processors, so
+                they see prefetched articles (a private one by default)
+            skip_unchanged_revisions: Skip articles whose current revision
+                is the revision stored with their vectors
+            quality_fetcher: Quality scorer shared with other processors, so
+                they share its score cache (a private one by default)
+        """
+        self.manifest = manifest
+        self.incremental = incremental and manifest is not None
+        self.skip_unchanged_revisions = skip_unchanged_revisions
+        self.unchanged_landmarks: Set[str] = set()
+        # Articles skipped by the revision check, per landmark
+        self.unchanged_articles: Dict[str, int] = {}
+        self._unchanged_urls: Dict[str, Set[str]] = {}
         self.db_client: Optional["DbClient"] = None
         self.wiki_fetcher = WikipediaFetcher()
+        self.bulk_fetcher = bulk_fetcher or WikipediaBulkFetcher(self.wiki_fetcher)
         self.embedding_generator = EmbeddingGenerator()
+        self.embedding_batcher = embedding_batcher or EmbeddingBatcher(
+            self.embedding_generator
+        )
         self.pinecone_db = PineconeDB()
-        self.quality_fetcher = WikipediaQualityFetcher()
+        self.quality_fetcher = quality_fetcher or WikipediaQualityFetcher()
+        self.chunking_engine = ChunkingEngine(
+            settings.WIKIPEDIA_CHUNK_STRATEGY,
+            settings.WIKIPEDIA_CHUNK_SIZE,
+            settings.WIKIPEDIA_CHUNK_OVERLAP,
+        )
+        if settings.LEXICAL_INDEX_ENABLED:
+            enable_lexical_indexing()
 
     def _initialize_db_client(self) -> Any:
         """Initialize database client on demand."""
@@ -45,6 +101,10 @@ class WikipediaProcessor:
         """
         Fetch Wikipedia articles for the landmark.
 
+        With ``skip_unchanged_revisions``, the content of articles whose
+        stored revision is still current is not fetched; they are returned
+        without content and skipped by ``process_landmark_wikipedia``.
+
         Args:
             landmark_id: ID of the landmark
 
@@ -66,15 +126,26 @@ class WikipediaProcessor:
             f"Found {len(articles)} Wikipedia articles for landmark: {landmark_id}"
         )
 
-        # Fetch content for each article
+        unchanged: Set[str] = set()
+        if self.skip_unchanged_revisions:
+            unchanged = self.find_unchanged_articles({landmark_id: list(articles)}).get(
+                landmark_id, set()
+            )
+            self._unchanged_urls[landmark_id] = unchanged
+
+        self._fetch_article_content(
+            [article for article in articles if article.url not in unchanged]
+        )
+        return list(articles)
+
+    def _fetch_article_content(self, articles: List[Any]) -> None:
+        """Fetch the content of articles with shared API requests."""
+        if not articles:
+            return
+        contents = self.bulk_fetcher.fetch_articles(article.url for article in articles)
         for article in articles:
             logger.info(f"- Article: {article.title}, URL: {article.url}")
-
-            # Fetch the actual content from Wikipedia
-            logger.info(f"Fetching content from Wikipedia for article: {article.title}")
-            article_content, rev_id = self.wiki_fetcher.fetch_wikipedia_content(
-                article.url
-            )
+            article_content, rev_id = contents.get(article.url, (None, None))
             if article_content:
                 article.content = article_content
                 article.rev_id = rev_id  # Store the revision ID
@@ -86,19 +157,133 @@ class WikipediaProcessor:
             else:
                 logger.warning(f"Failed to fetch content for article: {article.title}")
 
-        return list(articles)
+    def find_unchanged_articles(
+        self, landmark_articles: Dict[str, List[Any]]
+    ) -> Dict[str, Set[str]]:
+        """
+        Find articles whose stored vectors are built from their current revision.
+
+        Current revision IDs come from bulk MediaWiki queries, stored ones
+        from the ``article_rev_id`` of each article's first vector.
+
+        Args:
+            landmark_articles: Articles per landmark ID
+
+        Returns:
+            URLs of the unchanged articles per landmark ID
+        """
+        current = self.bulk_fetcher.fetch_revisions(
+            article.url
+            for articles in landmark_articles.values()
+            for article in articles
+        )
+        first_vectors = {
+            f"wiki-{article.title.replace(' ', '_')}-{landmark_id}-chunk-0": (
+                landmark_id,
+                article.url,
+            )
+            for landmark_id, articles in landmark_articles.items()
+            for article in articles
+        }
+        stored = {
+            first_vectors[vector_id]: str(rev_id)
+            for vector_id, vector in self.pinecone_db.fetch_vectors(
+                list(first_vectors)
+            ).items()
+            for rev_id in [(vector.get("metadata") or {}).get("article_rev_id")]
+            if rev_id
+        }
+
+        unchanged: Dict[str, Set[str]] = {}
+        for landmark_id, articles in landmark_articles.items():
+            urls = {
+                article.url
+                for article in articles
+                if current.get(article.url)
+                and stored.get((landmark_id, article.url)) == current[article.url]
+            }
+            if urls:
+                unchanged[landmark_id] = urls
+        return unchanged
+
+    def prefetch_wikipedia_articles(
+        self, landmark_ids: List[str], workers: int = 4
+    ) -> int:
+        """
+        Fetch the Wikipedia articles of many landmarks in bulk.
+
+        Looks up the articles of every landmark and fetches their content
+        with shared MediaWiki API requests; ``fetch_wikipedia_articles`` then
+        serves it from memory instead of fetching landmark by landmark. With
+        ``skip_unchanged_revisions``, the revisions of all articles are
+        checked first and unchanged articles are not fetched. The quality of
+        the fetched revisions is scored concurrently as well.
+
+        Args:
+            landmark_ids: IDs of the landmarks about to be processed
+            workers: Concurrent article lookups in the database
+
+        Returns:
+            Number of articles fetched with content
+        """
+        db_client = self._initialize_db_client()
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            article_lists = list(
+                executor.map(db_client.get_wikipedia_articles, landmark_ids)
+            )
+        landmark_articles = {
+            landmark_id: list(articles or [])
+            for landmark_id, articles in zip(landmark_ids, article_lists)
+        }
+
+        unchanged: Dict[str, Set[str]] = {}
+        if self.skip_unchanged_revisions:
+            unchanged = self.find_unchanged_articles(landmark_articles)
+            logger.info(
+                f"{sum(len(urls) for urls in unchanged.values())} Wikipedia "
+                "articles are unchanged since they were stored"
+            )
+        urls = [
+            article.url
+            for landmark_id, articles in landmark_articles.items()
+            for article in articles
+            if article.url not in unchanged.get(landmark_id, set())
+        ]
+        logger.info(
+            f"Prefetching {len(urls)} Wikipedia articles of {len(landmark_ids)} landmarks"
+        )
+        prefetched = self.bulk_fetcher.prefetch(urls)
+        self.quality_fetcher.fetch_qualities(
+            rev_id
+            for rev_id in self.bulk_fetcher.fetch_revisions(urls).values()
+            if rev_id
+        )
+        return prefetched
 
     def split_into_token_chunks(
-        self, text: Optional[str], max_tokens: int, tokenizer: PreTrainedTokenizer
+        self,
+        text: Optional[str],
+        max_tokens: int,
+        tokenizer: Optional[tiktoken.Encoding] = None,
     ) -> List[str]:
-        """Split text into chunks based on token count."""
-        if text is None:
-            return []
-        tokens = tokenizer.encode(text)
-        chunks = []
-        for i in range(0, len(tokens), max_tokens):
-            chunks.append(tokenizer.decode(tokens[i : i + max_tokens]))
-        return chunks
+        """
+        Split text into chunks of at most ``max_tokens`` tokens.
+
+        Uses the token strategy of the shared chunking engine, so each chunk
+        is a slice of the text cut at a token boundary.
+
+        Args:
+            text: Text to split
+            max_tokens: Maximum tokens per chunk
+            tokenizer: Encoder to count tokens with (default: the shared
+                encoder of the embedding model)
+
+        Returns:
+            List of text chunks
+        """
+        return ChunkingEngine(
+            ChunkStrategy.TOKENS, max_tokens, tokenizer=tokenizer
+        ).chunk_texts(text)
 
     def process_articles_into_chunks(
         self, articles: List[Any], landmark_id: str
@@ -116,20 +301,23 @@ class WikipediaProcessor:
         # Define low-quality article levels to skip
         LOW_QUALITY_LEVELS = ["Stub", "Start"]
 
-        # Initialize for token-based chunking
-        from transformers import GPT2Tokenizer
-
-        # Using stable GPT-2 tokenizer for text chunking - this is safe for our use case
-        tokenizer = GPT2Tokenizer.from_pretrained("gpt2")  # nosec B615
-        max_token_limit = 8192
-        token_limit_per_chunk = max_token_limit - 500  # Reserve tokens for metadata
-
-        logger.info(f"Using token limit of {token_limit_per_chunk} per chunk")
+        logger.info(
+            f"Chunking by {self.chunking_engine.strategy.value} with a limit of "
+            f"{self.chunking_engine.chunk_size} tokens per chunk"
+        )
 
         processed_articles = []
         total_chunks = 0
         skipped_articles = []
 
+        # Score all revisions concurrently; the loop below reads the scores
+        # from the quality fetcher's cache
+        self.quality_fetcher.fetch_qualities(
+            article.rev_id
+            for article in articles
+            if article.content is not None and getattr(article, "rev_id", None)
+        )
+
         for article in articles:
             logger.debug(f"Processing article: {article.title}")
 
@@ -137,50 +325,12 @@ class WikipediaProcessor:
                 logger.error(f"Content is None for article: {article.title}")
                 continue
 
-            # Split the article into token-based chunks
-            token_chunks = self.split_into_token_chunks(
-                article.content, token_limit_per_chunk, tokenizer
-            )
-            logger.info(
-                f"Split article '{article.title}' into {len(token_chunks)} token-based chunks"
-            )
-
-            # Create dictionary chunks for the WikipediaContentModel
-            dict_chunks: List[Dict[str, Any]] = []
-            for i, chunk_text in enumerate(token_chunks):
-                token_count = len(tokenizer.encode(chunk_text))
-                # Generate the vector ID that will be used for this chunk
-                vector_id = (
-                    f"wiki-{article.title.replace(' ', '_')}-{landmark_id}-chunk-{i}"
-                )
-                logger.info(
-                    f"Processing chunk {i} with {token_count} tokens (Vector ID: {vector_id})"
-                )
-
-                dict_chunks.append(
-                    {
-                        "text": chunk_text,
-                        "chunk_index": i,
-                        "metadata": {
-                            "chunk_index": i,
-                            "article_title": article.title,
-                            "article_url": article.url,
-                            "source_type": SourceType.WIKIPEDIA.value,
-                            "landmark_id": landmark_id,
-                            "rev_id": (
-                                article.rev_id if hasattr(article, "rev_id") else None
-                            ),
-                        },
-                        "total_chunks": len(token_chunks),
-                    }
-                )
-
-            # Fetch article quality if revision ID is available
+            # Fetch article quality if revision ID is available, and skip
+            # low-quality articles before tokenizing them
             quality = None
             if hasattr(article, "rev_id") and article.rev_id:
-                quality_data = self._fetch_article_quality(article.rev_id)
-                if quality_data:
-                    quality = quality_data
+                quality = self._fetch_article_quality(article.rev_id)
+                if quality:
                     logger.info(
                         f"Added quality assessment for article: {article.title} - {quality.prediction}"
                     )
@@ -193,16 +343,38 @@ class WikipediaProcessor:
                         skipped_articles.append(article.title)
                         continue  # Skip to next article
 
-                    # Add quality info to chunk metadata
-                    for chunk in dict_chunks:
-                        if "metadata" in chunk:
-                            chunk["metadata"]["article_quality"] = quality.prediction
-                            chunk["metadata"]["article_quality_score"] = str(
-                                quality.probabilities.get(quality.prediction, 0.0)
-                            )
-                            chunk["metadata"][
-                                "article_quality_description"
-                            ] = quality.get_quality_description()
+            # Split the article into chunks with the shared chunking engine
+            dict_chunks = self.chunking_engine.chunk_dicts(
+                article.content,
+                {
+                    "article_title": article.title,
+                    "article_url": article.url,
+                    "source_type": SourceType.WIKIPEDIA.value,
+                    "landmark_id": landmark_id,
+                    "rev_id": article.rev_id if hasattr(article, "rev_id") else None,
+                },
+            )
+            logger.info(
+                f"Split article '{article.title}' into {len(dict_chunks)} chunks"
+            )
+            for chunk in dict_chunks:
+                # Log the vector ID that will be used for this chunk
+                vector_id = f"wiki-{article.title.replace(' ', '_')}-{landmark_id}-chunk-{chunk['chunk_index']}"
+                logger.info(
+                    f"Processing chunk {chunk['chunk_index']} with "
+                    f"{chunk['metadata']['token_count']} tokens (Vector ID: {vector_id})"
+                )
+
+            # Add quality info to chunk metadata
+            if quality:
+                for chunk in dict_chunks:
+                    chunk["metadata"]["article_quality"] = quality.prediction
+                    chunk["metadata"]["article_quality_score"] = str(
+                        quality.probabilities.get(quality.prediction, 0.0)
+                    )
+                    chunk["metadata"][
+                        "article_quality_description"
+                    ] = quality.get_quality_description()
 
             # Create a WikipediaContentModel with the chunks
             content_model = WikipediaContentModel(
@@ -472,24 +644,16 @@ class WikipediaProcessor:
         """Extract building fields from enhanced metadata."""
         return {k: v for k, v in enhanced_metadata.items() if k.startswith("building_")}
 
-    def generate_embeddings_and_store(
-        self,
-        processed_articles: List[WikipediaContentModel],
-        landmark_id: str,
-        delete_existing: bool,
-    ) -> int:
+    def collect_enhanced_metadata(self, landmark_id: str) -> Dict[str, Any]:
         """
-        Generate embeddings for chunks and store them in Pinecone.
+        Collect the enhanced metadata stored with a landmark's Wikipedia vectors.
 
         Args:
-            processed_articles: List of processed Wikipedia articles
             landmark_id: ID of the landmark
-            delete_existing: Whether to delete existing vectors for the landmark
 
         Returns:
-            Total chunks embedded
+            Enhanced metadata dictionary (empty if it could not be collected)
         """
-        # Collect enhanced metadata once for this landmark
         from nyc_landmarks.vectordb.enhanced_metadata import get_metadata_collector
 
         enhanced_metadata_dict = {}
@@ -547,8 +711,39 @@ class WikipediaProcessor:
             )
             enhanced_metadata_dict = {}
 
+        return enhanced_metadata_dict
+
+    def generate_embeddings_and_store(
+        self,
+        processed_articles: List[WikipediaContentModel],
+        landmark_id: str,
+        delete_existing: bool,
+        enhanced_metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Generate embeddings for chunks and store them in Pinecone.
+
+        Args:
+            processed_articles: List of processed Wikipedia articles
+            landmark_id: ID of the landmark
+            delete_existing: Whether to delete existing vectors for the landmark
+            enhanced_metadata: Metadata collected earlier (collected if not given)
+
+        Returns:
+            Total chunks embedded
+        """
+        # Collect enhanced metadata once for this landmark
+        enhanced_metadata_dict = (
+            enhanced_metadata
+            if enhanced_metadata is not None
+            else self.collect_enhanced_metadata(landmark_id)
+        )
+
         total_chunks_embedded = 0
 
+        # Submit the chunks of every article before waiting for any, so the
+        # batcher can put them in the same embedding requests
+        pending_articles = []
         for wiki_article in processed_articles:
             # Skip articles with no chunks
             if not hasattr(wiki_article, "chunks") or not wiki_article.chunks:
@@ -557,13 +752,19 @@ class WikipediaProcessor:
                 )
                 continue
 
-            # Generate embeddings for the chunks
             logger.info(
                 f"Generating embeddings for {len(wiki_article.chunks)} chunks from article: {wiki_article.title}"
             )
-            chunks_with_embeddings = self.embedding_generator.process_chunks(
-                wiki_article.chunks
+            future = self.embedding_batcher.submit(
+                [chunk["text"] for chunk in wiki_article.chunks]
             )
+            pending_articles.append((wiki_article, future))
+
+        for wiki_article, future in pending_articles:
+            chunks_with_embeddings = [
+                {**chunk, "embedding": embedding}
+                for chunk, embedding in zip(wiki_article.chunks or [], future.result())
+            ]
 
             # Get current timestamp for processing_date
             current_time = datetime.datetime.now().isoformat()
@@ -659,6 +860,26 @@ class WikipediaProcessor:
                 )
                 return True, 0, 0  # Success with zero articles - not a failure
 
+            # Collected once: it is part of the source fingerprint and of the
+            # metadata check of unchanged articles
+            enhanced_metadata = None
+            if self.manifest is not None:
+                enhanced_metadata = self.collect_enhanced_metadata(landmark_id)
+
+            articles = self._skip_unchanged_articles(
+                landmark_id, articles, delete_existing, enhanced_metadata
+            )
+            if not articles:
+                self.unchanged_landmarks.add(landmark_id)
+                return True, 0, 0
+
+            source_hash = None
+            if enhanced_metadata is not None:
+                source_hash = self.source_fingerprint(articles, enhanced_metadata)
+            if self._source_processed(landmark_id, source_hash):
+                self.unchanged_landmarks.add(landmark_id)
+                return True, 0, 0
+
             # Step 2: Process the articles into chunks
             processed_articles, total_chunks = self.process_articles_into_chunks(
                 articles, landmark_id
@@ -682,11 +903,160 @@ class WikipediaProcessor:
                 processed_articles,
                 landmark_id,
                 delete_existing,
+                enhanced_metadata,
             )
 
             logger.info(f"Total chunks embedded: {total_chunks_embedded}")
+            self._record_processed(
+                landmark_id,
+                source_hash,
+                processed_articles,
+                total_chunks_embedded,
+                enhanced_metadata,
+            )
             return True, len(processed_articles), total_chunks_embedded
 
         except Exception as e:
             logger.error(f"Error processing Wikipedia for landmark {landmark_id}: {e}")
+            if self.manifest is not None:
+                self.manifest.record(
+                    landmark_id,
+                    self.MANIFEST_STAGE,
+                    status=StageStatus.FAILED,
+                    error=str(e),
+                )
             return False, 0, 0
+
+    def _skip_unchanged_articles(
+        self,
+        landmark_id: str,
+        articles: List[Any],
+        delete_existing: bool,
+        enhanced_metadata: Optional[Dict[str, Any]],
+    ) -> List[Any]:
+        """Drop the articles whose stored revision is current.
+
+        Unchanged articles are kept (and their content fetched) when the
+        landmark's stored vectors are replaced anyway, i.e. when existing
+        vectors are deleted or the enhanced metadata changed.
+
+        Args:
+            landmark_id: ID of the landmark
+            articles: Articles of the landmark
+            delete_existing: Whether existing vectors will be deleted
+            enhanced_metadata: Current enhanced metadata (None without a manifest)
+
+        Returns:
+            Articles that need to be processed
+        """
+        unchanged = self._unchanged_urls.pop(landmark_id, set())
+        if not unchanged:
+            return articles
+
+        if delete_existing or not self._metadata_current(
+            landmark_id, enhanced_metadata
+        ):
+            # Stored vectors are replaced, so unchanged articles are needed
+            self._fetch_article_content(
+                [article for article in articles if article.url in unchanged]
+            )
+            return articles
+
+        self.unchanged_articles[landmark_id] = len(unchanged)
+        logger.info(
+            f"Skipping {len(unchanged)} Wikipedia articles of landmark "
+            f"{landmark_id} with unchanged revisions"
+        )
+        return [article for article in articles if article.url not in unchanged]
+
+    def _source_processed(self, landmark_id: str, source_hash: Optional[str]) -> bool:
+        """Whether incremental mode can skip a landmark whose sources are indexed.
+
+        Args:
+            landmark_id: ID of the landmark
+            source_hash: Fingerprint of the landmark's sources (None if unknown)
+
+        Returns:
+            True if the manifest records a completed run for the same sources
+        """
+        if not self.incremental or source_hash is None or self.manifest is None:
+            return False
+        if not self.manifest.completed(landmark_id, self.MANIFEST_STAGE, source_hash):
+            return False
+        logger.info(f"Wikipedia articles of landmark {landmark_id} are unchanged")
+        return True
+
+    def _record_processed(
+        self,
+        landmark_id: str,
+        source_hash: Optional[str],
+        processed_articles: List[Any],
+        chunks_embedded: int,
+        enhanced_metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        """Record a processed landmark in the run manifest, if there is one."""
+        if self.manifest is None:
+            return
+        self.manifest.record(
+            landmark_id,
+            self.MANIFEST_STAGE,
+            source_hash,
+            details={
+                "revisions": {
+                    article.title: article.rev_id for article in processed_articles
+                },
+                "chunks": chunks_embedded,
+                "metadata": metadata_fingerprint(enhanced_metadata or {}),
+            },
+        )
+
+    def _metadata_current(
+        self, landmark_id: str, enhanced_metadata: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Whether the metadata recorded with a landmark's vectors is current.
+
+        Landmarks without a recorded metadata fingerprint count as current.
+        """
+        if self.manifest is None:
+            return True
+        record = self.manifest.get(landmark_id, self.MANIFEST_STAGE)
+        details = (record.details if record is not None else None) or {}
+        if "metadata" not in details:
+            return True
+        return bool(
+            details["metadata"] == metadata_fingerprint(enhanced_metadata or {})
+        )
+
+    def source_fingerprint(
+        self, articles: List[Any], enhanced_metadata: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Fingerprint of everything a landmark's Wikipedia vectors are built from.
+
+        Covers each article's revision ID and content hash, the enhanced
+        metadata and the embedding model and target index. The content hash
+        is included because the fetcher may report the page ID when no
+        revision ID is found in the page.
+
+        Args:
+            articles: Articles with fetched content
+            enhanced_metadata: Enhanced metadata of the landmark
+
+        Returns:
+            SHA-256 hex digest, or None if some article has no content
+        """
+        sources = []
+        for article in articles:
+            content = getattr(article, "content", None)
+            if not content:
+                return None
+            sources.append(
+                (article.url, getattr(article, "rev_id", None), sha256_text(content))
+            )
+        return fingerprint(
+            sorted(sources),
+            metadata_fingerprint(enhanced_metadata),
+            self.embedding_generator.model,
+            self.pinecone_db.index_name,
+            self.pinecone_db.namespace,
+        )
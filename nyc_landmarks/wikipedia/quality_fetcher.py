@@ -2,12 +2,24 @@
 Module for fetching Wikipedia article quality assessments using the Lift Wing API.
 
 This module provides functionality to assess the quality of Wikipedia articles
-by querying the Wikimedia Lift Wing API's articlequality model.
+by querying the Wikimedia Lift Wing API's articlequality model. The model
+scores one revision per request, so many revisions are scored with concurrent
+requests over a pooled session. A revision's quality never changes, so scores
+are kept in memory and, optionally, in a persistent SQLite cache.
 """
 
-from typing import Any, Dict, Optional
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -20,12 +32,134 @@ from nyc_landmarks.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_quality (
+    rev_id TEXT PRIMARY KEY,
+    prediction TEXT,
+    probabilities TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+
+class QualityCache:
+    """SQLite cache of article quality scores by revision ID.
+
+    The database is opened on first use; entries never expire.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, timeout=30
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, rev_id: str) -> Optional[Dict[str, Any]]:
+        """Cached quality of a revision.
+
+        Args:
+            rev_id: Wikipedia revision ID
+
+        Returns:
+            Quality dictionary, or None if the revision was not scored yet
+        """
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT prediction, probabilities FROM article_quality "
+                    "WHERE rev_id = ?",
+                    (str(rev_id),),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return {
+            "prediction": row[0],
+            "probabilities": json.loads(row[1]),
+            "rev_id": str(rev_id),
+        }
+
+    def put(self, rev_id: str, quality: Dict[str, Any]) -> None:
+        """Store the quality of a revision.
+
+        Args:
+            rev_id: Wikipedia revision ID
+            quality: Quality dictionary returned by the fetcher
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO article_quality "
+                "(rev_id, prediction, probabilities, fetched_at) VALUES (?, ?, ?, ?)",
+                (
+                    str(rev_id),
+                    quality.get("prediction"),
+                    json.dumps(quality.get("probabilities") or {}),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _RateLimiter:
+    """Space request starts of several threads by a minimum interval."""
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class WikipediaQualityFetcher:
     """Fetches quality assessments for Wikipedia articles using the Lift Wing API."""
 
-    def __init__(self) -> None:
-        """Initialize the Wikipedia quality fetcher."""
+    def __init__(
+        self,
+        cache: Optional[QualityCache] = None,
+        concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+    ) -> None:
+        """Initialize the Wikipedia quality fetcher.
+
+        Args:
+            cache: Persistent cache of scores by revision ID (scores are
+                only kept in memory without one)
+            concurrency: Concurrent API requests
+                (default: WIKIPEDIA_QUALITY_CONCURRENCY)
+            requests_per_second: Maximum API requests started per second
+                (default: WIKIPEDIA_QUALITY_REQUESTS_PER_SECOND)
+        """
         settings = Settings()
         self.api_endpoint = settings.WIKIPEDIA_API_ENDPOINT
         self.user_agent = settings.WIKIPEDIA_USER_AGENT
@@ -33,8 +167,85 @@ class WikipediaQualityFetcher:
             "User-Agent": self.user_agent,
             "Content-Type": "application/json",
         }
+        self.cache = cache
+        self.concurrency = max(concurrency or settings.WIKIPEDIA_QUALITY_CONCURRENCY, 1)
+        self._limiter = _RateLimiter(
+            requests_per_second
+            if requests_per_second is not None
+            else settings.WIKIPEDIA_QUALITY_REQUESTS_PER_SECOND
+        )
+        self._scores: Dict[str, Dict[str, Any]] = {}
+        self._scores_lock = threading.Lock()
+
+        # Pooled session shared by the concurrent scoring threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         logger.info("Initialized Wikipedia quality fetcher")
 
+    def _cached(self, rev_id: str) -> Optional[Dict[str, Any]]:
+        """Score of a revision from memory or the persistent cache."""
+        with self._scores_lock:
+            quality = self._scores.get(str(rev_id))
+        if quality is None and self.cache is not None:
+            try:
+                quality = self.cache.get(rev_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read the article quality cache: {e}")
+            if quality is not None:
+                with self._scores_lock:
+                    self._scores[str(rev_id)] = quality
+        return quality
+
+    def _remember(self, rev_id: str, quality: Dict[str, Any]) -> None:
+        """Keep the score of a revision in memory and the persistent cache."""
+        with self._scores_lock:
+            self._scores[str(rev_id)] = quality
+        if self.cache is not None:
+            try:
+                self.cache.put(rev_id, quality)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write the article quality cache: {e}")
+
+    def fetch_qualities(
+        self, rev_ids: Iterable[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch the quality of many revisions with concurrent requests.
+
+        Cached revisions are not requested again; revisions whose request
+        fails are reported as None.
+
+        Args:
+            rev_ids: Wikipedia revision IDs
+
+        Returns:
+            Mapping of revision ID to quality dictionary or None
+        """
+        rev_ids = list(dict.fromkeys(str(rev_id) for rev_id in rev_ids if rev_id))
+        results = {rev_id: self._cached(rev_id) for rev_id in rev_ids}
+        missing = [rev_id for rev_id, quality in results.items() if quality is None]
+        if not missing:
+            return results
+
+        def score(rev_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.fetch_article_quality(rev_id)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Could not score revision {rev_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(missing))
+        ) as executor:
+            results.update(zip(missing, executor.map(score, missing)))
+        logger.info(
+            f"Scored {sum(1 for rev_id in missing if results[rev_id])} of "
+            f"{len(missing)} uncached Wikipedia revisions"
+        )
+        return results
+
     @retry(  # type: ignore[misc]
         retry=retry_if_exception_type(
             (requests.ConnectionError, requests.Timeout, requests.HTTPError)
@@ -57,6 +268,10 @@ class WikipediaQualityFetcher:
             logger.warning("Cannot fetch article quality: No revision ID provided")
             return None
 
+        cached = self._cached(rev_id)
+        if cached is not None:
+            return cached
+
         try:
             logger.info(f"Fetching quality assessment for Wikipedia revision: {rev_id}")
 
@@ -64,7 +279,8 @@ class WikipediaQualityFetcher:
             payload = {"rev_id": int(rev_id)}
 
             # Make the API request
-            response = requests.post(
+            self._limiter.wait()
+            response = self.session.post(
                 self.api_endpoint, headers=self.headers, json=payload, timeout=30
             )
             response.raise_for_status()
@@ -104,11 +320,13 @@ class WikipediaQualityFetcher:
                 f"Quality assessment for rev_id {rev_id}: {score.get('prediction', 'Unknown')}"
             )
 
-            return {
+            quality = {
                 "prediction": score.get("prediction"),
                 "probabilities": score.get("probability", {}),
                 "rev_id": rev_id,
             }
+            self._remember(rev_id, quality)
+            return quality
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching quality assessment for rev_id {rev_id}: {e}")
@@ -118,3 +336,10 @@ class WikipediaQualityFetcher:
                 f"Unexpected error processing quality assessment for rev_id {rev_id}: {e}"
             )
             return None
+
+
+@lru_cache(maxsize=1)
+def get_wikipedia_quality_fetcher() -> WikipediaQualityFetcher:
+    """Shared quality fetcher using the cache at WIKIPEDIA_QUALITY_CACHE_PATH."""
+    path = Settings().WIKIPEDIA_QUALITY_CACHE_PATH
+    return WikipediaQualityFetcher(cache=QualityCache(path) if path else None)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Benchmark script for the chunking engine strategies.
+
+Chunks a generated Wikipedia-style article with every chunking strategy and
+reports how long each one takes. Exits with a non-zero code when a strategy
+exceeds the time limit, so it can be run as a manual performance check.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from nyc_landmarks.chunking import ChunkingEngine, ChunkStrategy, get_tokenizer
+from nyc_landmarks.utils.logger import get_logger
+
+logger = get_logger(name="benchmark_chunking")
+
+
+def build_article(sections: int, paragraphs: int) -> str:
+    """Build a Wikipedia extract with headings and paragraphs."""
+    parts = ["Gracie Mansion is the official residence of the mayor."]
+    for section in range(sections):
+        parts.append(f"== Section {section} ==")
+        parts.extend(
+            " ".join(
+                f"Sentence {sentence} of paragraph {paragraph}."
+                for sentence in range(6)
+            )
+            for paragraph in range(paragraphs)
+        )
+    return "\n\n".join(parts)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the chunking engine")
+    parser.add_argument(
+        "--sections", type=int, default=40, help="Sections in the article"
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=10, help="Paragraphs per section"
+    )
+    parser.add_argument("--chunk-size", type=int, default=200, help="Chunk tokens")
+    parser.add_argument("--chunk-overlap", type=int, default=20, help="Overlap tokens")
+    parser.add_argument(
+        "--limit", type=float, default=1.0, help="Seconds allowed per strategy"
+    )
+    args = parser.parse_args()
+
+    text = build_article(args.sections, args.paragraphs)
+    # Load the encoder up front so it is not part of the first timing
+    get_tokenizer()
+
+    slow = []
+    for strategy in ChunkStrategy:
+        engine = ChunkingEngine(strategy, args.chunk_size, args.chunk_overlap)
+        started = time.perf_counter()
+        chunks = engine.chunk(text)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"{strategy.value:<10} {len(chunks):>5} chunks in {elapsed * 1000:.1f}ms"
+        )
+        if elapsed > args.limit:
+            slow.append(strategy.value)
+
+    if slow:
+        logger.error(f"Slower than {args.limit:.2f}s: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
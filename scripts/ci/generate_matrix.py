@@ -2,7 +2,11 @@ import argparse
 import json
 import math
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add the project root to the path so cost-balanced jobs can import nyc_landmarks
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 
 def generate_matrix(
@@ -73,6 +77,108 @@ def generate_matrix(
     return json.dumps({"include": matrix_includes})
 
 
+def generate_cost_matrix(costs: Dict[str, float], jobs: int) -> str:
+    """
+    Generates a matrix of landmark ID lists with balanced estimated costs.
+
+    Args:
+        costs: Estimated processing cost per landmark ID.
+        jobs: Number of matrix jobs to split the landmarks into.
+
+    Returns:
+        A JSON string representing the matrix configuration.
+    """
+    # Imported here so page-based matrices need no project dependencies
+    from nyc_landmarks.pipeline.cost_model import balance_jobs
+
+    balanced = balance_jobs(costs, jobs) if costs else []
+    if balanced:
+        print(
+            f"Balanced {len(costs)} landmarks into {len(balanced)} jobs "
+            f"(estimated cost {min(j.cost for j in balanced):.0f} to "
+            f"{max(j.cost for j in balanced):.0f})",
+            file=sys.stderr,
+        )
+
+    # {"include": [ { "job": 1, "landmark_ids": "LP-00001,LP-00009", ... }, ... ]}
+    return json.dumps(
+        {
+            "include": [
+                {
+                    "job": number,
+                    "landmark_ids": ",".join(job.landmark_ids),
+                    "landmark_count": len(job.landmark_ids),
+                    "estimated_cost": round(job.cost, 1),
+                }
+                for number, job in enumerate(balanced, start=1)
+            ]
+        }
+    )
+
+
+def estimate_costs(
+    catalog_path: Optional[str] = None,
+    scan_catalog: bool = False,
+    manifest_path: Optional[str] = None,
+    head_pdfs: bool = False,
+) -> Dict[str, float]:
+    """
+    Estimates per-landmark processing costs from a catalog and earlier runs.
+
+    Args:
+        catalog_path: JSON file of landmark records (LPC reports or the PDF URL
+            list written by scripts/fetch_landmark_reports.py).
+        scan_catalog: Fetch the landmark records from the CoreDataStore API.
+        manifest_path: Run manifest with chunk counts and PDF sizes of earlier runs.
+        head_pdfs: Get the size of PDFs without recorded history from HEAD requests.
+
+    Returns:
+        Estimated cost per landmark ID.
+    """
+    from nyc_landmarks.pipeline.cost_model import (
+        CostModel,
+        fetch_pdf_sizes,
+        merge_sources,
+        sources_from_catalog,
+        sources_from_manifest,
+    )
+    from nyc_landmarks.pipeline.manifest import RunManifest
+
+    records: List[Dict[str, Any]] = []
+    if catalog_path:
+        with open(catalog_path) as f:
+            data = json.load(f)
+        records = data.get("landmarks", []) if isinstance(data, dict) else data
+    elif scan_catalog:
+        from nyc_landmarks.db.db_client import get_db_client
+
+        records = get_db_client().get_all_landmarks()
+
+    history: Dict[str, Any] = {}
+    if manifest_path:
+        if not Path(manifest_path).exists():
+            raise ValueError(f"No run manifest at {manifest_path}")
+        manifest = RunManifest(manifest_path)
+        try:
+            history = sources_from_manifest(manifest)
+        finally:
+            manifest.close()
+
+    sources = merge_sources(sources_from_catalog(records), history)
+    if head_pdfs:
+        unknown = {
+            s.landmark_id: s.pdf_url
+            for s in sources
+            if s.pdf_url and s.chunks is None and not s.pdf_bytes
+        }
+        sizes = fetch_pdf_sizes(unknown)
+        for source in sources:
+            source.pdf_bytes = sizes.get(source.landmark_id, source.pdf_bytes)
+        print(f"Got the size of {len(unknown)} PDFs", file=sys.stderr)
+
+    return CostModel(sources).costs()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Generate GitHub Actions matrix for batch processing."
@@ -80,8 +186,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "--total-records",
         type=int,
-        required=True,
-        help="Total number of records to process.",
+        required=False,
+        help="Total number of records to process (required for page ranges).",
     )
     parser.add_argument(
         "--api-page-size",
@@ -104,18 +210,70 @@ if __name__ == "__main__":
         required=False,
         help="Override for ending page number.",
     )
+    cost_group = parser.add_argument_group(
+        "cost-balanced jobs",
+        "Split landmark ID lists by estimated cost instead of API page ranges.",
+    )
+    cost_group.add_argument(
+        "--catalog",
+        type=str,
+        help="JSON file of landmark records (e.g. from fetch_landmark_reports.py).",
+    )
+    cost_group.add_argument(
+        "--scan-catalog",
+        action="store_true",
+        help="Fetch the landmark records from the CoreDataStore API.",
+    )
+    cost_group.add_argument(
+        "--manifest",
+        type=str,
+        help="Run manifest with chunk counts and PDF sizes of earlier runs.",
+    )
+    cost_group.add_argument(
+        "--head-pdfs",
+        action="store_true",
+        help="Get the size of PDFs without history from HEAD requests.",
+    )
+    cost_group.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of jobs (default: as many as the page-based matrix).",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write the matrix JSON to a file instead of stdout.",
+    )
 
     args = parser.parse_args()
 
     try:
-        matrix_json = generate_matrix(
-            args.total_records,
-            args.api_page_size,
-            args.job_batch_size,
-            args.start_page_override,
-            args.end_page_override,
-        )
-        print(matrix_json)  # Output the JSON to stdout
+        if args.catalog or args.scan_catalog or args.manifest:
+            if args.start_page_override or args.end_page_override:
+                raise ValueError(
+                    "Page overrides cannot be used with cost-balanced jobs"
+                )
+            costs = estimate_costs(
+                args.catalog, args.scan_catalog, args.manifest, args.head_pdfs
+            )
+            jobs = args.jobs or math.ceil(
+                len(costs) / (args.api_page_size * args.job_batch_size)
+            )
+            matrix_json = generate_cost_matrix(costs, max(jobs, 1))
+        else:
+            if args.total_records is None:
+                raise ValueError("--total-records is required for page ranges")
+            matrix_json = generate_matrix(
+                args.total_records,
+                args.api_page_size,
+                args.job_batch_size,
+                args.start_page_override,
+                args.end_page_override,
+            )
+        if args.output:
+            Path(args.output).write_text(matrix_json)
+        else:
+            print(matrix_json)  # Output the JSON to stdout
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Summarize landmark pipeline progress from the run manifest.
+
+Reads the SQLite run manifest written by scripts/ci/process_landmarks.py and
+prints recent runs, landmark counts per stage and outcome, and the latest
+failures.
+
+Examples:
+python scripts/ci/pipeline_status.py
+python scripts/ci/pipeline_status.py --runs 5 --failures 20
+python scripts/ci/pipeline_status.py --landmark LP-00079
+python scripts/ci/pipeline_status.py --json
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict
+
+# Add the project root to the path so we can import nyc_landmarks modules
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.pipeline.manifest import RunManifest
+
+# Stages in pipeline order
+STAGES = ["download", "extract", "chunk", "embed", "store"]
+
+
+def collect_status(manifest: RunManifest, runs: int, failures: int) -> Dict[str, Any]:
+    """Collect run, stage and failure summaries.
+
+    Args:
+        manifest: Run manifest to read
+        runs: Number of recent runs to include
+        failures: Number of recent failures to include
+
+    Returns:
+        Status summary
+    """
+    summary = manifest.stage_summary()
+    ordered = [stage for stage in STAGES if stage in summary]
+    ordered += sorted(set(summary) - set(STAGES))
+    return {
+        "runs": manifest.runs(runs),
+        "stages": {stage: summary[stage] for stage in ordered},
+        "failures": [asdict(record) for record in manifest.failures()[:failures]],
+    }
+
+
+def print_status(status: Dict[str, Any]) -> None:
+    """Print a status summary as text.
+
+    Args:
+        status: Summary from collect_status
+    """
+    print("\n===== PIPELINE RUNS =====")
+    for run in status["runs"]:
+        stats = run["stats"] or {}
+        state = "finished" if run["finished_at"] else "unfinished"
+        print(
+            f"{run['run_id']}  {run['started_at']}  {state}  "
+            f"processed={stats.get('landmarks_processed', '-')} "
+            f"up_to_date={stats.get('landmarks_resumed', '-')} "
+            f"failed={len(stats.get('failed_landmarks', [])) if stats else '-'}"
+        )
+        print(f"    {run['command']}")
+
+    print("\n===== LANDMARKS PER STAGE =====")
+    for stage, counts in status["stages"].items():
+        print(
+            f"{stage:<10} done={counts.get('done', 0):<6} "
+            f"failed={counts.get('failed', 0)}"
+        )
+
+    if status["failures"]:
+        print("\n===== LATEST FAILURES =====")
+        for failure in status["failures"]:
+            print(
+                f"{failure['landmark_id']:<12} {failure['stage']:<10} "
+                f"{failure['error']}"
+            )
+
+
+def print_landmark(manifest: RunManifest, landmark_id: str) -> None:
+    """Print every stage entry of one landmark.
+
+    Args:
+        manifest: Run manifest to read
+        landmark_id: Landmark ID
+    """
+    records = manifest.landmark_stages(landmark_id)
+    if not records:
+        print(f"No stages recorded for {landmark_id}")
+        return
+    print(f"\n===== {landmark_id} =====")
+    for record in records:
+        print(
+            f"{record.stage:<10} {record.status.value:<7} run={record.run_id} "
+            f"{record.updated_at}" + (f"  {record.error}" if record.error else "")
+        )
+
+
+def main() -> None:
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description="Summarize landmark pipeline progress from the run manifest"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=settings.PIPELINE_MANIFEST_PATH,
+        help=f"Run manifest path (default: {settings.PIPELINE_MANIFEST_PATH})",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="Recent runs to show (default: 10)"
+    )
+    parser.add_argument(
+        "--failures",
+        type=int,
+        default=10,
+        help="Recent failures to show (default: 10)",
+    )
+    parser.add_argument("--landmark", type=str, help="Show the stages of a landmark")
+    parser.add_argument("--json", action="store_true", help="Print JSON output")
+    args = parser.parse_args()
+
+    if not Path(args.manifest).exists():
+        print(f"No run manifest at {args.manifest}")
+        sys.exit(1)
+
+    manifest = RunManifest(args.manifest)
+    try:
+        if args.landmark:
+            print_landmark(manifest, args.landmark)
+        elif args.json:
+            print(
+                json.dumps(
+                    collect_status(manifest, args.runs, args.failures),
+                    indent=2,
+                    default=str,
+                )
+            )
+        else:
+            print_status(collect_status(manifest, args.runs, args.failures))
+    finally:
+        manifest.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,18 +13,38 @@ Examples to Test:
 python scripts/ci/process_landmarks.py --page 1 --limit 10 --verbose
 python scripts/ci/process_landmarks.py --landmark-ids LP-00079 --verbose
 python scripts/ci/process_landmarks.py --all --parallel --verbose
+
+With --parallel, landmarks flow through a staged pipeline: downloads on an
+I/O thread pool, text extraction and chunking in a process pool, embedding
+requests batched across landmarks, and upserts on their own thread pool.
+Each stage has a concurrency option (--download-workers, --extract-workers,
+--embed-workers, --embed-batch-size, --upsert-workers).
+
+Stage completion is recorded per landmark in a SQLite run manifest
+(--manifest) with the hashes of each stage's inputs. --resume skips stages
+already completed for the same inputs, e.g. after a CI job died halfway:
+python scripts/ci/process_landmarks.py --all --parallel --resume
+Progress across runs is shown by scripts/ci/pipeline_status.py.
+
+--incremental goes further for scheduled re-indexing: it checks each PDF's
+ETag with a HEAD request instead of trusting the local copy, and hashes the
+landmark's enhanced metadata. Only landmarks whose PDF text or metadata
+changed are re-indexed, and a metadata-only change re-upserts the stored
+embeddings instead of embedding the text again:
+python scripts/ci/process_landmarks.py --all --parallel --incremental
 """
 
 import argparse
 import atexit
-import concurrent.futures
+import functools
 import json
 import logging
 import os
 import sys
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
 from tqdm import tqdm
@@ -33,12 +53,28 @@ from tqdm import tqdm
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 from nyc_landmarks.config.settings import settings
 from nyc_landmarks.db.db_client import get_db_client
+from nyc_landmarks.embeddings.batcher import EmbeddingBatcher
 from nyc_landmarks.embeddings.generator import EmbeddingGenerator
 from nyc_landmarks.landmarks.landmarks_processing import get_landmarks_to_process
 from nyc_landmarks.pdf.extractor import PDFExtractor
 from nyc_landmarks.pdf.text_chunker import TextChunker
+from nyc_landmarks.pipeline import Stage, StagedPipeline, StageKind
+from nyc_landmarks.pipeline.landmark_stages import (
+    LandmarkJob,
+    build_chunk_dicts,
+    extract_and_chunk,
+)
+from nyc_landmarks.pipeline.manifest import (
+    RunManifest,
+    StageStatus,
+    fingerprint,
+    metadata_fingerprint,
+    sha256_file,
+    sha256_text,
+)
 from nyc_landmarks.utils.logger import get_logger
 from nyc_landmarks.vectordb.enhanced_metadata import get_metadata_collector
+from nyc_landmarks.vectordb.lexical_index import enable_lexical_indexing
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
 
 # Configure logger for this script
@@ -77,15 +113,62 @@ def register_cleanup() -> None:
         _cleanup_registered = True
 
 
+@dataclass
+class StageConcurrency:
+    """Concurrency of each stage of the staged pipeline."""
+
+    download_workers: int = 4  # Concurrent PDF downloads
+    extract_workers: int = field(
+        default_factory=lambda: os.cpu_count() or 2
+    )  # Processes extracting and chunking text
+    embed_workers: int = 2  # Concurrent embedding requests
+    embed_batch_size: int = field(
+        default_factory=lambda: settings.EMBEDDING_BATCH_SIZE
+    )  # Chunks per embedding request, across landmarks
+    upsert_workers: int = 4  # Concurrent vector upserts
+    queue_size: int = 16  # Landmarks waiting between two stages
+
+
+def _pdf_version(headers: Any) -> Optional[str]:
+    """Version of a PDF from its HTTP response headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        The ETag, else Last-Modified with Content-Length, else None
+    """
+    etag = headers.get("ETag")
+    if etag:
+        return str(etag)
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        return f"{last_modified}; {headers.get('Content-Length', '')}"
+    return None
+
+
 class LandmarkPipeline:
     """Pipeline for processing NYC landmark data."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        manifest: Optional[RunManifest] = None,
+        resume: bool = False,
+        incremental: bool = False,
+    ):
         """Initialize the pipeline components.
 
         Args:
             api_key: Optional API key for CoreDataStore API
+            manifest: Run manifest recording stage completion (optional)
+            resume: Skip stages the manifest shows done for the same inputs
+            incremental: Also detect changed PDFs and metadata (implies resume)
         """
+        self.manifest = manifest
+        self.incremental = incremental and manifest is not None
+        self.resume = (resume or incremental) and manifest is not None
+
         # Set up database client using the abstraction layer
         self.db_client = get_db_client()
 
@@ -95,8 +178,12 @@ class LandmarkPipeline:
             chunk_size=settings.CHUNK_SIZE, chunk_overlap=settings.CHUNK_OVERLAP
         )
         self.embedding_generator = EmbeddingGenerator()
+        # Shared by all workers, so small landmarks fill embedding requests together
+        self.embedding_batcher = EmbeddingBatcher(self.embedding_generator)
         self.pinecone_db = PineconeDB()
         self.metadata_collector = get_metadata_collector()
+        if settings.LEXICAL_INDEX_ENABLED:
+            enable_lexical_indexing()
 
         # Set up directories
         self.data_dir = Path("data")
@@ -442,15 +529,19 @@ class LandmarkPipeline:
         """
         items_with_embeddings = []
 
-        for landmark_id, chunks, landmark_data in tqdm(
-            chunked_items, desc="Generating embeddings"
+        # Submit every landmark first so the batcher can fill whole requests
+        futures = [
+            self.embedding_batcher.submit([chunk["text"] for chunk in chunks])
+            for _, chunks, _ in chunked_items
+        ]
+
+        for (landmark_id, chunks, landmark_data), future in tqdm(
+            zip(chunked_items, futures),
+            total=len(chunked_items),
+            desc="Generating embeddings",
         ):
             try:
-                # Prepare texts for embedding
-                texts = [chunk["text"] for chunk in chunks]
-
-                # Generate embeddings in batch
-                embeddings = self.embedding_generator.generate_embeddings_batch(texts)
+                embeddings = future.result()
 
                 # Add embeddings to chunks
                 chunks_with_embeddings = chunks.copy()
@@ -489,6 +580,7 @@ class LandmarkPipeline:
         """
         result = self._initialize_result(landmark)
         start_time = time.time()
+        stage = "download"
 
         try:
             # Step 1: Download PDF
@@ -500,18 +592,32 @@ class LandmarkPipeline:
             filepath = self._download_pdf(landmark, landmark_id, result)
 
             # Step 2: Extract and save text
+            stage = "extract"
             text = self._extract_and_save_text(filepath, landmark_id, result)
+            metadata = self._enhanced_metadata(landmark_id, result)
 
-            # Step 3: Chunk text
-            enriched_chunks = self._chunk_text(text, landmark_id, result)
-
-            # Step 4: Generate embeddings
-            chunks_with_embeddings = self._generate_embeddings(
-                enriched_chunks, landmark_id, result
-            )
+            if self._already_indexed(landmark_id, result):
+                logger.info(f"Vectors of landmark {landmark_id} are up to date")
+                result["stats"]["resumed"] = True
+            else:
+                # Step 3: Chunk text
+                stage = "chunk"
+                enriched_chunks = self._chunk_text(text, landmark_id, result)
+
+                # Step 4: Generate embeddings, unless only the metadata changed
+                stage = "embed"
+                if self._reuse_stored_embeddings(enriched_chunks, landmark_id, result):
+                    chunks_with_embeddings = enriched_chunks
+                else:
+                    chunks_with_embeddings = self._generate_embeddings(
+                        enriched_chunks, landmark_id, result
+                    )
 
-            # Step 5: Store vectors
-            self._store_vectors(chunks_with_embeddings, landmark_id, result)
+                # Step 5: Store vectors
+                stage = "store"
+                self._store_vectors(
+                    chunks_with_embeddings, landmark_id, result, metadata
+                )
 
             # Set success status
             result["status"] = "success"
@@ -520,6 +626,9 @@ class LandmarkPipeline:
             error_msg = f"Error processing landmark {result['landmark_id']}: {str(e)}"
             result["errors"].append(error_msg)
             logger.error(error_msg)
+            self._record_stage(
+                result["landmark_id"], stage, status=StageStatus.FAILED, error=str(e)
+            )
 
         # Calculate processing time
         result["stats"]["processing_time"] = time.time() - start_time
@@ -547,6 +656,7 @@ class LandmarkPipeline:
             "landmark_id": landmark_id,
             "status": "failed",
             "errors": [],
+            "hashes": {},  # Stage input/output hashes for the run manifest
             "stats": {
                 "pdf_downloaded": False,
                 "text_extracted": False,
@@ -592,6 +702,13 @@ class LandmarkPipeline:
         filename = f"{landmark_id.replace('/', '_')}.pdf"
         filepath = self.pdfs_dir / filename
 
+        version = None
+        if self.incremental and filepath.exists():
+            version = self._remote_pdf_version(pdf_url)
+            if not self._local_pdf_current(landmark_id, filepath, version):
+                logger.info(f"PDF of {landmark_id} may have changed, downloading it")
+                filepath.unlink()
+
         if not filepath.exists():
             logger.info(f"Downloading PDF for {landmark_id} from {pdf_url}")
             response = requests.get(pdf_url, stream=True, timeout=30)
@@ -600,10 +717,46 @@ class LandmarkPipeline:
             with open(filepath, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+            version = _pdf_version(response.headers)
 
         result["stats"]["pdf_downloaded"] = True
+        if self.manifest is not None:
+            result["hashes"]["pdf"] = sha256_file(filepath)
+            details: Dict[str, Any] = {"bytes": filepath.stat().st_size}
+            if version:
+                details["version"] = version
+            self._record_stage(
+                landmark_id,
+                "download",
+                fingerprint(pdf_url),
+                result["hashes"]["pdf"],
+                details=details,
+            )
         return filepath
 
+    def _remote_pdf_version(self, pdf_url: str) -> Optional[str]:
+        """Version of a remote PDF from a HEAD request, if the server reports one."""
+        try:
+            response = requests.head(pdf_url, allow_redirects=True, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Could not check PDF version at {pdf_url}: {e}")
+            return None
+        return _pdf_version(response.headers)
+
+    def _local_pdf_current(
+        self, landmark_id: str, filepath: Path, version: Optional[str]
+    ) -> bool:
+        """Whether the local PDF is the recorded download of the remote version."""
+        if not version or self.manifest is None:
+            return False
+        record = self.manifest.get(landmark_id, "download")
+        if record is None or record.status != StageStatus.DONE:
+            return False
+        return (record.details or {}).get(
+            "version"
+        ) == version and record.output_hash == sha256_file(filepath)
+
     def _extract_and_save_text(
         self, filepath: Path, landmark_id: str, result: Dict[str, Any]
     ) -> str:
@@ -620,21 +773,31 @@ class LandmarkPipeline:
         Raises:
             ValueError: If no text was extracted
         """
-        logger.info(f"Extracting text from PDF for landmark {landmark_id}")
-        with open(filepath, "rb") as f:
-            pdf_bytes = f.read()
-            text = self.pdf_extractor.extract_text_from_bytes(pdf_bytes)
-
-        if not text:
-            raise ValueError(f"No text extracted from PDF for landmark {landmark_id}")
+        text_filepath = self.text_dir / (filepath.stem + ".txt")
+        pdf_hash = result["hashes"].get("pdf")
+        resumed_text = self._resumed_text(landmark_id, pdf_hash, text_filepath)
+        if resumed_text is not None:
+            logger.info(f"Reusing text extracted earlier for landmark {landmark_id}")
+            text = resumed_text
+        else:
+            logger.info(f"Extracting text from PDF for landmark {landmark_id}")
+            with open(filepath, "rb") as f:
+                pdf_bytes = f.read()
+                extracted_text = self.pdf_extractor.extract_text_from_bytes(pdf_bytes)
+
+            if not extracted_text:
+                raise ValueError(
+                    f"No text extracted from PDF for landmark {landmark_id}"
+                )
+            text = extracted_text
 
-        # Save text to file
-        text_filename = filepath.stem + ".txt"
-        text_filepath = self.text_dir / text_filename
-        with open(text_filepath, "w", encoding="utf-8") as f:
-            f.write(text)
+            # Save text to file
+            with open(text_filepath, "w", encoding="utf-8") as f:
+                f.write(text)
 
         result["stats"]["text_extracted"] = True
+        result["hashes"]["text"] = sha256_text(text)
+        self._record_stage(landmark_id, "extract", pdf_hash, result["hashes"]["text"])
         return text
 
     def _chunk_text(
@@ -652,24 +815,10 @@ class LandmarkPipeline:
         """
         logger.info(f"Chunking text for landmark {landmark_id}")
         chunks = self.text_chunker.chunk_text_by_tokens(text)
-        enriched_chunks = []
-
-        for i, chunk in enumerate(chunks):
-            chunk_dict = {
-                "text": chunk,
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "metadata": {
-                    "landmark_id": landmark_id,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "source_type": "pdf",
-                    "processing_date": time.strftime("%Y-%m-%d"),
-                },
-            }
-            enriched_chunks.append(chunk_dict)
+        enriched_chunks = build_chunk_dicts(chunks, landmark_id)
 
         result["stats"]["chunks_created"] = len(chunks)
+        self._record_index_stage(landmark_id, "chunk", result, fingerprint(chunks))
         return enriched_chunks
 
     def _generate_embeddings(
@@ -690,13 +839,14 @@ class LandmarkPipeline:
         """
         logger.info(f"Generating embeddings for landmark {landmark_id}")
         texts = [chunk["text"] for chunk in enriched_chunks]
-        embeddings = self.embedding_generator.generate_embeddings_batch(texts)
+        embeddings = self.embedding_batcher.embed(texts)
 
         chunks_with_embeddings = enriched_chunks.copy()
         for i, embedding in enumerate(embeddings):
             chunks_with_embeddings[i]["embedding"] = embedding
 
         result["stats"]["embeddings_generated"] = len(embeddings)
+        self._record_index_stage(landmark_id, "embed", result)
         return chunks_with_embeddings
 
     def _store_vectors(
@@ -704,6 +854,7 @@ class LandmarkPipeline:
         chunks_with_embeddings: List[Dict[str, Any]],
         landmark_id: str,
         result: Dict[str, Any],
+        enhanced_metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Store vectors in Pinecone.
 
@@ -711,6 +862,7 @@ class LandmarkPipeline:
             chunks_with_embeddings: List of chunks with embeddings
             landmark_id: ID of the landmark
             result: Result dictionary to update
+            enhanced_metadata: Metadata collected earlier (fetched if not given)
         """
         logger.info(f"Storing vectors for landmark {landmark_id} using fixed IDs")
         vector_ids = self.pinecone_db.store_chunks(
@@ -719,9 +871,331 @@ class LandmarkPipeline:
             landmark_id=landmark_id,
             use_fixed_ids=True,  # Explicitly use fixed IDs to prevent duplication
             delete_existing=True,  # Delete any existing vectors for this landmark
+            enhanced_metadata=enhanced_metadata,
         )
 
         result["stats"]["vectors_stored"] = len(vector_ids)
+        metadata_hash = result["hashes"].get("metadata")
+        details: Dict[str, Any] = {"vectors": len(vector_ids)}
+        if metadata_hash:
+            details["metadata"] = metadata_hash
+        self._record_index_stage(landmark_id, "store", result, details=details)
+
+    def _record_stage(
+        self,
+        landmark_id: str,
+        stage: str,
+        input_hash: Optional[str] = None,
+        output_hash: Optional[str] = None,
+        status: StageStatus = StageStatus.DONE,
+        error: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a stage outcome in the run manifest, if there is one."""
+        if self.manifest is not None and landmark_id:
+            self.manifest.record(
+                landmark_id,
+                stage,
+                input_hash,
+                output_hash,
+                status=status,
+                error=error,
+                details=details or None,
+            )
+
+    def _index_fingerprints(self, text_hash: str) -> Dict[str, str]:
+        """Input fingerprints of the chunk, embed and store stages.
+
+        Each fingerprint covers the previous one, so changing the text, the
+        chunking parameters, the embedding model or the target index makes
+        every later stage run again.
+
+        Args:
+            text_hash: Hash of the extracted text
+
+        Returns:
+            Mapping of stage name to input fingerprint
+        """
+        chunk = fingerprint(
+            text_hash, self.text_chunker.chunk_size, self.text_chunker.chunk_overlap
+        )
+        embed = fingerprint(chunk, self.embedding_generator.model)
+        store = fingerprint(
+            embed, self.pinecone_db.index_name, self.pinecone_db.namespace
+        )
+        return {"chunk": chunk, "embed": embed, "store": store}
+
+    def _record_index_stage(
+        self,
+        landmark_id: str,
+        stage: str,
+        result: Dict[str, Any],
+        output_hash: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a chunk, embed or store stage keyed by the text hash."""
+        text_hash = result["hashes"].get("text")
+        if self.manifest is not None and text_hash:
+            self._record_stage(
+                landmark_id,
+                stage,
+                self._index_fingerprints(text_hash)[stage],
+                output_hash,
+                details=details,
+            )
+
+    def _resumed_text(
+        self, landmark_id: str, pdf_hash: Optional[str], text_path: Path
+    ) -> Optional[str]:
+        """Text extracted by an earlier run from the same PDF, if still intact."""
+        if not self.resume or self.manifest is None or not pdf_hash:
+            return None
+        record = self.manifest.completed(landmark_id, "extract", pdf_hash)
+        if record is None or not text_path.exists():
+            return None
+        text = text_path.read_text(encoding="utf-8")
+        return text if sha256_text(text) == record.output_hash else None
+
+    def _already_indexed(self, landmark_id: str, result: Dict[str, Any]) -> bool:
+        """Whether an earlier run stored the vectors of the same text and setup.
+
+        In incremental runs the stored vectors must also carry the current
+        enhanced metadata.
+        """
+        text_hash = result["hashes"].get("text")
+        if not self.resume or self.manifest is None or not text_hash:
+            return False
+        store_hash = self._index_fingerprints(text_hash)["store"]
+        record = self.manifest.completed(landmark_id, "store", store_hash)
+        if record is None:
+            return False
+        metadata_hash = result["hashes"].get("metadata")
+        return metadata_hash is None or (
+            (record.details or {}).get("metadata") == metadata_hash
+        )
+
+    def _enhanced_metadata(
+        self, landmark_id: str, result: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Collect and hash the enhanced metadata of a landmark (incremental runs).
+
+        Args:
+            landmark_id: ID of the landmark
+            result: Result dictionary to update
+
+        Returns:
+            Metadata dictionary to store with the vectors, or None to let the
+            vector database fetch it
+        """
+        if not self.incremental:
+            return None
+        try:
+            metadata = self.metadata_collector.collect_landmark_metadata(
+                landmark_id
+            ).model_dump()
+        except Exception as e:
+            logger.warning(
+                f"Could not collect enhanced metadata for {landmark_id}: {e}"
+            )
+            return None
+        result["hashes"]["metadata"] = metadata_fingerprint(metadata)
+        return metadata
+
+    def _reuse_stored_embeddings(
+        self,
+        enriched_chunks: List[Dict[str, Any]],
+        landmark_id: str,
+        result: Dict[str, Any],
+    ) -> bool:
+        """Attach the stored embeddings of unchanged text to its chunks.
+
+        Used by incremental runs when only the enhanced metadata of a
+        landmark changed: its vectors are fetched back by their fixed IDs
+        and upserted again with the new metadata.
+
+        Args:
+            enriched_chunks: Chunks of the current text
+            landmark_id: ID of the landmark
+            result: Result dictionary to update
+
+        Returns:
+            True if every chunk got its stored embedding
+        """
+        text_hash = result["hashes"].get("text")
+        if not self.incremental or self.manifest is None or not text_hash:
+            return False
+        store_hash = self._index_fingerprints(text_hash)["store"]
+        if self.manifest.completed(landmark_id, "store", store_hash) is None:
+            return False
+
+        ids = [f"{landmark_id}-chunk-{i}" for i in range(len(enriched_chunks))]
+        stored = self.pinecone_db.fetch_vectors(ids)
+        if not ids or any(not stored.get(i, {}).get("values") for i in ids):
+            return False
+        for chunk, vector_id in zip(enriched_chunks, ids):
+            chunk["embedding"] = list(stored[vector_id]["values"])
+        logger.info(f"Reusing stored embeddings of landmark {landmark_id}")
+        self._record_index_stage(landmark_id, "embed", result, details={"reused": True})
+        return True
+
+    def _new_job(self, landmark: Union[Dict[str, Any], Any]) -> LandmarkJob:
+        """Create the staged pipeline job of a landmark."""
+        result = self._initialize_result(landmark)
+        return LandmarkJob(
+            landmark_id=result["landmark_id"],
+            landmark=landmark,
+            result=result,
+            text_dir=self.text_dir,
+        )
+
+    def _download_stage(self, job: LandmarkJob) -> LandmarkJob:
+        """Download the PDF of a landmark (staged pipeline I/O stage)."""
+        if not job.landmark_id:
+            raise ValueError("Landmark missing ID")
+        job.pdf_path = self._download_pdf(job.landmark, job.landmark_id, job.result)
+        job.text = self._resumed_text(
+            job.landmark_id,
+            job.result["hashes"].get("pdf"),
+            self.text_dir / (job.pdf_path.stem + ".txt"),
+        )
+        job.metadata = self._enhanced_metadata(job.landmark_id, job.result)
+        return job
+
+    def _embed_stage(self, jobs: List[LandmarkJob]) -> List[LandmarkJob]:
+        """Embed the chunks of several landmarks with shared requests."""
+        for job in jobs:
+            # Extraction ran in another process, so its outcome is recorded here
+            self._record_stage(
+                job.landmark_id,
+                "extract",
+                job.result["hashes"].get("pdf"),
+                job.result["hashes"].get("text"),
+            )
+            self._record_index_stage(
+                job.landmark_id,
+                "chunk",
+                job.result,
+                fingerprint([chunk["text"] for chunk in job.chunks]),
+            )
+            job.resumed = self._already_indexed(job.landmark_id, job.result)
+
+        pending = [
+            job
+            for job in jobs
+            if not job.resumed
+            and not self._reuse_stored_embeddings(
+                job.chunks, job.landmark_id, job.result
+            )
+        ]
+        texts = [chunk["text"] for job in pending for chunk in job.chunks]
+        embeddings = self.embedding_batcher.embed(texts)
+
+        position = 0
+        for job in pending:
+            for chunk in job.chunks:
+                chunk["embedding"] = embeddings[position]
+                position += 1
+            job.result["stats"]["embeddings_generated"] = len(job.chunks)
+            self._record_index_stage(job.landmark_id, "embed", job.result)
+        logger.info(f"Generated {len(texts)} embeddings for {len(pending)} landmarks")
+        return jobs
+
+    def _store_stage(self, job: LandmarkJob) -> LandmarkJob:
+        """Store the vectors of a landmark (staged pipeline upsert stage)."""
+        if job.resumed:
+            logger.info(f"Vectors of landmark {job.landmark_id} are up to date")
+            job.result["stats"]["resumed"] = True
+        else:
+            self._store_vectors(job.chunks, job.landmark_id, job.result, job.metadata)
+        job.result["status"] = "success"
+        return job
+
+    def run_staged(
+        self,
+        landmarks: Iterable[Union[Dict[str, Any], Any]],
+        concurrency: Optional[StageConcurrency] = None,
+    ) -> Dict[str, Any]:
+        """Process landmarks with the staged producer/consumer pipeline.
+
+        Downloads, extraction and chunking, embedding and upserts run as
+        separate stages connected by bounded queues, so network and CPU work
+        of different landmarks overlap while memory use stays bounded.
+
+        Args:
+            landmarks: Landmark dictionaries or models to process
+            concurrency: Workers of each stage (default: StageConcurrency())
+
+        Returns:
+            Dict: Aggregated statistics in the run_parallel format
+        """
+        concurrency = concurrency or StageConcurrency()
+        self.embedding_batcher.batch_size = max(concurrency.embed_batch_size, 1)
+        pipeline = StagedPipeline(
+            [
+                Stage("download", self._download_stage, concurrency.download_workers),
+                Stage(
+                    "extract",
+                    functools.partial(
+                        extract_and_chunk,
+                        chunk_size=self.text_chunker.chunk_size,
+                        chunk_overlap=self.text_chunker.chunk_overlap,
+                    ),
+                    concurrency.extract_workers,
+                    kind=StageKind.PROCESS,
+                ),
+                Stage(
+                    "embed",
+                    self._embed_stage,
+                    concurrency.embed_workers,
+                    batch_size=concurrency.embed_batch_size,
+                    batch_weight=lambda job: len(job.chunks),
+                ),
+                Stage("store", self._store_stage, concurrency.upsert_workers),
+            ],
+            queue_size=concurrency.queue_size,
+        )
+
+        landmarks = list(landmarks)
+        with tqdm(total=len(landmarks), desc="Processing landmarks") as progress:
+            run = pipeline.run(
+                (self._new_job(landmark) for landmark in landmarks),
+                key=lambda job: job.landmark_id,
+                progress=progress.update,
+            )
+
+        results = [job.result for job in run.results]
+        for failure in run.failures:
+            error_msg = (
+                f"Error processing landmark {failure.key} "
+                f"({failure.stage} stage): {failure.error}"
+            )
+            failure.item.result["errors"].append(error_msg)
+            results.append(failure.item.result)
+            self._record_stage(
+                failure.key,
+                failure.stage,
+                status=StageStatus.FAILED,
+                error=failure.error,
+            )
+
+        return self._aggregate_results(results)
+
+    def run_sequential(
+        self, landmarks: Iterable[Union[Dict[str, Any], Any]]
+    ) -> Dict[str, Any]:
+        """Process landmarks one at a time through every stage.
+
+        Args:
+            landmarks: Landmark dictionaries or models to process
+
+        Returns:
+            Dict: Aggregated statistics in the run_parallel format
+        """
+        results = [
+            self.process_landmark_worker(landmark)
+            for landmark in tqdm(list(landmarks), desc="Processing landmarks")
+        ]
+        return self._aggregate_results(results)
 
     def store_in_vector_db(
         self,
@@ -781,6 +1255,7 @@ class LandmarkPipeline:
         workers: int = 4,
         recreate_index: bool = False,
         drop_index: bool = False,
+        concurrency: Optional[StageConcurrency] = None,
     ) -> Dict[str, Any]:
         """Run the pipeline with parallel processing.
 
@@ -789,9 +1264,10 @@ class LandmarkPipeline:
             end_page: The ending page number to fetch
             page_size: Number of landmarks per page
             download_limit: Maximum number of PDFs to download
-            workers: Number of parallel worker processes
+            workers: Number of concurrent downloads and upserts
             recreate_index: Whether to recreate the vector index
             drop_index: Whether to drop the vector index without recreating it
+            concurrency: Workers of each stage (overrides workers)
 
         Returns:
             Dict: Pipeline statistics
@@ -824,48 +1300,16 @@ class LandmarkPipeline:
         if not landmarks:
             return {"error": "No landmarks found"}
 
-        # Step 2: Process landmarks in parallel
-        # Use ThreadPoolExecutor instead of ProcessPoolExecutor to avoid pickle issues
-        # with network connections (SSL sockets) in the pipeline components
-        logger.info(f"Processing {len(landmarks)} landmarks with {workers} workers")
-
-        results: List[Dict[str, Any]] = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_landmark = {
-                executor.submit(self.process_landmark_worker, landmark): landmark
-                for landmark in landmarks
-            }
-
-            for future in tqdm(
-                concurrent.futures.as_completed(future_to_landmark),
-                total=len(future_to_landmark),
-                desc="Processing landmarks",
-            ):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    landmark = future_to_landmark[future]
-                    landmark_id = landmark.get("id", "") or landmark.get(
-                        "lpNumber", "unknown"
-                    )
-                    logger.error(
-                        f"Worker exception for landmark {landmark_id}: {str(e)}"
-                    )
-                    results.append(
-                        {
-                            "landmark_id": landmark_id,
-                            "status": "failed",
-                            "errors": [str(e)],
-                            "stats": {},
-                        }
-                    )
-
-        # Step 3: Aggregate statistics
-        stats = self._aggregate_results(results)
+        # Step 2: Process landmarks with the staged pipeline
+        logger.info(f"Processing {len(landmarks)} landmarks with the staged pipeline")
+        stats = self.run_staged(
+            landmarks,
+            concurrency
+            or StageConcurrency(download_workers=workers, upsert_workers=workers),
+        )
         stats["elapsed_time"] = f"{time.time() - start_time:.2f} seconds"
 
-        # Step 4: Save statistics
+        # Step 3: Save statistics
         stats_file = self.data_dir / "pipeline_stats.json"
         with open(stats_file, "w") as f:
             json.dump(stats, f, indent=2)
@@ -884,6 +1328,7 @@ class LandmarkPipeline:
         stats: Dict[str, Any] = {
             "landmarks_fetched": len(results),
             "landmarks_processed": 0,
+            "landmarks_resumed": 0,
             "pdfs_downloaded": 0,
             "pdfs_processed": 0,
             "chunks_created": 0,
@@ -898,6 +1343,8 @@ class LandmarkPipeline:
             if result["status"] == "success":
                 stats["landmarks_processed"] += 1
                 stats["successful_landmarks"].append(result["landmark_id"])
+                if result["stats"].get("resumed"):
+                    stats["landmarks_resumed"] += 1
 
                 if result["stats"].get("pdf_downloaded"):
                     stats["pdfs_downloaded"] += 1
@@ -914,6 +1361,7 @@ class LandmarkPipeline:
                 stats["failed_landmarks"].append(result["landmark_id"])
                 stats["errors"].extend(result["errors"])
 
+        stats["embedding_requests"] = self.embedding_batcher.stats.api_calls
         stats["pipeline_success"] = (
             len(stats["successful_landmarks"]) > 0 and len(stats["errors"]) == 0
         )
@@ -958,14 +1406,24 @@ class LandmarkPipeline:
         logger.info(f"STEP 1: Fetching landmarks from page {start_page} to {end_page}")
         landmarks = self.get_landmarks(start_page, end_page, page_size)
 
-        # Step 2: Download PDFs
-        logger.info("STEP 2: Downloading PDFs")
         # Apply limit here if needed for sequential mode
         if download_limit and download_limit > 0:
             logger.warning(
                 f"Applying download limit of {download_limit} in sequential mode."
             )
             landmarks = landmarks[:download_limit]
+
+        if self.manifest is not None:
+            # Per-landmark processing records each stage in the run manifest
+            logger.info("STEP 2: Processing landmarks")
+            stats = self.run_sequential(landmarks)
+            stats["elapsed_time"] = f"{time.time() - start_time:.2f} seconds"
+            with open(self.data_dir / "pipeline_stats.json", "w") as f:
+                json.dump(stats, f, indent=2)
+            return stats
+
+        # Step 2: Download PDFs
+        logger.info("STEP 2: Downloading PDFs")
         pdf_items = self.download_pdfs(landmarks, download_limit)
 
         # Step 3: Extract text
@@ -1039,6 +1497,59 @@ def parse_arguments() -> argparse.Namespace:
         default=4,
         help="Number of parallel workers (only used with --parallel)",
     )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        help="Concurrent PDF downloads (default: --workers)",
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=os.cpu_count() or 2,
+        help="Processes extracting and chunking PDF text (default: CPU count)",
+    )
+    parser.add_argument(
+        "--embed-workers",
+        type=int,
+        default=2,
+        help="Concurrent embedding requests (default: 2)",
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=settings.EMBEDDING_BATCH_SIZE,
+        help="Chunks per embedding request, across landmarks "
+        f"(default: {settings.EMBEDDING_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--upsert-workers",
+        type=int,
+        help="Concurrent vector upserts (default: --workers)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=16,
+        help="Landmarks waiting between two pipeline stages (default: 16)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=settings.PIPELINE_MANIFEST_PATH,
+        help="SQLite run manifest recording stage completion "
+        f"(default: {settings.PIPELINE_MANIFEST_PATH}; empty to disable)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages the run manifest shows completed for the same inputs",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-index landmarks whose PDF or enhanced metadata changed "
+        "since the last run (implies --resume)",
+    )
     parser.add_argument(
         "--delete-existing",
         action="store_true",
@@ -1100,6 +1611,43 @@ def parse_arguments() -> argparse.Namespace:
     return args
 
 
+def concurrency_from_args(args: argparse.Namespace) -> StageConcurrency:
+    """Build the staged pipeline concurrency from command line arguments.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Workers of each pipeline stage
+    """
+    return StageConcurrency(
+        download_workers=args.download_workers or args.workers,
+        extract_workers=args.extract_workers,
+        embed_workers=args.embed_workers,
+        embed_batch_size=args.embed_batch_size,
+        upsert_workers=args.upsert_workers or args.workers,
+        queue_size=args.queue_size,
+    )
+
+
+def open_manifest(args: argparse.Namespace) -> Optional[RunManifest]:
+    """Open the run manifest and record the start of this run.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        The run manifest, or None if disabled
+    """
+    if not args.manifest:
+        if args.resume or args.incremental:
+            logger.warning("No run manifest, so every landmark is processed in full")
+        return None
+    manifest = RunManifest(args.manifest)
+    manifest.start_run(" ".join(sys.argv))
+    return manifest
+
+
 def setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity level.
 
@@ -1113,51 +1661,30 @@ def setup_logging(verbose: bool) -> None:
 
 
 def process_landmarks_parallel(
-    pipeline: LandmarkPipeline, landmarks: List[Dict[str, Any]], workers: int
+    pipeline: LandmarkPipeline,
+    landmarks: List[Dict[str, Any]],
+    workers: int,
+    concurrency: Optional[StageConcurrency] = None,
 ) -> Dict[str, Any]:
-    """Process landmarks in parallel using ThreadPoolExecutor.
+    """Process landmarks in parallel with the staged pipeline.
 
     Args:
         pipeline: LandmarkPipeline instance
         landmarks: List of landmark dictionaries
-        workers: Number of parallel workers
+        workers: Number of concurrent downloads and upserts
+        concurrency: Workers of each stage (overrides workers)
 
     Returns:
         Aggregated processing statistics
     """
+    concurrency = concurrency or StageConcurrency(
+        download_workers=workers, upsert_workers=workers
+    )
     logger.info(
-        f"Processing {len(landmarks)} landmarks in parallel with {workers} workers"
+        f"Processing {len(landmarks)} landmarks with the staged pipeline: "
+        f"{concurrency}"
     )
-
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_landmark = {
-            executor.submit(pipeline.process_landmark_worker, landmark): landmark
-            for landmark in landmarks
-        }
-
-        for future in tqdm(
-            concurrent.futures.as_completed(future_to_landmark),
-            total=len(future_to_landmark),
-            desc="Processing landmarks",
-        ):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                landmark = future_to_landmark[future]
-                landmark_id = getattr(landmark, "lpNumber", "unknown")
-                logger.error(f"Worker exception for landmark {landmark_id}: {str(e)}")
-                results.append(
-                    {
-                        "landmark_id": landmark_id,
-                        "status": "failed",
-                        "errors": [str(e)],
-                        "stats": {},
-                    }
-                )
-
-    return pipeline._aggregate_results(results)
+    return pipeline.run_staged(landmarks, concurrency)
 
 
 def process_landmarks_sequential(
@@ -1174,6 +1701,10 @@ def process_landmarks_sequential(
     """
     logger.info(f"Processing {len(landmarks)} landmarks sequentially")
 
+    if pipeline.manifest is not None:
+        # Per-landmark processing records each stage in the run manifest
+        return pipeline.run_sequential(landmarks)
+
     # landmarks are already dictionaries, no need to convert
 
     # Download PDFs
@@ -1200,6 +1731,10 @@ def process_landmarks_from_ids(
     use_parallel: bool,
     workers: int,
     api_key: Optional[str] = None,
+    concurrency: Optional[StageConcurrency] = None,
+    manifest: Optional[RunManifest] = None,
+    resume: bool = False,
+    incremental: bool = False,
 ) -> Dict[str, Any]:
     """Process landmarks from a list of IDs.
 
@@ -1209,11 +1744,17 @@ def process_landmarks_from_ids(
         use_parallel: Whether to process landmarks in parallel
         workers: Number of parallel workers
         api_key: Optional API key
+        concurrency: Workers of each stage of the parallel pipeline
+        manifest: Run manifest recording stage completion
+        resume: Skip stages the manifest shows done for the same inputs
+        incremental: Only re-index landmarks whose PDF or metadata changed
 
     Returns:
         Results of processing each landmark
     """
-    pipeline = LandmarkPipeline(api_key)
+    pipeline = LandmarkPipeline(
+        api_key, manifest=manifest, resume=resume, incremental=incremental
+    )
 
     # Fetch landmarks from database using db_client directly
     db_client = get_db_client()
@@ -1251,7 +1792,7 @@ def process_landmarks_from_ids(
 
     # Process landmarks based on mode
     if use_parallel:
-        stats = process_landmarks_parallel(pipeline, landmarks, workers)
+        stats = process_landmarks_parallel(pipeline, landmarks, workers, concurrency)
     else:
         stats = process_landmarks_sequential(pipeline, landmarks)
 
@@ -1277,10 +1818,14 @@ def print_results(
     print("\n===== LANDMARKS PROCESSING RESULTS =====")
     print(f"Total landmarks processed: {landmarks_count}")
     print(f"Landmarks fetched: {stats.get('landmarks_fetched', 0)}")
+    if stats.get("landmarks_resumed"):
+        print(f"Landmarks already up to date: {stats['landmarks_resumed']}")
     print(f"PDFs downloaded: {stats.get('pdfs_downloaded', 0)}")
     print(f"PDFs processed: {stats.get('pdfs_processed', 0)}")
     print(f"Text chunks created: {stats.get('chunks_created', 0)}")
     print(f"Embeddings generated: {stats.get('embeddings_generated', 0)}")
+    if "embedding_requests" in stats:
+        print(f"Embedding API requests: {stats['embedding_requests']}")
     print(f"Vectors stored: {stats.get('vectors_stored', 0)}")
     print(f"Processing time: {stats.get('elapsed_time', 'N/A')}")
 
@@ -1317,7 +1862,10 @@ def run_legacy_mode(args: argparse.Namespace, api_key: Optional[str]) -> None:
     )
 
     # Initialize pipeline
-    pipeline = LandmarkPipeline(api_key)
+    manifest = open_manifest(args)
+    pipeline = LandmarkPipeline(
+        api_key, manifest=manifest, resume=args.resume, incremental=args.incremental
+    )
 
     try:
         # Validate page range
@@ -1337,6 +1885,7 @@ def run_legacy_mode(args: argparse.Namespace, api_key: Optional[str]) -> None:
                 workers=args.workers,
                 recreate_index=args.recreate_index,
                 drop_index=False,
+                concurrency=concurrency_from_args(args),
             )
         else:
             logger.info(
@@ -1351,6 +1900,9 @@ def run_legacy_mode(args: argparse.Namespace, api_key: Optional[str]) -> None:
                 drop_index=False,
             )
 
+        if manifest is not None:
+            manifest.finish_run(stats)
+
         # Handle errors
         if "error" in stats:
             print(f"\nError: {stats['error']}")
@@ -1410,6 +1962,7 @@ def run_unified_mode(args: argparse.Namespace, api_key: Optional[str]) -> None:
         sys.exit(1)
 
     # Process landmarks and time the execution
+    manifest = open_manifest(args)
     start_time = time.time()
     stats = process_landmarks_from_ids(
         landmarks_to_process,
@@ -1417,8 +1970,14 @@ def run_unified_mode(args: argparse.Namespace, api_key: Optional[str]) -> None:
         args.parallel,
         args.workers,
         api_key,
+        concurrency_from_args(args),
+        manifest=manifest,
+        resume=args.resume,
+        incremental=args.incremental,
     )
     elapsed_time = time.time() - start_time
+    if manifest is not None:
+        manifest.finish_run(stats)
 
     if "error" in stats:
         print(f"\nError: {stats['error']}")
@@ -15,6 +15,21 @@ Examples:
     python scripts/ci/process_wikipedia_articles.py --all --delete-existing --verbose
     python scripts/ci/process_wikipedia_articles.py --all --verbose --parallel
     python scripts/ci/process_wikipedia_articles.py --all --verbose --parallel --workers 8
+    python scripts/ci/process_wikipedia_articles.py --all --parallel --incremental
+
+Article content and revision IDs are fetched in bulk through the MediaWiki
+Action API before processing starts (--no-prefetch fetches them landmark by
+landmark); HTML scraping is only a fallback.
+
+The revision ID and content hash of every article stored, together with a hash
+of the landmark's enhanced metadata, are recorded in the run manifest
+(--manifest). With --incremental, landmarks whose articles and metadata are
+unchanged skip quality scoring, chunking, embedding and upserts.
+
+Before any content is fetched, the current revision of every article is
+looked up in bulk and compared with the revision stored with its vectors;
+unchanged articles are not fetched, scored, embedded or upserted again
+(--no-revision-check or --delete-existing process every article).
 """
 
 import argparse
@@ -23,14 +38,19 @@ import logging
 import sys
 import threading
 import time
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from tqdm import tqdm
 
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.embeddings.batcher import get_embedding_batcher
 from nyc_landmarks.landmarks.landmarks_processing import get_landmarks_to_process
+from nyc_landmarks.pipeline.manifest import RunManifest
 from nyc_landmarks.utils.logger import get_logger
 from nyc_landmarks.utils.results_reporter import print_results
 from nyc_landmarks.wikipedia import WikipediaProcessor
+from nyc_landmarks.wikipedia.bulk_fetcher import get_wikipedia_bulk_fetcher
+from nyc_landmarks.wikipedia.quality_fetcher import get_wikipedia_quality_fetcher
 
 # Configure logging
 logger = get_logger(__name__)
@@ -39,9 +59,19 @@ logger = get_logger(__name__)
 _thread_local = threading.local()
 
 
-def _get_processor() -> WikipediaProcessor:
+def _get_processor(
+    manifest: Optional[RunManifest] = None,
+    incremental: bool = False,
+    revision_check: bool = False,
+) -> WikipediaProcessor:
     """Return a thread-local ``WikipediaProcessor`` instance.
 
+    The manifest, incremental and revision check flags only apply to the thread's first call,
+    which creates its processor. All processors share one embedding batcher,
+    so chunks of landmarks processed by different threads are embedded in
+    the same requests, one Wikipedia bulk fetcher holding the prefetched
+    articles and one quality fetcher with its cache of quality scores.
+
     Example
     -------
     Use within a worker function to share a single processor per thread::
@@ -53,7 +83,14 @@ def _get_processor() -> WikipediaProcessor:
 
     processor = getattr(_thread_local, "processor", None)
     if processor is None:
-        processor = WikipediaProcessor()
+        processor = WikipediaProcessor(
+            manifest=manifest,
+            incremental=incremental,
+            skip_unchanged_revisions=revision_check,
+            embedding_batcher=get_embedding_batcher(),
+            bulk_fetcher=get_wikipedia_bulk_fetcher(),
+            quality_fetcher=get_wikipedia_quality_fetcher(),
+        )
         _thread_local.processor = processor
     return processor
 
@@ -61,6 +98,9 @@ def _get_processor() -> WikipediaProcessor:
 def process_landmarks_sequential(
     landmarks: List[str],
     delete_existing: bool,
+    manifest: Optional[RunManifest] = None,
+    incremental: bool = False,
+    revision_check: bool = False,
 ) -> Dict[str, Any]:
     """
     Process Wikipedia articles for multiple landmarks sequentially.
@@ -68,11 +108,14 @@ def process_landmarks_sequential(
     Args:
         landmarks: List of landmark IDs to process
         delete_existing: Whether to delete existing vectors for landmarks
+        manifest: Run manifest recording the sources of stored vectors
+        incremental: Skip landmarks whose articles and metadata are unchanged
+        revision_check: Skip articles whose stored revision is current
 
     Returns:
         Dictionary mapping landmark IDs to processing results
     """
-    processor = _get_processor()
+    processor = _get_processor(manifest, incremental, revision_check)
     results: Dict[str, Any] = {}
     errors: List[str] = []
     skipped_landmarks: Set[str] = set()
@@ -88,11 +131,20 @@ def process_landmarks_sequential(
                 "success": success,
                 "articles_processed": articles_processed,
                 "chunks_embedded": chunks_embedded,
+                "unchanged": (incremental or revision_check)
+                and landmark_id in processor.unchanged_landmarks,
+                "articles_unchanged": (
+                    processor.unchanged_articles.get(landmark_id, 0)
+                    if revision_check
+                    else 0
+                ),
             }
 
             # Track landmarks that failed processing (not just those with no articles)
             # Note: landmarks with no Wikipedia articles now return success=True
-            if not success:
+            if results[landmark_id]["unchanged"]:
+                logger.info(f"Wikipedia vectors of {landmark_id} are up to date")
+            elif not success:
                 # This is a real processing failure, not just "no articles found"
                 logger.warning(
                     f"Failed to process Wikipedia for landmark {landmark_id}"
@@ -126,6 +178,9 @@ def process_landmarks_parallel(
     landmarks: List[str],
     delete_existing: bool,
     workers: int,
+    manifest: Optional[RunManifest] = None,
+    incremental: bool = False,
+    revision_check: bool = False,
 ) -> Dict[str, Any]:
     """
     Process Wikipedia articles for multiple landmarks in parallel.
@@ -134,6 +189,9 @@ def process_landmarks_parallel(
         landmarks: List of landmark IDs to process
         delete_existing: Whether to delete existing vectors for landmarks
         workers: Number of parallel workers
+        manifest: Run manifest recording the sources of stored vectors
+        incremental: Skip landmarks whose articles and metadata are unchanged
+        revision_check: Skip articles whose stored revision is current
 
     Returns:
         Dictionary mapping landmark IDs to processing results
@@ -146,15 +204,29 @@ def process_landmarks_parallel(
     errors: List[str] = []
     skipped_landmarks: Set[str] = set()
 
-    def process_single_landmark(landmark_id: str) -> Tuple[bool, int, int]:
+    def process_single_landmark(
+        landmark_id: str,
+    ) -> Tuple[bool, int, int, bool, int]:
         """Process a single landmark and return the processing results."""
-        processor = _get_processor()
+        processor = _get_processor(manifest, incremental, revision_check)
         success, articles_processed, chunks_embedded = (
             processor.process_landmark_wikipedia(
                 landmark_id, delete_existing=delete_existing
             )
         )
-        return success, articles_processed, chunks_embedded
+        unchanged = (
+            incremental or revision_check
+        ) and landmark_id in processor.unchanged_landmarks
+        articles_unchanged = (
+            processor.unchanged_articles.get(landmark_id, 0) if revision_check else 0
+        )
+        return (
+            success,
+            articles_processed,
+            chunks_embedded,
+            unchanged,
+            articles_unchanged,
+        )
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
         # Submit all tasks
@@ -171,16 +243,24 @@ def process_landmarks_parallel(
         ):
             landmark_id = future_to_landmark[future]
             try:
-                success, articles_processed, chunks_embedded = future.result()
+                (
+                    success,
+                    articles_processed,
+                    chunks_embedded,
+                    unchanged,
+                    articles_unchanged,
+                ) = future.result()
                 results[landmark_id] = {
                     "success": success,
                     "articles_processed": articles_processed,
                     "chunks_embedded": chunks_embedded,
+                    "unchanged": unchanged,
+                    "articles_unchanged": articles_unchanged,
                 }
 
                 # Track landmarks that had no articles processed
                 # regardless of whether processing succeeded or failed
-                if articles_processed == 0:
+                if articles_processed == 0 and not unchanged:
                     skipped_landmarks.add(landmark_id)
 
             except Exception as e:
@@ -227,6 +307,29 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Delete existing Wikipedia vectors before processing",
     )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=settings.PIPELINE_MANIFEST_PATH,
+        help="SQLite run manifest recording the sources of stored vectors "
+        f"(default: {settings.PIPELINE_MANIFEST_PATH}; empty to disable)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip landmarks whose Wikipedia articles and enhanced metadata are "
+        "unchanged since they were last stored",
+    )
+    parser.add_argument(
+        "--no-revision-check",
+        action="store_true",
+        help="Process articles even if their stored revision is current",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="Fetch articles landmark by landmark instead of in bulk up front",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -279,16 +382,32 @@ def process_landmarks(
     delete_existing: bool,
     use_parallel: bool,
     workers: int,
+    manifest: Optional[RunManifest] = None,
+    incremental: bool = False,
+    prefetch: bool = True,
+    revision_check: bool = False,
 ) -> Dict[str, Any]:
     """Process the landmarks based on configuration."""
+    if prefetch and landmarks:
+        # Fetch every landmark's articles with shared MediaWiki API requests
+        # before processing, instead of one page download per article
+        prefetched = _get_processor(
+            manifest, incremental, revision_check
+        ).prefetch_wikipedia_articles(landmarks, workers)
+        logger.info(f"Prefetched {prefetched} Wikipedia articles")
+
     if use_parallel:
         logger.info(
             f"Processing {len(landmarks)} landmarks in parallel with {workers} workers"
         )
-        return process_landmarks_parallel(landmarks, delete_existing, workers)
+        return process_landmarks_parallel(
+            landmarks, delete_existing, workers, manifest, incremental, revision_check
+        )
     else:
         logger.info(f"Processing {len(landmarks)} landmarks sequentially")
-        return process_landmarks_sequential(landmarks, delete_existing)
+        return process_landmarks_sequential(
+            landmarks, delete_existing, manifest, incremental, revision_check
+        )
 
 
 def main() -> None:
@@ -305,6 +424,13 @@ def main() -> None:
         logger.error("No landmarks to process")
         sys.exit(1)
 
+    manifest = None
+    if args.manifest:
+        manifest = RunManifest(args.manifest)
+        manifest.start_run(" ".join(sys.argv))
+    elif args.incremental:
+        logger.warning("No run manifest, so every landmark is processed in full")
+
     # Process landmarks and time the execution
     start_time = time.time()
     results = process_landmarks(
@@ -312,6 +438,10 @@ def main() -> None:
         args.delete_existing,
         args.parallel,
         args.workers,
+        manifest,
+        args.incremental,
+        not args.no_prefetch,
+        not (args.no_revision_check or args.delete_existing),
     )
     elapsed_time = time.time() - start_time
 
@@ -319,6 +449,21 @@ def main() -> None:
     metadata = results.pop("__metadata__", {})
     errors = metadata.get("errors", [])
     skipped_landmarks = metadata.get("skipped_landmarks", set())
+    if manifest is not None:
+        manifest.finish_run(
+            {
+                "landmarks": len(results),
+                "unchanged": sum(1 for r in results.values() if r.get("unchanged")),
+                "articles_unchanged": sum(
+                    r.get("articles_unchanged", 0) for r in results.values()
+                ),
+                "failed_landmarks": [
+                    landmark_id
+                    for landmark_id, result in results.items()
+                    if not result["success"]
+                ],
+            }
+        )
 
     # Print results and exit with appropriate code
     exit_code = print_results(
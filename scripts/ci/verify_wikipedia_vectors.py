@@ -5,7 +5,7 @@ Script to verify metadata for a batch of Wikipedia vectors.
 This script checks multiple Wikipedia vectors to ensure they have the required metadata fields.
 """
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from nyc_landmarks.utils.logger import get_logger
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
@@ -14,24 +14,21 @@ from scripts.vector_utility import validate_vector_metadata
 logger = get_logger(__name__)
 
 
-def _validate_single_vector(pinecone_db: PineconeDB, vector_id: str) -> bool:
+def _validate_single_vector(
+    vector_id: str, vector_data: Optional[Dict[str, Any]]
+) -> bool:
     """
     Validate a single vector.
 
     Args:
-        pinecone_db: The PineconeDB client
         vector_id: The vector ID to validate
+        vector_data: The fetched vector data, or None if it was not found
 
     Returns:
         True if valid, False otherwise
     """
     print(f"\nChecking vector: {vector_id}")
     try:
-        # Fetch vector data using PineconeDB
-        # Use "__default__" namespace
-        namespace_to_use = "__default__"
-        vector_data = pinecone_db.fetch_vector_by_id(vector_id, namespace_to_use)
-
         if not vector_data:
             print(f"✗ {vector_id} not found in database")
             return False
@@ -93,10 +90,17 @@ def verify_batch_vectors(vector_ids: List[str]) -> Dict[str, bool]:
     print(f"Verifying {len(vector_ids)} vectors...")
     print("=" * 50)
 
+    # Fetch all vectors with batched requests, starting in "__default__"
+    try:
+        vectors = pinecone_db.fetch_vectors(vector_ids, "__default__")
+    except Exception as e:
+        logger.error(f"Failed to fetch vectors: {e}")
+        return dict.fromkeys(vector_ids, False)
+
     # Validate each vector
     results = {}
     for vector_id in vector_ids:
-        results[vector_id] = _validate_single_vector(pinecone_db, vector_id)
+        results[vector_id] = _validate_single_vector(vector_id, vectors.get(vector_id))
 
     # Print summary
     _print_summary(results, vector_ids)
@@ -102,7 +102,7 @@ import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import requests
 
@@ -166,6 +166,8 @@ class LandmarkReportProcessor:
         """
         self.db_client = get_db_client()
         self.verbose = verbose
+        # Landmark IDs with PDF vectors, listed on first use
+        self._pdf_indexed_landmarks: Optional[Set[str]] = None
 
         if self.verbose:
             logger.info("Initialized LandmarkReportProcessor with DbClient")
@@ -795,6 +797,28 @@ class LandmarkReportProcessor:
 
         return reports
 
+    def get_pdf_indexed_landmarks(self) -> Set[str]:
+        """Get the IDs of landmarks whose PDF is indexed in the vector database.
+
+        The index's vector IDs are enumerated once and the result is reused
+        for every landmark checked by this processor.
+
+        Returns:
+            Set of landmark IDs with PDF vectors
+
+        Raises:
+            Exception: If the vector index can't be listed
+        """
+        if self._pdf_indexed_landmarks is None:
+            from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+
+            indexed = PineconeDB().get_indexed_landmarks()
+            self._pdf_indexed_landmarks = indexed.get("pdf", set())
+            logger.info(
+                f"Found {len(self._pdf_indexed_landmarks)} landmarks with PDFs in vector index"
+            )
+        return self._pdf_indexed_landmarks
+
     def check_pdf_in_index(self, landmark_id: str) -> bool:
         """Check if a landmark's PDF is indexed in the vector database.
 
@@ -805,21 +829,7 @@ class LandmarkReportProcessor:
             True if the PDF is found in the vector index, False otherwise
         """
         try:
-            from nyc_landmarks.vectordb.pinecone_db import PineconeDB
-
-            # Initialize Pinecone database connection
-            pinecone_db = PineconeDB()
-
-            # Query for vectors with this landmark_id and source_type "pdf"
-            vectors = pinecone_db.list_vectors(
-                limit=1,  # We only need to know if at least one exists
-                landmark_id=landmark_id,
-                source_type="pdf",
-            )
-
-            # Return True if any vectors are found
-            return len(vectors) > 0
-
+            return landmark_id in self.get_pdf_indexed_landmarks()
         except Exception as e:
             logger.warning(f"Error checking PDF index for landmark {landmark_id}: {e}")
             return False
@@ -842,49 +852,35 @@ class LandmarkReportProcessor:
         logger.info("Checking PDF index status for landmark reports...")
 
         total = len(reports)
-        futures = {}
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(32, os.cpu_count() or 1)
-        ) as executor:
-            for i, report in enumerate(reports):
-                landmark_id = report.get("lpNumber") or report.get("lpcId")
-
-                if not landmark_id:
-                    logger.warning(
-                        f"No landmark ID found for report {i + 1}, skipping PDF index check"
-                    )
-                    report["in_pdf_index"] = "No"
-                    metrics.pdf_index_check_failures += 1
-                    continue
+        for i, report in enumerate(reports):
+            landmark_id = report.get("lpNumber") or report.get("lpcId")
 
-                futures[executor.submit(self.check_pdf_in_index, landmark_id)] = (
-                    i,
-                    report,
-                    landmark_id,
+            if not landmark_id:
+                logger.warning(
+                    f"No landmark ID found for report {i + 1}, skipping PDF index check"
                 )
+                report["in_pdf_index"] = "No"
+                metrics.pdf_index_check_failures += 1
+                continue
 
-            for future in concurrent.futures.as_completed(futures):
-                i, report, landmark_id = futures[future]
-                try:
-                    is_in_index = future.result()
-                    report["in_pdf_index"] = "Yes" if is_in_index else "No"
-
-                    if is_in_index:
-                        metrics.landmarks_in_pdf_index += 1
+            try:
+                is_in_index = self.check_pdf_in_index(landmark_id)
+                report["in_pdf_index"] = "Yes" if is_in_index else "No"
 
-                    if self.verbose and is_in_index:
-                        logger.info(
-                            f"Landmark {landmark_id} PDF found in vector index ({i + 1}/{total})"
-                        )
+                if is_in_index:
+                    metrics.landmarks_in_pdf_index += 1
 
-                except Exception as e:
-                    error_msg = (
-                        f"Error checking PDF index for landmark {landmark_id}: {e}"
+                if self.verbose and is_in_index:
+                    logger.info(
+                        f"Landmark {landmark_id} PDF found in vector index ({i + 1}/{total})"
                     )
-                    logger.error(error_msg)
-                    metrics.errors_encountered.append(error_msg)
-                    report["in_pdf_index"] = "No"
-                    metrics.pdf_index_check_failures += 1
+
+            except Exception as e:
+                error_msg = f"Error checking PDF index for landmark {landmark_id}: {e}"
+                logger.error(error_msg)
+                metrics.errors_encountered.append(error_msg)
+                report["in_pdf_index"] = "No"
+                metrics.pdf_index_check_failures += 1
 
         # Log summary
         logger.info(f"Completed PDF index checking for {len(reports)} landmarks")
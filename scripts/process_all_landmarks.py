@@ -177,16 +177,50 @@ def check_processing_status(
     """
     Check which landmarks already have vectors in Pinecone.
 
+    Uses one enumeration of the index's vector IDs, and falls back to
+    querying each landmark if the index doesn't support ID listing.
+
     Args:
         pinecone_db: PineconeDB instance
         landmark_ids: Set of landmark IDs to check
-        batch_size: Number of landmarks to check in parallel batches
+        batch_size: Number of landmarks per batch when querying each landmark
 
     Returns:
         Tuple containing:
             processed_landmarks: Set of landmark IDs that have vectors
             unprocessed_landmarks: Set of landmark IDs that don't have vectors
     """
+    logger.info(f"Checking processing status for {len(landmark_ids)} landmarks")
+    try:
+        indexed = pinecone_db.get_indexed_landmarks()
+    except Exception as e:
+        logger.warning(f"Could not list vector IDs, querying each landmark: {e}")
+        return _check_processing_status_by_query(pinecone_db, landmark_ids, batch_size)
+
+    all_indexed = set().union(*indexed.values())
+    processed_landmarks = landmark_ids & all_indexed
+    unprocessed_landmarks = landmark_ids - all_indexed
+
+    logger.info(
+        f"Found {len(processed_landmarks)} processed landmarks and {len(unprocessed_landmarks)} unprocessed landmarks"
+    )
+    return processed_landmarks, unprocessed_landmarks
+
+
+def _check_processing_status_by_query(
+    pinecone_db: PineconeDB, landmark_ids: Set[str], batch_size: int = 10
+) -> Tuple[Set[str], Set[str]]:
+    """
+    Check which landmarks have vectors with one filtered query per landmark.
+
+    Args:
+        pinecone_db: PineconeDB instance
+        landmark_ids: Set of landmark IDs to check
+        batch_size: Number of landmarks to check in parallel batches
+
+    Returns:
+        Tuple of processed and unprocessed landmark IDs
+    """
     # Generate a random query vector for searching
     random_vector = np.random.rand(pinecone_db.dimensions).tolist()
 
@@ -196,8 +230,6 @@ def check_processing_status(
     # Convert set to list for iteration with tqdm
     landmark_ids_list = list(landmark_ids)
 
-    logger.info(f"Checking processing status for {len(landmark_ids)} landmarks")
-
     with tqdm(total=len(landmark_ids_list), desc="Checking processing status") as pbar:
         for i in range(0, len(landmark_ids_list), batch_size):
             # Get the current batch
@@ -15,6 +15,9 @@ Commands:
     verify-vectors  - Verify the integrity of vectors in Pinecone
     verify-batch    - Verify a batch of specific vectors by their IDs
     verify           - Verify the integrity of vectors
+    export          - Export the whole index to a snapshot directory
+    import          - Import a snapshot directory into the index
+    index-lexical   - Rebuild the local BM25 index for hybrid search
 
 Example usage:
     # Fetch a specific vector by ID (will search across all available namespaces):
@@ -41,14 +44,33 @@ Example usage:
 
     # Verify a batch of specific vectors:
     python scripts/vector_utility.py verify-batch wiki-Wyckoff_House-LP-00001-chunk-0 wiki-Wyckoff_House-LP-00001-chunk-1
+
+    # Export every namespace of the index to a snapshot (.npy vectors + Parquet metadata):
+    python scripts/vector_utility.py export backups/nyc-landmarks --workers 8
+
+    # Import a snapshot into another index:
+    python scripts/vector_utility.py import backups/nyc-landmarks --index-name nyc-landmarks-v2
+
+    # Rebuild the local BM25 index from the chunk texts of a namespace:
+    python scripts/vector_utility.py index-lexical --namespace landmarks
 """
 
 import argparse
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
+from nyc_landmarks.config.settings import settings
 from nyc_landmarks.utils.logger import get_logger
+from nyc_landmarks.vectordb.lexical_index import LexicalIndex, build_lexical_index
+from nyc_landmarks.vectordb.local_vector_db import read_snapshot_manifest
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+from nyc_landmarks.vectordb.snapshot import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_UPSERT_BATCH_SIZE,
+    export_snapshot,
+    import_snapshot,
+)
 from nyc_landmarks.vectordb.vector_id_validator import VectorIDValidator
 
 # Configure logging
@@ -1399,14 +1421,17 @@ def _check_batch_embeddings(vector: Dict[str, Any], verbose: bool) -> Optional[s
 
 
 def _verify_single_vector_in_batch(
-    vector_id: str, namespace: Optional[str], check_embeddings: bool, verbose: bool
+    vector_id: str,
+    vector: Optional[Dict[str, Any]],
+    check_embeddings: bool,
+    verbose: bool,
 ) -> Dict[str, Any]:
     """
     Verify a single vector in batch processing.
 
     Args:
         vector_id: ID of vector to verify
-        namespace: Optional namespace
+        vector: Fetched vector data, or None if the vector was not found
         check_embeddings: Whether to check embeddings
         verbose: Whether to print verbose output
 
@@ -1416,19 +1441,6 @@ def _verify_single_vector_in_batch(
     if verbose:
         print(f"\nChecking vector: {vector_id}")
 
-    # Initialize PineconeDB client
-    pinecone_db = PineconeDB()
-
-    # Use "__default__" namespace when none is specified
-    if namespace is None:
-        namespace_to_use = "__default__"
-        logger.info(f"No namespace specified, using: {namespace_to_use}")
-    else:
-        namespace_to_use = namespace
-        logger.info(f"Using specified namespace: {namespace_to_use}")
-
-    # Fetch the vector
-    vector = pinecone_db.fetch_vector_by_id(vector_id, namespace_to_use)
     if not vector:
         if verbose:
             print("  ✗ Vector not found")
@@ -1507,10 +1519,14 @@ def verify_batch(
         "details": {},
     }
 
+    # Fetch all vectors with batched requests
+    pinecone_db = PineconeDB()
+    vectors = pinecone_db.fetch_vectors(vector_ids, namespace_to_use)
+
     # Process each vector
     for vector_id in vector_ids:
         vector_result = _verify_single_vector_in_batch(
-            vector_id, namespace_to_use, check_embeddings, verbose
+            vector_id, vectors.get(vector_id), check_embeddings, verbose
         )
 
         # Update aggregate results
@@ -1796,6 +1812,60 @@ def list_vectors_command(args: argparse.Namespace) -> None:
         traceback.print_exc()
 
 
+# =============== Snapshot Command Functions ===============
+
+
+def export_command(args: argparse.Namespace) -> None:
+    """Handle the export command."""
+    try:
+        pinecone_db = PineconeDB(index_name=args.index_name)
+        print(f"\nExporting index '{pinecone_db.index_name}' to {args.path}")
+        generation = export_snapshot(
+            pinecone_db,
+            args.path,
+            batch_size=args.batch_size,
+            max_workers=args.workers,
+        )
+        manifest = read_snapshot_manifest(args.path) or {}
+        print(f"\nSnapshot generation: {generation}")
+        for namespace, count in manifest.get("namespaces", {}).items():
+            print(f"  {namespace or '__default__'}: {count} vectors")
+    except Exception as e:
+        logger.error(f"Error exporting index: {e}")
+        print(f"\nError: Failed to export index - {str(e)}")
+
+
+def import_command(args: argparse.Namespace) -> None:
+    """Handle the import command."""
+    try:
+        pinecone_db = PineconeDB(index_name=args.index_name)
+        print(f"\nImporting {args.path} into index '{pinecone_db.index_name}'")
+        stored = import_snapshot(
+            pinecone_db,
+            args.path,
+            namespace=args.namespace,
+            batch_size=args.batch_size,
+            max_workers=args.workers,
+        )
+        print(f"Imported {stored} vectors")
+    except Exception as e:
+        logger.error(f"Error importing snapshot: {e}")
+        print(f"\nError: Failed to import snapshot - {str(e)}")
+
+
+def index_lexical_command(args: argparse.Namespace) -> None:
+    """Handle the index-lexical command."""
+    try:
+        pinecone_db = PineconeDB(index_name=args.index_name)
+        index = LexicalIndex(args.path, namespace=args.namespace)
+        print(f"\nIndexing namespace '{index.namespace}' into {args.path}")
+        indexed = build_lexical_index(pinecone_db, index)
+        print(f"Indexed {indexed} chunks (generation {index.generation})")
+    except Exception as e:
+        logger.error(f"Error building lexical index: {e}")
+        print(f"\nError: Failed to build lexical index - {str(e)}")
+
+
 def setup_fetch_parser(subparsers: Any) -> None:
     """Set up the parser for the fetch command."""
     fetch_parser = subparsers.add_parser(
@@ -2022,6 +2092,92 @@ def setup_verify_batch_parser(subparsers: Any) -> None:
     batch_parser.set_defaults(func=verify_batch_command)
 
 
+def _add_snapshot_arguments(parser: Any, default_batch_size: int) -> None:
+    """Add the arguments shared by the export and import commands."""
+    parser.add_argument(
+        "path",
+        type=str,
+        help="Snapshot directory",
+    )
+    parser.add_argument(
+        "--index-name",
+        type=str,
+        help="Pinecone index name (default: from settings)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=default_batch_size,
+        help=f"Vectors per request (default: {default_batch_size})",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Parallel requests (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+
+def setup_export_parser(subparsers: Any) -> None:
+    """Set up the parser for the export command."""
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export the whole index to a snapshot directory",
+        description="List every vector ID per namespace, fetch the vectors in "
+        "parallel batches and write .npy vectors, IDs and Parquet metadata",
+    )
+    _add_snapshot_arguments(export_parser, DEFAULT_FETCH_BATCH_SIZE)
+    export_parser.set_defaults(func=export_command)
+
+
+def setup_import_parser(subparsers: Any) -> None:
+    """Set up the parser for the import command."""
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Import a snapshot directory into the index",
+        description="Bulk-upsert the vectors of a snapshot with parallel batches",
+    )
+    _add_snapshot_arguments(import_parser, DEFAULT_UPSERT_BATCH_SIZE)
+    import_parser.add_argument(
+        "--namespace",
+        "-n",
+        type=str,
+        help="Import every vector into this namespace (default: keep the "
+        "snapshot's namespaces)",
+    )
+    import_parser.set_defaults(func=import_command)
+
+
+def setup_index_lexical_parser(subparsers: Any) -> None:
+    """Set up the parser for the index-lexical command."""
+    lexical_parser = subparsers.add_parser(
+        "index-lexical",
+        help="Rebuild the local BM25 index for hybrid search",
+        description="Read the chunk texts of every vector in a namespace and "
+        "save a BM25 inverted index used by hybrid text search",
+    )
+    lexical_parser.add_argument(
+        "--path",
+        type=str,
+        default=settings.LEXICAL_INDEX_PATH,
+        help=f"Index directory (default: {settings.LEXICAL_INDEX_PATH})",
+    )
+    lexical_parser.add_argument(
+        "--namespace",
+        "-n",
+        type=str,
+        default=settings.PINECONE_NAMESPACE,
+        help=f"Namespace to index (default: {settings.PINECONE_NAMESPACE})",
+    )
+    lexical_parser.add_argument(
+        "--index-name",
+        type=str,
+        help="Pinecone index name (default: from settings)",
+    )
+    lexical_parser.set_defaults(func=index_lexical_command)
+
+
 def main() -> None:
     """
     Main entry point for the script.
@@ -2047,6 +2203,9 @@ def main() -> None:
     setup_compare_vectors_parser(subparsers)
     setup_verify_vectors_parser(subparsers)
     setup_verify_batch_parser(subparsers)
+    setup_export_parser(subparsers)
+    setup_import_parser(subparsers)
+    setup_index_lexical_parser(subparsers)
 
     # Parse arguments and call the appropriate function
     args = parser.parse_args()
@@ -139,6 +139,10 @@ setup(
             "tqdm>=4.67.1",  # Added for progress bars in notebooks/scripts
         ],
         "lint": ["ruff"],
+        "local": [
+            "hnswlib>=0.8.0",  # HNSW search for the local vector store
+            "pyarrow>=17.0.0",  # Parquet metadata for index snapshots
+        ],
         "coverage>=7.8.0": ["pytest-cov"],
     },
 )
@@ -95,7 +95,7 @@ class TestWikipediaQualityFetcherFunctional:
         )
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_nested_response(
         self,
         mock_post: Mock,
@@ -134,7 +134,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Nested API response test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_simple_response(
         self,
         mock_post: Mock,
@@ -182,7 +182,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Empty revision ID test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_connection_error(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -202,7 +202,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Connection error test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_http_error(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -221,7 +221,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ HTTP error test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_invalid_response_format(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -245,7 +245,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Invalid response format test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_missing_rev_id_in_response(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -283,7 +283,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Missing revision ID test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_missing_articlequality_key(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -319,7 +319,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ Missing articlequality key test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_json_decode_error(
         self, mock_post: Mock, quality_fetcher: WikipediaQualityFetcher
     ) -> None:
@@ -341,7 +341,7 @@ class TestWikipediaQualityFetcherFunctional:
         logger.info("✅ JSON decode error test completed successfully")
 
     @pytest.mark.functional
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_article_quality_retry_success_after_failure(
         self,
         mock_post: Mock,
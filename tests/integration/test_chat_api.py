@@ -4,14 +4,20 @@ Unit tests for Chat API functionality.
 This module tests the chat API endpoints, response generation, and conversation management.
 """
 
-from typing import Any
+import json
+import threading
+from typing import Any, Generator, cast
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from openai.types.chat import ChatCompletionMessage
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta
 
+from nyc_landmarks.api.chat import CHAT_HISTORY_LIMIT, _stream_chat_completion
+from nyc_landmarks.chat.answer_cache import SemanticAnswerCache
 from nyc_landmarks.chat.conversation import Conversation
 from nyc_landmarks.main import app
 
@@ -67,6 +73,29 @@ class MockChatCompletion:
         ]
 
 
+def make_stream_chunks(*deltas: str) -> list[ChatCompletionChunk]:
+    """Create streamed chat completion chunks for the given content deltas."""
+    return [
+        ChatCompletionChunk(
+            id="chunk",
+            created=0,
+            model="gpt-3.5-turbo",
+            object="chat.completion.chunk",
+            choices=[ChunkChoice(index=0, delta=ChoiceDelta(content=delta))],
+        )
+        for delta in deltas
+    ]
+
+
+def parse_sse_events(body: str) -> list[tuple[str, dict]]:
+    """Parse a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
 class TestChatAPI:
     """Test cases for the Chat API."""
 
@@ -157,6 +186,52 @@ class TestChatAPI:
         assert mock_pinecone_db.return_value.query_vectors.called
         assert mock_openai_create.called
 
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.conversation_store")
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    @patch("nyc_landmarks.api.chat.PineconeDB")
+    @patch("nyc_landmarks.api.chat.EmbeddingGenerator")
+    @patch("nyc_landmarks.api.chat.DbClient")
+    def test_chat_message_returns_full_history(
+        self,
+        mock_db_client: Any,
+        mock_embedding_generator: Any,
+        mock_pinecone_db: Any,
+        mock_openai_create: Any,
+        mock_conv_store: Any,
+        test_client: TestClient,
+        mock_conversation: Conversation,
+    ) -> None:
+        """Test the response holds every message while the prompt is limited."""
+        # Setup mocks
+        for i in range(CHAT_HISTORY_LIMIT):
+            mock_conversation.add_message("user", f"Question {i}")
+            mock_conversation.add_message("assistant", f"Answer {i}")
+        mock_conv_store.get_conversation.return_value = mock_conversation
+
+        mock_embedding_generator.return_value.generate_embedding.return_value = [
+            0.1
+        ] * 1536
+        mock_pinecone_db.return_value.query_vectors.return_value = []
+        mock_openai_create.return_value = MockChatCompletion("Follow-up response")
+
+        # Test
+        response = test_client.post(
+            "/api/chat/message",
+            json={"message": "And another?", "conversation_id": "test-id"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        mock_conv_store.get_conversation.assert_called_once_with("test-id")
+        messages = response.json()["messages"]
+        assert len(messages) == len(mock_conversation.get_messages()) - 1
+        assert messages[0]["content"] == "User message"
+
+        # Only the recent history is sent to the model
+        prompt = mock_openai_create.call_args[1]["messages"]
+        assert "User message" not in [message["content"] for message in prompt]
+
     @pytest.mark.integration
     @patch("nyc_landmarks.api.chat.conversation_store")
     @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
@@ -342,3 +417,247 @@ class TestChatAPI:
         # Assert
         assert response.status_code == 500
         assert "OpenAI API error" in response.json()["detail"]
+
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.conversation_store")
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    @patch("nyc_landmarks.api.chat.PineconeDB")
+    @patch("nyc_landmarks.api.chat.EmbeddingGenerator")
+    @patch("nyc_landmarks.api.chat.DbClient")
+    def test_chat_message_stream(
+        self,
+        mock_db_client: Any,
+        mock_embedding_generator: Any,
+        mock_pinecone_db: Any,
+        mock_openai_create: Any,
+        mock_conv_store: Any,
+        test_client: TestClient,
+        mock_conversation: Conversation,
+    ) -> None:
+        """Test streaming chat sends sources first, then tokens, then done."""
+        # Setup mocks
+        mock_conv_store.get_conversation.return_value = mock_conversation
+
+        mock_embedding_generator.return_value.generate_embedding.return_value = [
+            0.1
+        ] * 1536
+        mock_pinecone_db.return_value.query_vectors.return_value = []
+        mock_openai_create.return_value = iter(
+            make_stream_chunks("Streamed ", "response")
+        )
+
+        # Test
+        response = test_client.post(
+            "/api/chat/message/stream",
+            json={"message": "Tell me more.", "conversation_id": "test-id"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse_events(response.text)
+        assert [event for event, _ in events] == ["sources", "token", "token", "done"]
+        assert events[0][1]["conversation_id"] == "test-id"
+        assert events[0][1]["sources"] == []
+        assert events[-1][1]["response"] == "Streamed response"
+        assert mock_openai_create.call_args[1]["stream"] is True
+
+        # The full response is appended to the conversation on completion
+        last_message = mock_conversation.get_messages()[-1]
+        assert last_message["role"] == "assistant"
+        assert last_message["content"] == "Streamed response"
+
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    def test_stream_disconnect_saves_partial_response(
+        self, mock_openai_create: Any, mock_conversation: Conversation
+    ) -> None:
+        """Test that a stream closed by the client keeps the turn complete."""
+        mock_conversation.add_message("user", "Tell me more.")
+        mock_openai_create.return_value = iter(
+            make_stream_chunks("Partial ", "response", " never sent")
+        )
+
+        events = cast(
+            Generator[str, None, None],
+            _stream_chat_completion(
+                mock_conversation, [], sources=[], landmark_id=None
+            ),
+        )
+        # Sources and the first two tokens reach the client, then it disconnects
+        for _ in range(3):
+            next(events)
+        events.close()
+
+        last_message = mock_conversation.get_messages()[-1]
+        assert last_message["role"] == "assistant"
+        assert last_message["content"] == "Partial response"
+
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.conversation_store")
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    @patch("nyc_landmarks.api.chat.PineconeDB")
+    @patch("nyc_landmarks.api.chat.EmbeddingGenerator")
+    @patch("nyc_landmarks.api.chat.DbClient")
+    def test_chat_message_stream_openai_error(
+        self,
+        mock_db_client: Any,
+        mock_embedding_generator: Any,
+        mock_pinecone_db: Any,
+        mock_openai_create: Any,
+        mock_conv_store: Any,
+        test_client: TestClient,
+        mock_conversation: Conversation,
+    ) -> None:
+        """Test that completion errors are reported as an in-band error event."""
+        # Setup mocks
+        mock_conv_store.get_conversation.return_value = None
+        mock_conv_store.create_conversation.return_value = mock_conversation
+
+        mock_embedding_generator.return_value.generate_embedding.return_value = [
+            0.1
+        ] * 1536
+        mock_pinecone_db.return_value.query_vectors.return_value = []
+        mock_openai_create.side_effect = Exception("OpenAI API error")
+
+        # Test
+        response = test_client.post(
+            "/api/chat/message/stream",
+            json={"message": "Hello, what can you tell me about NYC landmarks?"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        events = parse_sse_events(response.text)
+        assert [event for event, _ in events] == ["sources", "error"]
+        assert "OpenAI API error" in events[-1][1]["detail"]
+
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.conversation_store")
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    @patch("nyc_landmarks.api.chat.PineconeDB")
+    @patch("nyc_landmarks.api.chat.EmbeddingGenerator")
+    @patch("nyc_landmarks.api.chat.DbClient")
+    def test_chat_message_answer_cache(
+        self,
+        mock_db_client: Any,
+        mock_embedding_generator: Any,
+        mock_pinecone_db: Any,
+        mock_openai_create: Any,
+        mock_conv_store: Any,
+        test_client: TestClient,
+    ) -> None:
+        """Test that repeated first-turn questions are answered from the cache."""
+        # Setup mocks: every request starts a new conversation
+        mock_conv_store.get_conversation.return_value = None
+        mock_conv_store.create_conversation.side_effect = lambda: Conversation()
+
+        mock_embedding_generator.return_value.generate_embedding.return_value = [
+            0.1
+        ] * 1536
+        mock_pinecone_db.return_value.query_vectors.return_value = []
+        mock_openai_create.return_value = MockChatCompletion("Designated in 1978.")
+
+        request = {
+            "message": "When was the Chrysler Building designated?",
+            "landmark_id": "LP-00992",
+        }
+        cache = SemanticAnswerCache(enabled=True, threshold=0.95)
+        with patch("nyc_landmarks.api.chat.answer_cache", cache):
+            first = test_client.post("/api/chat/message", json=request)
+            second = test_client.post("/api/chat/message", json=request)
+            streamed = test_client.post("/api/chat/message/stream", json=request)
+            other_landmark = test_client.post(
+                "/api/chat/message", json={**request, "landmark_id": "LP-00001"}
+            )
+
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["response"] == "Designated in 1978."
+        assert second.json()["conversation_id"] != first.json()["conversation_id"]
+        assert [m["role"] for m in second.json()["messages"]] == ["user", "assistant"]
+
+        events = parse_sse_events(streamed.text)
+        assert [event for event, _ in events] == ["sources", "token", "done"]
+        assert events[-1][1]["response"] == "Designated in 1978."
+
+        # Only the first question and the one with a different filter reached
+        # the vector database and the completion API
+        assert other_landmark.status_code == 200
+        assert mock_pinecone_db.return_value.query_vectors.call_count == 2
+        assert mock_openai_create.call_count == 2
+        assert cache.get_metrics()["hits"] == 2
+
+    @pytest.mark.integration
+    @patch("nyc_landmarks.api.chat.conversation_store")
+    @patch("nyc_landmarks.api.chat.openai.chat.completions.create")
+    @patch("nyc_landmarks.api.chat.PineconeDB")
+    @patch("nyc_landmarks.api.chat.EmbeddingGenerator")
+    @patch("nyc_landmarks.api.chat.DbClient")
+    def test_chat_message_overlaps_embedding_and_conversation_loading(
+        self,
+        mock_db_client: Any,
+        mock_embedding_generator: Any,
+        mock_pinecone_db: Any,
+        mock_openai_create: Any,
+        mock_conv_store: Any,
+        test_client: TestClient,
+        mock_conversation: Conversation,
+        mock_pinecone_match: Any,
+    ) -> None:
+        """Test that the query is embedded while the conversation is loading."""
+        # Both calls must be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load_conversation(*args: Any, **kwargs: Any) -> Conversation:
+            barrier.wait()
+            return mock_conversation
+
+        def generate_embedding(text: str) -> list[float]:
+            barrier.wait()
+            return [0.1] * 1536
+
+        mock_conv_store.get_conversation.side_effect = load_conversation
+        mock_embedding_generator.return_value.generate_embedding.side_effect = (
+            generate_embedding
+        )
+        mock_pinecone_db.return_value.query_vectors.return_value = [mock_pinecone_match]
+        mock_db_client.return_value.get_landmark_by_id.return_value = {
+            "name": "Test Landmark"
+        }
+        mock_openai_create.return_value = MockChatCompletion("Test response")
+
+        # Use FastAPI dependency overrides to inject the mock db_client
+        from nyc_landmarks.api.chat import get_db_client
+        from nyc_landmarks.main import app as fastapi_app
+
+        fastapi_app.dependency_overrides[get_db_client] = (
+            lambda: mock_db_client.return_value
+        )
+
+        try:
+            # Test
+            response = test_client.post(
+                "/api/chat/message",
+                json={"message": "Tell me more.", "conversation_id": "test-id"},
+            )
+        finally:
+            fastapi_app.dependency_overrides = {}
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["sources"][0]["landmark_name"] == "Test Landmark"
+        stages = [
+            entry.split(";")[0]
+            for entry in response.headers["Server-Timing"].split(", ")
+        ]
+        assert set(stages) == {
+            "conversation",
+            "embedding",
+            "retrieval",
+            "enrichment",
+            "prompt_assembly",
+            "completion",
+            "total",
+        }
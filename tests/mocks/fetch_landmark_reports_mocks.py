@@ -423,6 +423,10 @@ def create_mock_pinecone_db_for_pdf_index() -> Mock:
         return []  # No matches for other landmarks or source types
 
     mock_db.query_vectors.side_effect = mock_query_vectors
+    mock_db.get_indexed_landmarks.return_value = {
+        "pdf": {"LP-00001", "LP-00002", "LP-00005"},
+        "wikipedia": {"LP-00001"},
+    }
     return mock_db
 
 
@@ -435,6 +439,7 @@ def create_mock_pinecone_db_pdf_index_empty() -> Mock:
     """
     mock_db = Mock()
     mock_db.query_vectors.return_value = []
+    mock_db.get_indexed_landmarks.return_value = {"pdf": set(), "wikipedia": set()}
     return mock_db
 
 
@@ -448,4 +453,5 @@ def create_mock_pinecone_db_pdf_index_errors() -> Mock:
     mock_db = Mock()
     mock_db.list_vectors.side_effect = Exception("PDF index query failed")
     mock_db.query_vectors.side_effect = Exception("PDF index query failed")
+    mock_db.get_indexed_landmarks.side_effect = Exception("PDF index query failed")
     return mock_db
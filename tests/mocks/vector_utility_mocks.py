@@ -24,6 +24,9 @@ def create_mock_pinecone_db() -> Mock:
     # Mock successful operations
     mock_db.get_index_stats.return_value = {"total_vector_count": 1000}
     mock_db.fetch_vector_by_id.return_value = get_mock_vector_data()
+    mock_db.fetch_vectors.side_effect = lambda ids, namespace=None: {
+        vector_id: get_mock_vector_data(vector_id) for vector_id in ids
+    }
     mock_db.query_vectors.return_value = create_mock_matches(
         get_mock_landmark_vectors()
     )
@@ -39,6 +42,7 @@ def create_mock_pinecone_db_empty() -> Mock:
     # Mock empty operations
     mock_db.get_index_stats.return_value = {"total_vector_count": 0}
     mock_db.fetch_vector_by_id.return_value = None
+    mock_db.fetch_vectors.return_value = {}
     mock_db.query_vectors.return_value = []
     mock_db.list_vectors.return_value = []
 
@@ -52,6 +56,7 @@ def create_mock_pinecone_db_with_errors() -> Mock:
     # Mock error operations
     mock_db.get_index_stats.side_effect = Exception("Connection error")
     mock_db.fetch_vector_by_id.side_effect = Exception("Fetch error")
+    mock_db.fetch_vectors.side_effect = Exception("Fetch error")
     mock_db.query_vectors.side_effect = Exception("Query error")
     mock_db.list_vectors.side_effect = Exception("List error")
 
@@ -612,8 +612,8 @@ class TestVerifyVectorsCommand(unittest.TestCase):
         with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
             verify_batch_command(args)
 
-        # Verify vectors were fetched
-        self.assertGreater(mock_db.fetch_vector_by_id.call_count, 0)
+        # Verify vectors were fetched in one batch
+        mock_db.fetch_vectors.assert_called_once_with(args.vector_ids, "__default__")
 
         # Verify batch verification output
         output = mock_stdout.getvalue()
@@ -641,7 +641,10 @@ class TestVerifyVectorsCommand(unittest.TestCase):
                 verify_batch_command(args)
 
             # Should have read from file and processed vectors
-            self.assertGreater(mock_db.fetch_vector_by_id.call_count, 0)
+            mock_db.fetch_vectors.assert_called_once_with(
+                ["wiki-Test-LP-001-chunk-0", "wiki-Test-LP-001-chunk-1"],
+                "__default__",
+            )
         finally:
             import os
 
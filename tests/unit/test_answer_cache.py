@@ -0,0 +1,144 @@
+"""
+Unit tests for the semantic answer cache.
+
+Tests the SemanticAnswerCache, focusing on:
+- Similarity threshold and landmark filter partitioning
+- TTL expiry and LRU eviction
+- Invalidation when landmark vectors change
+"""
+
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from nyc_landmarks.chat.answer_cache import SemanticAnswerCache
+from nyc_landmarks.vectordb import pinecone_db
+
+
+def _embedding(seed: int, dimensions: int = 32) -> List[float]:
+    """Create a deterministic random embedding."""
+    return [float(x) for x in np.random.default_rng(seed).normal(size=dimensions)]
+
+
+def _nearby(embedding: List[float], noise: float = 0.01) -> List[float]:
+    """Create an embedding very close to the given one."""
+    rng = np.random.default_rng(0)
+    return [x + noise * float(rng.normal()) for x in embedding]
+
+
+def _sources(*landmark_ids: str) -> List[Dict[str, Any]]:
+    return [{"landmark_id": landmark_id, "score": 0.9} for landmark_id in landmark_ids]
+
+
+class TestSemanticAnswerCache:
+    """Test the SemanticAnswerCache."""
+
+    @staticmethod
+    def _cache(**kwargs: Any) -> SemanticAnswerCache:
+        options: Dict[str, Any] = {
+            "enabled": True,
+            "threshold": 0.95,
+            "max_entries": 10,
+            "ttl": 3600,
+        }
+        options.update(kwargs)
+        return SemanticAnswerCache(**options)
+
+    def test_hit_for_similar_question(self) -> None:
+        """Test that a near-duplicate question returns the cached answer."""
+        cache = self._cache()
+        question = _embedding(1)
+        cache.store("Q", question, "Answer", _sources("LP-00001"), "LP-00001")
+
+        cached = cache.lookup(_nearby(question), "LP-00001")
+
+        assert cached is not None
+        assert cached.answer == "Answer"
+        assert cached.sources == _sources("LP-00001")
+        assert cache.get_metrics()["hits"] == 1
+
+    def test_miss_below_threshold(self) -> None:
+        """Test that dissimilar questions are not answered from the cache."""
+        cache = self._cache()
+        cache.store("Q", _embedding(1), "Answer", [], None)
+
+        assert cache.lookup(_embedding(2), None) is None
+        assert cache.get_metrics()["misses"] == 1
+
+    def test_partitioned_by_landmark_filter(self) -> None:
+        """Test that entries only match requests with the same landmark filter."""
+        cache = self._cache()
+        question = _embedding(1)
+        cache.store("Q", question, "Answer", [], "LP-00001")
+
+        assert cache.lookup(question, "LP-00002") is None
+        assert cache.lookup(question, None) is None
+        assert cache.lookup(question, "LP-00001") is not None
+
+    def test_disabled_cache(self) -> None:
+        """Test that a disabled cache neither stores nor returns answers."""
+        cache = self._cache(enabled=False)
+        question = _embedding(1)
+        cache.store("Q", question, "Answer", [], None)
+
+        assert cache.lookup(question, None) is None
+        assert cache.get_metrics()["size"] == 0
+
+    def test_expired_entries_are_removed(self) -> None:
+        """Test that entries older than the TTL are not returned."""
+        cache = self._cache(ttl=60)
+        question = _embedding(1)
+        cache.store("Q", question, "Answer", [], None)
+        cache._entries[next(iter(cache._entries))].created_at = time.time() - 120
+
+        assert cache.lookup(question, None) is None
+        assert cache.get_metrics()["size"] == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = self._cache(max_entries=2)
+        first, second, third = _embedding(1), _embedding(2), _embedding(3)
+        cache.store("first", first, "A1", [], None)
+        cache.store("second", second, "A2", [], None)
+
+        # Touch the first entry so the second becomes least recently used
+        assert cache.lookup(first, None) is not None
+        cache.store("third", third, "A3", [], None)
+
+        assert cache.lookup(second, None) is None
+        assert cache.lookup(first, None) is not None
+        assert cache.lookup(third, None) is not None
+
+    def test_invalidate_landmark(self) -> None:
+        """Test that entries depending on a landmark's vectors are dropped."""
+        cache = self._cache()
+        filtered, unfiltered, other = _embedding(1), _embedding(2), _embedding(3)
+        cache.store("filtered", filtered, "A1", [], "LP-00001")
+        cache.store("cites", unfiltered, "A2", _sources("LP-00001"), None)
+        cache.store("other", other, "A3", _sources("LP-00002"), None)
+
+        assert cache.invalidate_landmark("LP-00001") == 2
+
+        assert cache.lookup(filtered, "LP-00001") is None
+        assert cache.lookup(unfiltered, None) is None
+        assert cache.lookup(other, None) is not None
+        assert cache.invalidate_landmark(None) == 1
+        assert cache.get_metrics()["invalidations"] == 3
+
+    def test_invalidated_by_vector_change_listener(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that PineconeDB vector changes invalidate registered caches."""
+        monkeypatch.setattr(pinecone_db, "_vector_change_listeners", [])
+        cache = self._cache()
+        question = _embedding(1)
+        cache.store("Q", question, "Answer", [], "LP-00001")
+        pinecone_db.register_vector_change_listener(cache.invalidate_landmark)
+
+        pinecone_db._notify_vector_change(["LP-00002"])
+        assert cache.lookup(question, "LP-00001") is not None
+
+        pinecone_db._notify_vector_change(["LP-00001"])
+        assert cache.lookup(question, "LP-00001") is None
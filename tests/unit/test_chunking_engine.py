@@ -0,0 +1,153 @@
+"""
+Unit tests for the chunking engine.
+
+Tests the ChunkingEngine class, focusing on:
+- Token, sentence, paragraph and section strategies slicing the text
+- Chunk size limits, overlap and section boundaries
+- Identical chunk dictionaries for every strategy
+- Chunking long articles with every strategy
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from nyc_landmarks.chunking import ChunkingEngine, ChunkStrategy
+from nyc_landmarks.pdf.text_chunker import TextChunker
+
+
+def _article(sections: int = 3, paragraphs: int = 4) -> str:
+    """Build a Wikipedia extract with headings and paragraphs."""
+    parts = ["Gracie Mansion is the official residence of the mayor."]
+    for section in range(sections):
+        parts.append(f"== Section {section} ==")
+        parts.extend(
+            " ".join(
+                f"Sentence {sentence} of paragraph {paragraph}."
+                for sentence in range(6)
+            )
+            for paragraph in range(paragraphs)
+        )
+    return "\n\n".join(parts)
+
+
+class TestChunkingEngine:
+    """Test splitting text with each strategy."""
+
+    @pytest.mark.parametrize("strategy", list(ChunkStrategy))
+    def test_chunks_are_slices_within_the_limit(self, strategy: ChunkStrategy) -> None:
+        """Test that chunks are ordered slices of the text within the size."""
+        text = _article()
+        engine = ChunkingEngine(strategy, chunk_size=60)
+
+        chunks = engine.chunk(text)
+
+        assert len(chunks) > 1
+        assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            assert chunk.text == text[chunk.start : chunk.end]
+            assert chunk.token_count <= 60
+        assert "".join("".join(c.text for c in chunks).split()) == "".join(text.split())
+
+    def test_sections_split_at_headings(self) -> None:
+        """Test that sections start chunks and are recorded in the metadata."""
+        text = _article(sections=3, paragraphs=1)
+        engine = ChunkingEngine(ChunkStrategy.SECTIONS, chunk_size=60)
+
+        chunks = engine.chunk(text)
+
+        assert [chunk.section for chunk in chunks] == [
+            None,
+            "Section 0",
+            "Section 1",
+            "Section 2",
+        ]
+        assert all(chunk.text.startswith("== Section") for chunk in chunks[1:])
+
+    def test_split_sections_do_not_share_chunks(self) -> None:
+        """Test that a section too large for a chunk starts and ends chunks."""
+        text = _article(sections=2, paragraphs=8)
+        engine = ChunkingEngine(ChunkStrategy.SECTIONS, chunk_size=80)
+
+        chunks = engine.chunk(text)
+
+        for chunk in chunks:
+            assert chunk.text.count("== Section") <= 1
+            if "== Section" in chunk.text:
+                assert chunk.text.startswith("== Section")
+
+    def test_paragraph_overlap(self) -> None:
+        """Test that trailing paragraphs are repeated in the next chunk."""
+        text = _article(sections=1, paragraphs=12)
+        engine = ChunkingEngine(ChunkStrategy.PARAGRAPHS, 100, chunk_overlap=50)
+
+        chunks = engine.chunk(text)
+
+        assert len(chunks) > 1
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert chunk.start < previous.end
+
+    def test_token_windows_do_not_repeat_the_tail(self) -> None:
+        """Test that the last token window ends at the end of the text."""
+        text = " ".join(f"word{i}" for i in range(300))
+        engine = ChunkingEngine(ChunkStrategy.TOKENS, 100, chunk_overlap=20)
+
+        chunks = engine.chunk(text)
+
+        assert chunks[-1].end == len(text)
+        assert sum(chunk.end == len(text) for chunk in chunks) == 1
+
+    def test_chunk_dicts_share_a_format(self) -> None:
+        """Test that every strategy produces the same dictionary keys."""
+        text = _article()
+        shapes = set()
+        for strategy in ChunkStrategy:
+            dicts = ChunkingEngine(strategy, 60).chunk_dicts(text, {"landmark_id": "x"})
+            for chunk in dicts:
+                assert chunk["total_chunks"] == len(dicts)
+                assert chunk["metadata"]["landmark_id"] == "x"
+                shapes.add((tuple(sorted(chunk)), tuple(sorted(chunk["metadata"]))))
+
+        assert len(shapes) == 1
+
+    def test_pdf_chunker_uses_the_engine(self) -> None:
+        """Test that the PDF chunker returns the engine's dictionaries."""
+        chunker = TextChunker(60, 10, strategy=ChunkStrategy.SENTENCES)
+        text = _article(sections=1)
+
+        chunks = chunker.chunk_with_metadata(text, {"landmark_id": "LP-00001"})
+
+        assert chunks == chunker.engine.chunk_dicts(
+            chunker.preprocess_text(text), {"landmark_id": "LP-00001"}
+        )
+
+    def test_empty_text(self) -> None:
+        """Test that empty text yields no chunks."""
+        engine = ChunkingEngine(ChunkStrategy.SECTIONS, 60)
+
+        assert engine.chunk(None) == []
+        assert engine.chunk(" \n\n ") == []
+
+    def test_tokenizer_is_loaded_on_first_use(self) -> None:
+        """Test that creating an engine does not load the shared encoder."""
+        with patch("nyc_landmarks.chunking.engine.get_tokenizer") as get_tokenizer:
+            engine = ChunkingEngine(ChunkStrategy.TOKENS, 60)
+            get_tokenizer.assert_not_called()
+
+            assert engine.tokenizer is get_tokenizer.return_value
+
+    @pytest.mark.parametrize("size, overlap", [(0, 0), (10, 10), (10, -1)])
+    def test_invalid_sizes(self, size: int, overlap: int) -> None:
+        """Test that unusable sizes are rejected."""
+        with pytest.raises(ValueError):
+            ChunkingEngine(ChunkStrategy.TOKENS, size, overlap)
+
+    def test_long_article(self) -> None:
+        """Test that every strategy chunks a long article within the size."""
+        text = _article(sections=40, paragraphs=10)
+
+        for strategy in ChunkStrategy:
+            chunks = ChunkingEngine(strategy, 200, 20).chunk(text)
+
+            assert chunks
+            assert all(chunk.token_count <= 200 for chunk in chunks)
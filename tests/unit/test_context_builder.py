@@ -0,0 +1,188 @@
+"""
+Unit tests for the chat context builder.
+
+Tests the ContextBuilder, focusing on:
+- Score filtering and ordering of retrieved chunks
+- Context token budget enforcement and truncation
+- Removal of overlapping and duplicate chunk text
+- Trimming conversation history to the history budget
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from nyc_landmarks.chat.context_builder import TRUNCATION_MARKER, ContextBuilder
+from nyc_landmarks.pdf.text_chunker import TextChunker
+
+
+def _match(
+    text: str, score: float, landmark_id: str = "LP-00001", **metadata: Any
+) -> Tuple[Dict[str, Any], float]:
+    """Build a (metadata, score) pair as produced by the chat API."""
+    return (
+        {"text": text, "landmark_id": landmark_id, "source_type": "pdf", **metadata},
+        score,
+    )
+
+
+def _sentences(count: int, prefix: str = "Sentence") -> str:
+    return " ".join(
+        f"{prefix} number {i} describes the landmark facade." for i in range(count)
+    )
+
+
+class TestSelectContext:
+    """Test selection of retrieved chunks."""
+
+    def test_filters_low_scores_and_orders_by_score(self) -> None:
+        """Test that low-scoring chunks are dropped and the rest sorted."""
+        builder = ContextBuilder(context_token_budget=1000, min_score=0.7)
+        selected = builder.select_context(
+            [
+                _match("Second chunk about the building.", 0.8, "LP-00002"),
+                _match("Irrelevant chunk.", 0.5, "LP-00003"),
+                _match("First chunk about the building.", 0.9, "LP-00001"),
+            ]
+        )
+
+        assert [chunk.score for chunk in selected] == [0.9, 0.8]
+        assert selected[0].text == "First chunk about the building."
+
+    def test_respects_context_budget(self) -> None:
+        """Test that the selected context never exceeds the token budget."""
+        builder = ContextBuilder(
+            context_token_budget=120, min_score=0.0, min_fragment_tokens=10
+        )
+        matches = [
+            _match(_sentences(10, f"Doc{i}"), 0.9 - i * 0.01, f"LP-0000{i}")
+            for i in range(5)
+        ]
+
+        selected = builder.select_context(matches)
+
+        assert sum(chunk.token_count for chunk in selected) <= 120
+        assert selected[-1].text.endswith(TRUNCATION_MARKER)
+        for chunk in selected:
+            assert builder.count_tokens(chunk.text) == chunk.token_count
+
+    def test_drops_fragments_below_minimum(self) -> None:
+        """Test that a chunk is skipped when too little budget is left."""
+        builder = ContextBuilder(
+            context_token_budget=110, min_score=0.0, min_fragment_tokens=50
+        )
+        first = _sentences(10, "First")
+        first_tokens = builder.count_tokens(first)
+        assert 60 < first_tokens < 110
+
+        selected = builder.select_context(
+            [_match(first, 0.9, "LP-00001"), _match(_sentences(10), 0.8, "LP-00002")]
+        )
+
+        assert len(selected) == 1
+
+    def test_removes_overlap_between_adjacent_chunks(self) -> None:
+        """Test that text shared by overlapping chunks is only included once."""
+        chunker = TextChunker(chunk_size=100, chunk_overlap=30)
+        text = chunker.preprocess_text(_sentences(40))
+        chunks = chunker.chunk_text_by_tokens(text)
+        assert len(chunks) >= 3
+
+        builder = ContextBuilder(context_token_budget=10000, min_score=0.0)
+        # Middle chunk scores highest so overlap is removed on both sides
+        scores = [0.8, 0.9, 0.85] + [0.7] * (len(chunks) - 3)
+        selected = builder.select_context(
+            [
+                _match(chunk, score, chunk_index=i)
+                for i, (chunk, score) in enumerate(zip(chunks, scores))
+            ]
+        )
+
+        assert sum(chunk.token_count for chunk in selected) < sum(
+            builder.count_tokens(chunk) for chunk in chunks
+        )
+        ordered = sorted(selected, key=lambda chunk: chunk.metadata["chunk_index"])
+        combined = "".join(chunk.text for chunk in ordered)
+        assert "".join(combined.split()) == "".join(text.split())
+
+    def test_keeps_overlap_across_documents(self) -> None:
+        """Test that identical passages from different landmarks are both kept."""
+        text = _sentences(10)
+        builder = ContextBuilder(context_token_budget=10000, min_score=0.0)
+
+        selected = builder.select_context(
+            [
+                _match(text + " Extra one.", 0.9, "LP-00001"),
+                _match(text + " Extra two.", 0.8, "LP-00002"),
+            ]
+        )
+
+        assert [chunk.text for chunk in selected] == [
+            text + " Extra one.",
+            text + " Extra two.",
+        ]
+
+    def test_drops_duplicate_text(self) -> None:
+        """Test that exact duplicate chunks are only included once."""
+        builder = ContextBuilder(context_token_budget=1000, min_score=0.0)
+        selected = builder.select_context(
+            [
+                _match("Same chunk text.", 0.9, "LP-00001"),
+                _match("Same chunk text.", 0.8, "LP-00002"),
+            ]
+        )
+
+        assert len(selected) == 1
+
+
+class TestFitHistory:
+    """Test trimming of conversation history."""
+
+    @staticmethod
+    def _messages(count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i}: " + _sentences(3),
+            }
+            for i in range(count)
+        ]
+
+    def test_keeps_everything_within_budget(self) -> None:
+        """Test that short histories are returned unchanged."""
+        builder = ContextBuilder(history_token_budget=10000)
+        messages = self._messages(4)
+
+        assert builder.fit_history(messages) == messages
+
+    def test_trims_oldest_messages_first(self) -> None:
+        """Test that the oldest messages are dropped when over budget."""
+        builder = ContextBuilder(history_token_budget=100, min_fragment_tokens=1000)
+        messages = self._messages(10)
+        per_message = builder.count_tokens(messages[0]["content"])
+
+        fitted = builder.fit_history(messages)
+
+        assert fitted == messages[-len(fitted) :]
+        assert len(fitted) == 100 // per_message
+        assert sum(builder.count_tokens(m["content"]) for m in fitted) <= 100
+
+    def test_truncates_partially_fitting_message(self) -> None:
+        """Test that the oldest kept message is truncated to fill the budget."""
+        builder = ContextBuilder(history_token_budget=60, min_fragment_tokens=5)
+        messages = self._messages(4)
+
+        fitted = builder.fit_history(messages)
+
+        assert fitted[0]["content"].endswith(TRUNCATION_MARKER)
+        assert fitted[0]["role"] == messages[len(messages) - len(fitted)]["role"]
+        assert fitted[-1] == messages[-1]
+
+    def test_always_keeps_newest_message(self) -> None:
+        """Test that the newest message is kept even if it exceeds the budget."""
+        builder = ContextBuilder(history_token_budget=10, min_fragment_tokens=20)
+        messages = self._messages(3)
+
+        fitted = builder.fit_history(messages)
+
+        assert len(fitted) == 1
+        assert fitted[0]["content"].endswith(TRUNCATION_MARKER)
+        assert builder.count_tokens(fitted[0]["content"]) <= 20
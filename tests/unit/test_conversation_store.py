@@ -0,0 +1,311 @@
+"""
+Unit tests for the conversation memory module.
+
+Tests the ConversationStore backends, focusing on:
+- Per-conversation message caps
+- LRU eviction when the store is full
+- TTL expiry and background cleanup
+- Metrics and thread safety
+- SQLite persistence shared across store instances
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nyc_landmarks.chat.conversation import (
+    Conversation,
+    InMemoryConversationStore,
+    SQLiteConversationStore,
+)
+
+
+class TestConversation:
+    """Test the Conversation model."""
+
+    def test_message_cap_keeps_system_message(self) -> None:
+        """Test that trimming drops the oldest non-system messages."""
+        conversation = Conversation(max_messages=3)
+        conversation.add_message("system", "System prompt")
+        for i in range(5):
+            conversation.add_message("user", f"Message {i}")
+
+        messages = conversation.get_messages()
+        assert len(messages) == 3
+        assert messages[0]["role"] == "system"
+        assert [m["content"] for m in messages[1:]] == ["Message 3", "Message 4"]
+
+    def test_unbounded_without_cap(self) -> None:
+        """Test that conversations without a cap keep every message."""
+        conversation = Conversation()
+        for i in range(20):
+            conversation.add_message("user", f"Message {i}")
+
+        assert len(conversation.get_messages()) == 20
+        assert len(conversation.get_messages(limit=5)) == 5
+
+
+class TestInMemoryConversationStore:
+    """Test the bounded InMemoryConversationStore."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used conversation is evicted first."""
+        store = InMemoryConversationStore(
+            max_conversations=2, max_messages=10, ttl=3600
+        )
+        first = store.create_conversation()
+        second = store.create_conversation()
+
+        # Touch the first conversation so the second becomes least recently used
+        assert store.get_conversation(first.conversation_id) is first
+
+        third = store.create_conversation()
+
+        assert store.get_conversation(second.conversation_id) is None
+        assert store.get_conversation(first.conversation_id) is first
+        assert store.get_conversation(third.conversation_id) is third
+        assert store.get_metrics()["evictions"] == 1
+
+    def test_created_conversations_use_message_cap(self) -> None:
+        """Test that the store applies its message cap to new conversations."""
+        store = InMemoryConversationStore(
+            max_conversations=10, max_messages=4, ttl=3600
+        )
+        conversation = store.create_conversation()
+        for i in range(10):
+            conversation.add_message("user", f"Message {i}")
+
+        assert len(conversation.get_messages()) == 4
+
+    def test_get_expired_conversation(self) -> None:
+        """Test that expired conversations are removed on access."""
+        store = InMemoryConversationStore(max_conversations=10, max_messages=10, ttl=60)
+        conversation = store.create_conversation()
+        conversation.updated_at = time.time() - 120
+
+        assert store.get_conversation(conversation.conversation_id) is None
+        assert store.get_metrics()["expirations"] == 1
+        assert store.get_metrics()["size"] == 0
+
+    def test_cleanup_expired(self) -> None:
+        """Test that cleanup_expired removes only expired conversations."""
+        store = InMemoryConversationStore(max_conversations=10, max_messages=10, ttl=60)
+        expired = store.create_conversation()
+        active = store.create_conversation()
+        expired.updated_at = time.time() - 120
+
+        assert store.cleanup_expired() == 1
+        assert store.get_conversation(active.conversation_id) is active
+        assert store.get_metrics()["size"] == 1
+
+    def test_delete_conversation(self) -> None:
+        """Test deleting existing and missing conversations."""
+        store = InMemoryConversationStore(
+            max_conversations=10, max_messages=10, ttl=3600
+        )
+        conversation = store.create_conversation()
+
+        assert store.delete_conversation(conversation.conversation_id) is True
+        assert store.delete_conversation(conversation.conversation_id) is False
+
+    def test_metrics(self) -> None:
+        """Test the metrics reported by the store."""
+        store = InMemoryConversationStore(max_conversations=1, max_messages=5, ttl=3600)
+        store.create_conversation()
+        store.create_conversation()
+
+        assert store.get_metrics() == {
+            "backend": "memory",
+            "size": 1,
+            "max_conversations": 1,
+            "max_messages": 5,
+            "created": 2,
+            "evictions": 1,
+            "expirations": 0,
+        }
+
+    def test_concurrent_creation_respects_cap(self) -> None:
+        """Test that concurrent creation never exceeds the cap."""
+        store = InMemoryConversationStore(
+            max_conversations=50, max_messages=10, ttl=3600
+        )
+
+        def create_many() -> None:
+            for _ in range(100):
+                store.create_conversation()
+
+        threads = [threading.Thread(target=create_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = store.get_metrics()
+        assert metrics["size"] == 50
+        assert metrics["created"] == 800
+        assert metrics["evictions"] == 750
+
+    @pytest.mark.asyncio
+    async def test_background_cleanup_task(self) -> None:
+        """Test that the background sweeper removes expired conversations."""
+        store = InMemoryConversationStore(max_conversations=10, max_messages=10, ttl=60)
+        conversation = store.create_conversation()
+        conversation.updated_at = time.time() - 120
+
+        store.start_cleanup_task(interval=0.01)
+        try:
+            for _ in range(100):
+                if store.get_metrics()["size"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await store.stop_cleanup_task()
+
+        assert store.get_metrics()["size"] == 0
+        assert store.get_metrics()["expirations"] == 1
+
+
+class TestSQLiteConversationStore:
+    """Test the SQLite-backed conversation store."""
+
+    @staticmethod
+    def _store(db_path: Path, **kwargs: int) -> SQLiteConversationStore:
+        options = {"max_conversations": 10, "max_messages": 10, "ttl": 3600}
+        options.update(kwargs)
+        return SQLiteConversationStore(db_path=str(db_path), **options)
+
+    def test_uses_wal_mode(self, tmp_path: Path) -> None:
+        """Test that the database is created in WAL mode."""
+        db_path = tmp_path / "conversations.db"
+        self._store(db_path)
+
+        connection = sqlite3.connect(db_path)
+        try:
+            (mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+        finally:
+            connection.close()
+        assert mode == "wal"
+
+    def test_shared_across_store_instances(self, tmp_path: Path) -> None:
+        """Test that a conversation created by one worker is visible to another."""
+        db_path = tmp_path / "conversations.db"
+        worker_a = self._store(db_path)
+        worker_b = self._store(db_path)
+
+        conversation = worker_a.create_conversation()
+        conversation.add_message("system", "System prompt")
+        conversation.add_message("user", "Hello", metadata={"landmark_id": "LP-1"})
+
+        loaded = worker_b.get_conversation(conversation.conversation_id)
+        assert loaded is not None
+        messages = loaded.get_messages()
+        assert [m["content"] for m in messages] == ["System prompt", "Hello"]
+        assert messages[1]["metadata"] == {"landmark_id": "LP-1"}
+
+        # Messages added through the other worker are appended to the same record
+        loaded.add_message("assistant", "Hi there")
+        reloaded = worker_a.get_conversation(conversation.conversation_id)
+        assert reloaded is not None
+        assert reloaded.get_messages()[-1]["content"] == "Hi there"
+
+    def test_message_limit_loads_recent_messages(self, tmp_path: Path) -> None:
+        """Test that only the most recent messages are loaded when limited."""
+        store = self._store(tmp_path / "conversations.db", max_messages=50)
+        conversation = store.create_conversation()
+        for i in range(20):
+            conversation.add_message("user", f"Message {i}")
+
+        loaded = store.get_conversation(conversation.conversation_id, message_limit=3)
+        assert loaded is not None
+        assert [m["content"] for m in loaded.get_messages()] == [
+            "Message 17",
+            "Message 18",
+            "Message 19",
+        ]
+
+    def test_message_cap_keeps_system_message(self, tmp_path: Path) -> None:
+        """Test that persisted conversations are trimmed to the message cap."""
+        store = self._store(tmp_path / "conversations.db", max_messages=3)
+        conversation = store.create_conversation()
+        conversation.add_message("system", "System prompt")
+        for i in range(5):
+            conversation.add_message("user", f"Message {i}")
+
+        loaded = store.get_conversation(conversation.conversation_id)
+        assert loaded is not None
+        assert [m["content"] for m in loaded.get_messages()] == [
+            "System prompt",
+            "Message 3",
+            "Message 4",
+        ]
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that the least recently updated conversation is evicted first."""
+        store = self._store(tmp_path / "conversations.db", max_conversations=2)
+        first = store.create_conversation()
+        second = store.create_conversation()
+        first.add_message("user", "Keep me")
+
+        store.create_conversation()
+
+        assert store.get_conversation(second.conversation_id) is None
+        assert store.get_conversation(first.conversation_id) is not None
+        assert store.get_metrics()["evictions"] == 1
+        assert store.get_metrics()["size"] == 2
+
+    def test_expiry_and_cleanup(self, tmp_path: Path) -> None:
+        """Test that expired conversations are removed on access and cleanup."""
+        store = self._store(tmp_path / "conversations.db", ttl=60)
+        accessed = store.create_conversation()
+        swept = store.create_conversation()
+        active = store.create_conversation()
+
+        connection = sqlite3.connect(tmp_path / "conversations.db")
+        with connection:
+            connection.execute(
+                "UPDATE conversations SET updated_at = ? WHERE conversation_id IN (?, ?)",
+                (time.time() - 120, accessed.conversation_id, swept.conversation_id),
+            )
+        connection.close()
+
+        assert store.get_conversation(accessed.conversation_id) is None
+        assert store.cleanup_expired() == 1
+        assert store.get_conversation(active.conversation_id) is not None
+        assert store.get_metrics()["expirations"] == 2
+
+    def test_delete_conversation(self, tmp_path: Path) -> None:
+        """Test deleting existing and missing conversations."""
+        store = self._store(tmp_path / "conversations.db")
+        conversation = store.create_conversation()
+        conversation.add_message("user", "Hello")
+
+        assert store.delete_conversation(conversation.conversation_id) is True
+        assert store.delete_conversation(conversation.conversation_id) is False
+        assert store.get_conversation(conversation.conversation_id) is None
+
+    def test_concurrent_appends(self, tmp_path: Path) -> None:
+        """Test that appends from several threads are all persisted."""
+        store = self._store(tmp_path / "conversations.db", max_messages=1000)
+        conversation = store.create_conversation()
+
+        def append_many(worker: int) -> None:
+            loaded = store.get_conversation(conversation.conversation_id)
+            assert loaded is not None
+            for i in range(25):
+                loaded.add_message("user", f"{worker}-{i}")
+
+        threads = [
+            threading.Thread(target=append_many, args=(worker,)) for worker in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        loaded = store.get_conversation(conversation.conversation_id)
+        assert loaded is not None
+        assert len(loaded.get_messages()) == 100
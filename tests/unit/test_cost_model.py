@@ -0,0 +1,114 @@
+"""
+Unit tests for the batch job cost model.
+
+Tests the cost model module, focusing on:
+- Estimating landmark costs from chunk counts, PDF sizes and defaults
+- Reading history from the run manifest
+- Balancing landmarks into jobs of similar cost
+"""
+
+from pathlib import Path
+
+import pytest
+
+from nyc_landmarks.pipeline.cost_model import (
+    LANDMARK_OVERHEAD,
+    CostModel,
+    LandmarkSource,
+    balance_jobs,
+    merge_sources,
+    sources_from_catalog,
+    sources_from_manifest,
+)
+from nyc_landmarks.pipeline.manifest import RunManifest
+
+
+class TestCostModel:
+    """Test per-landmark cost estimates."""
+
+    def test_pdf_size_is_calibrated_on_known_chunk_counts(self) -> None:
+        """Test that PDF sizes are converted with the observed bytes per chunk."""
+        model = CostModel(
+            [
+                LandmarkSource("LP-00001", chunks=10, pdf_bytes=1_000_000),
+                LandmarkSource("LP-00002", pdf_bytes=3_000_000),
+            ]
+        )
+
+        assert model.cost("LP-00001") == LANDMARK_OVERHEAD + 10
+        assert model.cost("LP-00002") == LANDMARK_OVERHEAD + 30
+
+    def test_landmarks_without_pdf_cost_only_overhead(self) -> None:
+        """Test that landmarks without a PDF report are cheap."""
+        model = CostModel([LandmarkSource("LP-00001", has_pdf=False)])
+
+        assert model.cost("LP-00001") == LANDMARK_OVERHEAD
+
+    def test_unknown_landmarks_use_median(self) -> None:
+        """Test that landmarks without history cost the median known landmark."""
+        model = CostModel(
+            [
+                LandmarkSource("LP-00001", chunks=2),
+                LandmarkSource("LP-00002", chunks=4),
+                LandmarkSource("LP-00003", chunks=90),
+                LandmarkSource("LP-00004"),
+            ]
+        )
+
+        assert model.cost("LP-00004") == LANDMARK_OVERHEAD + 4
+
+
+class TestCostSources:
+    """Test collecting landmark sources from catalogs and the manifest."""
+
+    def test_manifest_history_completes_catalog(self, tmp_path: Path) -> None:
+        """Test that catalog landmarks get chunk counts and sizes of earlier runs."""
+        manifest = RunManifest(tmp_path / "manifest.db")
+        manifest.record("LP-00001", "store", "a", details={"vectors": 12})
+        manifest.record("LP-00001", "download", "b", details={"bytes": 600_000})
+        manifest.record("LP-00009", "store", "c", details={"vectors": 3})
+
+        catalog = sources_from_catalog(
+            [
+                {"lpNumber": "LP-00001", "pdfReportUrl": "https://example.com/1.pdf"},
+                {"id": "LP-00002", "pdf_url": ""},
+            ]
+        )
+        sources = merge_sources(catalog, sources_from_manifest(manifest))
+
+        assert [s.landmark_id for s in sources] == ["LP-00001", "LP-00002"]
+        assert (sources[0].chunks, sources[0].pdf_bytes) == (12, 600_000)
+        assert not sources[1].has_pdf
+
+    def test_empty_catalog_uses_recorded_landmarks(self, tmp_path: Path) -> None:
+        """Test that the manifest alone defines the landmarks without a catalog."""
+        manifest = RunManifest(tmp_path / "manifest.db")
+        manifest.record("LP-00001", "store", "a", details={"vectors": 12})
+
+        sources = merge_sources([], sources_from_manifest(manifest))
+
+        assert [(s.landmark_id, s.chunks) for s in sources] == [("LP-00001", 12)]
+
+
+class TestBalanceJobs:
+    """Test bin-packing landmarks into jobs."""
+
+    def test_expensive_landmarks_are_spread(self) -> None:
+        """Test that jobs end up with similar total costs."""
+        costs = {"LP-00001": 100.0, "LP-00002": 60.0, "LP-00003": 40.0}
+        costs.update({f"LP-01{i:03d}": 2.0 for i in range(50)})
+
+        jobs = balance_jobs(costs, 2)
+
+        assert sorted(job.cost for job in jobs) == [150.0, 150.0]
+        assert sum(len(job.landmark_ids) for job in jobs) == len(costs)
+        assert all(job.landmark_ids == sorted(job.landmark_ids) for job in jobs)
+
+    def test_no_more_jobs_than_landmarks(self) -> None:
+        """Test that empty jobs are not created."""
+        assert len(balance_jobs({"LP-00001": 1.0}, 4)) == 1
+
+    def test_jobs_must_be_positive(self) -> None:
+        """Test that a non-positive job count is rejected."""
+        with pytest.raises(ValueError):
+            balance_jobs({"LP-00001": 1.0}, 0)
@@ -0,0 +1,137 @@
+"""
+Unit tests for the embedding micro-batcher.
+
+Tests the EmbeddingBatcher class, focusing on:
+- Coalescing submissions of many workers into shared requests
+- Batch size, token budget and max-wait limits
+- Error propagation to the submitting workers
+"""
+
+import threading
+from typing import List, cast
+
+import pytest
+
+from nyc_landmarks.embeddings.batcher import EmbeddingBatcher
+from nyc_landmarks.embeddings.generator import EmbeddingGenerator
+
+
+class FakeGenerator:
+    """Embedding generator recording the texts of each request."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: List[List[str]] = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def generate_embeddings_batch(
+        self, texts: List[str], batch_size: int = 20
+    ) -> List[List[float]]:
+        with self._lock:
+            self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Test coalescing of embedding requests."""
+
+    def test_submissions_share_one_request(self) -> None:
+        """Test that pending submissions are sent together, in order."""
+        generator = FakeGenerator()
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, generator), batch_size=100, max_wait=0.2
+        )
+
+        futures = [batcher.submit(["a" * n, "b" * n]) for n in (1, 2, 3)]
+        results = [future.result(timeout=5) for future in futures]
+        batcher.close()
+
+        assert results == [[[1.0], [1.0]], [[2.0], [2.0]], [[3.0], [3.0]]]
+        assert len(generator.calls) == 1
+        assert batcher.stats.api_calls == 1
+        assert batcher.stats.requests == 3
+
+    def test_batch_size_splits_requests(self) -> None:
+        """Test that a submission larger than a batch spans several requests."""
+        generator = FakeGenerator()
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, generator), batch_size=2, max_wait=0.2
+        )
+
+        embeddings = batcher.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+        batcher.close()
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert sorted(len(call) for call in generator.calls) == [1, 2, 2]
+
+    def test_token_budget_limits_requests(self) -> None:
+        """Test that long texts are split by the estimated token budget."""
+        generator = FakeGenerator()
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, generator),
+            batch_size=100,
+            max_wait=0.2,
+            max_batch_tokens=1000,
+        )
+
+        batcher.embed(["x" * 2400] * 3)  # About 800 tokens each
+        batcher.close()
+
+        assert [len(call) for call in generator.calls] == [1, 1, 1]
+
+    def test_partial_batch_sent_after_max_wait(self) -> None:
+        """Test that a lone submission does not wait for a full batch."""
+        generator = FakeGenerator()
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, generator), batch_size=100, max_wait=0.01
+        )
+
+        assert batcher.submit(["a"]).result(timeout=5) == [[1.0]]
+        batcher.close()
+
+    def test_concurrent_workers_coalesce(self) -> None:
+        """Test that submissions from several threads share requests."""
+        generator = FakeGenerator()
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, generator), batch_size=100, max_wait=0.5
+        )
+        results: List[List[List[float]]] = []
+
+        def worker(n: int) -> None:
+            results.append(batcher.embed(["x" * n] * 3))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+
+        assert len(results) == 8
+        assert sum(len(call) for call in generator.calls) == 24
+        assert len(generator.calls) < 8
+
+    def test_failure_reaches_every_submission(self) -> None:
+        """Test that a failed request fails the futures of its texts."""
+        batcher = EmbeddingBatcher(
+            cast(EmbeddingGenerator, FakeGenerator(fail=True)), max_wait=0.2
+        )
+
+        futures = [batcher.submit(["a"]), batcher.submit(["b"])]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="rate limited"):
+                future.result(timeout=5)
+        batcher.close()
+
+        assert batcher.stats.failed_calls == 1
+
+    def test_closed_batcher_rejects_submissions(self) -> None:
+        """Test that submitting after close raises."""
+        batcher = EmbeddingBatcher(cast(EmbeddingGenerator, FakeGenerator()))
+        batcher.close()
+
+        assert batcher.submit([]).result() == []
+        with pytest.raises(RuntimeError):
+            batcher.submit(["a"])
@@ -0,0 +1,214 @@
+"""
+Unit tests for the local BM25 index and hybrid search.
+
+Tests the lexical_index module and reciprocal rank fusion, focusing on:
+- BM25 ranking of exact-match terms such as LP numbers
+- Incremental upserts and deletes before and after saving
+- Saving and reloading the memory-mapped posting arrays
+- Following writes made through PineconeDB
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import numpy as np
+
+from nyc_landmarks.vectordb.lexical_index import (
+    LexicalIndex,
+    build_lexical_index,
+    tokenize,
+)
+from nyc_landmarks.vectordb.local_vector_db import LocalVectorDB
+from nyc_landmarks.vectordb.pinecone_db import VectorWrite
+from nyc_landmarks.vectordb.reranking import query_hybrid, reciprocal_rank_fusion
+
+
+def _chunk(vector_id: str, text: str, **metadata: Any) -> Dict[str, Any]:
+    """Vector in the upsert format with chunk text metadata."""
+    return {"id": vector_id, "metadata": {"text": text, **metadata}}
+
+
+def _corpus() -> List[Dict[str, Any]]:
+    """Chunks of three landmarks."""
+    return [
+        _chunk(
+            "LP-00001-chunk-0",
+            "Wyckoff House is the oldest house in New York City",
+            landmark_id="LP-00001",
+        ),
+        _chunk(
+            "LP-00002-chunk-0",
+            "The Tweed Courthouse on Chambers Street was designed by John Kellum",
+            landmark_id="LP-00002",
+        ),
+        _chunk(
+            "LP-00003-chunk-0",
+            "A Beaux-Arts house of limestone on Fifth Avenue",
+            landmark_id="LP-00003",
+            architect="Warren & Wetmore",
+        ),
+    ]
+
+
+class TestLexicalSearch:
+    """Test BM25 search."""
+
+    def test_tokenize_keeps_identifiers_whole(self) -> None:
+        """Test that LP numbers and hyphenated words stay single tokens."""
+        assert tokenize("See LP-00001, Beaux-Arts!") == [
+            "see",
+            "lp-00001",
+            "beaux-arts",
+        ]
+
+    def test_exact_match_ranks_first(self) -> None:
+        """Test that LP numbers, names and architect fields are matched."""
+        index = LexicalIndex()
+        index.upsert(_corpus())
+
+        assert index.search("LP-00002")[0]["id"] == "LP-00002-chunk-0"
+        assert index.search("Kellum courthouse")[0]["id"] == "LP-00002-chunk-0"
+        assert index.search("Wetmore")[0]["id"] == "LP-00003-chunk-0"
+        assert index.search("unrelated") == []
+
+    def test_rare_terms_weigh_more(self) -> None:
+        """Test that a rare term outranks a term shared by several chunks."""
+        index = LexicalIndex()
+        index.upsert(_corpus())
+
+        results = index.search("house limestone")
+
+        assert results[0]["id"] == "LP-00003-chunk-0"
+        assert [r["id"] for r in results][1:] == ["LP-00001-chunk-0"]
+
+    def test_search_applies_metadata_filter(self) -> None:
+        """Test that results are restricted by a metadata filter."""
+        index = LexicalIndex()
+        index.upsert(_corpus())
+
+        results = index.search("house", filter_dict={"landmark_id": "LP-00001"})
+
+        assert [r["id"] for r in results] == ["LP-00001-chunk-0"]
+
+
+class TestIncrementalUpdates:
+    """Test incremental updates and persistence."""
+
+    def test_upsert_replaces_and_delete_removes(self) -> None:
+        """Test that replaced and deleted chunks no longer match."""
+        index = LexicalIndex()
+        index.upsert(_corpus())
+
+        index.upsert([_chunk("LP-00001-chunk-0", "A Dutch farmhouse in Brooklyn")])
+        index.delete(["LP-00002-chunk-0"])
+
+        assert index.search("oldest") == []
+        assert index.search("Kellum") == []
+        assert index.search("farmhouse")[0]["id"] == "LP-00001-chunk-0"
+        assert len(index) == 2
+
+    def test_save_and_reload(self, tmp_path: Path) -> None:
+        """Test that a saved index reloads with memory-mapped postings."""
+        path = str(tmp_path / "lexical")
+        index = LexicalIndex(path)
+        index.upsert(_corpus())
+        index.delete(["LP-00003-chunk-0"])
+        index.save()
+
+        reloaded = LexicalIndex(path)
+
+        assert reloaded.generation == index.generation
+        assert isinstance(reloaded._term_freqs, np.memmap)
+        assert len(reloaded) == 2
+        assert reloaded.search("Kellum")[0]["id"] == "LP-00002-chunk-0"
+        assert reloaded.search("limestone") == []
+
+    def test_updates_after_save_merge_with_saved_postings(self, tmp_path: Path) -> None:
+        """Test that changes after a save combine with the saved segment."""
+        path = str(tmp_path / "lexical")
+        index = LexicalIndex(path)
+        index.upsert(_corpus())
+        index.save()
+
+        index.upsert([_chunk("LP-00004-chunk-0", "Another house by John Kellum")])
+        index.delete(["LP-00002-chunk-0"])
+
+        assert [r["id"] for r in index.search("Kellum")] == ["LP-00004-chunk-0"]
+        index.save()
+        assert [r["id"] for r in LexicalIndex(path).search("Kellum")] == [
+            "LP-00004-chunk-0"
+        ]
+
+    def test_refresh_loads_new_generation(self, tmp_path: Path) -> None:
+        """Test that a reader picks up a generation saved by another writer."""
+        path = str(tmp_path / "lexical")
+        reader = LexicalIndex(path)
+        writer = LexicalIndex(path)
+        writer.upsert(_corpus())
+        writer.save()
+
+        assert reader.maybe_refresh(0) is True
+        assert reader.search("Wyckoff")[0]["id"] == "LP-00001-chunk-0"
+        assert reader.maybe_refresh(0) is False
+
+
+class TestVectorWrites:
+    """Test following vector writes."""
+
+    def test_apply_follows_writes_of_its_namespace(self) -> None:
+        """Test that upserts, deletes and clears are applied per namespace."""
+        index = LexicalIndex(namespace="landmarks")
+
+        index.apply(VectorWrite(namespace="landmarks", upserted=_corpus()))
+        index.apply(VectorWrite(namespace="other", upserted=[_chunk("x", "Kellum")]))
+        index.apply(
+            VectorWrite(
+                namespace="landmarks", deleted_filter={"landmark_id": "LP-00001"}
+            )
+        )
+
+        assert len(index) == 2
+        assert [r["id"] for r in index.search("Kellum")] == ["LP-00002-chunk-0"]
+
+        index.apply(VectorWrite(namespace="", cleared=True))
+        assert len(index) == 0
+
+    def test_build_from_vector_db(self, tmp_path: Path) -> None:
+        """Test that the index is rebuilt from a vector database listing."""
+        source = LocalVectorDB(path="")
+        source.upsert_vectors(
+            [{**chunk, "values": [1.0] * source.dimensions} for chunk in _corpus()]
+        )
+        index = LexicalIndex(str(tmp_path / "lexical"), namespace=source.namespace)
+
+        assert build_lexical_index(source, index) == 3
+        assert index.search("Wyckoff")[0]["id"] == "LP-00001-chunk-0"
+
+
+class TestHybridSearch:
+    """Test reciprocal rank fusion of dense and lexical rankings."""
+
+    def test_reciprocal_rank_fusion(self) -> None:
+        """Test that matches ranked by both lists come first."""
+        dense = [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}]
+        lexical = [{"id": "b", "score": 12.0}, {"id": "c", "score": 3.0}]
+
+        fused = reciprocal_rank_fusion([dense, lexical], k=60)
+
+        assert [m["id"] for m in fused] == ["b", "a", "c"]
+        assert fused[0]["score"] == 1 / 62 + 1 / 61
+
+    def test_query_hybrid_adds_lexical_matches(self) -> None:
+        """Test that exact matches missed by dense search are returned."""
+        index = LexicalIndex()
+        index.upsert(_corpus())
+        vector_db = Mock()
+        vector_db.query_vectors.return_value = [
+            {"id": "LP-00001-chunk-0", "score": 0.8, "metadata": {}},
+        ]
+
+        results = query_hybrid(vector_db, index, "LP-00002", [0.1, 0.2], top_k=2)
+
+        assert {m["id"] for m in results} == {"LP-00001-chunk-0", "LP-00002-chunk-0"}
+        assert vector_db.query_vectors.call_args.kwargs["top_k"] == 6
@@ -0,0 +1,299 @@
+"""
+Unit tests for the in-process vector store.
+
+Tests LocalIndex and LocalVectorDB, focusing on:
+- Cosine top-k ordering
+- Pinecone metadata filter operators
+- Fetch, delete and ID-prefix listing
+- Persistence to disk
+- PineconeDB operations running against the local index
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.vectordb.local_vector_db import LocalIndex, LocalVectorDB
+
+
+def _index_with_landmarks() -> LocalIndex:
+    index = LocalIndex(dimension=3)
+    index.upsert(
+        vectors=[
+            {
+                "id": "LP-00001-chunk-0",
+                "values": [1.0, 0.0, 0.0],
+                "metadata": {
+                    "landmark_id": "LP-00001",
+                    "source_type": "pdf",
+                    "year": 1930,
+                    "building_names": ["Chrysler Building"],
+                },
+            },
+            {
+                "id": "wiki-LP-00002-chunk-0",
+                "values": [0.8, 0.6, 0.0],
+                "metadata": {
+                    "landmark_id": "LP-00002",
+                    "source_type": "wikipedia",
+                    "year": 1931,
+                },
+            },
+            {
+                "id": "LP-00003-chunk-0",
+                "values": [0.0, 0.0, 1.0],
+                "metadata": {"landmark_id": "LP-00003", "source_type": "pdf"},
+            },
+        ]
+    )
+    return index
+
+
+def _query_ids(index: LocalIndex, filter_dict: Dict[str, Any]) -> List[str]:
+    response = index.query(vector=[1.0, 0.0, 0.0], top_k=10, filter=filter_dict)
+    return sorted(match.id for match in response.matches)
+
+
+def _embedding(*coordinates: float) -> List[float]:
+    """Embedding with the given leading coordinates and zeros elsewhere."""
+    vector = np.zeros(settings.PINECONE_DIMENSIONS)
+    vector[: len(coordinates)] = coordinates
+    return vector.tolist()
+
+
+class TestLocalIndex:
+    """Test the Pinecone-compatible LocalIndex."""
+
+    def test_query_orders_by_cosine_similarity(self) -> None:
+        """Test that matches are returned by descending cosine similarity."""
+        index = _index_with_landmarks()
+
+        response = index.query(vector=[2.0, 0.0, 0.0], top_k=2, include_metadata=True)
+
+        assert [match.id for match in response.matches] == [
+            "LP-00001-chunk-0",
+            "wiki-LP-00002-chunk-0",
+        ]
+        assert response.matches[0].score == pytest.approx(1.0)
+        assert response.matches[1].score == pytest.approx(0.8)
+        metadata = response.matches[0].metadata
+        assert metadata is not None and metadata["landmark_id"] == "LP-00001"
+
+    def test_upsert_overwrites_existing_ids(self) -> None:
+        """Test that upserting an existing ID replaces its vector and metadata."""
+        index = _index_with_landmarks()
+        index.upsert(
+            vectors=[("LP-00003-chunk-0", [1.0, 0.0, 0.0], {"landmark_id": "LP-9"})]
+        )
+
+        stats = index.describe_index_stats()
+        assert stats.total_vector_count == 3
+        top = index.query(vector=[1.0, 0.0, 0.0], top_k=3).matches
+        assert top[0].score == pytest.approx(1.0) and top[1].score == pytest.approx(1.0)
+        assert index.fetch(ids=["LP-00003-chunk-0"]).vectors[
+            "LP-00003-chunk-0"
+        ].metadata == {"landmark_id": "LP-9"}
+
+    def test_rejects_wrong_dimension(self) -> None:
+        """Test that vectors of the wrong dimension are rejected."""
+        index = LocalIndex(dimension=3)
+        with pytest.raises(ValueError):
+            index.upsert(vectors=[("a", [1.0, 0.0], {})])
+
+    @pytest.mark.parametrize(
+        "filter_dict, expected",
+        [
+            ({"source_type": "pdf"}, ["LP-00001-chunk-0", "LP-00003-chunk-0"]),
+            ({"source_type": {"$ne": "pdf"}}, ["wiki-LP-00002-chunk-0"]),
+            ({"year": {"$gt": 1930}}, ["wiki-LP-00002-chunk-0"]),
+            (
+                {"year": {"$gte": 1930, "$lt": 1932}},
+                ["LP-00001-chunk-0", "wiki-LP-00002-chunk-0"],
+            ),
+            ({"year": {"$lte": 1930}}, ["LP-00001-chunk-0"]),
+            (
+                {"landmark_id": {"$in": ["LP-00001", "LP-00003"]}},
+                ["LP-00001-chunk-0", "LP-00003-chunk-0"],
+            ),
+            (
+                {"landmark_id": {"$nin": ["LP-00001", "LP-00003"]}},
+                ["wiki-LP-00002-chunk-0"],
+            ),
+            ({"year": {"$exists": False}}, ["LP-00003-chunk-0"]),
+            ({"building_names": "Chrysler Building"}, ["LP-00001-chunk-0"]),
+            (
+                {"$or": [{"landmark_id": "LP-00001"}, {"year": 1931}]},
+                ["LP-00001-chunk-0", "wiki-LP-00002-chunk-0"],
+            ),
+            (
+                {"$and": [{"source_type": "pdf"}, {"year": {"$exists": True}}]},
+                ["LP-00001-chunk-0"],
+            ),
+        ],
+    )
+    def test_metadata_filters(
+        self, filter_dict: Dict[str, Any], expected: List[str]
+    ) -> None:
+        """Test the supported Pinecone filter operators."""
+        assert _query_ids(_index_with_landmarks(), filter_dict) == expected
+
+    def test_unsupported_filter_operator(self) -> None:
+        """Test that unknown filter operators raise an error."""
+        with pytest.raises(ValueError):
+            _query_ids(_index_with_landmarks(), {"year": {"$regex": "19"}})
+
+    def test_delete_by_id_and_filter(self) -> None:
+        """Test deleting vectors by ID and by metadata filter."""
+        index = _index_with_landmarks()
+
+        index.delete(ids=["LP-00001-chunk-0", "missing"])
+        assert _query_ids(index, {}) == ["LP-00003-chunk-0", "wiki-LP-00002-chunk-0"]
+
+        index.delete(filter={"source_type": "wikipedia"})
+        assert _query_ids(index, {}) == ["LP-00003-chunk-0"]
+        assert index.fetch(ids=["LP-00003-chunk-0"]).vectors[
+            "LP-00003-chunk-0"
+        ].values == [0.0, 0.0, 1.0]
+
+    def test_list_paginated_by_prefix(self) -> None:
+        """Test listing IDs by prefix across pages."""
+        index = LocalIndex(dimension=2)
+        index.upsert(
+            vectors=[(f"wiki-LP-{i:05d}-chunk-0", [1.0, 0.0], {}) for i in range(5)]
+            + [("LP-00001-chunk-0", [0.0, 1.0], {})]
+        )
+
+        first = index.list_paginated(prefix="wiki-", limit=3)
+        assert [item.id for item in first.vectors] == [
+            f"wiki-LP-{i:05d}-chunk-0" for i in range(3)
+        ]
+        assert first.pagination is not None
+
+        second = index.list_paginated(
+            prefix="wiki-", limit=3, pagination_token=first.pagination.next
+        )
+        assert len(second.vectors) == 2
+        assert second.pagination is None
+        assert sum(len(page) for page in index.list(prefix="wiki-", limit=2)) == 5
+
+    def test_namespaces_are_isolated(self) -> None:
+        """Test that vectors in different namespaces don't mix."""
+        index = LocalIndex(dimension=2)
+        index.upsert(vectors=[("a", [1.0, 0.0], {})], namespace="one")
+        index.upsert(vectors=[("b", [1.0, 0.0], {})])
+
+        assert [
+            m.id
+            for m in index.query(vector=[1.0, 0.0], top_k=5, namespace="one").matches
+        ] == ["a"]
+        assert [m.id for m in index.query(vector=[1.0, 0.0], top_k=5).matches] == ["b"]
+        assert index.describe_index_stats().namespaces == {
+            "one": {"vector_count": 1},
+            "": {"vector_count": 1},
+        }
+
+    def test_persistence_round_trip(self, tmp_path: Path) -> None:
+        """Test that saved namespaces are loaded by a new index."""
+        index = _index_with_landmarks()
+        index.path = tmp_path
+        index.upsert(vectors=[("other", [0.0, 1.0, 0.0], {"x": 1})], namespace="ns")
+        index.save()
+
+        reloaded = LocalIndex(dimension=3, path=str(tmp_path))
+
+        assert _query_ids(reloaded, {}) == _query_ids(index, {})
+        assert reloaded.fetch(ids=["other"], namespace="ns").vectors[
+            "other"
+        ].metadata == {"x": 1}
+        assert reloaded.query(vector=[1.0, 0.0, 0.0], top_k=1).matches[
+            0
+        ].score == pytest.approx(1.0)
+
+
+class TestLocalVectorDB:
+    """Test PineconeDB operations against the local index."""
+
+    @staticmethod
+    def _db(tmp_path: Path) -> LocalVectorDB:
+        db = LocalVectorDB(path=str(tmp_path / "index"))
+        db.store_chunks(
+            chunks=[
+                {"text": "Chrysler Building spire", "embedding": _embedding(1.0)},
+                {"text": "Chrysler Building lobby", "embedding": _embedding(0.6, 0.8)},
+            ],
+            id_prefix="",
+            landmark_id="LP-00001",
+            enhanced_metadata={},
+        )
+        db.store_chunks(
+            chunks=[{"text": "Empire State Building", "embedding": _embedding(0, 1.0)}],
+            id_prefix="wiki-Empire_State_Building-",
+            landmark_id="LP-00002",
+            enhanced_metadata={},
+        )
+        return db
+
+    def test_store_and_query(self, tmp_path: Path) -> None:
+        """Test semantic queries with PineconeDB filters."""
+        db = self._db(tmp_path)
+
+        matches = db.query_vectors(query_vector=_embedding(1.0), top_k=2)
+        assert [m["metadata"]["text"] for m in matches] == [
+            "Chrysler Building spire",
+            "Chrysler Building lobby",
+        ]
+
+        wiki = db.query_vectors(
+            query_vector=_embedding(1.0), top_k=5, source_type="wikipedia"
+        )
+        assert [m["metadata"]["landmark_id"] for m in wiki] == ["LP-00002"]
+
+    def test_listing_and_fetch(self, tmp_path: Path) -> None:
+        """Test listing vectors with a zero vector and fetching by ID."""
+        db = self._db(tmp_path)
+
+        listed = db.query_vectors(top_k=10, landmark_id="LP-00001")
+        assert len(listed) == 2
+
+        vector = db.fetch_vector_by_id(listed[0]["id"])
+        assert vector is not None
+        assert vector["metadata"]["landmark_id"] == "LP-00001"
+
+    def test_delete_and_persist(self, tmp_path: Path) -> None:
+        """Test that deletions are persisted for the next instance."""
+        db = self._db(tmp_path)
+        db.delete_vectors_by_filter({"landmark_id": "LP-00001"})
+
+        reloaded = LocalVectorDB(path=str(tmp_path / "index"))
+
+        assert reloaded.get_index_stats()["total_vector_count"] == 1
+        assert reloaded.query_vectors(top_k=10, landmark_id="LP-00001") == []
+
+    def test_recreate_index(self, tmp_path: Path) -> None:
+        """Test that recreating the index removes every vector."""
+        db = self._db(tmp_path)
+
+        assert db.recreate_index() is True
+        assert db.get_index_stats()["total_vector_count"] == 0
+        assert not (tmp_path / "index").exists()
+
+    def test_prefix_listing_is_exact(self, tmp_path: Path) -> None:
+        """Test that prefix listings return every matching vector in ID order."""
+        db = LocalVectorDB(path="")
+        db.upsert_vectors(
+            [
+                {"id": f"{prefix}-{i:04d}", "values": _embedding(1.0), "metadata": {}}
+                for prefix in ("LP-00001-chunk", "wiki-A-LP-00001-chunk")
+                for i in range(300)
+            ]
+        )
+
+        listed = db.list_vectors(limit=1000, id_prefix="wiki-A-")
+        streamed = [v["id"] for v in db.iter_vectors(id_prefix="LP-", page_size=40)]
+
+        assert len(listed) == 300
+        assert all(v["id"].startswith("wiki-A-") for v in listed)
+        assert streamed == [f"LP-00001-chunk-{i:04d}" for i in range(300)]
@@ -11,9 +11,12 @@ Tests the core vector database operations, focusing on:
 
 import os
 import unittest
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from unittest.mock import Mock, patch
 
+from pinecone.exceptions import PineconeApiException
+
+from nyc_landmarks.config.settings import settings
 from nyc_landmarks.vectordb.pinecone_db import PineconeDB
 
 # Constants
@@ -500,6 +503,30 @@ class TestPineconeDBVectorOperations(unittest.TestCase):
         # Should be called 3 times (max retries)
         self.assertEqual(self.mock_index.upsert.call_count, 3)
 
+    def test_upsert_vectors_parallel(self) -> None:
+        """Test parallel batch upserts and the stored count."""
+        vectors = [
+            {"id": f"test-{i}", "values": [0.1], "metadata": {"index": i}}
+            for i in range(250)
+        ]
+
+        def upsert(vectors: List[Any], namespace: Optional[str]) -> None:
+            # The last batch (50 vectors) always fails
+            if len(vectors) == 50:
+                raise Exception("Persistent error")
+
+        self.mock_index.upsert.side_effect = upsert
+
+        stored = self.db.upsert_vectors(
+            vectors, namespace="backup", batch_size=100, max_workers=3
+        )
+
+        self.assertEqual(stored, 200)
+        # 2 successful batches + 3 attempts for the failing one
+        self.assertEqual(self.mock_index.upsert.call_count, 5)
+        for call in self.mock_index.upsert.call_args_list:
+            self.assertEqual(call.kwargs["namespace"], "backup")
+
     @patch("nyc_landmarks.vectordb.pinecone_db.EnhancedMetadataCollector")
     def test_store_chunks_basic(self, mock_collector_class: Mock) -> None:
         """Test basic chunk storage functionality."""
@@ -589,6 +616,17 @@ class TestPineconeDBVectorOperations(unittest.TestCase):
         # Should be called 3 times due to batching (100, 100, 50)
         self.assertEqual(self.mock_index.delete.call_count, 3)
 
+    def test_delete_vectors_uses_instance_namespace(self) -> None:
+        """Test that deletes target the namespace vectors are stored in."""
+        self.db.namespace = "landmarks"
+
+        self.db.delete_vectors(["test-0"])
+        self.db.delete_vectors_by_filter({"landmark_id": "landmark123"})
+
+        for delete in self.mock_index.delete.call_args_list:
+            self.assertEqual(delete.kwargs["namespace"], "landmarks")
+        self.assertEqual(self.mock_index.delete.call_count, 2)
+
     def test_delete_vectors_empty_list(self) -> None:
         """Test deletion with empty vector list."""
         result = self.db.delete_vectors([])
@@ -604,7 +642,9 @@ class TestPineconeDBVectorOperations(unittest.TestCase):
         result = self.db.delete_vectors_by_filter(filter_dict)
 
         self.assertEqual(result, 1)  # Returns 1 as approximate count
-        self.mock_index.delete.assert_called_once_with(filter=filter_dict)
+        self.mock_index.delete.assert_called_once_with(
+            filter=filter_dict, namespace=self.db.namespace
+        )
 
     def test_delete_vectors_by_filter_failure(self) -> None:
         """Test deletion by filter with failure."""
@@ -777,5 +817,261 @@ class TestPineconeDBIndexOperations(unittest.TestCase):
         self.mock_pc.create_index.assert_not_called()
 
 
+class TestPineconeDBListing(unittest.TestCase):
+    """Test listing vectors with native ID pagination."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.mock_pc = Mock()
+        self.mock_index = Mock()
+
+        with patch("nyc_landmarks.vectordb.pinecone_db.Pinecone") as mock_pinecone:
+            mock_pinecone.return_value = self.mock_pc
+            self.mock_pc.Index.return_value = self.mock_index
+            self.db = PineconeDB(index_name="test-index")
+
+        # Two pages of IDs: wiki-A-0..2, then wiki-A-3..4
+        ids = [f"wiki-A-chunk-{i}" for i in range(5)]
+        self.mock_index.list_paginated.side_effect = [
+            Mock(vectors=[Mock(id=i) for i in ids[:3]], pagination=Mock(next="tok")),
+            Mock(vectors=[Mock(id=i) for i in ids[3:]], pagination=None),
+        ]
+        self.mock_index.fetch.side_effect = lambda ids, namespace: Mock(
+            vectors={
+                vector_id: Mock(
+                    values=[0.1],
+                    metadata={
+                        "landmark_id": "LP-00001",
+                        "chunk_index": int(vector_id[-1]),
+                    },
+                )
+                for vector_id in ids
+            }
+        )
+
+    def test_iter_vectors_paginates_and_fetches_in_batches(self) -> None:
+        """Test that listing follows pagination tokens with one fetch per page."""
+        vectors = list(self.db.iter_vectors(id_prefix="wiki-A", page_size=3))
+
+        self.assertEqual(
+            [v["id"] for v in vectors], [f"wiki-A-chunk-{i}" for i in range(5)]
+        )
+        self.assertNotIn("values", vectors[0])
+        self.assertEqual(self.mock_index.fetch.call_count, 2)
+        second_page = self.mock_index.list_paginated.call_args_list[1]
+        self.assertEqual(second_page.kwargs["pagination_token"], "tok")
+        self.assertEqual(second_page.kwargs["prefix"], "wiki-A")
+        self.mock_index.query.assert_not_called()
+
+    def test_iter_vectors_applies_metadata_filter_and_limit(self) -> None:
+        """Test that fetched metadata is filtered and the limit stops paging."""
+        vectors = list(
+            self.db.iter_vectors(
+                id_prefix="wiki-A",
+                filter_dict={"chunk_index": {"$gte": 1}},
+                include_values=True,
+                limit=2,
+            )
+        )
+
+        self.assertEqual(
+            [v["id"] for v in vectors], ["wiki-A-chunk-1", "wiki-A-chunk-2"]
+        )
+        self.assertEqual(vectors[0]["values"], [0.1])
+        self.assertEqual(self.mock_index.list_paginated.call_count, 1)
+
+    def test_list_vectors_with_prefix_uses_id_listing(self) -> None:
+        """Test that prefix listings are exact instead of zero-vector queries."""
+        vectors = self.db.list_vectors(limit=10, id_prefix="wiki-A")
+
+        self.assertEqual(len(vectors), 5)
+        self.mock_index.query.assert_not_called()
+
+    def test_prefix_listing_is_case_sensitive(self) -> None:
+        """Test that an exact-case prefix only returns the listed IDs."""
+        self.mock_index.list_paginated.side_effect = [
+            Mock(vectors=[Mock(id="wiki-A-chunk-0")], pagination=None)
+        ]
+
+        vectors = self.db.list_vectors(limit=10, id_prefix="wiki-A")
+
+        self.assertEqual([v["id"] for v in vectors], ["wiki-A-chunk-0"])
+        self.mock_index.query.assert_not_called()
+
+    def test_prefix_without_exact_matches_is_case_insensitive(self) -> None:
+        """Test that a prefix in another case falls back to the query listing."""
+        self.mock_index.list_paginated.side_effect = [Mock(vectors=[], pagination=None)]
+        matches = [
+            Mock(id="wiki-A-chunk-0", score=0.0, metadata={}),
+            Mock(id="wiki-B-chunk-0", score=0.0, metadata={}),
+        ]
+        self.mock_index.query.return_value = Mock(matches=matches)
+
+        vectors = self.db.list_vectors(limit=10, id_prefix="WIKI-a")
+
+        self.assertEqual([v["id"] for v in vectors], ["wiki-A-chunk-0"])
+        self.assertEqual(
+            self.mock_index.list_paginated.call_args.kwargs["prefix"], "WIKI-a"
+        )
+        self.assertTrue(self.db._id_listing_supported)
+
+    def test_filter_only_listing_uses_query(self) -> None:
+        """Test that listings without a prefix keep the server-side filter."""
+        self.mock_index.query.return_value = Mock(matches=[])
+
+        self.db.list_vectors(limit=10, landmark_id="LP-00001")
+
+        self.mock_index.query.assert_called_once()
+        self.mock_index.list_paginated.assert_not_called()
+
+    def test_falls_back_to_query_without_id_listing(self) -> None:
+        """Test the zero-vector fallback for indexes without ID listing."""
+        self.mock_index.list_paginated.side_effect = PineconeApiException(
+            status=400, reason="Listing is not supported for pod-based indexes"
+        )
+        match = Mock(id="wiki-A-chunk-0", score=0.0, metadata={})
+        self.mock_index.query.return_value = Mock(matches=[match])
+
+        vectors = self.db.list_vectors(limit=10, id_prefix="wiki-A")
+
+        self.assertEqual([v["id"] for v in vectors], ["wiki-A-chunk-0"])
+        self.assertFalse(self.db._id_listing_supported)
+
+    def test_transient_listing_error_keeps_id_listing(self) -> None:
+        """Test that a transient listing error only falls back for one call."""
+        self.mock_index.list_paginated.side_effect = [
+            ConnectionError("connection reset"),
+            Mock(vectors=[Mock(id="wiki-A-chunk-0")], pagination=None),
+        ]
+        match = Mock(id="wiki-A-chunk-0", score=0.0, metadata={})
+        self.mock_index.query.return_value = Mock(matches=[match])
+        self.mock_index.fetch.return_value = Mock(
+            vectors={"wiki-A-chunk-0": Mock(metadata={}, values=[])}
+        )
+
+        self.db.list_vectors(limit=10, id_prefix="wiki-A")
+        self.assertTrue(self.db._id_listing_supported)
+        self.mock_index.query.assert_called_once()
+
+        vectors = self.db.list_vectors(limit=10, id_prefix="wiki-A")
+        self.assertEqual([v["id"] for v in vectors], ["wiki-A-chunk-0"])
+        self.mock_index.query.assert_called_once()
+
+    def test_get_indexed_landmarks_from_id_listing(self) -> None:
+        """Test that indexed landmarks come from vector IDs without fetches."""
+        self.mock_index.list_paginated.side_effect = [
+            Mock(
+                vectors=[
+                    Mock(id="LP-00001-chunk-0"),
+                    Mock(id="LP-00001-chunk-1"),
+                    Mock(id="LP-00002-chunk-0"),
+                ],
+                pagination=Mock(next="tok"),
+            ),
+            Mock(
+                vectors=[
+                    Mock(id="test-vector-1"),
+                    Mock(id="wiki-Wyckoff_House-LP-00001-chunk-0"),
+                ],
+                pagination=None,
+            ),
+        ]
+
+        indexed = self.db.get_indexed_landmarks()
+
+        self.assertEqual(
+            indexed, {"pdf": {"LP-00001", "LP-00002"}, "wikipedia": {"LP-00001"}}
+        )
+        self.mock_index.fetch.assert_not_called()
+        self.mock_index.query.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestPineconeDBBatchFetch(unittest.TestCase):
+    """Test batched multi-ID fetches with namespace resolution."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.mock_pc = Mock()
+        self.mock_index = Mock()
+
+        with patch("nyc_landmarks.vectordb.pinecone_db.Pinecone") as mock_pinecone:
+            mock_pinecone.return_value = self.mock_pc
+            self.mock_pc.Index.return_value = self.mock_index
+            self.db = PineconeDB(index_name="test-index")
+
+        # Wikipedia vectors live in "landmarks", PDF vectors in the default namespace
+        self.stored = {
+            "landmarks": {f"wiki-A-LP-00001-chunk-{i}" for i in range(250)},
+            None: {f"LP-00001-chunk-{i}" for i in range(5)},
+        }
+        self.mock_index.fetch.side_effect = lambda ids, namespace: Mock(
+            vectors={
+                vector_id: Mock(values=[0.1], metadata={"landmark_id": "LP-00001"})
+                for vector_id in ids
+                if vector_id in self.stored.get(namespace, set())
+            }
+        )
+        self.mock_index.describe_index_stats.return_value = Mock(
+            namespaces={"landmarks": {}, "": {}},
+            dimension=1536,
+            index_fullness=0.0,
+            total_vector_count=255,
+        )
+
+    def test_fetch_vectors_batches_requests(self) -> None:
+        """Test that IDs are fetched in batches from the requested namespace."""
+        ids = sorted(self.stored["landmarks"])
+
+        vectors = self.db.fetch_vectors(ids, namespace="landmarks", batch_size=100)
+
+        self.assertEqual(set(vectors), set(ids))
+        self.assertEqual(self.mock_index.fetch.call_count, 3)
+        self.mock_index.describe_index_stats.assert_not_called()
+
+    def test_fetch_vectors_resolves_and_remembers_namespaces(self) -> None:
+        """Test that missing IDs are found in other namespaces by ID prefix."""
+        ids = ["wiki-A-LP-00001-chunk-0", "LP-00001-chunk-0", "missing-1"]
+
+        vectors = self.db.fetch_vectors(ids, namespace="__default__")
+
+        self.assertEqual(set(vectors), set(ids[:2]))
+        # Default namespace, then "landmarks" for the IDs not found there
+        self.assertEqual(self.mock_index.fetch.call_count, 2)
+
+        self.mock_index.fetch.reset_mock()
+        vectors = self.db.fetch_vectors(
+            ["wiki-A-LP-00001-chunk-1", "LP-00001-chunk-1"], namespace="__default__"
+        )
+
+        self.assertEqual(len(vectors), 2)
+        namespaces = {
+            call.kwargs["namespace"] for call in self.mock_index.fetch.call_args_list
+        }
+        self.assertEqual(namespaces, {"landmarks", None})
+        self.assertEqual(self.mock_index.fetch.call_count, 2)
+        self.mock_index.describe_index_stats.assert_called_once()
+
+    def test_index_stats_cache_expires(self) -> None:
+        """Test that namespace lookups reuse index stats until the TTL passes."""
+        with patch("nyc_landmarks.vectordb.pinecone_db.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            self.db.fetch_vectors(["missing-1"])
+            self.db.fetch_vectors(["missing-2"])
+            self.assertEqual(self.mock_index.describe_index_stats.call_count, 1)
+
+            clock.return_value = 1000.0 + settings.PINECONE_INDEX_STATS_TTL
+            self.db.fetch_vectors(["missing-3"])
+            self.assertEqual(self.mock_index.describe_index_stats.call_count, 2)
+
+    def test_fetch_vector_by_id_uses_batched_fetch(self) -> None:
+        """Test that single-ID fetches share the namespace resolution."""
+        vector = self.db.fetch_vector_by_id("LP-00001-chunk-3", namespace="landmarks")
+
+        self.assertIsNotNone(vector)
+        assert vector is not None
+        self.assertEqual(vector["metadata"], {"landmark_id": "LP-00001"})
+        self.assertIsNone(self.db.fetch_vector_by_id("missing-1"))
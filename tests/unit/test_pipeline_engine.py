@@ -0,0 +1,211 @@
+"""
+Unit tests for the staged pipeline engine.
+
+Tests the StagedPipeline class, focusing on:
+- Passing items through thread and process stages
+- Batching items across sources by weight
+- Recording failures without stopping other items
+- Reporting progress as items leave the pipeline
+- Bounding the work in progress with queue backpressure
+"""
+
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+
+from nyc_landmarks.pipeline import Stage, StagedPipeline, StageKind
+
+
+class TestStagedPipeline:
+    """Test running items through stages."""
+
+    def test_items_pass_through_every_stage(self) -> None:
+        """Test that each item is transformed by each stage in order."""
+        pipeline = StagedPipeline(
+            [
+                Stage("double", lambda x: x * 2, workers=3),
+                Stage("increment", lambda x: x + 1, workers=2),
+            ]
+        )
+
+        run = pipeline.run(range(20))
+
+        assert sorted(run.results) == [x * 2 + 1 for x in range(20)]
+        assert run.failures == []
+        assert run.stages["double"].processed == 20
+        assert run.stages["increment"].processed == 20
+
+    def test_process_stage(self) -> None:
+        """Test that process stages run their function in a process pool."""
+        pipeline = StagedPipeline(
+            [Stage("abs", abs, workers=2, kind=StageKind.PROCESS)]
+        )
+
+        run = pipeline.run([-3, -2, 1])
+
+        assert sorted(run.results) == [1, 2, 3]
+
+    def test_none_drops_item(self) -> None:
+        """Test that a stage returning None drops the item."""
+        pipeline = StagedPipeline(
+            [Stage("even", lambda x: x if x % 2 == 0 else None), Stage("id", str)]
+        )
+
+        assert sorted(pipeline.run(range(6)).results) == ["0", "2", "4"]
+
+    def test_failures_are_recorded_per_item(self) -> None:
+        """Test that a failing item is reported and the others complete."""
+
+        def invert(x: int) -> float:
+            return 1 / x
+
+        run = StagedPipeline([Stage("invert", invert, workers=2)]).run(
+            [0, 1, 2], key=lambda x: f"item-{x}"
+        )
+
+        assert sorted(run.results) == [0.5, 1.0]
+        assert len(run.failures) == 1
+        failure = run.failures[0]
+        assert (failure.key, failure.stage, failure.item) == ("item-0", "invert", 0)
+        assert run.stages["invert"].failed == 1
+
+    def test_progress_counts_every_item(self) -> None:
+        """Test that completed, dropped and failed items are all reported."""
+        finished: List[int] = []
+
+        def keep_even(x: int) -> int:
+            if x == 3:
+                raise ValueError("odd")
+            return x if x % 2 == 0 else 0
+
+        pipeline = StagedPipeline(
+            [
+                Stage("check", keep_even),
+                Stage("drop_zero", lambda x: x or None),
+            ]
+        )
+
+        run = pipeline.run(range(6), progress=finished.append)
+
+        assert sorted(run.results) == [2, 4]
+        assert sum(finished) == 6
+
+    def test_requires_stages(self) -> None:
+        """Test that a pipeline without stages is rejected."""
+        with pytest.raises(ValueError):
+            StagedPipeline([])
+
+
+class TestBatchStages:
+    """Test batched stages."""
+
+    def test_batches_collect_items_by_weight(self) -> None:
+        """Test that batches are flushed once their weight is reached."""
+        batches: List[List[List[int]]] = []
+
+        def record(items: List[List[int]]) -> List[int]:
+            batches.append(items)
+            return [len(item) for item in items]
+
+        pipeline = StagedPipeline(
+            [
+                Stage(
+                    "batch",
+                    record,
+                    batch_size=4,
+                    batch_weight=len,
+                    batch_timeout=5.0,
+                )
+            ]
+        )
+
+        run = pipeline.run([[1, 2], [3], [4], [5, 6, 7], [8]])
+
+        assert [sum(len(item) for item in batch) for batch in batches] == [4, 4]
+        assert sorted(run.results) == [1, 1, 1, 2, 3]
+
+    def test_partial_batch_flushes_after_timeout(self) -> None:
+        """Test that a partial batch is processed without waiting for more input."""
+        calls: List[int] = []
+
+        def slow_source() -> Iterator[int]:
+            yield 1
+            time.sleep(0.3)
+            yield 2
+
+        def record(items: List[int]) -> List[int]:
+            calls.append(len(items))
+            return items
+
+        pipeline = StagedPipeline(
+            [Stage("batch", record, batch_size=10, batch_timeout=0.05)]
+        )
+
+        run = pipeline.run(slow_source())
+
+        assert calls == [1, 1]
+        assert sorted(run.results) == [1, 2]
+
+    def test_failed_batch_fails_its_items(self) -> None:
+        """Test that an exception in a batch call fails every item of the batch."""
+
+        def fail(items: List[int]) -> List[int]:
+            raise RuntimeError("embedding service unavailable")
+
+        run = StagedPipeline([Stage("embed", fail, batch_size=2)]).run([1, 2, 3])
+
+        assert run.results == []
+        assert sorted(f.item for f in run.failures) == [1, 2, 3]
+
+    def test_failed_batch_is_retried_per_item(self) -> None:
+        """Test that only the items failing on their own fail after a batch error."""
+        calls: List[List[int]] = []
+
+        def invert(items: List[int]) -> List[float]:
+            calls.append(items)
+            return [1 / x for x in items]
+
+        run = StagedPipeline(
+            [Stage("invert", invert, batch_size=3, batch_timeout=5.0)]
+        ).run([1, 0, 2], key=lambda x: f"item-{x}")
+
+        assert calls == [[1, 0, 2], [1], [0], [2]]
+        assert sorted(run.results) == [0.5, 1.0]
+        assert [f.key for f in run.failures] == ["item-0"]
+        assert run.stages["invert"].failed == 1
+
+
+class TestBackpressure:
+    """Test bounded work in progress."""
+
+    def test_slow_stage_limits_items_in_flight(self) -> None:
+        """Test that bounded queues stop the source from running ahead."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def start(x: int) -> int:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            return x
+
+        def finish(x: int) -> int:
+            nonlocal in_flight
+            time.sleep(0.005)
+            with lock:
+                in_flight -= 1
+            return x
+
+        pipeline = StagedPipeline(
+            [Stage("start", start), Stage("finish", finish)], queue_size=2
+        )
+
+        run = pipeline.run(range(50))
+
+        assert len(run.results) == 50
+        # Queued items plus one item held by each worker
+        assert peak <= 2 + 2
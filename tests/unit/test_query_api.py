@@ -15,6 +15,7 @@ from fastapi import HTTPException, Request
 from nyc_landmarks.api.query import (
     LandmarkInfo,
     LandmarkListResponse,
+    SearchMode,
     SearchResponse,
     SearchResult,
     TextQuery,
@@ -35,6 +36,7 @@ from nyc_landmarks.api.query import (
     search_text,
     search_text_by_landmark,
 )
+from nyc_landmarks.vectordb.reranking import DEFAULT_LAMBDA
 
 
 class TestTextQuery(unittest.TestCase):
@@ -73,6 +75,24 @@ class TestTextQuery(unittest.TestCase):
         with pytest.raises(ValueError):
             TextQuery(query="test", landmark_id=None, source_type=None, top_k=21)
 
+    def test_text_query_hybrid_rejects_rerank_options(self) -> None:
+        """Test that MMR re-ranking options are rejected in hybrid mode."""
+        with pytest.raises(ValueError, match="rerank"):
+            TextQuery.model_validate(
+                {"query": "test", "mode": "hybrid", "rerank": True}
+            )
+        with pytest.raises(ValueError, match="mmr_lambda"):
+            TextQuery.model_validate(
+                {"query": "test", "mode": "hybrid", "mmr_lambda": 0.5}
+            )
+
+        query = TextQuery.model_validate(
+            {"query": "test", "mode": "hybrid", "max_per_landmark": 2}
+        )
+        assert query.mode == SearchMode.HYBRID
+        assert query.rerank is False
+        assert query.max_per_landmark == 2
+
 
 class TestSearchResult(unittest.TestCase):
     """Test the SearchResult Pydantic model."""
@@ -421,6 +441,10 @@ class TestSearchCombinedSources(unittest.TestCase):
             {"landmark_id": "LP-12345"},
             mock_vector_db,
             "test-correlation",
+            rerank=False,
+            mmr_lambda=DEFAULT_LAMBDA,
+            max_per_landmark=None,
+            max_per_document=None,
         )
         mock_process.assert_called_once_with(
             [{"id": "1", "score": 0.95}], mock_db_client
@@ -0,0 +1,131 @@
+"""
+Unit tests for the local read replica.
+
+Tests ReadReplicaVectorDB, focusing on:
+- Serving memory-mapped snapshots
+- Refreshing when the snapshot generation changes
+- Read-only enforcement and the remote fallback
+- Loading the replica when the app starts
+"""
+
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from nyc_landmarks.config.settings import VectorDBBackend, settings
+from nyc_landmarks.main import app
+from nyc_landmarks.vectordb.local_vector_db import LocalVectorDB
+from nyc_landmarks.vectordb.read_replica import ReadReplicaVectorDB
+from nyc_landmarks.vectordb.snapshot import export_snapshot
+
+
+def _embedding(*coordinates: float) -> List[float]:
+    """Embedding with the given leading coordinates and zeros elsewhere."""
+    vector = np.zeros(settings.PINECONE_DIMENSIONS)
+    vector[: len(coordinates)] = coordinates
+    return vector.tolist()
+
+
+def _source(tmp_path: Path) -> LocalVectorDB:
+    """Source index with two landmarks."""
+    source = LocalVectorDB(path=str(tmp_path / "source"))
+    for landmark_id, embedding in [
+        ("LP-00001", _embedding(1.0)),
+        ("LP-00002", _embedding(0.0, 1.0)),
+    ]:
+        source.store_chunks(
+            chunks=[{"text": f"{landmark_id} report", "embedding": embedding}],
+            landmark_id=landmark_id,
+            enhanced_metadata={},
+        )
+    return source
+
+
+class TestReadReplicaVectorDB:
+    """Test serving queries from a snapshot."""
+
+    def test_serves_memory_mapped_snapshot(self, tmp_path: Path) -> None:
+        """Test that snapshot vectors are memory-mapped and filters work."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path), snapshot_path)
+
+        replica = ReadReplicaVectorDB(snapshot_path=snapshot_path)
+
+        namespace = replica.local_index._namespace(replica.namespace)
+        assert namespace is not None
+        assert isinstance(namespace._vectors.base, np.memmap)
+        matches = replica.query_vectors(
+            query_vector=_embedding(1.0), top_k=5, landmark_id="LP-00002"
+        )
+        assert [m["metadata"]["landmark_id"] for m in matches] == ["LP-00002"]
+
+    def test_refreshes_when_generation_changes(self, tmp_path: Path) -> None:
+        """Test that a new snapshot generation is picked up on the next query."""
+        source = _source(tmp_path)
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(source, snapshot_path)
+        replica = ReadReplicaVectorDB(snapshot_path=snapshot_path, refresh_interval=0)
+        first_index = replica.index
+
+        # No new generation: the loaded snapshot is kept
+        replica.query_vectors(query_vector=_embedding(1.0), top_k=5)
+        assert replica.index is first_index
+
+        source.delete_vectors_by_filter({"landmark_id": "LP-00001"})
+        new_generation = export_snapshot(source, snapshot_path)
+
+        matches = replica.query_vectors(query_vector=_embedding(1.0), top_k=5)
+        assert replica.generation == new_generation
+        assert [m["metadata"]["landmark_id"] for m in matches] == ["LP-00002"]
+
+    def test_refresh_interval_limits_checks(self, tmp_path: Path) -> None:
+        """Test that the snapshot is not re-checked within the refresh interval."""
+        source = _source(tmp_path)
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(source, snapshot_path)
+        replica = ReadReplicaVectorDB(
+            snapshot_path=snapshot_path, refresh_interval=3600
+        )
+        generation = replica.generation
+
+        export_snapshot(source, snapshot_path)
+        replica.query_vectors(query_vector=_embedding(1.0), top_k=5)
+
+        assert replica.generation == generation
+        assert replica.refresh() is True
+        assert replica.generation != generation
+
+    def test_rejects_writes(self, tmp_path: Path) -> None:
+        """Test that the replica index is read-only."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path), snapshot_path)
+        replica = ReadReplicaVectorDB(snapshot_path=snapshot_path)
+
+        with pytest.raises(RuntimeError):
+            replica.local_index.upsert(vectors=[("new", _embedding(1.0), {})])
+        with pytest.raises(RuntimeError):
+            replica.recreate_index()
+
+    def test_falls_back_to_remote_without_snapshot(self, tmp_path: Path) -> None:
+        """Test that queries go to Pinecone until a snapshot exists."""
+        with patch("nyc_landmarks.vectordb.read_replica.PineconeDB") as mock_db:
+            mock_db.return_value.query_vectors.return_value = [{"id": "remote"}]
+            replica = ReadReplicaVectorDB(snapshot_path=str(tmp_path / "missing"))
+
+            assert replica.generation is None
+            assert replica.query_vectors(query_vector=_embedding(1.0)) == [
+                {"id": "remote"}
+            ]
+
+    def test_app_startup_loads_replica(self) -> None:
+        """Test that the replica is loaded when the app starts, not on a query."""
+        with (
+            patch.object(settings, "VECTOR_DB_BACKEND", VectorDBBackend.REPLICA),
+            patch("nyc_landmarks.main.get_read_replica_db") as get_replica,
+            TestClient(app),
+        ):
+            get_replica.return_value.refresh.assert_called_once()
@@ -0,0 +1,101 @@
+"""
+Unit tests for client-side re-ranking of search results.
+
+Tests the reranking module, focusing on:
+- Maximal marginal relevance selection over near-duplicate chunks
+- Per-landmark and per-document caps
+- Over-fetching candidates with values from the vector database
+"""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from nyc_landmarks.vectordb.reranking import mmr_rerank, query_reranked
+
+
+def _match(
+    vector_id: str,
+    values: Optional[List[float]],
+    landmark_id: str,
+    document: str = "report.pdf",
+) -> Dict[str, Any]:
+    """Build a match in the query_vectors format."""
+    match: Dict[str, Any] = {
+        "id": vector_id,
+        "score": 0.0,
+        "metadata": {"landmark_id": landmark_id, "file_name": document},
+    }
+    if values is not None:
+        match["values"] = values
+    return match
+
+
+QUERY = [1.0, 0.0, 0.0]
+
+# Two near-duplicate overlapping chunks of one report and a distinct result
+CANDIDATES = [
+    _match("LP-00001-chunk-0", [0.95, 0.31, 0.0], "LP-00001"),
+    _match("LP-00001-chunk-1", [0.94, 0.34, 0.0], "LP-00001"),
+    _match("LP-00002-chunk-0", [0.8, 0.0, 0.6], "LP-00002"),
+]
+
+
+class TestMmrRerank:
+    """Test maximal marginal relevance selection."""
+
+    def test_relevance_only_keeps_similarity_order(self) -> None:
+        """Test that lambda 1.0 ranks purely by similarity to the query."""
+        selected = mmr_rerank(QUERY, CANDIDATES, top_k=2, lambda_mult=1.0)
+
+        assert [m["id"] for m in selected] == ["LP-00001-chunk-0", "LP-00001-chunk-1"]
+
+    def test_near_duplicates_are_demoted(self) -> None:
+        """Test that a distinct result beats an overlapping sibling chunk."""
+        selected = mmr_rerank(QUERY, CANDIDATES, top_k=2, lambda_mult=0.5)
+
+        assert [m["id"] for m in selected] == ["LP-00001-chunk-0", "LP-00002-chunk-0"]
+
+    def test_caps_limit_results_per_landmark_and_document(self) -> None:
+        """Test that capped landmarks and documents are skipped."""
+        by_landmark = mmr_rerank(
+            QUERY, CANDIDATES, top_k=3, lambda_mult=1.0, max_per_landmark=1
+        )
+        by_document = mmr_rerank(
+            QUERY, CANDIDATES, top_k=3, lambda_mult=1.0, max_per_document=1
+        )
+
+        assert [m["id"] for m in by_landmark] == [
+            "LP-00001-chunk-0",
+            "LP-00002-chunk-0",
+        ]
+        assert by_document == by_landmark
+
+    def test_matches_without_values_only_apply_caps(self) -> None:
+        """Test that candidates without embeddings keep their order."""
+        matches = [
+            _match(m["id"], None, m["metadata"]["landmark_id"]) for m in CANDIDATES
+        ]
+
+        selected = mmr_rerank(QUERY, matches, top_k=2, max_per_landmark=1)
+
+        assert [m["id"] for m in selected] == ["LP-00001-chunk-0", "LP-00002-chunk-0"]
+
+
+class TestQueryReranked:
+    """Test the over-fetching query wrapper."""
+
+    def test_over_fetches_with_values_and_strips_them(self) -> None:
+        """Test that candidates are over-fetched and values are not returned."""
+        vector_db = Mock()
+        vector_db.query_vectors.return_value = [dict(m) for m in CANDIDATES]
+
+        results = query_reranked(
+            vector_db, QUERY, top_k=2, filter_dict={"source_type": "pdf"}
+        )
+
+        kwargs = vector_db.query_vectors.call_args.kwargs
+        assert kwargs["top_k"] == 6
+        assert kwargs["include_values"] is True
+        assert kwargs["filter_dict"] == {"source_type": "pdf"}
+        assert len(results) == 2
+        assert all("values" not in m for m in results)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the pipeline run manifest.
+
+Tests the RunManifest class, focusing on:
+- Recording stage outcomes with input fingerprints
+- Matching completed stages against current inputs
+- Run bookkeeping and summaries across runs
+"""
+
+from pathlib import Path
+
+from nyc_landmarks.pipeline.manifest import (
+    RunManifest,
+    StageStatus,
+    fingerprint,
+    metadata_fingerprint,
+    sha256_file,
+    sha256_text,
+)
+
+
+class TestFingerprints:
+    """Test input hashing helpers."""
+
+    def test_fingerprint_is_order_sensitive_and_stable(self) -> None:
+        """Test that fingerprints depend on every part and its position."""
+        assert fingerprint("abc", 1000, 200) == fingerprint("abc", 1000, 200)
+        assert fingerprint("abc", 1000, 200) != fingerprint("abc", 200, 1000)
+
+    def test_file_hash_matches_content_hash(self, tmp_path: Path) -> None:
+        """Test that file and text hashes agree for the same bytes."""
+        path = tmp_path / "report.txt"
+        path.write_text("Wyckoff House", encoding="utf-8")
+
+        assert sha256_file(path) == sha256_text("Wyckoff House")
+
+    def test_metadata_fingerprint_ignores_processing_date(self) -> None:
+        """Test that only source fields of the metadata are hashed."""
+        metadata = {"name": "Wyckoff House", "processing_date": "2024-01-01"}
+
+        assert metadata_fingerprint(metadata) == metadata_fingerprint(
+            {**metadata, "processing_date": "2024-02-01"}
+        )
+        assert metadata_fingerprint(metadata) != metadata_fingerprint(
+            {**metadata, "name": "Wyckoff Farmhouse"}
+        )
+
+
+class TestRunManifest:
+    """Test stage records and run summaries."""
+
+    def test_completed_requires_matching_input(self, tmp_path: Path) -> None:
+        """Test that a stage counts as done only for the same inputs."""
+        manifest = RunManifest(tmp_path / "manifest.db")
+        manifest.start_run("process_landmarks.py --all")
+        manifest.record("LP-00001", "extract", "pdf-hash", "text-hash")
+
+        record = manifest.completed("LP-00001", "extract", "pdf-hash")
+
+        assert record is not None
+        assert record.output_hash == "text-hash"
+        assert record.run_id == manifest.run_id
+        assert manifest.completed("LP-00001", "extract", "other-pdf") is None
+        assert manifest.completed("LP-00002", "extract", "pdf-hash") is None
+
+    def test_failure_replaces_completion(self, tmp_path: Path) -> None:
+        """Test that the latest outcome of a stage wins."""
+        manifest = RunManifest(tmp_path / "manifest.db")
+        manifest.record("LP-00001", "store", "hash")
+        manifest.record(
+            "LP-00001", "store", "hash", status=StageStatus.FAILED, error="timeout"
+        )
+
+        assert manifest.completed("LP-00001", "store", "hash") is None
+        assert [r.error for r in manifest.failures()] == ["timeout"]
+
+    def test_records_persist_across_runs(self, tmp_path: Path) -> None:
+        """Test that a later run sees stages recorded by an earlier one."""
+        path = tmp_path / "manifest.db"
+        first = RunManifest(path)
+        first.start_run("first")
+        first.record("LP-00001", "download", "url-hash", "pdf-hash", details={"n": 1})
+        first.finish_run({"landmarks_processed": 1})
+        first.close()
+
+        second = RunManifest(path)
+        second.start_run("second")
+
+        record = second.get("LP-00001", "download")
+        assert record is not None
+        assert record.details == {"n": 1}
+        runs = second.runs()
+        assert [run["command"] for run in runs] == ["second", "first"]
+        assert runs[1]["stats"] == {"landmarks_processed": 1}
+        assert runs[0]["finished_at"] is None
+
+    def test_stage_summary(self, tmp_path: Path) -> None:
+        """Test counting landmarks per stage and outcome."""
+        manifest = RunManifest(tmp_path / "manifest.db")
+        manifest.record("LP-00001", "store", "a")
+        manifest.record("LP-00002", "store", "b")
+        manifest.record("LP-00003", "store", "c", status=StageStatus.FAILED)
+        manifest.record("LP-00001", "extract", "d")
+
+        assert manifest.stage_summary() == {
+            "store": {"done": 2, "failed": 1},
+            "extract": {"done": 1},
+        }
+        assert [r.stage for r in manifest.landmark_stages("LP-00001")] == [
+            "store",
+            "extract",
+        ]
@@ -0,0 +1,190 @@
+"""
+Unit tests for bulk index export and import.
+
+Tests the snapshot module, focusing on:
+- Exporting every namespace with ID listing and batched fetches
+- Parquet metadata round trips, including mixed-type fields
+- Importing a snapshot with parallel upserts
+- Dimension and manifest checks
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from nyc_landmarks.config.settings import settings
+from nyc_landmarks.vectordb.local_vector_db import (
+    METADATA_PARQUET_FILE,
+    PYARROW_AVAILABLE,
+    LocalIndex,
+    LocalVectorDB,
+    read_metadata,
+    write_metadata,
+)
+from nyc_landmarks.vectordb.pinecone_db import PineconeDB
+from nyc_landmarks.vectordb.snapshot import export_snapshot, import_snapshot
+
+
+def _embedding(*coordinates: float) -> List[float]:
+    """Embedding with the given leading coordinates and zeros elsewhere."""
+    vector = np.zeros(settings.PINECONE_DIMENSIONS)
+    vector[: len(coordinates)] = coordinates
+    return vector.tolist()
+
+
+def _source(tmp_path: Path, count: int = 25) -> LocalVectorDB:
+    """Source index with vectors in the configured and a second namespace."""
+    source = LocalVectorDB(path=str(tmp_path / "source"))
+    source.upsert_vectors(
+        [
+            {
+                "id": f"LP-{i:05d}-chunk-0",
+                "values": _embedding(1.0, float(i)),
+                "metadata": {"landmark_id": f"LP-{i:05d}", "chunk_index": 0},
+            }
+            for i in range(count)
+        ]
+    )
+    source.upsert_vectors(
+        [{"id": "other", "values": _embedding(0.0, 1.0), "metadata": {"x": 1}}],
+        namespace="archive",
+    )
+    return source
+
+
+class TestMetadataFiles:
+    """Test metadata persistence."""
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_parquet_round_trip(self, tmp_path: Path) -> None:
+        """Test that records with missing, list and mixed-type fields round trip."""
+        records: List[Dict[str, Any]] = [
+            {"landmark_id": "LP-00001", "year": 1930, "names": ["A", "B"]},
+            {"landmark_id": "LP-00002", "year": "circa 1900"},
+            {},
+        ]
+
+        write_metadata(tmp_path, records)
+
+        assert (tmp_path / METADATA_PARQUET_FILE).exists()
+        assert read_metadata(tmp_path) == records
+
+    def test_records_without_fields(self, tmp_path: Path) -> None:
+        """Test that records without any fields keep their row count."""
+        write_metadata(tmp_path, [{}, {}])
+
+        assert read_metadata(tmp_path) == [{}, {}]
+
+
+class TestExportSnapshot:
+    """Test exporting an index to a snapshot."""
+
+    def test_export_copies_all_namespaces(self, tmp_path: Path) -> None:
+        """Test that every vector of every namespace is exported."""
+        source = _source(tmp_path)
+        snapshot_path = str(tmp_path / "snapshot")
+
+        export_snapshot(source, snapshot_path, batch_size=4, max_workers=3)
+
+        snapshot = LocalIndex(settings.PINECONE_DIMENSIONS, path=snapshot_path)
+        stats = snapshot.describe_index_stats()
+        assert stats.namespaces == {
+            source.namespace: {"vector_count": 25},
+            "archive": {"vector_count": 1},
+        }
+        fetched = snapshot.fetch(ids=["LP-00007-chunk-0"], namespace=source.namespace)
+        vector = fetched.vectors["LP-00007-chunk-0"]
+        assert vector.values[:2] == [1.0, 7.0]
+        assert vector.metadata == {"landmark_id": "LP-00007", "chunk_index": 0}
+
+    def test_export_uses_id_listing_and_batched_fetch(self, tmp_path: Path) -> None:
+        """Test that IDs are listed by page and fetched in batches."""
+        source = _source(tmp_path, count=10)
+        index = source.local_index
+
+        with (
+            patch.object(index, "list", wraps=index.list) as mock_list,
+            patch.object(index, "fetch", wraps=index.fetch) as mock_fetch,
+        ):
+            export_snapshot(source, str(tmp_path / "snapshot"), batch_size=4)
+
+        assert mock_list.call_count == 2
+        assert mock_fetch.call_count == 4  # 3 batches + 1 for "archive"
+
+    def test_failed_export_keeps_previous_snapshot(self, tmp_path: Path) -> None:
+        """Test that a failing export leaves the existing snapshot in place."""
+        source = _source(tmp_path, count=3)
+        snapshot_path = str(tmp_path / "snapshot")
+        generation = export_snapshot(source, snapshot_path)
+        source.index.fetch = Mock(side_effect=RuntimeError("unavailable"))  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError):
+            export_snapshot(source, snapshot_path)
+
+        snapshot = LocalIndex(settings.PINECONE_DIMENSIONS, path=snapshot_path)
+        assert snapshot.generation == generation
+        assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+class TestImportSnapshot:
+    """Test importing a snapshot into an index."""
+
+    def test_import_round_trip(self, tmp_path: Path) -> None:
+        """Test that an exported snapshot imports into another index."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path), snapshot_path)
+        target = LocalVectorDB(path=str(tmp_path / "target"))
+
+        stored = import_snapshot(target, snapshot_path, batch_size=4, max_workers=3)
+
+        assert stored == 26
+        stats = target.get_index_stats()
+        assert stats["namespaces"] == {
+            target.namespace: {"vector_count": 25},
+            "archive": {"vector_count": 1},
+        }
+
+    def test_import_into_single_namespace(self, tmp_path: Path) -> None:
+        """Test that a namespace override imports everything into one namespace."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path, count=5), snapshot_path)
+        target = LocalVectorDB(path="")
+
+        import_snapshot(target, snapshot_path, namespace="restored")
+
+        assert target.get_index_stats()["namespaces"] == {
+            "restored": {"vector_count": 6}
+        }
+
+    def test_import_upserts_in_parallel_batches(self, tmp_path: Path) -> None:
+        """Test that the import sends batches through upsert_vectors."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path, count=10), snapshot_path)
+        target = Mock(spec=PineconeDB)
+        target.dimensions = settings.PINECONE_DIMENSIONS
+        target.upsert_vectors.side_effect = lambda vectors, **kwargs: len(vectors)
+
+        stored = import_snapshot(target, snapshot_path, batch_size=2, max_workers=4)
+
+        assert stored == 11
+        for call in target.upsert_vectors.call_args_list:
+            assert call.kwargs["batch_size"] == 2
+            assert call.kwargs["max_workers"] == 4
+
+    def test_import_rejects_dimension_mismatch(self, tmp_path: Path) -> None:
+        """Test that snapshots of another dimension are rejected."""
+        snapshot_path = str(tmp_path / "snapshot")
+        export_snapshot(_source(tmp_path, count=2), snapshot_path)
+        target = Mock(spec=PineconeDB)
+        target.dimensions = 3
+
+        with pytest.raises(ValueError):
+            import_snapshot(target, snapshot_path)
+
+    def test_import_requires_snapshot(self, tmp_path: Path) -> None:
+        """Test that importing a directory without a manifest fails."""
+        with pytest.raises(ValueError):
+            import_snapshot(LocalVectorDB(path=""), str(tmp_path / "missing"))
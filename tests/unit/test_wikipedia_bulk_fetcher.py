@@ -0,0 +1,189 @@
+"""
+Unit tests for the Wikipedia bulk fetcher.
+
+Tests the WikipediaBulkFetcher class, focusing on:
+- Resolving many titles, redirects and revisions per API request
+- Plain-text extracts with HTML scraping as a fallback
+- Serving prefetched articles from memory
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import httpx
+
+from nyc_landmarks.wikipedia.bulk_fetcher import (
+    AsyncRateLimiter,
+    WikipediaBulkFetcher,
+    parse_article_url,
+)
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+
+
+class FakeMediaWiki:
+    """MediaWiki Action API serving a few articles."""
+
+    def __init__(self) -> None:
+        self.pages = {
+            "Gracie Mansion": {
+                "pageid": 1,
+                "lastrevid": 111,
+                "extract": "Gracie  Mansion\nis a house.",
+            },
+            "Wyckoff House": {"pageid": 2, "lastrevid": 222, "extract": ""},
+        }
+        self.redirects = {"Gracie House": "Gracie Mansion"}
+        self.requests: List[Dict[str, Any]] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        if params["prop"] == "info":
+            return httpx.Response(200, json=self._info(params["titles"].split("|")))
+        page = next(
+            p for p in self.pages.values() if str(p["pageid"]) == params["pageids"]
+        )
+        return httpx.Response(
+            200,
+            json={
+                "query": {
+                    "pages": [{"pageid": page["pageid"], "extract": page["extract"]}]
+                }
+            },
+        )
+
+    def _info(self, titles: List[str]) -> Dict[str, Any]:
+        redirects = [
+            {"from": t, "to": self.redirects[t]} for t in titles if t in self.redirects
+        ]
+        pages = []
+        for title in {self.redirects.get(t, t) for t in titles}:
+            if title in self.pages:
+                page = self.pages[title]
+                pages.append(
+                    {
+                        "title": title,
+                        "pageid": page["pageid"],
+                        "lastrevid": page["lastrevid"],
+                    }
+                )
+            else:
+                pages.append({"title": title, "missing": True})
+        return {"query": {"redirects": redirects, "pages": pages}}
+
+
+def make_fetcher(api: FakeMediaWiki, **kwargs: Any) -> WikipediaBulkFetcher:
+    """Create a fetcher sending its requests to a fake API."""
+    html_fetcher = Mock()
+    html_fetcher.fetch_wikipedia_content.return_value = ("Scraped text", "999")
+    fetcher = WikipediaBulkFetcher(html_fetcher, requests_per_second=0, **kwargs)
+    transport = httpx.MockTransport(api.handle)
+    fetcher._client = lambda: httpx.AsyncClient(transport=transport)  # type: ignore[method-assign]
+    return fetcher
+
+
+class TestParseArticleUrl:
+    """Test mapping article URLs to API endpoints and titles."""
+
+    def test_article_urls(self) -> None:
+        """Test that titles are decoded from article links."""
+        assert parse_article_url(
+            "https://en.wikipedia.org/wiki/Caf%C3%A9_des_Artistes"
+        ) == (
+            API_URL,
+            "Café des Artistes",
+        )
+        assert parse_article_url("https://example.com/wiki/Gracie_Mansion") is None
+        assert (
+            parse_article_url("https://en.wikipedia.org/w/index.php?title=X&oldid=5")
+            is None
+        )
+
+
+class TestWikipediaBulkFetcher:
+    """Test bulk article fetching."""
+
+    def test_titles_share_revision_queries(self) -> None:
+        """Test that titles are resolved in batches, following redirects."""
+        api = FakeMediaWiki()
+        fetcher = make_fetcher(api, titles_per_request=2)
+        urls = [
+            "https://en.wikipedia.org/wiki/Gracie_House",
+            "https://en.wikipedia.org/wiki/Wyckoff_House",
+            "https://en.wikipedia.org/wiki/Lost_Building",
+        ]
+
+        revisions = fetcher.fetch_revisions(urls)
+
+        assert revisions == dict(zip(urls, ["111", "222", None]))
+        assert [r["titles"].count("|") + 1 for r in api.requests] == [2, 1]
+
+    def test_revisions_are_remembered(self) -> None:
+        """Test that a bulk revision lookup answers later lookups."""
+        api = FakeMediaWiki()
+        fetcher = make_fetcher(api)
+        gracie = "https://en.wikipedia.org/wiki/Gracie_Mansion"
+        wyckoff = "https://en.wikipedia.org/wiki/Wyckoff_House"
+
+        fetcher.fetch_revisions([gracie, wyckoff])
+        sent = len(api.requests)
+
+        assert fetcher.fetch_revisions([wyckoff]) == {wyckoff: "222"}
+        assert len(api.requests) == sent
+
+    def test_extracts_with_html_fallback(self) -> None:
+        """Test that articles without an extract are scraped instead."""
+        api = FakeMediaWiki()
+        fetcher = make_fetcher(api)
+        gracie = "https://en.wikipedia.org/wiki/Gracie_Mansion"
+        wyckoff = "https://en.wikipedia.org/wiki/Wyckoff_House"
+        missing = "https://en.wikipedia.org/wiki/Lost_Building"
+
+        with patch.object(
+            fetcher.html_fetcher,
+            "fetch_wikipedia_content",
+            new=Mock(return_value=("Scraped text", "999")),
+        ) as fetch_html:
+            results = fetcher.fetch_articles([gracie, wyckoff, missing])
+
+        assert results[gracie] == ("Gracie Mansion\n\nis a house.", "111")
+        assert results[wyckoff] == ("Scraped text", "222")
+        assert results[missing] == (None, None)
+        fetch_html.assert_called_once_with(wyckoff)
+
+    def test_prefetched_articles_are_served_once(self) -> None:
+        """Test that prefetched articles need no further requests."""
+        api = FakeMediaWiki()
+        fetcher = make_fetcher(api)
+        url = "https://en.wikipedia.org/wiki/Gracie_Mansion"
+
+        assert fetcher.prefetch([url]) == 1
+        sent = len(api.requests)
+
+        assert fetcher.fetch_articles([url])[url][1] == "111"
+        assert len(api.requests) == sent
+        fetcher.fetch_articles([url])
+        assert len(api.requests) > sent
+
+
+class TestAsyncRateLimiter:
+    """Test the request limiter."""
+
+    def test_requests_are_spaced(self) -> None:
+        """Test that request starts respect the rate limit."""
+
+        async def run() -> float:
+            limiter = AsyncRateLimiter(concurrency=4, requests_per_second=20)
+            started = time.monotonic()
+
+            async def request() -> None:
+                async with limiter:
+                    pass
+
+            await asyncio.gather(*(request() for _ in range(5)))
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.19
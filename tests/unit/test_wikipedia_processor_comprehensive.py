@@ -6,13 +6,22 @@ testing all major functionality including initialization, article fetching,
 content processing, quality assessment, and metadata enrichment.
 """
 
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import tiktoken
+
+from nyc_landmarks.chunking import Chunk, get_tokenizer
 from nyc_landmarks.models.wikipedia_models import (
     WikipediaContentModel,
     WikipediaQualityModel,
 )
+from nyc_landmarks.pipeline.manifest import RunManifest, metadata_fingerprint
 from nyc_landmarks.wikipedia.processor import WikipediaProcessor
 
 
@@ -25,6 +34,7 @@ class BaseWikipediaProcessorTest(unittest.TestCase):
         self.mock_embedding_generator = Mock()
         self.mock_pinecone_db = Mock()
         self.mock_quality_fetcher = Mock()
+        self.mock_bulk_fetcher = Mock()
 
         patcher_wiki_fetcher = patch(
             'nyc_landmarks.wikipedia.processor.WikipediaFetcher',
@@ -42,16 +52,22 @@ class BaseWikipediaProcessorTest(unittest.TestCase):
             'nyc_landmarks.wikipedia.processor.WikipediaQualityFetcher',
             return_value=self.mock_quality_fetcher,
         )
+        patcher_bulk_fetcher = patch(
+            'nyc_landmarks.wikipedia.processor.WikipediaBulkFetcher',
+            return_value=self.mock_bulk_fetcher,
+        )
 
         self.addCleanup(patcher_wiki_fetcher.stop)
         self.addCleanup(patcher_embedding_gen.stop)
         self.addCleanup(patcher_pinecone_db.stop)
         self.addCleanup(patcher_quality_fetcher.stop)
+        self.addCleanup(patcher_bulk_fetcher.stop)
 
         patcher_wiki_fetcher.start()
         patcher_embedding_gen.start()
         patcher_pinecone_db.start()
         patcher_quality_fetcher.start()
+        patcher_bulk_fetcher.start()
 
         self.processor = WikipediaProcessor()
 
@@ -148,11 +164,11 @@ class TestWikipediaProcessorArticleFetching(BaseWikipediaProcessorTest):
             mock_article2,
         ]
 
-        # Mock wiki fetcher
-        self.mock_wiki_fetcher.fetch_wikipedia_content.side_effect = [
-            ("Gracie Mansion content here", "123456"),
-            ("Test article content here", "789012"),
-        ]
+        # Mock bulk fetcher
+        self.mock_bulk_fetcher.fetch_articles.return_value = {
+            mock_article1.url: ("Gracie Mansion content here", "123456"),
+            mock_article2.url: ("Test article content here", "789012"),
+        }
 
         with patch.object(
             self.processor, '_initialize_db_client', return_value=mock_db_client
@@ -181,8 +197,10 @@ class TestWikipediaProcessorArticleFetching(BaseWikipediaProcessorTest):
 
         mock_db_client.get_wikipedia_articles.return_value = [mock_article]
 
-        # Mock wiki fetcher to return None (failure)
-        self.mock_wiki_fetcher.fetch_wikipedia_content.return_value = (None, None)
+        # Mock bulk fetcher to return None (failure)
+        self.mock_bulk_fetcher.fetch_articles.return_value = {
+            mock_article.url: (None, None)
+        }
 
         with patch.object(
             self.processor, '_initialize_db_client', return_value=mock_db_client
@@ -235,11 +253,14 @@ class TestWikipediaProcessorArticleProcessing(BaseWikipediaProcessorTest):
 
         articles = [mock_article1, mock_article2]
 
-        # Mock the chunking method
+        # Mock the chunking engine
+        def chunks(*texts: str) -> list:
+            return [Chunk(t, i, 0, len(t), 1) for i, t in enumerate(texts)]
+
         with patch.object(
-            self.processor,
-            'split_into_token_chunks',
-            side_effect=[["chunk1", "chunk2"], ["chunk3"]],
+            self.processor.chunking_engine,
+            'chunk',
+            side_effect=[chunks("chunk1", "chunk2"), chunks("chunk3")],
         ):
             result, total_chunks = self.processor.process_articles_into_chunks(
                 articles, landmark_id
@@ -275,7 +296,9 @@ class TestWikipediaProcessorArticleProcessing(BaseWikipediaProcessorTest):
                 self.processor, '_fetch_article_quality', return_value=mock_quality
             ),
             patch.object(
-                self.processor, 'split_into_token_chunks', return_value=["chunk1"]
+                self.processor.chunking_engine,
+                'chunk',
+                return_value=[Chunk("chunk1", 0, 0, 6, 1)],
             ),
         ):
 
@@ -288,6 +311,77 @@ class TestWikipediaProcessorArticleProcessing(BaseWikipediaProcessorTest):
         self.assertEqual(total_chunks, 0)
 
 
+class TestWikipediaProcessorTokenChunking(BaseWikipediaProcessorTest):
+    """Test token chunking with the shared embedding model encoder."""
+
+    def test_chunks_are_slices_of_the_text(self) -> None:
+        """Test that chunks cover the text exactly, within the token limit."""
+        text = " ".join(f"Landmark sentence number {i}." for i in range(200))
+        tokenizer = get_tokenizer()
+
+        chunks = self.processor.split_into_token_chunks(text, 50)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), text)
+        self.assertTrue(all(len(tokenizer.encode(c)) <= 51 for c in chunks))
+        self.assertEqual(self.processor.split_into_token_chunks("Short", 50), ["Short"])
+        self.assertEqual(self.processor.split_into_token_chunks(None, 50), [])
+
+    def test_low_quality_articles_are_not_tokenized(self) -> None:
+        """Test that Stub articles are dropped before they are split."""
+        article = Mock(title="Stub", url="https://en.wikipedia.org/wiki/Stub")
+        article.content = "Short content"
+        article.rev_id = "123456"
+        stub = WikipediaQualityModel(
+            prediction="Stub", probabilities={"Stub": 0.9}, rev_id="123456"
+        )
+
+        with (
+            patch.object(self.processor, '_fetch_article_quality', return_value=stub),
+            patch.object(self.processor.chunking_engine, 'chunk') as split,
+        ):
+            self.processor.process_articles_into_chunks([article], "LP-00179")
+
+        split.assert_not_called()
+
+    def test_startup_cost_is_paid_once(self) -> None:
+        """Benchmark: chunking many landmarks loads the encoder at most once."""
+        get_tokenizer.cache_clear()
+        articles = [
+            Mock(
+                title=f"Article {i}",
+                url=f"https://en.wikipedia.org/wiki/Article_{i}",
+                content="The landmark was designated in 1966. " * 400,
+                rev_id=None,
+            )
+            for i in range(50)
+        ]
+
+        started = time.perf_counter()
+        with patch("tiktoken.get_encoding", wraps=tiktoken.get_encoding) as load:
+            for article in articles:
+                self.processor.process_articles_into_chunks([article], "LP-00179")
+        elapsed = time.perf_counter() - started
+
+        self.assertLessEqual(load.call_count, 1)
+        self.assertLess(elapsed, 10.0)
+
+    def test_processor_does_not_import_transformers(self) -> None:
+        """Test that importing the processor does not load transformers."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, nyc_landmarks.wikipedia.processor; "
+                "print('transformers' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+
 class TestWikipediaProcessorQualityAssessment(BaseWikipediaProcessorTest):
     """Test Wikipedia article quality assessment functionality."""
 
@@ -350,18 +444,18 @@ class TestWikipediaProcessorEmbeddingsAndStorage(BaseWikipediaProcessorTest):
             title="Test Article",
             content="Test content",
             rev_id="123456",
-            chunks=[{"text": "chunk1"}, {"text": "chunk2"}],
+            chunks=[
+                {"text": "chunk1", "metadata": {}},
+                {"text": "chunk2", "metadata": {}},
+            ],
             quality=None,
         )
 
-        # Mock embedding generation with proper metadata structure
-        chunks_with_embeddings = [
-            {"text": "chunk1", "embedding": [0.1, 0.2, 0.3], "metadata": {}},
-            {"text": "chunk2", "embedding": [0.4, 0.5, 0.6], "metadata": {}},
+        # Mock embedding generation
+        self.mock_embedding_generator.generate_embeddings_batch.return_value = [
+            [0.1, 0.2, 0.3],
+            [0.4, 0.5, 0.6],
         ]
-        self.mock_embedding_generator.process_chunks.return_value = (
-            chunks_with_embeddings
-        )
 
         # Mock storage - return list of IDs, not just count
         self.mock_pinecone_db.store_chunks.return_value = ["id1", "id2"]
@@ -371,7 +465,7 @@ class TestWikipediaProcessorEmbeddingsAndStorage(BaseWikipediaProcessorTest):
         )
 
         # Verify calls were made
-        self.mock_embedding_generator.process_chunks.assert_called_once()
+        self.mock_embedding_generator.generate_embeddings_batch.assert_called_once()
         self.mock_pinecone_db.store_chunks.assert_called_once()
 
         # Verify result
@@ -397,7 +491,7 @@ class TestWikipediaProcessorEmbeddingsAndStorage(BaseWikipediaProcessorTest):
         )
 
         # Verify no processing occurred
-        self.mock_embedding_generator.process_chunks.assert_not_called()
+        self.mock_embedding_generator.generate_embeddings_batch.assert_not_called()
         self.assertEqual(result, 0)
 
     def test_generate_embeddings_and_store_with_deletion(self) -> None:
@@ -411,13 +505,13 @@ class TestWikipediaProcessorEmbeddingsAndStorage(BaseWikipediaProcessorTest):
             title="Test Article",
             content="Test content",
             rev_id="123456",
-            chunks=[{"text": "chunk1"}],
+            chunks=[{"text": "chunk1", "metadata": {}}],
             quality=None,
         )
 
-        # Mock embedding and storage with proper metadata structure
-        self.mock_embedding_generator.process_chunks.return_value = [
-            {"text": "chunk1", "embedding": [0.1, 0.2, 0.3], "metadata": {}}
+        # Mock embedding and storage
+        self.mock_embedding_generator.generate_embeddings_batch.return_value = [
+            [0.1, 0.2, 0.3]
         ]
         self.mock_pinecone_db.store_chunks.return_value = ["id1"]
 
@@ -432,5 +526,188 @@ class TestWikipediaProcessorEmbeddingsAndStorage(BaseWikipediaProcessorTest):
         self.assertEqual(result, 1)
 
 
+class TestWikipediaProcessorIncremental(BaseWikipediaProcessorTest):
+    """Test skipping landmarks whose Wikipedia sources are unchanged."""
+
+    def setUp(self) -> None:
+        """Set up a processor recording to a temporary run manifest."""
+        super().setUp()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.manifest = RunManifest(Path(tmp_dir.name) / "manifest.db")
+        self.addCleanup(self.manifest.close)
+        self.processor = WikipediaProcessor(manifest=self.manifest, incremental=True)
+        self.mock_embedding_generator.model = "text-embedding-3-small"
+        self.mock_pinecone_db.index_name = "nyc-landmarks"
+        self.mock_pinecone_db.namespace = "landmarks"
+
+        self.article = Mock(
+            title="Test Article",
+            url="https://en.wikipedia.org/wiki/Test",
+            content="Test content",
+            rev_id="123456",
+        )
+        self.metadata = {"name": "Test Landmark", "processing_date": "2024-01-01"}
+
+        patchers = [
+            patch.object(
+                self.processor, "fetch_wikipedia_articles", return_value=[self.article]
+            ),
+            patch.object(
+                self.processor,
+                "collect_enhanced_metadata",
+                side_effect=lambda landmark_id: dict(self.metadata),
+            ),
+            patch.object(
+                self.processor,
+                "process_articles_into_chunks",
+                return_value=([Mock(title="Test Article", rev_id="123456")], 2),
+            ),
+            patch.object(
+                self.processor, "generate_embeddings_and_store", return_value=2
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_unchanged_landmark_is_skipped(self) -> None:
+        """Test that a second run with the same sources stores nothing."""
+        first = self.processor.process_landmark_wikipedia("LP-00179")
+        self.metadata["processing_date"] = "2024-02-01"  # Not a source change
+        second = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(first, (True, 1, 2))
+        self.assertEqual(second, (True, 0, 0))
+        self.assertEqual(self.processor.unchanged_landmarks, {"LP-00179"})
+        self.assertEqual(
+            self.processor.process_articles_into_chunks.call_count, 1  # type: ignore[attr-defined]
+        )
+
+    def test_new_revision_is_processed(self) -> None:
+        """Test that a changed article revision is processed again."""
+        self.processor.process_landmark_wikipedia("LP-00179")
+        self.article.rev_id = "123457"
+        self.article.content = "Edited content"
+
+        result = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(result, (True, 1, 2))
+        self.assertEqual(self.processor.unchanged_landmarks, set())
+
+    def test_metadata_change_is_processed(self) -> None:
+        """Test that a change of the enhanced metadata is processed again."""
+        self.processor.process_landmark_wikipedia("LP-00179")
+        self.metadata["name"] = "Renamed Landmark"
+
+        result = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(result, (True, 1, 2))
+        record = self.manifest.get("LP-00179", WikipediaProcessor.MANIFEST_STAGE)
+        assert record is not None and record.details is not None
+        self.assertEqual(record.details["revisions"], {"Test Article": "123456"})
+        self.assertEqual(
+            record.details["metadata"], metadata_fingerprint(self.metadata)
+        )
+
+    def test_metadata_is_collected_once(self) -> None:
+        """Test that the revision and source checks share one metadata lookup."""
+        self.processor.process_landmark_wikipedia("LP-00179")
+        self.metadata["name"] = "Renamed Landmark"
+        self.processor._unchanged_urls["LP-00179"] = {self.article.url}
+        collect = self.processor.collect_enhanced_metadata
+        collect.reset_mock()  # type: ignore[attr-defined]
+
+        with patch.object(self.processor, "_fetch_article_content") as fetch:
+            result = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(result, (True, 1, 2))
+        fetch.assert_called_once_with([self.article])
+        self.assertEqual(collect.call_count, 1)  # type: ignore[attr-defined]
+
+
+class TestWikipediaProcessorRevisionCheck(BaseWikipediaProcessorTest):
+    """Test skipping articles whose stored revision is current."""
+
+    def setUp(self) -> None:
+        """Set up a processor checking revisions against stored vectors."""
+        super().setUp()
+        self.processor = WikipediaProcessor(skip_unchanged_revisions=True)
+        self.gracie = Mock(
+            title="Gracie Mansion",
+            url="https://en.wikipedia.org/wiki/Gracie_Mansion",
+            content=None,
+        )
+        self.wyckoff = Mock(
+            title="Wyckoff House",
+            url="https://en.wikipedia.org/wiki/Wyckoff_House",
+            content=None,
+        )
+        self.db_client = Mock()
+        self.db_client.get_wikipedia_articles.return_value = [
+            self.gracie,
+            self.wyckoff,
+        ]
+        self.processor.db_client = self.db_client
+
+        self.mock_bulk_fetcher.fetch_revisions.side_effect = lambda urls: dict.fromkeys(
+            urls, "200"
+        )
+        self.mock_pinecone_db.fetch_vectors.return_value = {
+            "wiki-Gracie_Mansion-LP-00179-chunk-0": {
+                "metadata": {"article_rev_id": "200"}
+            },
+            "wiki-Wyckoff_House-LP-00179-chunk-0": {
+                "metadata": {"article_rev_id": "100"}
+            },
+        }
+        self.mock_bulk_fetcher.fetch_articles.side_effect = lambda urls: {
+            url: ("Content", "200") for url in urls
+        }
+
+    def test_unchanged_articles_are_not_fetched(self) -> None:
+        """Test that only articles with a new revision are fetched and stored."""
+        with (
+            patch.object(
+                self.processor,
+                "process_articles_into_chunks",
+                return_value=([Mock(title="Wyckoff House", rev_id="200")], 3),
+            ) as chunk,
+            patch.object(
+                self.processor, "generate_embeddings_and_store", return_value=3
+            ),
+        ):
+            result = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(result, (True, 1, 3))
+        self.assertEqual(chunk.call_args[0][0], [self.wyckoff])
+        self.assertEqual(self.wyckoff.content, "Content")
+        self.assertIsNone(self.gracie.content)
+        self.assertEqual(self.processor.unchanged_articles, {"LP-00179": 1})
+
+    def test_landmark_with_unchanged_articles_is_skipped(self) -> None:
+        """Test that a landmark whose articles are all current does no work."""
+        self.mock_pinecone_db.fetch_vectors.return_value[
+            "wiki-Wyckoff_House-LP-00179-chunk-0"
+        ]["metadata"]["article_rev_id"] = "200"
+
+        with patch.object(self.processor, "process_articles_into_chunks") as chunk:
+            result = self.processor.process_landmark_wikipedia("LP-00179")
+
+        self.assertEqual(result, (True, 0, 0))
+        self.assertEqual(self.processor.unchanged_landmarks, {"LP-00179"})
+        chunk.assert_not_called()
+        self.mock_bulk_fetcher.fetch_articles.assert_not_called()
+
+    def test_prefetch_skips_unchanged_articles(self) -> None:
+        """Test that the bulk prefetch only fetches changed articles."""
+        self.mock_bulk_fetcher.prefetch.side_effect = lambda urls: len(urls)
+
+        self.assertEqual(self.processor.prefetch_wikipedia_articles(["LP-00179"]), 1)
+        self.assertEqual(
+            self.mock_bulk_fetcher.prefetch.call_args[0][0], [self.wyckoff.url]
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
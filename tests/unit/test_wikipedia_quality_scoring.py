@@ -0,0 +1,105 @@
+"""
+Unit tests for the Wikipedia quality fetcher.
+
+Tests the WikipediaQualityFetcher class, focusing on:
+- Scoring many revisions with concurrent requests
+- Caching scores by revision ID in memory and on disk
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Iterator, List
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from nyc_landmarks.wikipedia.quality_fetcher import (
+    QualityCache,
+    WikipediaQualityFetcher,
+)
+
+
+class FakeLiftWing:
+    """Lift Wing endpoint scoring every revision as a C-class article."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.rev_ids: List[int] = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def post(self, url: str, **kwargs: Any) -> Mock:
+        rev_id = kwargs["json"]["rev_id"]
+        with self._lock:
+            self.rev_ids.append(rev_id)
+        if self.fail:
+            raise requests.ConnectionError("unreachable")
+        response = Mock()
+        response.json.return_value = {
+            "enwiki": {
+                "scores": {
+                    str(rev_id): {
+                        "articlequality": {
+                            "score": {"prediction": "C", "probability": {"C": 0.7}}
+                        }
+                    }
+                }
+            }
+        }
+        return response
+
+
+def make_fetcher(api: FakeLiftWing, **kwargs: Any) -> WikipediaQualityFetcher:
+    """Create a fetcher sending its requests to a fake endpoint."""
+    fetcher = WikipediaQualityFetcher(requests_per_second=0, **kwargs)
+    patch.object(fetcher.session, "post", new=api.post).start()
+    return fetcher
+
+
+@pytest.fixture(autouse=True)
+def stop_patches() -> Iterator[None]:
+    """Undo the session patches of the fetchers created by a test."""
+    yield
+    patch.stopall()
+
+
+class TestWikipediaQualityFetcher:
+    """Test concurrent and cached quality scoring."""
+
+    def test_revisions_are_scored_once(self) -> None:
+        """Test that each revision is requested once, however often it is asked."""
+        api = FakeLiftWing()
+        fetcher = make_fetcher(api, concurrency=4)
+
+        scores = fetcher.fetch_qualities(["1", "2", "3", "2", ""])
+        assert fetcher.fetch_article_quality("3") == scores["3"]
+
+        assert sorted(api.rev_ids) == [1, 2, 3]
+        assert {q["prediction"] for q in scores.values() if q} == {"C"}
+
+    def test_scores_persist_across_fetchers(self, tmp_path: Path) -> None:
+        """Test that a new fetcher reads earlier scores from the cache."""
+        path = tmp_path / "quality.db"
+        make_fetcher(FakeLiftWing(), cache=QualityCache(path)).fetch_qualities(["42"])
+
+        api = FakeLiftWing()
+        fetcher = make_fetcher(api, cache=QualityCache(path))
+        quality = fetcher.fetch_article_quality("42")
+
+        assert quality == {
+            "prediction": "C",
+            "probabilities": {"C": 0.7},
+            "rev_id": "42",
+        }
+        assert api.rev_ids == []
+
+    def test_failed_requests_are_not_cached(self) -> None:
+        """Test that revisions whose request fails are reported and retried later."""
+        api = FakeLiftWing(fail=True)
+        fetcher = make_fetcher(api)
+
+        with patch("time.sleep"):
+            assert fetcher.fetch_qualities(["7"]) == {"7": None}
+        api.fail = False
+
+        assert fetcher.fetch_qualities(["7"])["7"] is not None
@@ -9,18 +9,23 @@ import json
 import logging
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from io import StringIO
 from pathlib import Path
+from typing import Any, List, Optional
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from nyc_landmarks.config.settings import LogProvider
+from nyc_landmarks.config.settings import LogProvider, LogQueueOverflow
 from nyc_landmarks.utils.logger import (
     EnhancedCloudLoggingHandler,
     LoggerSetup,
     LoggingContext,
+    LogQueue,
+    QueuedLogHandler,
     StructuredFormatter,
     cleanup_loggers,
     configure_basic_logging_safely,
@@ -31,6 +36,7 @@ from nyc_landmarks.utils.logger import (
     log_with_attributes,
     log_with_context,
     shutdown_logging_gracefully,
+    stop_log_queue,
 )
 
 
@@ -442,6 +448,138 @@ class TestLoggerSetup(unittest.TestCase):
         assert len(logger.handlers) == handlers_count
 
 
+class _CollectingHandler(logging.Handler):
+    """Handler recording the messages and threads it emits, optionally gated."""
+
+    def __init__(self, gate: Optional[threading.Event] = None) -> None:
+        super().__init__()
+        self.gate = gate
+        self.messages: List[str] = []
+        self.threads: List[int] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(self.format(record))
+        self.threads.append(threading.get_ident())
+
+
+class TestLogQueue(unittest.TestCase):
+    """Test queue-based logging on a background thread."""
+
+    def setUp(self) -> None:
+        """Set up a logger emitting through a log queue."""
+        self.logger = logging.getLogger("queue_test_logger")
+        self.logger.handlers.clear()
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.queues: List[LogQueue] = []
+
+    def tearDown(self) -> None:
+        """Stop the queues and clean up the logger."""
+        for log_queue in self.queues:
+            log_queue.stop()
+        self.logger.handlers.clear()
+        self.logger.propagate = True
+        stop_log_queue()
+
+    def _queue(self, target: logging.Handler, **kwargs: Any) -> LogQueue:
+        log_queue = LogQueue(**kwargs)
+        self.queues.append(log_queue)
+        self.logger.addHandler(QueuedLogHandler(log_queue, [target]))
+        return log_queue
+
+    def test_records_are_emitted_on_the_listener_thread(self) -> None:
+        """Test that handlers run on the background thread after a flush."""
+        target = _CollectingHandler()
+        log_queue = self._queue(target)
+
+        self.logger.info("Processed %s chunks", 3)
+        assert log_queue.flush(timeout=5)
+
+        assert target.messages == ["Processed 3 chunks"]
+        assert target.threads[0] != threading.get_ident()
+
+    def test_logging_does_not_wait_for_slow_handlers(self) -> None:
+        """Benchmark: logging returns before a slow handler has emitted."""
+        gate = threading.Event()
+        target = _CollectingHandler(gate)
+        log_queue = self._queue(target)
+
+        started = time.perf_counter()
+        for i in range(100):
+            self.logger.info("Chunk %d", i)
+        elapsed = time.perf_counter() - started
+        gate.set()
+        log_queue.flush(timeout=5)
+
+        assert elapsed < 1.0
+        assert len(target.messages) == 100
+
+    @patch("nyc_landmarks.utils.logger.get_request_context")
+    def test_request_context_is_captured_by_the_caller(
+        self, mock_get_context: Mock
+    ) -> None:
+        """Test that the caller's request context reaches the JSON output."""
+        mock_get_context.return_value = {"request_id": "req-123"}
+        target = _CollectingHandler()
+        target.setFormatter(StructuredFormatter(include_context=False))
+        log_queue = self._queue(target)
+
+        self.logger.info("Query served")
+        log_queue.flush(timeout=5)
+
+        assert json.loads(target.messages[0])["request_id"] == "req-123"
+
+    def test_debug_records_are_dropped_first(self) -> None:
+        """Test that DEBUG records are dropped before the queue is full."""
+        gate = threading.Event()
+        target = _CollectingHandler(gate)
+        log_queue = self._queue(target, maxsize=4, overflow=LogQueueOverflow.DROP_DEBUG)
+
+        self.logger.info("Blocking the listener")
+        while log_queue.queue.qsize():
+            time.sleep(0.01)
+        for i in range(4):
+            self.logger.debug("Debug %d", i)
+        self.logger.info("Kept")
+        self.logger.info("Dropped")
+        gate.set()
+        log_queue.flush(timeout=5)
+
+        assert log_queue.dropped == {"DEBUG": 1, "INFO": 1}
+        assert target.messages[-1] == "Kept"
+
+    def test_stop_drains_the_queue(self) -> None:
+        """Test that stopping emits queued records and later ones synchronously."""
+        target = _CollectingHandler()
+        log_queue = self._queue(target)
+
+        self.logger.info("Before stop")
+        log_queue.stop()
+        self.logger.info("After stop")
+
+        assert target.messages == ["Before stop", "After stop"]
+        assert target.threads[1] == threading.get_ident()
+
+    def test_setup_with_queue(self) -> None:
+        """Test that LoggerSetup wraps its handlers in a queued handler."""
+        setup = LoggerSetup("queue_setup_logger")
+        try:
+            logger = setup.setup(
+                log_to_console=True,
+                log_to_file=False,
+                provider=LogProvider.STDOUT,
+                use_queue=True,
+            )
+
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], QueuedLogHandler)
+            assert isinstance(logger.handlers[0].handlers[0], logging.StreamHandler)
+        finally:
+            logging.getLogger("queue_setup_logger").handlers.clear()
+
+
 class TestLoggerFunctions(unittest.TestCase):
     """Test module-level logger functions."""
 